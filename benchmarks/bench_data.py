@@ -0,0 +1,71 @@
+"""
+Benchmarks of parameter database and section -> tab mapping.
+"""
+
+from src.data.database_loader import ParameterDatabase
+from src.data.tab_mapper import build_tab_index, get_dynamic_tabs, get_tab_for_section
+from src.modules.ini_manager import INIManager
+
+from conftest import rounds_for
+
+
+def bench_database_load(benchmark):
+    database = ParameterDatabase()
+    assert benchmark(database.load)
+
+
+def bench_database_lookup(benchmark):
+    """Lookup of every parameter by name."""
+    database = ParameterDatabase()
+    database.load()
+    names = list(database.parameters)
+
+    def lookup():
+        for name in names:
+            database.get_parameter(name)
+
+    benchmark(lookup)
+
+
+def bench_database_sections(benchmark):
+    """Parameters of every section (prefix scan per section)."""
+    database = ParameterDatabase()
+    database.load()
+    sections = list(database.get_all_sections())
+
+    def scan():
+        for section in sections:
+            database.get_parameters_for_section(section)
+
+    benchmark(scan)
+
+
+def bench_database_group_by_ini(benchmark):
+    database = ParameterDatabase()
+    database.load()
+    benchmark(database.group_by_ini_file)
+
+
+def _sections_by_ini(ini_path):
+    manager = INIManager(ini_path)
+    manager.load_ini()
+    return {'3dsmax.ini': list(manager.current_sections)}
+
+
+def bench_tab_mapping_cold(benchmark, ini_path, ini_size):
+    """Tab index and tab list with empty section -> tab cache."""
+    sections_by_ini = _sections_by_ini(ini_path)
+
+    def build():
+        tab_index = build_tab_index(sections_by_ini)
+        return get_dynamic_tabs(sections_by_ini, tab_index)
+
+    tabs = benchmark.pedantic(build, setup=get_tab_for_section.cache_clear, rounds=rounds_for(ini_size))
+    assert tabs
+
+
+def bench_tab_mapping_warm(benchmark, ini_path):
+    """Tab index rebuild with cached section -> tab lookups (tab switch)."""
+    sections_by_ini = _sections_by_ini(ini_path)
+    build_tab_index(sections_by_ini)
+    benchmark(build_tab_index, sections_by_ini)
@@ -0,0 +1,46 @@
+"""
+Benchmarks of canvas packing engine (1000 panels, 1-4 columns).
+
+Panels and widths are the ones of scripts/bench_packing.py.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from bench_packing import WIDTHS, make_items
+from ui.packing_engine import PackingEngine
+
+
+PANELS = 1000
+
+
+@pytest.fixture(params=sorted(WIDTHS), ids=lambda columns: f"{columns}col")
+def columns(request) -> int:
+    return request.param
+
+
+def bench_pack_pinned(benchmark, columns):
+    engine = PackingEngine(columns=columns)
+    items = make_items(PANELS, columns, pinned=True)
+    placements = benchmark(engine.pack, items, WIDTHS[columns])
+    assert len(placements) == PANELS
+
+
+def bench_pack_auto(benchmark, columns):
+    engine = PackingEngine(columns=columns)
+    items = make_items(PANELS, columns, pinned=False)
+    placements = benchmark(engine.pack, items, WIDTHS[columns])
+    assert len(placements) == PANELS
+
+
+def bench_repack_middle(benchmark, columns):
+    """Incremental repack after panel in the middle collapses/expands."""
+    engine = PackingEngine(columns=columns)
+    engine.pack(make_items(PANELS, columns, pinned=True), WIDTHS[columns])
+    middle = engine.items[len(engine.items) // 2].item_id
+    heights = iter([40, 600] * 100000)
+    benchmark(lambda: engine.repack_from(middle, height=next(heights)))
@@ -0,0 +1,141 @@
+"""
+Benchmarks of MaxINI core: parser, INIManager, backups, presets.
+"""
+
+from src.modules.ini_manager import INIManager
+from src.modules.maxini_backup import MaxINIBackupManager
+from src.modules.maxini_parser import MaxINIParser
+from src.modules.maxini_presets import MaxINIPresetManager
+
+from conftest import RULES_PATH, rounds_for
+
+
+UPDATES = 1000  # Parameters edited per INIManager round
+BACKUPS = 20  # Backups on disk for list/cleanup (2x default max_backups)
+
+
+def bench_parser_load(benchmark, ini_path, ini_size):
+    parser = MaxINIParser(RULES_PATH)
+    params = benchmark.pedantic(parser.load, args=(ini_path,), rounds=rounds_for(ini_size))
+    assert len(params) == ini_size
+
+
+def bench_parser_save(benchmark, ini_path, ini_size, tmp_path):
+    parser = MaxINIParser(RULES_PATH)
+    params = parser.load(ini_path)
+    out_path = tmp_path / '3dsMax.ini'
+    benchmark.pedantic(parser.save, args=(out_path, params, False), rounds=rounds_for(ini_size))
+    assert len(parser.load(out_path)) == ini_size
+
+
+def bench_parser_validate(benchmark, ini_path, ini_size):
+    parser = MaxINIParser(RULES_PATH)
+    params = parser.load(ini_path)
+    benchmark.pedantic(parser.validate, args=(params,), rounds=rounds_for(ini_size))
+
+
+def bench_manager_load(benchmark, ini_path, ini_size):
+    def load():
+        manager = INIManager(ini_path)
+        assert manager.load_ini()
+        return manager
+
+    manager = benchmark.pedantic(load, rounds=rounds_for(ini_size))
+    assert len(manager.original_parameters) == ini_size
+
+
+def _edits(manager: INIManager, count: int = UPDATES):
+    """(section, key, value) edits of first count parameters."""
+    edits = []
+    for section in manager.current_sections.values():
+        for key in section.parameters:
+            if len(edits) == count:
+                return edits
+            edits.append((section.name, key, 'edited'))
+    return edits
+
+
+def bench_manager_update(benchmark, ini_path):
+    manager = INIManager(ini_path)
+    manager.load_ini()
+    edits = _edits(manager)
+
+    def update():
+        for section, key, value in edits:
+            manager.update_parameter(section, key, value)
+
+    benchmark(update)
+    assert manager.get_modified_count() == len(edits)
+
+
+def bench_manager_revert_all(benchmark, ini_path, ini_size):
+    manager = INIManager(ini_path)
+    manager.load_ini()
+    edits = _edits(manager)
+
+    def setup():
+        for section, key, value in edits:
+            manager.update_parameter(section, key, value)
+
+    benchmark.pedantic(manager.revert_all, setup=setup, rounds=rounds_for(ini_size))
+    assert not manager.has_unsaved_changes()
+
+
+def bench_manager_save(benchmark, fresh_ini, ini_size):
+    """Save with backup (as Save button does) of freshly edited copy."""
+    def setup():
+        manager = INIManager(fresh_ini())
+        manager.load_ini()
+        for section, key, value in _edits(manager):
+            manager.update_parameter(section, key, value)
+        return (manager,), {}
+
+    def save(manager):
+        success, error = manager.save_ini(create_backup=True)
+        assert success, error
+
+    benchmark.pedantic(save, setup=setup, rounds=rounds_for(ini_size))
+
+
+def bench_backup_create(benchmark, fresh_ini, ini_size):
+    backup_manager = MaxINIBackupManager()
+    benchmark.pedantic(
+        lambda ini: backup_manager.create_backup(ini),
+        setup=lambda: ((fresh_ini(),), {}),
+        rounds=rounds_for(ini_size),
+    )
+
+
+def _fill_backups(ini_path, count: int = BACKUPS):
+    """Write count backups of ini_path with distinct timestamps."""
+    data = ini_path.read_bytes()
+    for i in range(count):
+        (ini_path.parent / f"{ini_path.name}.backup.20250101_{i:06d}").write_bytes(data)
+
+
+def bench_backup_list(benchmark, fresh_ini, ini_size):
+    ini = fresh_ini()
+    _fill_backups(ini)
+    backups = benchmark.pedantic(MaxINIBackupManager().list_backups, args=(ini,), rounds=rounds_for(ini_size))
+    assert len(backups) == BACKUPS
+
+
+def bench_backup_cleanup(benchmark, fresh_ini, ini_size):
+    backup_manager = MaxINIBackupManager()
+
+    def setup():
+        ini = fresh_ini()
+        _fill_backups(ini)
+        return (ini,), {}
+
+    deleted = benchmark.pedantic(backup_manager.cleanup_old_backups, setup=setup, rounds=rounds_for(ini_size))
+    assert deleted == BACKUPS - backup_manager.max_backups
+
+
+def bench_preset_apply(benchmark, ini_path, ini_size):
+    preset_manager = MaxINIPresetManager()
+    preset = preset_manager.get_preset_by_name('high_performance')
+    params = MaxINIParser(RULES_PATH).load(ini_path)
+    benchmark.pedantic(
+        preset_manager.apply_preset_to_parameters, args=(preset, params), rounds=rounds_for(ini_size)
+    )
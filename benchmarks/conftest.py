@@ -0,0 +1,68 @@
+"""
+Shared fixtures of the benchmark suite.
+
+Runs headless (offscreen Qt) with profiling timers off. INI sizes come from
+MAXMANAGER_BENCH_SIZES (default 1000,10000,100000 keys); files are generated
+once per session.
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("MAXMANAGER_PROFILE", "0")  # Measure code, not instrumentation
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import pytest
+
+from ini_generator import generate_ini
+
+
+SIZES = [int(size) for size in os.environ.get('MAXMANAGER_BENCH_SIZES', '1000,10000,100000').split(',')]
+RULES_PATH = Path(__file__).parent.parent / 'data' / 'validation' / 'rules.json'
+
+
+def rounds_for(keys: int) -> int:
+    """Rounds of pedantic benchmarks (100k-key files take seconds per round)."""
+    if keys >= 100000:
+        return 3
+    if keys >= 10000:
+        return 10
+    return 50
+
+
+@pytest.fixture(scope='session')
+def ini_files(tmp_path_factory):
+    """{keys: generated INI path} for all benchmark sizes."""
+    directory = tmp_path_factory.mktemp('ini')
+    return {keys: generate_ini(directory / f"3dsMax_{keys}.ini", keys) for keys in SIZES}
+
+
+@pytest.fixture(params=SIZES, ids=lambda keys: f"{keys // 1000}k")
+def ini_size(request) -> int:
+    """Number of keys of INI under benchmark."""
+    return request.param
+
+
+@pytest.fixture
+def ini_path(ini_files, ini_size) -> Path:
+    """Generated INI (shared - don't write)."""
+    return ini_files[ini_size]
+
+
+@pytest.fixture
+def fresh_ini(ini_path, tmp_path):
+    """Factory of writable copies of INI in own directory (for save/backup benchmarks)."""
+    counter = [0]
+
+    def make() -> Path:
+        counter[0] += 1
+        directory = tmp_path / f"copy{counter[0]}"
+        directory.mkdir()
+        return Path(shutil.copy2(ini_path, directory / '3dsMax.ini'))
+
+    return make
@@ -0,0 +1,102 @@
+"""
+Synthetic 3dsMax.ini generator for benchmarks.
+
+Writes UTF-16 LE files (with BOM, like 3ds Max does) with a realistic mix
+of sections and values: real section names from the parameter database
+first, then numbered ones; ints, 0/1 flags, floats, paths and strings;
+keys from validation/rules.json so validation has work to do.
+
+Usage:
+    python benchmarks/ini_generator.py 10000 /tmp/3dsMax_10k.ini
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import List
+
+
+REPO_ROOT = Path(__file__).parent.parent
+KEYS_PER_SECTION = 50
+
+
+def real_section_names() -> List[str]:
+    """Section names known to the parameter database (sorted, unique)."""
+    db_path = REPO_ROOT / 'data' / 'ini_parameters_database.json'
+    with open(db_path, 'r', encoding='utf-8') as f:
+        names = json.load(f)
+    return sorted({name.split('.', 1)[0] for name in names if '.' in name and name != '_metadata'})
+
+
+def rule_keys() -> List[str]:
+    """Parameter keys with validation rules."""
+    with open(REPO_ROOT / 'data' / 'validation' / 'rules.json', 'r', encoding='utf-8') as f:
+        rules = json.load(f)
+    return [key for key, rule in rules.items() if isinstance(rule, dict) and 'type' in rule]
+
+
+def random_value(rng: random.Random, index: int) -> str:
+    """Value of one of the INI value kinds."""
+    kind = index % 5
+    if kind == 0:
+        return str(rng.randint(0, 4096))
+    if kind == 1:
+        return rng.choice(('0', '1'))
+    if kind == 2:
+        return f"{rng.uniform(0, 100):.3f}"
+    if kind == 3:
+        return f"C:\\Users\\artist\\Documents\\3ds Max 2025\\dir{rng.randint(0, 999)}\\"
+    return f"value_{rng.randint(0, 10**6)}"
+
+
+def generate_ini_text(keys: int, seed: int = 0) -> str:
+    """INI content with given number of keys."""
+    rng = random.Random(seed)
+    sections = real_section_names()
+    rules = rule_keys()
+    rule_values = {'RenderThreads': '8', 'MemoryPool': '1024', 'BackupInterval': '5', 'PageFileSize': '4096'}
+
+    lines = []
+    written = 0
+    section_index = 0
+    while written < keys:
+        name = sections[section_index] if section_index < len(sections) else f"Section{section_index:05d}"
+        lines.append(f"[{name}]")
+        count = min(KEYS_PER_SECTION, keys - written)
+        for i in range(count):
+            if section_index == 0 and i < len(rules):
+                key = rules[i]
+                value = rule_values.get(key, random_value(rng, i))
+            else:
+                key = f"Param{i:03d}"
+                value = random_value(rng, i)
+            lines.append(f"{key}={value}")
+        lines.append("")
+        written += count
+        section_index += 1
+    return "\n".join(lines)
+
+
+def generate_ini(path: Path, keys: int, seed: int = 0) -> Path:
+    """Write synthetic 3dsMax.ini (UTF-16 LE with BOM)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-16-le') as f:
+        f.write('\ufeff' + generate_ini_text(keys, seed))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic 3dsMax.ini")
+    parser.add_argument('keys', type=int, help="Number of keys")
+    parser.add_argument('output', type=Path, help="Output INI path")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    generate_ini(args.output, args.keys, args.seed)
+    print(f"Wrote {args.keys} keys to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Import-time budget check of the editor window module.
+
+Imports src.ui.canvas_main_window in a fresh interpreter with
+`python -X importtime` (PySide6 and logging preloaded, as they are inside
+3ds Max) and fails when:
+- cumulative import time (best of --runs) exceeds --budget-ms
+- a module that must load lazily (icon fonts, pymxs, workers of deferred
+  startup) is imported before the first frame
+
+Usage:
+    python scripts/check_import_time.py [--budget-ms 150] [--runs 3] [--top 10]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TARGET_MODULE = 'src.ui.canvas_main_window'
+PRELOAD = 'import PySide6.QtCore, PySide6.QtGui, PySide6.QtWidgets, logging.handlers'
+
+# Loaded after the first frame (deferred startup, first tab build, first use)
+LAZY_MODULES = (
+    'qtawesome',
+    'qtpy',
+    'pymxs',
+    'src.modules.apply_planner',
+    'src.modules.ini_manager',
+    'src.modules.max_bridge',
+    'src.modules.plugin_ini_finder',
+    'src.ui.canvas_builder',
+    'src.ui.ini_file_watcher',
+    'src.ui.parameter_list_view',
+    'src.ui.search_pipeline',
+    'src.ui.timing_overlay',
+)
+
+DEFAULT_BUDGET_MS = 150
+
+
+def run_importtime(module: str = TARGET_MODULE) -> dict:
+    """Import module in fresh interpreter, get {module: (self_us, cumulative_us)}."""
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen', PYTHONDONTWRITEBYTECODE='1')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"{PRELOAD}; import {module}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import of {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def parse_importtime(output: str) -> dict:
+    """Parse `-X importtime` lines into {module: (self_us, cumulative_us)}."""
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        times[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check import-time budget of the editor window")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help="Max cumulative import time")
+    parser.add_argument('--runs', type=int, default=3, help="Imports to run (best is checked)")
+    parser.add_argument('--top', type=int, default=10, help="Slowest MaxManager modules to list")
+    args = parser.parse_args()
+
+    runs = [run_importtime() for _ in range(args.runs)]
+    best = min(runs, key=lambda times: times[TARGET_MODULE][1])
+    total_ms = best[TARGET_MODULE][1] / 1000
+
+    print(f"{TARGET_MODULE}: {total_ms:.1f} ms (best of {args.runs}, budget {args.budget_ms:.0f} ms)")
+    own = sorted(
+        ((name, self_us) for name, (self_us, _) in best.items() if name.startswith('src')),
+        key=lambda item: item[1], reverse=True,
+    )
+    for name, self_us in own[:args.top]:
+        print(f"  {self_us / 1000:>7.1f} ms  {name}")
+
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in best]
+    if eager:
+        print(f"[FAIL] Imported before first frame (must be lazy): {', '.join(eager)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"[FAIL] Import time {total_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print("[OK] Import time within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Test apply planner: live-safe keys to session, others to file, one backup, rollback."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.modules.apply_planner import ApplyPlanner, load_live_safe_keys, session_bridge_for
+from src.modules.ini_manager import INIManager
+from src.modules.max_bridge import MaxBridge, MockMaxRuntime
+from src.modules.maxini_presets import MaxINIPreset
+
+
+def make_manager() -> INIManager:
+    """Load small 3dsMax.ini with one live-safe and one restart-required key."""
+    ini_path = Path(tempfile.mkdtemp()) / '3dsMax.ini'
+    with open(ini_path, 'w', encoding='utf-16-le') as f:
+        f.write('\ufeff[Renderer]\nRenderThreads=8\n\n[Memory]\nMemoryPool=512\nPageFileSize=4096\n')
+    manager = INIManager(ini_path)
+    assert manager.load_ini()
+    return manager
+
+
+def make_preset() -> MaxINIPreset:
+    return MaxINIPreset(
+        name="Test", description_en="", description_ru="", author="test", tags=[],
+        parameters={"RenderThreads": 16, "MemoryPool": 1024, "PageFileSize": 4096, "NotInFile": True},
+    )
+
+
+def rewrite_later(manager: INIManager, text: str):
+    """Change file outside the manager (newer mtime for coarse filesystem clocks)."""
+    with open(manager.ini_path, 'w', encoding='utf-16-le') as f:
+        f.write('\ufeff' + text)
+    stat = manager.ini_path.stat()
+    os.utime(manager.ini_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+def backups_of(manager: INIManager) -> list:
+    return list(manager.ini_path.parent.glob('3dsMax.ini.backup.*'))
+
+
+def test_plan_and_execute():
+    """Safe key goes live, the rest needs restart; one backup, one live round-trip."""
+    assert 'renderthreads' in load_live_safe_keys()
+    manager = make_manager()
+    runtime = MockMaxRuntime(max_ini_file=str(manager.ini_path))
+    bridge = session_bridge_for(manager.ini_path, runtime)
+    assert bridge is not None
+    assert session_bridge_for(manager.ini_path, MockMaxRuntime(max_ini_file='other.ini')) is None
+
+    planner = ApplyPlanner(manager, bridge=bridge)
+    plan = planner.plan_preset(make_preset())
+    assert [(c.key, c.value, c.old_value) for c in plan.live] == [('renderthreads', '16', '8')]
+    assert [(c.key, c.value) for c in plan.restart] == [('memorypool', '1024')]  # PageFileSize unchanged
+    assert plan.unknown == ['NotInFile']
+
+    result = planner.execute(plan, reason="preset_applied:Test")
+    assert result.success and result.requires_restart
+    assert len(backups_of(manager)) == 1
+    assert bridge.round_trips == 1 and runtime.refresh_count == 1
+    assert runtime.getINISetting(str(manager.ini_path), 'Renderer', 'RenderThreads') == '16'
+
+    reloaded = INIManager(manager.ini_path)
+    assert reloaded.load_ini()
+    assert reloaded.current_sections['Memory'].parameters['memorypool'] == '1024'
+    assert not manager.has_unsaved_changes() and not manager.is_changed_on_disk()
+
+    # Outside 3ds Max everything is restart-required
+    plan = ApplyPlanner(make_manager()).plan_preset(make_preset())
+    assert plan.live == [] and len(plan.restart) == 2
+    print("[OK] Plan split and executed")
+
+
+def test_failed_live_apply_rolls_back():
+    """Live failure restores file, session values and unsaved edits."""
+    manager = make_manager()
+    manager.update_parameter('Memory', 'pagefilesize', '8192')  # Unsaved edit outside the plan
+    runtime = MockMaxRuntime({('Renderer', 'RenderThreads'): '8'}, max_ini_file=str(manager.ini_path))
+    runtime.fail_keys.add(('Renderer', 'renderthreads'))
+    planner = ApplyPlanner(manager, bridge=MaxBridge(runtime), live_safe_keys={'renderthreads', 'memorypool'})
+
+    result = planner.execute(planner.plan_changes({('Renderer', 'RenderThreads'): 16, ('Memory', 'MemoryPool'): 1024}))
+    assert not result.success and result.error
+    assert len(backups_of(manager)) == 1
+    assert runtime.getINISetting(str(manager.ini_path), 'Memory', 'MemoryPool') == '512'  # Pushed, then restored
+
+    sections = manager.current_sections
+    assert sections['Renderer'].parameters['renderthreads'] == '8'
+    assert sections['Memory'].parameters['memorypool'] == '512'
+    assert manager.original_sections['Memory'].parameters['pagefilesize'] == '4096'  # File restored
+    assert manager.get_modified_values() == {('Memory', 'pagefilesize'): '8192'}
+    print("[OK] Failed apply rolled back")
+
+
+def test_changed_on_disk_is_merged_or_aborted():
+    """Plan is made again after merge; keys changed both here and on disk abort the apply."""
+    manager = make_manager()
+    planner = ApplyPlanner(manager, live_safe_keys=set())
+    plan = planner.plan_changes({('Memory', 'MemoryPool'): 1024, ('Memory', 'PageFileSize'): 8192})
+    rewrite_later(manager, '[Renderer]\nRenderThreads=4\n\n[Memory]\nMemoryPool=1024\nPageFileSize=4096\n')
+
+    result = planner.execute(plan)
+    assert result.success and not result.conflicts
+    assert [(c.key, c.value, c.old_value) for c in result.plan.changes] == [('pagefilesize', '8192', '4096')]
+    reloaded = INIManager(manager.ini_path)
+    assert reloaded.load_ini()
+    assert reloaded.current_sections['Renderer'].parameters['renderthreads'] == '4'  # Disk value kept
+    assert reloaded.current_sections['Memory'].parameters['pagefilesize'] == '8192'
+
+    # Unsaved edit and planned key both changed on disk
+    manager.update_parameter('Renderer', 'renderthreads', '2')
+    plan = planner.plan_changes(manager.get_modified_values())
+    plan.restart += planner.plan_changes({('Memory', 'MemoryPool'): 256}).changes
+    rewrite_later(manager, '[Renderer]\nRenderThreads=6\n\n[Memory]\nMemoryPool=2048\nPageFileSize=8192\n')
+    result = planner.execute(plan)
+    assert not result.success and result.error and result.backup is None
+    assert sorted((c.key, c.local_value, c.disk_value) for c in result.conflicts) == [
+        ('memorypool', '256', '2048'), ('renderthreads', '2', '6')]
+    assert len(backups_of(manager)) == 1  # First apply only
+    assert manager.get_modified_values() == {('Renderer', 'renderthreads'): '2'}  # Edit kept, nothing written
+    print("[OK] Changes on disk merged or reported")
+
+
+if __name__ == "__main__":
+    test_plan_and_execute()
+    test_failed_live_apply_rolls_back()
+    test_changed_on_disk_is_merged_or_aborted()
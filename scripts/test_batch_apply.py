@@ -0,0 +1,88 @@
+"""Test headless batch apply to many INI profiles."""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.modules.batch_apply import apply_to_files, collect_ini_files, main, parse_assignments
+from src.modules.ini_manager import INIManager
+
+
+def make_farm(count: int) -> Path:
+    """Profiles share/nodeNN/3dsMax.ini; node00 already has the new thread count."""
+    root = Path(tempfile.mkdtemp())
+    for i in range(count):
+        node = root / f'node{i:02d}'
+        node.mkdir()
+        with open(node / '3dsMax.ini', 'w', encoding='utf-16-le') as f:
+            f.write(f'\ufeff[Renderer]\nThreadCount={32 if i == 0 else 8}\n\n[Memory]\nMemoryPool=512\n')
+    with open(root / 'node01' / 'plugin.ini', 'w', encoding='utf-16-le') as f:  # Same key, not a profile
+        f.write('\ufeff[Renderer]\nThreadCount=8\n')
+    (root / 'broken').mkdir()
+    (root / 'broken' / '3dsMax.ini').write_bytes(b'\xff\xfe[')  # Unparsable
+    return root
+
+
+def read_value(path: Path, section: str, key: str) -> str:
+    manager = INIManager(path)
+    assert manager.load_ini()
+    return manager.current_sections[section].parameters[key]
+
+
+def test_apply_to_farm():
+    """Changed files get one backup each, unchanged are skipped, each file has a report."""
+    root = make_farm(6)
+    files = collect_ini_files([str(root)])
+    assert len(files) == 7
+    assert collect_ini_files([str(root / 'node0*' / '3dsMax.ini')]) == files[1:]
+
+    report_dir = root / 'reports'
+    summary = apply_to_files(files, parse_assignments(['Renderer.ThreadCount=32', 'Missing=1']),
+                             report_dir=report_dir, workers=2)
+    assert summary['counts'] == {'applied': 5, 'unchanged': 1, 'dry_run': 0, 'failed': 1}
+    assert read_value(root / 'node03' / '3dsMax.ini', 'Renderer', 'threadcount') == '32'
+    assert len(list((root / 'node03').glob('3dsMax.ini.backup.*'))) == 1
+    assert list((root / 'node00').glob('3dsMax.ini.backup.*')) == []
+
+    report = json.loads((report_dir / 'node03__3dsMax.ini.json').read_text(encoding='utf-8'))
+    assert report['status'] == 'applied' and report['unknown'] == ['Missing']
+    assert report['changes'] == [{'section': 'Renderer', 'key': 'threadcount', 'old': '8', 'new': '32'}]
+    assert json.loads((report_dir / 'summary.json').read_text(encoding='utf-8'))['files'] == 7
+    print("[OK] Batch applied to farm")
+
+
+def test_cli_dry_run():
+    """Dry run reports planned changes without writing."""
+    root = make_farm(2)
+    report_dir = root / 'reports'
+    code = main([str(root / 'node*' / '3dsMax.ini'), '--set', 'memorypool=1024',
+                 '--dry-run', '--report-dir', str(report_dir)])
+    assert code == 0
+    assert read_value(root / 'node01' / '3dsMax.ini', 'Memory', 'memorypool') == '512'
+    summary = json.loads((report_dir / 'summary.json').read_text(encoding='utf-8'))
+    assert summary['counts']['dry_run'] == 2
+    print("[OK] CLI dry run")
+
+
+def test_directory_scan_skips_plugin_ini():
+    """Bare key change reaches only 3dsMax.ini files unless another pattern is given."""
+    root = make_farm(2)
+    plugin_ini = root / 'node01' / 'plugin.ini'
+    before = plugin_ini.read_bytes()
+    assert plugin_ini not in collect_ini_files([str(root)])
+    assert plugin_ini in collect_ini_files([str(root)], pattern='*.ini')
+
+    code = main([str(root), '--set', 'ThreadCount=32', '--workers', '1', '--report-dir', str(root / 'reports')])
+    assert code == 1  # broken/3dsMax.ini
+    assert read_value(root / 'node01' / '3dsMax.ini', 'Renderer', 'threadcount') == '32'
+    assert plugin_ini.read_bytes() == before
+    assert list((root / 'node01').glob('plugin.ini.backup.*')) == []
+    print("[OK] Plugin INI left untouched")
+
+
+if __name__ == "__main__":
+    test_apply_to_farm()
+    test_cli_dry_run()
+    test_directory_scan_skips_plugin_ini()
@@ -0,0 +1,71 @@
+"""Test time-sliced CanvasBuilder (budget, cancel, finish_now)."""
+
+import os
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from src.ui.canvas_builder import CanvasBuilder
+
+app = QApplication.instance() or QApplication([])
+
+
+def slow_steps(done: list, count: int):
+    """Steps taking ~1 ms each."""
+    for i in range(count):
+        time.sleep(0.001)
+        done.append(i)
+        yield
+
+
+def test_first_chunk_respects_budget():
+    """start() runs only first chunk, rest continues from event loop."""
+    done = []
+    slices = []
+    finished = []
+    builder = CanvasBuilder(slow_steps(done, 200), on_slice=lambda: slices.append(len(done)),
+                            first_budget_ms=20, budget_ms=10)
+    builder.finished.connect(lambda: finished.append(True))
+
+    builder.start()
+    assert 0 < len(done) < 200, "First chunk should be partial"
+    assert builder.is_running
+
+    deadline = time.perf_counter() + 5
+    while builder.is_running and time.perf_counter() < deadline:
+        app.processEvents()
+
+    assert len(done) == 200
+    assert finished == [True]
+    assert len(slices) > 2
+    print(f"[OK] Built in {len(slices)} slices")
+
+
+def test_cancel_and_finish_now():
+    """cancel() drops remaining steps, finish_now() completes synchronously."""
+    done = []
+    builder = CanvasBuilder(slow_steps(done, 100), first_budget_ms=5)
+    builder.start()
+    builder.cancel()
+    app.processEvents()
+    cancelled_at = len(done)
+    assert not builder.is_running
+    assert cancelled_at < 100
+
+    done2 = []
+    builder2 = CanvasBuilder(slow_steps(done2, 100), first_budget_ms=5)
+    builder2.start()
+    builder2.finish_now()
+    assert len(done2) == 100
+    assert not builder2.is_running
+    print("[OK] Cancel and finish_now")
+
+
+if __name__ == "__main__":
+    test_first_chunk_respects_budget()
+    test_cancel_and_finish_now()
@@ -0,0 +1,100 @@
+"""Test incremental skyline relayout of CanvasContainer."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QMimeData, QPoint, QPointF, Qt
+from PySide6.QtGui import QDropEvent
+from PySide6.QtWidgets import QApplication, QLabel
+
+from src.ui import collapsible_canvas
+from src.ui.collapsible_canvas import CollapsibleCanvas, CanvasContainer
+from src.ui.layout_storage import LayoutStorage
+
+app = QApplication.instance() or QApplication([])
+collapsible_canvas.LAYOUT_DEBUG = True  # Overlap assertion after every pass
+
+
+def make_container(count: int = 40) -> CanvasContainer:
+    """Shown container with canvases of different heights."""
+    container = CanvasContainer()
+    container.resize(1400, 900)
+    container.show()
+    app.processEvents()
+    for i in range(count):
+        canvas = CollapsibleCanvas(f"Section {i:03d}")
+        for row in range(1 + i % 7):
+            canvas.add_content(QLabel(f"param {row}"))
+        container.add_canvas(canvas)
+    container._rebuild_skyline_layout()
+    return container
+
+
+def geometries(container: CanvasContainer) -> dict:
+    return {cid: canvas.geometry().getRect() for cid, canvas in container.canvas_items.items()}
+
+
+def test_relayout_matches_full_layout():
+    """Incremental relayout after collapse/span change gives same geometry as full pass."""
+    container = make_container()
+    canvases = list(container.canvas_items.values())
+
+    for canvas in (canvases[5], canvases[0], canvases[-1]):
+        canvas.toggle()  # relayout_canvas()
+        incremental = geometries(container)
+        container._rebuild_skyline_layout()
+        assert geometries(container) == incremental
+
+    container.grid_manager.items[canvases[3].title].span = 2
+    container.relayout_canvas(canvases[3])
+    incremental = geometries(container)
+    container._rebuild_skyline_layout()
+    assert geometries(container) == incremental
+    print("[OK] Incremental relayout matches full layout")
+
+
+def test_relayout_keeps_canvases_before():
+    """Canvases placed before the changed one are not touched."""
+    container = make_container()
+    order = [item.item_id for item in container.packer.items]
+    changed = container.canvas_items[order[len(order) // 2]]
+    before = {cid: container.canvas_items[cid].geometry().getRect() for cid in order[:len(order) // 2]}
+
+    changed.toggle()
+    assert {cid: container.canvas_items[cid].geometry().getRect() for cid in before} == before
+    print("[OK] Canvases before changed one keep geometry")
+
+
+def test_resize_and_drop_use_packer():
+    """Span change and drop are pinned updates of the packer, stored in grid_manager."""
+    container = make_container(12)
+    container.layout_storage = LayoutStorage(Path(tempfile.mkdtemp()) / 'layout.json', write_delay=0)
+    dragged = container.canvas_items['Section 005']
+
+    container.resize_canvas('Section 005', 2)
+    assert container.packer.placements['Section 005'].span == 2
+    assert container.grid_manager.items['Section 005'].span == 2
+
+    target = container.canvas_items['Section 000'].geometry()
+    mime = QMimeData()
+    mime.setText('Section 005')
+    drop_pos = container.canvas_widget.mapTo(container, target.topLeft() + QPoint(20, target.height() // 4))
+    event = QDropEvent(QPointF(drop_pos), Qt.MoveAction, mime, Qt.LeftButton, Qt.NoModifier)
+    container.dropEvent(event)
+
+    column = sorted((item for item in container.grid_manager.items.values() if item.col == 0), key=lambda item: item.row)
+    assert [item.canvas_id for item in column][:2] == ['Section 005', 'Section 000']
+    assert dragged.geometry().top() == container.packer.margin
+    assert container.packer.find_overlaps() == []
+    print("[OK] Resize and drop go through packer")
+
+
+if __name__ == "__main__":
+    test_relayout_matches_full_layout()
+    test_relayout_keeps_canvases_before()
+    test_resize_and_drop_use_packer()
@@ -0,0 +1,58 @@
+"""Test coalescing parameter change dispatcher."""
+
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from src.ui.change_dispatcher import ChangeDispatcher
+
+app = QApplication.instance() or QApplication([])
+
+
+def test_one_update_per_key_per_tick():
+    """Drag over many values delivers only the latest value per key."""
+    dispatcher = ChangeDispatcher()
+    batches = []
+    dispatcher.changes_ready.connect(batches.append)
+
+    a = ('3dsMax.ini', 'Performance', 'ThreadCount')
+    b = ('3dsMax.ini', 'Renderer', 'Quality')
+    for value in range(100):
+        dispatcher.submit(a, str(value))
+    dispatcher.submit(b, '0.5')
+    dispatcher.submit(a, 'last')
+
+    assert batches == []
+    assert dispatcher.pending_count == 2
+    app.processEvents()
+
+    assert batches == [[(a, 'last'), (b, '0.5')]]  # Order of first change
+    assert dispatcher.pending_count == 0
+    print("[OK] One update per key per tick")
+
+
+def test_flush_delivers_synchronously():
+    """flush() delivers pending changes now and the timer delivers nothing later."""
+    dispatcher = ChangeDispatcher()
+    batches = []
+    dispatcher.changes_ready.connect(batches.append)
+
+    key = ('plugin.ini', 'Main', 'Enabled')
+    dispatcher.submit(key, '1')
+    dispatcher.flush()
+    assert batches == [[(key, '1')]]
+
+    app.processEvents()
+    dispatcher.flush()
+    assert len(batches) == 1
+    print("[OK] Flush delivers synchronously")
+
+
+if __name__ == "__main__":
+    test_one_update_per_key_per_tick()
+    test_flush_delivers_synchronously()
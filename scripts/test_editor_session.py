@@ -0,0 +1,138 @@
+"""Test resident editor session: singleton window, reload of INIs changed on disk."""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from src.core.logger import PACKAGE_LOGGER
+from src.modules.ini_manager import INIManager
+
+app = QApplication.instance() or QApplication([])
+
+
+def write_ini(path: Path, threads: str, safe: str = '1'):
+    """Write small UTF-16 3dsMax.ini."""
+    with open(path, 'w', encoding='utf-16-le') as f:
+        f.write(f'\ufeff[Performance]\nThreadCount={threads}\n\n[Security]\nSafeSceneScriptExecutionEnabled={safe}\n')
+
+
+def touch_later(path: Path, threads: str, safe: str = '1'):
+    """Rewrite file with a newer mtime (coarse filesystem clocks)."""
+    write_ini(path, threads, safe)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+def test_ini_manager_detects_disk_changes():
+    """Stamp taken on load/save; external writes are detected, own saves are not."""
+    ini_path = Path(tempfile.mkdtemp()) / '3dsMax.ini'
+    write_ini(ini_path, '8')
+    manager = INIManager(ini_path)
+    assert manager.is_changed_on_disk()  # Never loaded
+    assert manager.load_ini()
+    assert not manager.is_changed_on_disk()
+
+    manager.update_parameter('Performance', 'ThreadCount', '16')
+    assert manager.save_ini(create_backup=False)[0]
+    assert not manager.is_changed_on_disk()
+
+    touch_later(ini_path, '4')
+    assert manager.is_changed_on_disk()
+    ini_path.unlink()
+    assert manager.is_changed_on_disk()
+    print("[OK] INI manager detects disk changes")
+
+
+def test_show_editor_reuses_window():
+    """Second show re-shows the same window, reloading only changed INI; apply saves every INI."""
+    home = os.environ.get('HOME')
+    os.environ['HOME'] = tempfile.mkdtemp()  # Layouts and logs of the window
+    handlers = list(logging.getLogger(PACKAGE_LOGGER).handlers)
+    try:
+        from src.ui import editor_session
+
+        ini_path = Path(tempfile.mkdtemp()) / '3dsMax.ini'
+        write_ini(ini_path, '8')
+
+        window = editor_session.show_editor(ini_path)
+        window.wait_until_ready()
+        assert window.isVisible()
+        assert window.ini_manager.current_sections['Performance'].parameters['threadcount'] == '8'
+
+        window.close()
+        assert not window.isVisible()
+        start = time.perf_counter()
+        assert editor_session.show_editor() is window
+        assert time.perf_counter() - start < 0.5
+        assert window.reload_changed_inis() == []
+
+        touch_later(ini_path, '4')
+        window.close()
+        assert editor_session.show_editor() is window
+        assert window.ini_manager.current_sections['Performance'].parameters['threadcount'] == '4'
+
+        # Unsaved edits are merged over the reloaded file
+        window.ini_manager.update_parameter('Performance', 'threadcount', '2')
+        touch_later(ini_path, '4', safe='0')
+        assert window.reload_changed_inis() == ['3dsMax.ini']
+        sections = window.ini_manager.current_sections
+        assert sections['Performance'].parameters['threadcount'] == '2'
+        assert sections['Security'].parameters['safescenescriptexecutionenabled'] == '0'
+
+        # Apply saves plugin INI edits too
+        plugin_path = ini_path.parent / 'plugin.ini'
+        write_ini(plugin_path, '8')
+        plugin_manager = INIManager(plugin_path)
+        assert plugin_manager.load_ini()
+        window.plugin_ini_managers['plugin.ini'] = plugin_manager
+        plugin_manager.update_parameter('Performance', 'threadcount', '6')
+        canvases = list(window.canvas_container.canvas_items.values())
+        for canvas in canvases:
+            canvas.mark_as_modified()
+        window.on_apply_clicked()
+        assert canvases and not any(canvas.has_unsaved_changes for canvas in canvases)
+        assert not window.ini_manager.has_unsaved_changes() and not plugin_manager.has_unsaved_changes()
+        reloaded = INIManager(plugin_path)
+        assert reloaded.load_ini()
+        assert reloaded.current_sections['Performance'].parameters['threadcount'] == '6'
+
+        # Tab edit drops only the edited section from the search pool
+        window.apply_search_results('thread', {'Performance': ['threadcount']})
+        pool = dict(window._search_pool)
+        assert set(pool) == {'Performance', 'Security'}
+        window.on_search_cleared()
+        window.on_parameter_changed('threadcount', '3', ('3dsMax.ini', 'Performance', 'threadcount'))
+        assert set(window._search_pool) == {'Security'}
+        window.apply_search_results('thread', {'Performance': ['threadcount']})
+        assert window._search_pool['Security'] is pool['Security']
+        assert window._search_pool['Performance'] is not pool['Performance']
+        window.on_search_cleared()
+
+        # Revert drops pooled canvases built from edited values, apply marks pool saved
+        window.on_revert_clicked()
+        assert not window.ini_manager.has_unsaved_changes()
+        assert set(window._search_pool) == {'Security'}
+        window._search_pool['Security'].mark_as_modified()
+        window.ini_manager.update_parameter('Security', 'safescenescriptexecutionenabled', '1')
+        window.on_apply_clicked()
+        assert not window._search_pool['Security'].has_unsaved_changes
+
+        editor_session.close_session()
+        assert editor_session.get_editor() is None
+    finally:
+        os.environ['HOME'] = home
+        logging.getLogger(PACKAGE_LOGGER).handlers = handlers  # Window configured logging into temp HOME
+    print("[OK] Editor window is resident")
+
+
+if __name__ == "__main__":
+    test_ini_manager_detects_disk_changes()
+    test_show_editor_reuses_window()
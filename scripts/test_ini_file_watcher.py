@@ -0,0 +1,116 @@
+"""Test live reload of INI files: debounced watcher, polling fallback, merge with unsaved edits."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+from src.modules.ini_manager import INIManager
+from src.ui.ini_file_watcher import INIFileWatcher, is_network_path
+
+app = QApplication.instance() or QApplication([])
+
+
+def write_ini(path: Path, threads: str, safe: str = '1', mtime_shift_s: int = 0):
+    """Write small UTF-16 3dsMax.ini (mtime shifted for coarse filesystem clocks)."""
+    with open(path, 'w', encoding='utf-16-le') as f:
+        f.write(f'\ufeff[Performance]\nThreadCount={threads}\n\n[Security]\nSafeSceneScriptExecutionEnabled={safe}\n')
+    if mtime_shift_s:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_shift_s * 1_000_000_000))
+
+
+def wait_for_signal(signal, timeout_ms: int = 3000) -> list:
+    """Run event loop until signal fires (or timeout), get emitted values."""
+    received = []
+    loop = QEventLoop()
+    signal.connect(lambda value: (received.append(value), loop.quit()))
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    return received
+
+
+def test_merge_keeps_unsaved_edits():
+    """Untouched keys take disk values, edits are kept, edits changed on disk are conflicts."""
+    ini_path = Path(tempfile.mkdtemp()) / '3dsMax.ini'
+    write_ini(ini_path, '8')
+    manager = INIManager(ini_path)
+    assert manager.load_ini()
+
+    # Edit of a key unchanged on disk: kept, still unsaved
+    manager.update_parameter('Performance', 'threadcount', '16')
+    write_ini(ini_path, '8', safe='0', mtime_shift_s=2)
+    result = manager.merge_from_disk()
+    assert result.conflicts == [] and result.changed_sections == {'Security'}
+    assert manager.current_sections['Performance'].parameters['threadcount'] == '16'
+    assert manager.current_sections['Security'].parameters['safescenescriptexecutionenabled'] == '0'
+    assert manager.has_unsaved_changes() and not manager.is_changed_on_disk()
+
+    # Same key changed on disk to another value: edit kept, conflict reported
+    write_ini(ini_path, '4', safe='0', mtime_shift_s=4)
+    result = manager.merge_from_disk()
+    assert [(c.section, c.key, c.local_value, c.disk_value) for c in result.conflicts] == \
+        [('Performance', 'threadcount', '16', '4')]
+    assert result.changed_sections == set()
+    assert manager.current_sections['Performance'].parameters['threadcount'] == '16'
+
+    # Disk caught up with the edit: no longer unsaved
+    write_ini(ini_path, '16', safe='0', mtime_shift_s=6)
+    result = manager.merge_from_disk()
+    assert result.conflicts == [] and not manager.has_unsaved_changes()
+    print("[OK] External changes merged with unsaved edits")
+
+
+def test_watcher_debounces_writes():
+    """A burst of writes gives one files_changed; watch survives save via rename."""
+    folder = Path(tempfile.mkdtemp())
+    ini_path = folder / '3dsMax.ini'
+    write_ini(ini_path, '8')
+    watcher = INIFileWatcher(force_polling=False)
+    watcher.set_paths([ini_path])
+    assert watcher.watched_paths() == [ini_path] and not watcher.is_polled(ini_path)
+
+    emitted = []
+    watcher.files_changed.connect(emitted.append)
+    for threads in ('1', '2', '3'):
+        write_ini(ini_path, threads)
+    assert wait_for_signal(watcher.files_changed) == [[ini_path]]
+    app.processEvents()
+    assert emitted == [[ini_path]]
+
+    # Editors save to temp file and rename it over the watched one
+    temp_path = folder / '3dsMax.ini.tmp'
+    write_ini(temp_path, '5')
+    os.replace(temp_path, ini_path)
+    assert wait_for_signal(watcher.files_changed) == [[ini_path]]
+    assert ini_path in watcher.watched_paths()
+    watcher.clear()
+    print("[OK] Watcher debounces writes")
+
+
+def test_watcher_polling_fallback():
+    """Polled files (network profiles) are reported by stamp change."""
+    ini_path = Path(tempfile.mkdtemp()) / '3dsMax.ini'
+    write_ini(ini_path, '8')
+    watcher = INIFileWatcher(force_polling=True, poll_interval_ms=20)
+    watcher.set_paths([ini_path])
+    assert watcher.is_polled(ini_path)
+
+    write_ini(ini_path, '12', mtime_shift_s=2)
+    assert wait_for_signal(watcher.files_changed) == [[ini_path]]
+    assert is_network_path(Path('//server/profiles/3dsMax.ini'))
+    assert not is_network_path(ini_path)
+    watcher.clear()
+    print("[OK] Polling fallback")
+
+
+if __name__ == "__main__":
+    test_merge_keeps_unsaved_edits()
+    test_watcher_debounces_writes()
+    test_watcher_polling_fallback()
@@ -0,0 +1,69 @@
+"""Test cached, write-coalescing LayoutStorage."""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ui.layout_storage import LayoutStorage
+
+
+def make_storage(write_delay: float = 60.0) -> LayoutStorage:
+    """Storage in fresh temp dir (long delay - writes only on flush)."""
+    return LayoutStorage(Path(tempfile.mkdtemp()) / "canvas_layout.json", write_delay=write_delay)
+
+
+def test_saves_are_batched():
+    """Many saves make one atomic write on flush, no temp files left."""
+    storage = make_storage()
+    for i in range(50):
+        storage.save_layout({'Security': {'row': i, 'col': 0, 'span': 1}}, 'Security_layout')
+
+    assert not storage.storage_path.exists()
+    assert storage.has_pending_writes
+    assert storage.flush()
+    assert not storage.has_pending_writes
+
+    saved = json.loads(storage.storage_path.read_text(encoding='utf-8'))
+    assert saved['Security_layout']['data']['Security']['row'] == 49
+    assert [p.name for p in storage.storage_path.parent.iterdir()] == ['canvas_layout.json']
+    print("[OK] Saves batched into one atomic write")
+
+
+def test_background_write():
+    """Batch timer writes without explicit flush."""
+    storage = make_storage(write_delay=0.05)
+    storage.save_layout({'A': {'row': 0, 'col': 1, 'span': 2}})
+
+    deadline = time.time() + 5
+    while storage.has_pending_writes and time.time() < deadline:
+        time.sleep(0.01)
+    assert not storage.has_pending_writes
+
+    reloaded = LayoutStorage(storage.storage_path)
+    assert reloaded.load_layout() == {'A': {'row': 0, 'col': 1, 'span': 2}}
+    print("[OK] Background timer writes batch")
+
+
+def test_file_read_once():
+    """Layouts are served from memory after first read."""
+    storage = make_storage()
+    storage.storage_path.write_text(json.dumps({'default': {'data': {'A': {}}}}), encoding='utf-8')
+
+    assert storage.load_layout() == {'A': {}}
+    storage.storage_path.write_text('{ corrupt', encoding='utf-8')
+    assert storage.load_layout() == {'A': {}}
+    assert storage.has_saved_layout('default')
+
+    assert storage.delete_layout('default')
+    assert storage.flush()
+    assert json.loads(storage.storage_path.read_text(encoding='utf-8')) == {}
+    print("[OK] File read once, cache written back")
+
+
+if __name__ == "__main__":
+    test_saves_are_batched()
+    test_background_write()
+    test_file_read_once()
@@ -0,0 +1,66 @@
+"""Test level-gated, queued file logging."""
+
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core import logger as core_logger
+from src.core.logger import setup_logging, set_level, get_level
+
+
+class Counted:
+    """Argument that counts how often it is formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return 'counted'
+
+
+def wait_for(path: Path, text: str) -> bool:
+    """Wait until background listener wrote text."""
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        if path.exists() and text in path.read_text(encoding='utf-8'):
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_queued_file_logging():
+    """Records reach rotating file, debug is gated and never formatted when off."""
+    log_file = Path(tempfile.mkdtemp()) / 'maxmanager.log'
+    assert setup_logging(level='INFO', log_file=log_file, console_level=None) == log_file
+    assert setup_logging(level='INFO', log_file=log_file, console_level=None) == log_file  # Idempotent
+
+    logger = logging.getLogger('src.ui.some_widget')
+    arg = Counted()
+    logger.debug("Debug %s", arg)
+    logger.info("Tab switched to %s", 'Security')
+    assert wait_for(log_file, 'Tab switched to Security')
+    assert arg.formatted == 0
+    assert 'Debug' not in log_file.read_text(encoding='utf-8')
+
+    set_level('DEBUG')
+    try:
+        assert get_level() == logging.DEBUG
+        logging.getLogger('src.ui.other_widget').debug("Placed %d canvases", 3)
+        assert wait_for(log_file, 'Placed 3 canvases')
+    finally:
+        set_level(core_logger.DEFAULT_LEVEL)
+
+    handlers = logging.getLogger('src').handlers
+    assert sum(isinstance(h, logging.handlers.QueueHandler) for h in handlers) == 1
+    for name in ('ui', 'data', 'modules', 'utils', 'core', 'i18n'):  # Other tools in 3ds Max may use these
+        foreign = logging.getLogger(name)
+        assert foreign.handlers == [] and foreign.propagate and foreign.level == logging.NOTSET
+    print("[OK] Queued, level-gated file logging")
+
+
+if __name__ == "__main__":
+    test_queued_file_logging()
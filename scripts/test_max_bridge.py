@@ -0,0 +1,64 @@
+"""Test batched pymxs bridge against mock 3ds Max runtime."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.modules.max_bridge import IniOp, MaxBridge, MockMaxRuntime, build_batch_script
+
+
+def test_batch_is_one_round_trip():
+    """50-key preset is written and read back in one evaluation each."""
+    runtime = MockMaxRuntime()
+    bridge = MaxBridge(runtime)
+    preset = [('Performance', f'Key{i}', i) for i in range(50)]
+
+    written = bridge.write(preset, refresh=True)
+    assert all(written.values()) and len(written) == 50
+    assert bridge.round_trips == 1 and runtime.refresh_count == 1
+
+    values = bridge.read((section, key) for section, key, _ in preset)
+    assert bridge.round_trips == 2
+    assert values[('Performance', 'Key7')] == '7'
+    print("[OK] One round-trip per batch")
+
+
+def test_batch_results_and_failures():
+    """Results follow operation order; failing key does not abort the batch."""
+    runtime = MockMaxRuntime({('Renderer', 'ThreadCount'): '8'})
+    runtime.fail_keys.add(('Security', 'Broken'))
+    bridge = MaxBridge(runtime)
+
+    path = 'C:\\Max "2025"\\scripts'
+    results = bridge.execute([
+        IniOp('renderer', 'threadcount'),  # Case-insensitive like 3ds Max
+        IniOp('Security', 'Broken'),
+        IniOp('Directories', 'Scripts', path),
+        IniOp('Directories', 'Scripts'),
+        IniOp('Missing', 'Key'),
+    ])
+    assert results == ['8', None, True, path, '']
+    assert bridge.write([('Security', 'Broken', '1')]) == {('Security', 'Broken'): False}
+    print("[OK] Batch results and failures")
+
+
+def test_script_and_unavailable_runtime():
+    """Script targets session INI unless file given; no runtime raises."""
+    script = build_batch_script([IniOp('A', 'B')])
+    assert 'getMAXIniFile()' in script and 'refreshSystem' not in script
+    assert '"D:\\\\profiles\\\\3dsMax.ini"' in build_batch_script([IniOp('A', 'B')], ini_file='D:\\profiles\\3dsMax.ini')
+
+    bridge = MaxBridge(runtime=None)
+    if not bridge.available:  # Outside 3ds Max
+        try:
+            bridge.read([('A', 'B')])
+            assert False, "RuntimeError expected"
+        except RuntimeError:
+            pass
+    print("[OK] Script and unavailable runtime")
+
+
+if __name__ == "__main__":
+    test_batch_is_one_round_trip()
+    test_batch_results_and_failures()
+    test_script_and_unavailable_runtime()
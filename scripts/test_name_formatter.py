@@ -0,0 +1,71 @@
+"""Test cached parameter name formatting (name_formatter)."""
+
+import re
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.name_formatter import (
+    ACRONYMS, FORMAT_CACHE_SIZE, camel_case_split, format_many, format_parameter_name, get_short_name
+)
+
+
+NAMES = [
+    'ThreadCount', 'UseGPU', 'HDAOEnabled', 'MaxUIScale', 'CPUAffinity', 'ExportXMLFile',
+    'safescenescriptexecutionenabled', 'DisplayGamma', 'Enabled', '  PadDisabled  ', 'useRAMCache',
+]
+
+
+def reference_split(text: str) -> str:
+    """Straightforward acronym loop (original behavior)."""
+    text = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1 \2', text)
+    text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
+    words = []
+    for word in text.split():
+        if word.upper() in ['GPU', 'UI', 'CPU', 'RAM', 'API', 'URL', 'HTTP', 'FTP',
+                            'MAX', 'INI', 'EXE', 'DLL', 'XML', 'JSON', 'HDAO']:
+            words.append(word.upper())
+        else:
+            words.append(word.capitalize())
+    return ' '.join(words)
+
+
+def test_acronyms_match_original():
+    """Precompiled patterns and ACRONYMS set format names as before."""
+    assert isinstance(ACRONYMS, frozenset) and 'GPU' in ACRONYMS and 'Gpu' not in ACRONYMS
+    for name in NAMES:
+        assert camel_case_split(name) == reference_split(name), name
+    assert camel_case_split('UseGPU') == 'Use GPU'
+    assert format_parameter_name('HDAOEnabled') == 'HDAO'
+    assert format_parameter_name('Enabled') == 'Enabled'  # Nothing left - raw name
+    print("[OK] Acronyms formatted as before")
+
+
+def test_format_many():
+    """Batch formatting equals per-name formatting."""
+    assert format_many(NAMES) == {name: format_parameter_name(name) for name in NAMES}
+    assert format_many(iter(['ThreadCount'])) == {'ThreadCount': 'Thread Count'}
+    assert format_many([]) == {}
+    print("[OK] format_many")
+
+
+def test_short_name_cached():
+    """Repeated names are served from bounded caches."""
+    format_parameter_name.cache_clear()
+    get_short_name.cache_clear()
+    long_name = 'EmbeddedMaxscriptSystemCommandsExecutionBlocked'
+
+    short = get_short_name(long_name, 30)
+    assert len(short) == 30 and short.endswith('...')
+    assert get_short_name('ThreadCount') == 'Thread Count'
+    assert get_short_name(long_name, 30) is short
+    info = get_short_name.cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (1, 2, FORMAT_CACHE_SIZE)
+    assert format_parameter_name.cache_info().maxsize == FORMAT_CACHE_SIZE
+    print("[OK] Short names cached")
+
+
+if __name__ == "__main__":
+    test_acronyms_match_original()
+    test_format_many()
+    test_short_name_cached()
@@ -0,0 +1,111 @@
+"""Test pure-Python packing engine (spans, pinned columns, column changes)."""
+
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ui.packing_engine import PackingEngine, PackItem, best_column, next_slot
+
+
+def test_best_column():
+    """Lowest window under span wins, first one on ties."""
+    assert best_column([30, 10, 10, 20], 1) == (1, 10)
+    assert best_column([30, 10, 10, 20], 2) == (1, 10)
+    assert best_column([30, 10, 40, 20], 2) == (0, 30)
+    assert best_column([5, 5], 4) == (0, 5)  # Span clamped to columns
+    print("[OK] best_column")
+
+
+def test_pinned_and_auto_items():
+    """Pinned items stack in their column by row, auto items fill lowest column."""
+    engine = PackingEngine(columns=2, spacing=10, margin=10)
+    placements = engine.pack([
+        PackItem('B', 50, col=0, row=1),
+        PackItem('A', 100, col=0, row=0),
+        PackItem('C', 30, col=1),
+        PackItem('Wide', 20, span=2),
+        PackItem('Auto', 40),
+    ], width=430)
+
+    assert engine.col_width == 200
+    assert (placements['A'].x, placements['A'].y) == (10, 10)
+    assert (placements['B'].x, placements['B'].y) == (10, 120)
+    assert (placements['C'].x, placements['C'].y) == (220, 10)
+    assert (placements['Wide'].y, placements['Wide'].width) == (180, 410)  # Below tallest column
+    assert (placements['Auto'].col, placements['Auto'].y) == (0, 210)
+    assert engine.total_height == 250
+    assert engine.find_overlaps() == []
+    print("[OK] Pinned and auto items")
+
+
+def test_column_change_keeps_items_inside():
+    """Pinned columns beyond new column count wrap, spans are clamped."""
+    engine = PackingEngine(columns=4)
+    items = [PackItem(f"P{i}", 10 + i, span=1 + i % 3, col=i % 4, row=i // 4) for i in range(20)]
+    engine.pack(items, width=1900)
+
+    engine.set_columns(2)
+    placements = engine.pack(items, width=1000)
+    for placement in placements.values():
+        assert placement.col + placement.span <= 2
+    assert engine.find_overlaps() == []
+    print("[OK] Column change")
+
+
+def test_repack_from_matches_full_pack():
+    """Incremental repack gives the same placements as packing from scratch."""
+    rng = random.Random(1)
+    items = [PackItem(f"P{i:03d}", rng.randint(40, 400), rng.choice((1, 1, 2)), rng.randrange(3), i)
+             for i in range(200)]
+    engine = PackingEngine(columns=3)
+    engine.pack(items, width=1500)
+
+    for item_id in ('P150', 'P007', 'P199'):
+        placed = engine.repack_from(item_id, height=40, span=2)
+        assert placed[0] == item_id
+        incremental = dict(engine.placements)
+        engine.pack(engine.items, width=1500)
+        assert engine.placements == incremental
+    assert engine.find_overlaps() == []
+    print("[OK] repack_from matches full pack")
+
+
+def test_next_slot():
+    """New panels go to the column window with fewest panels."""
+    assert next_slot([], 4, 1) == (0, 0)
+    items = [PackItem('A', 10, span=2, col=0), PackItem('B', 10, col=2), PackItem('Auto', 10)]
+    assert next_slot(items, 4, 1) == (0, 3)
+    assert next_slot(items, 4, 2) == (1, 0)
+    print("[OK] next_slot")
+
+
+def test_drop_slot_and_pin():
+    """Drop inserts before/after panel under cursor or at top of column; pin pushes column down."""
+    engine = PackingEngine(columns=2, spacing=10, margin=10)
+    engine.pack([
+        PackItem('A', 100, col=0, row=0),
+        PackItem('B', 50, col=0, row=1),
+        PackItem('C', 30, col=1, row=0),
+    ], width=430)
+
+    assert [engine.column_at(x) for x in (0, 215, 220, 1000)] == [0, 0, 1, 1]
+    assert engine.drop_slot(50, 20) == (0, 0)  # Upper half of A
+    assert engine.drop_slot(50, 100) == (0, 1)  # Lower half of A
+    assert engine.drop_slot(300, 200) == (1, 0)  # Empty space
+    assert engine.drop_slot(50, 130, 'B') == (0, 0)  # Dragged panel ignored
+
+    placements = engine.pin('C', 0, 1)
+    assert [(item.item_id, item.col, item.row) for item in engine.items] == [('A', 0, 0), ('C', 0, 1), ('B', 0, 2)]
+    assert (placements['C'].y, placements['B'].y) == (120, 160)
+    assert engine.find_overlaps() == []
+    print("[OK] drop_slot and pin")
+
+
+if __name__ == "__main__":
+    test_best_column()
+    test_pinned_and_auto_items()
+    test_column_change_keeps_items_inside()
+    test_repack_from_matches_full_pack()
+    test_next_slot()
+    test_drop_slot_and_pin()
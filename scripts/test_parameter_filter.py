@@ -0,0 +1,60 @@
+"""Test single-regex technical parameter filter."""
+
+import re
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.database_loader import ParameterDatabase
+from src.utils.parameter_filter import HIDDEN_PATTERNS, filter_parameters, hidden_mask, is_technical_parameter
+
+
+SAMPLE_NAMES = [
+    'Dimension', 'dimension2', 'Position', 'place', 'MainWindow', 'MainWindowState',
+    'RenderDialogPosition', 'dialogposition', 'MatEditorWindowPosition', 'WindowPositionX',
+    'MagWindow0', 'magwindow12', 'MagWindow', 'ATSPosProto', 'ATSColumnPositions', 'XfmTypeInPos',
+    'ModSetEntry3', 'ModSetEntry', 'Vert0', 'vert15', 'Vertex1', 'ThreadCount', 'UseGPU', '',
+]
+
+
+def reference_is_technical(param_name: str) -> bool:
+    """Pattern-by-pattern loop (original behavior)."""
+    return any(re.match(pattern, param_name.lower()) for pattern in HIDDEN_PATTERNS)
+
+
+def all_names() -> list:
+    """Sample names plus every key name of the parameter database."""
+    db = ParameterDatabase()
+    assert db.load()
+    return SAMPLE_NAMES + [name.rpartition('.')[2] for name in db.parameters]
+
+
+def test_combined_regex_matches_patterns():
+    """Merged regex hides exactly the names the pattern list hides."""
+    names = all_names()
+    hidden = {name for name in names if is_technical_parameter(name)}
+    assert hidden == {name for name in names if reference_is_technical(name)}
+    assert {'Dimension', 'MagWindow0', 'ModSetEntry3', 'vert15', 'RenderDialogPosition'} <= hidden
+    assert not hidden & {'dimension2', 'MainWindowState', 'MagWindow', 'Vertex1', 'ThreadCount'}
+    print(f"[OK] Combined regex matches {len(HIDDEN_PATTERNS)} patterns on {len(names)} names")
+
+
+def test_hidden_mask_and_filter():
+    """Mask bits follow name order; nothing hidden returns the same dict."""
+    assert hidden_mask(['ThreadCount', 'Position', 'UseGPU', 'Vert1']) == 0b1010
+    assert hidden_mask([]) == 0
+
+    parameters = {'ThreadCount': '8', 'UseGPU': '1'}
+    assert filter_parameters(parameters) is parameters
+
+    parameters = {'ThreadCount': '8', 'Position': '0 0', 'UseGPU': '1', 'Vert1': 'x'}
+    filtered = filter_parameters(parameters)
+    assert filtered == {'ThreadCount': '8', 'UseGPU': '1'}
+    assert list(filtered) == ['ThreadCount', 'UseGPU']
+    assert len(parameters) == 4  # Input not modified
+    print("[OK] Hidden mask and filter")
+
+
+if __name__ == "__main__":
+    test_combined_regex_matches_patterns()
+    test_hidden_mask_and_filter()
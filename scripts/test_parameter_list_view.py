@@ -0,0 +1,119 @@
+"""Test virtualized ParameterListModel (values, modified state, revert)."""
+
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent, Qt
+from PySide6.QtWidgets import QApplication, QLineEdit, QWidget
+
+from src.ui.parameter_list_view import ParameterItemDelegate, ParameterListModel, ParameterListView
+
+app = QApplication.instance() or QApplication([])
+
+
+def test_model_types_and_edits():
+    """Rows get detected types, edits emit value/modified signals."""
+    model = ParameterListModel({
+        'UseGPU': '1',
+        'ThreadCount': '8',
+        'Gamma': '2.2',
+        'Extra': {'value': '0', 'available': True, 'data': {}},
+    })
+
+    assert model.rowCount() == 4
+    assert model.data(model.index_of('UseGPU'), ParameterListModel.TypeRole) == 'boolean'
+    assert model.data(model.index_of('ThreadCount'), ParameterListModel.TypeRole) == 'integer'
+    assert model.data(model.index_of('Gamma'), ParameterListModel.TypeRole) == 'float'
+
+    # Available (database) rows are read-only
+    assert not (model.flags(model.index_of('Extra')) & Qt.ItemIsEditable)
+
+    changes = []
+    modified_states = []
+    model.value_changed.connect(lambda name, value: changes.append((name, value)))
+    model.modified_state_changed.connect(modified_states.append)
+
+    model.setData(model.index_of('ThreadCount'), '16', ParameterListModel.ValueRole)
+    assert changes == [('ThreadCount', '16')]
+    assert modified_states == [True]
+    assert model.data(model.index_of('ThreadCount'), ParameterListModel.ModifiedRole)
+
+    model.reset_row(model.index_of('ThreadCount').row())
+    assert modified_states == [True, False]
+    assert model.data(model.index_of('ThreadCount'), ParameterListModel.ValueRole) == '8'
+    print("[OK] Model edits and revert")
+
+
+def test_view_visible_set():
+    """Search filtering hides rows without creating widgets."""
+    view = ParameterListView({f'Param{i}': str(i) for i in range(50)})
+
+    assert view.apply_visible_set({'Param1', 'Param2'}) == 2
+    assert view.apply_visible_set(None) == 50
+    assert view.apply_visible_set(set()) == 0
+    assert view.isHidden()
+    print("[OK] View visible set")
+
+
+def test_delegate_non_numeric_values():
+    """Numeric keys with hand-edited non-numeric values get a text editor."""
+    model = ParameterListModel(
+        {'ThreadCount': 'auto', 'Gamma': '2.2', 'Scale': '1.5'},
+        param_types={'ThreadCount': 'integer', 'Gamma': 'float', 'Scale': 'integer'},
+    )
+    delegate = ParameterItemDelegate()
+    parent = QWidget()
+
+    for name in ('ThreadCount', 'Scale'):
+        index = model.index_of(name)
+        editor = delegate.createEditor(parent, None, index)
+        assert type(editor) is QLineEdit and editor.property('param_type') == 'string'
+        delegate.setEditorData(editor, index)
+        assert editor.text() == model.data(index, ParameterListModel.ValueRole)
+        delegate.setModelData(editor, model, index)
+
+    index = model.index_of('Gamma')
+    editor = delegate.createEditor(parent, None, index)
+    assert editor.property('param_type') == 'float'
+    model.setData(index, 'off', ParameterListModel.ValueRole)
+    delegate.setEditorData(editor, index)  # Value changed to non-number: no exception
+    assert editor.value() == 2.2
+    print("[OK] Delegate handles non-numeric values")
+
+
+def open_editor_rows(view: ParameterListView) -> list:
+    return [row for row in range(view.list_model.rowCount())
+            if view.isPersistentEditorOpen(view.list_model.index(row))]
+
+
+def test_focused_editors_closed_on_focus_out():
+    """Moving through focused rows keeps at most hovered + focused editor open."""
+    view = ParameterListView({f'Param{i}': str(i) for i in range(10)})
+    view.show()
+    view.activateWindow()
+    for row in range(5):
+        index = view.list_model.index(row)
+        view._on_row_entered(index)
+        view.indexWidget(index).setFocus()
+        app.processEvents()
+        assert len(open_editor_rows(view)) <= 2, open_editor_rows(view)
+
+    view._on_row_entered(view.list_model.index(7))
+    assert open_editor_rows(view) == [4, 7]  # Row 4 still focused
+    view.setFocus()
+    app.processEvents()
+    assert open_editor_rows(view) == [7]
+    view.leaveEvent(QEvent(QEvent.Leave))
+    assert open_editor_rows(view) == []
+    print("[OK] Focused editors closed")
+
+
+if __name__ == "__main__":
+    test_model_types_and_edits()
+    test_view_visible_set()
+    test_delegate_non_numeric_values()
+    test_focused_editors_closed_on_focus_out()
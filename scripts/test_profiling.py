@@ -0,0 +1,91 @@
+"""Test hot-path timers, rolling stats and Chrome trace export."""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QWidget
+
+from src.core.profiling import Profiler, percentile
+from src.ui.timing_overlay import TimingOverlay
+
+
+def test_timers_and_stats():
+    """Context manager and decorator feed rolling percentiles."""
+    profiler = Profiler(window=10)
+
+    @profiler.timer('ini.load')
+    def load(delay):
+        time.sleep(delay)
+        return 'loaded'
+
+    assert load(0) == 'loaded'
+    assert load.__name__ == 'load'
+    for _ in range(20):
+        with profiler.timer('layout.rebuild'):
+            pass
+
+    stats = profiler.stats()
+    assert list(stats) == ['ini.load', 'layout.rebuild']
+    assert stats['ini.load'].count == 1
+    assert stats['layout.rebuild'].count == 20  # All calls counted, percentiles over window
+    assert 0 <= stats['layout.rebuild'].p50_ms <= stats['layout.rebuild'].p95_ms <= stats['layout.rebuild'].max_ms
+
+    assert percentile([1, 2, 3, 4], 0.5) == 2
+    assert percentile(list(range(1, 101)), 0.95) == 95
+
+    profiler.enabled = False
+    load(0)
+    assert profiler.stats()['ini.load'].count == 1
+    print("[OK] Timers feed rolling stats")
+
+
+def test_chrome_trace_export():
+    """Trace is a list of complete events in microseconds."""
+    profiler = Profiler()
+    with profiler.timer('search.global'):
+        time.sleep(0.002)
+
+    path = Path(tempfile.mkdtemp()) / 'trace.json'
+    assert profiler.export_chrome_trace(path) == 1
+    trace = json.loads(path.read_text(encoding='utf-8'))
+    event = trace['traceEvents'][0]
+    assert event['name'] == 'search.global' and event['cat'] == 'search' and event['ph'] == 'X'
+    assert event['dur'] >= 2000
+
+    profiler.reset()
+    assert profiler.stats() == {} and profiler.chrome_trace()['traceEvents'] == []
+    print("[OK] Chrome trace export")
+
+
+def test_overlay_shows_stats():
+    """Overlay lists timers while visible."""
+    QApplication.instance() or QApplication([])
+    profiler = Profiler()
+    with profiler.timer('canvas.load_panels'):
+        pass
+
+    parent = QWidget()
+    parent.resize(800, 600)
+    overlay = TimingOverlay(parent, profiler)
+    parent.show()
+    assert not overlay.isVisible()
+    overlay.toggle()
+    assert overlay.isVisible()
+    assert 'canvas.load_panels' in overlay.table_label.text()
+    overlay.toggle()
+    assert not overlay._timer.isActive()
+    parent.close()
+    print("[OK] Overlay shows stats")
+
+
+if __name__ == "__main__":
+    test_timers_and_stats()
+    test_chrome_trace_export()
+    test_overlay_shows_stats()
@@ -0,0 +1,63 @@
+"""Test frame-throttled value signalling of scrubby spin boxes."""
+
+import os
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from src.ui.ini_parameter_widget import ScrubbyIntSpinBox, ScrubbyFloatSpinBox, FRAME_INTERVAL_MS
+
+app = QApplication.instance() or QApplication([])
+
+
+def wait_frame():
+    """Run event loop for a bit longer than one frame."""
+    deadline = time.perf_counter() + 3 * FRAME_INTERVAL_MS / 1000
+    while time.perf_counter() < deadline:
+        app.processEvents()
+
+
+def test_drag_emits_once_per_frame():
+    """Text follows every step, valueChanged carries only the latest value."""
+    for box, values in ((ScrubbyIntSpinBox(0), range(1, 51)), (ScrubbyFloatSpinBox(0.0), [v / 10 for v in range(1, 51)])):
+        emitted = []
+        box.valueChanged.connect(emitted.append)
+
+        for value in values:
+            box.setValue(value, throttled=True)
+        assert box.value() == values[-1]
+        assert float(box.text()) == values[-1]  # Visual feedback is immediate
+        assert emitted == []
+
+        wait_frame()
+        assert emitted == [values[-1]]
+    print("[OK] One valueChanged per frame while dragging")
+
+
+def test_release_commits_immediately():
+    """commit() (mouse release) delivers pending value without waiting for frame."""
+    box = ScrubbyIntSpinBox(0)
+    emitted = []
+    box.valueChanged.connect(emitted.append)
+
+    box.setValue(5, throttled=True)
+    box.commit()
+    assert emitted == [5]
+
+    wait_frame()
+    box.commit()
+    assert emitted == [5]  # Nothing left pending
+
+    box.setValue(7)
+    assert emitted == [5, 7]  # Typed/programmatic values are not throttled
+    print("[OK] Release commits pending value")
+
+
+if __name__ == "__main__":
+    test_drag_emits_once_per_frame()
+    test_release_commits_immediately()
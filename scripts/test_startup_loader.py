@@ -0,0 +1,56 @@
+"""Test deferred startup: lazy imports of editor window and background loading."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from check_import_time import LAZY_MODULES, TARGET_MODULE, run_importtime
+from src.ui.startup_loader import StartupLoader
+
+app = QApplication.instance() or QApplication([])
+
+
+def test_window_import_is_lazy():
+    """Icon fonts, pymxs and deferred-startup workers are not imported with the window module."""
+    times = run_importtime()
+    assert TARGET_MODULE in times
+    assert [name for name in LAZY_MODULES if name in times] == []
+    print("[OK] Window module imports lazily")
+
+
+def test_startup_loader_loads_in_background():
+    """INI and database arrive on GUI thread via finished signal."""
+    ini_path = Path(tempfile.mkdtemp()) / '3dsMax.ini'
+    with open(ini_path, 'w', encoding='utf-16-le') as f:
+        f.write('\ufeff[Performance]\nThreadCount=8\n\n[Security]\nSafeSceneScriptExecutionEnabled=1\n')
+
+    received = []
+    loader = StartupLoader()
+    loader.finished.connect(received.append)
+    loader.start(ini_path, find_plugins=False)
+    assert loader.is_running
+    loader.wait()
+
+    assert len(received) == 1 and not loader.is_running
+    data = received[0]
+    assert set(data.ini_manager.current_sections) == {'Performance', 'Security'}
+    assert data.database.total_parameters > 0
+    assert data.plugin_ini_managers == {}
+
+    # Missing INI: mock data, still finishes
+    loader.start(ini_path.parent / 'missing.ini', find_plugins=False)
+    loader.wait()
+    assert received[1].ini_manager is None
+    print("[OK] Startup data loaded in background")
+
+
+if __name__ == "__main__":
+    test_window_import_is_lazy()
+    test_startup_loader_loads_in_background()
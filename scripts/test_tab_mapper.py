@@ -0,0 +1,67 @@
+"""Test compiled tab classifier in tab_mapper."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.tab_mapper import (
+    TAB_KEYWORDS, PATH_SUFFIXES, get_tab_for_section, build_tab_index, get_dynamic_tabs
+)
+
+
+def reference_tab_for_section(section_name: str, ini_file: str = '3dsmax.ini') -> str:
+    """Straightforward keyword loop (original behavior)."""
+    if ini_file != '3dsmax.ini':
+        return 'Plugins'
+    section_lower = section_name.lower()
+    for tab_name, keywords in TAB_KEYWORDS.items():
+        if any(kw in section_lower for kw in keywords):
+            return tab_name
+    if any(suffix in section_lower for suffix in PATH_SUFFIXES):
+        return 'Paths'
+    return 'Advanced'
+
+
+def test_classifier_matches_reference():
+    """Compiled matcher gives same tabs as keyword loop."""
+    print("=" * 50)
+    print("TEST: Classifier vs reference")
+    print("=" * 50)
+
+    sections = [
+        'Security', 'Performance', 'Renderer', 'Material Editor', 'BitmapDirs',
+        'Directories', 'Autobackup', 'CuiConfiguration', 'WindowState', 'LayerManager',
+        'NitrousDirs', 'SafeDirectories', 'LegacyPathSettings', 'OSLPaths', 'XRefDirs',
+        'ObjectSnapPerformance', 'SelectionSecurity', 'GammaDirsttrs', 'Viewports',
+    ]
+
+    for section in sections:
+        expected = reference_tab_for_section(section)
+        result = get_tab_for_section(section)
+        print(f"   {section:25} -> {result}")
+        assert result == expected, f"{section}: {result} != {expected}"
+
+    assert get_tab_for_section('Corona', 'corona.ini') == 'Plugins'
+    print("[OK] Compiled classifier matches reference")
+
+
+def test_tab_index():
+    """Tab index groups sections in original order."""
+    sections_by_ini = {
+        '3dsmax.ini': ['Security', 'BitmapDirs', 'Performance', 'Directories', 'Autobackup'],
+        'corona.ini': ['Corona'],
+    }
+
+    tab_index = build_tab_index(sections_by_ini)
+
+    assert tab_index['Paths'] == ['BitmapDirs', 'Directories']
+    assert tab_index['Plugins'] == ['Corona']
+    assert get_dynamic_tabs(sections_by_ini, tab_index) == [
+        'Security', 'Performance', 'Paths', 'Plugins', 'Advanced'
+    ]
+    print("[OK] Tab index built correctly")
+
+
+if __name__ == "__main__":
+    test_classifier_matches_reference()
+    test_tab_index()
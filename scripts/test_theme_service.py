@@ -0,0 +1,57 @@
+"""Test shared theme service (compiled stylesheet, icon cache, theme switch)."""
+
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import shiboken6
+from PySide6.QtWidgets import QApplication, QWidget
+
+from src.ui import theme_service
+from src.ui.theme_service import DARK_THEME, get_stylesheet, install_theme, set_theme, get_icon
+
+app = QApplication.instance() or QApplication([])
+
+
+def test_stylesheet_compiled_once():
+    """All palette names are substituted, same string is reused."""
+    sheet = get_stylesheet()
+
+    assert '$' not in sheet
+    assert DARK_THEME['accent'] in sheet
+    assert 'INIParameterWidget[available="true"] QLabel' in sheet
+    assert get_stylesheet() is sheet
+    print("[OK] Stylesheet compiled once")
+
+
+def test_set_theme_restyles_installed_targets():
+    """Theme switch recompiles sheet and re-applies it on installed targets."""
+    window = QWidget()
+    install_theme(window)
+
+    try:
+        set_theme({'accent': '#123456'})
+        assert '#123456' in window.styleSheet()
+    finally:
+        set_theme(DARK_THEME)
+
+    assert DARK_THEME['accent'] in window.styleSheet()
+    assert theme_service._targets[id(window)] is window
+    shiboken6.delete(window)  # Destroyed (closed) window is not kept alive
+    assert id(window) not in theme_service._targets
+    print("[OK] Theme switch re-applied stylesheet")
+
+
+def test_icons_shared():
+    """Same (glyph, color) returns the same icon object."""
+    assert get_icon('fa5s.undo', 'white') is get_icon('fa5s.undo', 'white')
+    print("[OK] Icons are shared")
+
+
+if __name__ == "__main__":
+    test_stylesheet_compiled_once()
+    test_set_theme_restyles_installed_targets()
+    test_icons_shared()
@@ -0,0 +1,86 @@
+"""Test translate-in-place engine (TranslationTable + LabelRegistry)."""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import shiboken6
+from PySide6.QtWidgets import QApplication, QLabel
+
+from src.data.database_loader import ParameterDatabase
+from src.modules.parameter_info_loader import ParameterInfoLoader
+from src.i18n.translation_table import KIND_NAME, KIND_HELP, KIND_SECTION, TranslationTable, LabelRegistry
+
+app = QApplication.instance() or QApplication([])
+
+
+def make_table() -> TranslationTable:
+    """Table over small parameter info file and section translations."""
+    info_file = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8')
+    json.dump({
+        'Performance.ThreadCount': {
+            'en': {'display_name': 'Thread Count', 'help_text': 'Number of threads'},
+            'ru': {'display_name': 'Количество потоков', 'help_text': 'Число потоков'},
+        },
+        'Security.SafeScript': {'en': {'display_name': 'Safe Script'}},
+        'Gamma.GammaValue': {'ru': {'help_text': 'Значение гаммы'}},
+        'GammaValue': {'ru': {'display_name': 'Гамма'}},  # Exact key without help text
+        'LegacyNote': 'not a parameter',
+    }, info_file)
+    info_file.close()
+
+    db = ParameterDatabase()
+    db.section_translations = {'Security': {'en': 'Security', 'ru': 'Безопасность'}}
+    db._loaded = True
+
+    return TranslationTable(ParameterInfoLoader(Path(info_file.name)), db)
+
+
+def test_table_lookups():
+    """Names/help/titles by language with the same fallbacks as widgets used."""
+    table = make_table()
+
+    assert table.display_name('threadcount', 'ru') == 'Количество потоков'  # Name after dot, any case
+    assert table.display_name('Performance.ThreadCount', 'en') == 'Thread Count'
+    assert table.display_name('SafeScript', 'ru') == 'Safe Script'  # English fallback
+    assert table.display_name('UseGPU', 'ru') == 'Use GPU'  # Formatted technical name
+    assert table.help_text('ThreadCount', 'ru') == 'Число потоков'
+    assert table.help_text('SafeScript', 'ru') == 'Parameter: SafeScript'
+    assert table.help_text('GammaValue', 'ru') == 'Значение гаммы'  # Short key after exact key
+    assert table.help_text('GammaValue', 'ru') == table.info_loader.get_help_text('GammaValue', 'ru')
+    assert table.display_name('LegacyNote', 'ru') == 'Legacy Note'  # Non-dict entry
+    assert table.section_title('Security', 'ru') == 'Безопасность'
+    assert table.section_title('Corona', 'ru') == 'Corona'
+    print("[OK] Translation table lookups")
+
+
+def test_registry_updates_bound_labels():
+    """apply() updates exactly the bound setters, destroyed owners are dropped."""
+    registry = LabelRegistry(make_table())
+
+    name_label = QLabel()
+    help_label = QLabel()
+    registry.bind(name_label, KIND_NAME, 'ThreadCount', name_label.setText)
+    registry.bind(name_label, KIND_HELP, 'ThreadCount', name_label.setToolTip)
+    registry.bind(help_label, KIND_SECTION, 'Security', help_label.setText)
+
+    assert registry.apply('ru') == 3
+    assert name_label.text() == 'Количество потоков'
+    assert name_label.toolTip() == 'Число потоков'
+    assert help_label.text() == 'Безопасность'
+
+    shiboken6.delete(help_label)  # C++ object destroyed (as when canvas is deleted)
+    assert len(registry) == 2
+    assert registry.apply('en') == 2
+    assert name_label.text() == 'Thread Count'
+    print("[OK] Registry updates bound labels")
+
+
+if __name__ == "__main__":
+    test_table_lookups()
+    test_registry_updates_bound_labels()
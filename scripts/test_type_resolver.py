@@ -0,0 +1,69 @@
+"""Test schema-driven parameter typing (TypeResolver)."""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.database_loader import ParameterDatabase
+from src.data.type_resolver import TypeResolver, infer_type
+
+
+def make_resolver() -> TypeResolver:
+    """Resolver over small in-memory database and rules file."""
+    db = ParameterDatabase()
+    db.parameters = {
+        'Performance.ThreadCount': {'type': 'int', 'section': 'Performance'},
+        'Security.SafeScript': {'type': 'boolean', 'section': 'Security'},
+        'Corona.DenoiserMode': {'type': 'int', 'section': 'System'},
+    }
+    db._loaded = True
+
+    rules_file = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8')
+    json.dump({'MemoryPool': {'type': 'INT'}, 'SAFE_PARAMETERS_ONLY': {'note': 'x'}}, rules_file)
+    rules_file.close()
+
+    return TypeResolver(database=db, rules_path=Path(rules_file.name))
+
+
+def test_declared_type_wins():
+    """Database/rules type is used even if value looks like something else."""
+    resolver = make_resolver()
+
+    assert infer_type('1') == 'boolean'
+    assert resolver.resolve('Performance', 'ThreadCount', '1') == 'integer'
+    assert resolver.resolve('performance', 'threadcount', '8') == 'integer'  # INI is case-insensitive
+    assert resolver.resolve('System', 'DenoiserMode', '1') == 'integer'
+    assert resolver.resolve('Corona', 'Corona.DenoiserMode', '1') == 'integer'  # Plugin tab full name
+    assert resolver.resolve('Memory', 'MemoryPool', '1') == 'integer'  # rules.json
+    print("[OK] Declared types win over inference")
+
+
+def test_type_stable_per_key():
+    """Widget type of a key doesn't change with its value."""
+    resolver = make_resolver()
+
+    assert resolver.resolve('Custom', 'Flag', '1') == 'boolean'
+    assert resolver.resolve('Custom', 'Flag', '0') == 'boolean'
+    assert resolver.resolve('Custom', 'Flag', '') == 'boolean'
+    assert resolver.resolve('Security', 'SafeScript', '0') == 'boolean'
+    print("[OK] Type memoized per (section, key)")
+
+
+def test_incompatible_value_falls_back():
+    """Value that doesn't fit the type is never forced into a numeric widget."""
+    resolver = make_resolver()
+
+    assert resolver.resolve('Performance', 'ThreadCount', 'auto') == 'string'
+    assert resolver.resolve('Performance', 'ThreadCount', '4') == 'integer'
+
+    assert resolver.resolve('Custom', 'Size', '10') == 'integer'
+    assert resolver.resolve('Custom', 'Size', '10.5') == 'float'  # Re-inferred after reload
+    print("[OK] Incompatible values fall back to inference")
+
+
+if __name__ == "__main__":
+    test_declared_type_wins()
+    test_type_stable_per_key()
+    test_incompatible_value_falls_back()
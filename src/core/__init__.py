@@ -0,0 +1,15 @@
+"""Core services for MaxManager."""
+
+from .logger import get_logger, setup_logging, get_level, set_level
+from .profiling import Profiler, TimingStats, get_profiler, timed
+
+__all__ = [
+    'get_logger',
+    'setup_logging',
+    'get_level',
+    'set_level',
+    'Profiler',
+    'TimingStats',
+    'get_profiler',
+    'timed'
+]
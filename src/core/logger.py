@@ -0,0 +1,118 @@
+"""
+Logging subsystem for MaxManager.
+
+Modules log through named loggers (logging.getLogger(__name__)); only
+the package logger 'src' is configured, once, by setup_logging(). Generic
+top-level names (ui, data, ...) are left alone: the 3ds Max interpreter
+is shared with other tools. Records go through
+a QueueHandler to a background QueueListener writing a rotating file, so
+logging never blocks the UI on disk or on the 3ds Max Listener. Debug
+output is off by default; enable it with MAXMANAGER_LOG_LEVEL=DEBUG or
+set_level('DEBUG').
+
+Usage:
+    logger = logging.getLogger(__name__)
+    logger.debug("Placed %d canvases", count)  # Formatted only if enabled
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+from pathlib import Path
+from typing import Optional, Union
+
+
+PACKAGE_LOGGER = 'src'  # Parent of all MaxManager module loggers ('src.ui.x')
+DEFAULT_LEVEL = logging.INFO
+LOG_FORMAT = '%(asctime)s %(levelname)-7s %(name)s: %(message)s'
+MAX_LOG_BYTES = 1024 * 1024  # Rotate at 1 MB
+LOG_BACKUP_COUNT = 3
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get named logger of module."""
+    return logging.getLogger(name)
+
+
+def default_log_file() -> Path:
+    """Default log file: ~/.maxmanager/logs/maxmanager.log"""
+    return Path.home() / '.maxmanager' / 'logs' / 'maxmanager.log'
+
+
+def _is_configured() -> bool:
+    """Check if package logger already has queue handler (survives module reload in Max)."""
+    return any(isinstance(handler, logging.handlers.QueueHandler)
+               for handler in logging.getLogger(PACKAGE_LOGGER).handlers)
+
+
+def setup_logging(level: Union[int, str, None] = None, log_file: Optional[Path] = None,
+                  console_level: Union[int, str, None] = logging.WARNING) -> Path:
+    """
+    Configure MaxManager package logger (idempotent).
+
+    Args:
+        level: Log level (default: MAXMANAGER_LOG_LEVEL env or INFO)
+        log_file: Rotating log file (default: ~/.maxmanager/logs/maxmanager.log)
+        console_level: Minimal level also printed to stderr (None = file only)
+
+    Returns:
+        Log file path
+    """
+    if level is None:
+        level = os.environ.get('MAXMANAGER_LOG_LEVEL', DEFAULT_LEVEL)
+    set_level(level)
+
+    log_file = Path(log_file) if log_file else default_log_file()
+    if _is_configured():
+        return log_file
+
+    handlers = []
+    try:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=MAX_LOG_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+        )
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(logging.handlers.QueueHandler(_start_listener(file_handler)))
+    except OSError as e:
+        print(f"[Logger] Can't open log file {log_file}: {e}")
+
+    if console_level is not None:
+        # Warnings and errors stay visible in Listener/console (rare - synchronous is fine)
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(console_level)
+        console_handler.setFormatter(logging.Formatter('[%(name)s] %(levelname)s: %(message)s'))
+        handlers.append(console_handler)
+
+    package_logger = logging.getLogger(PACKAGE_LOGGER)
+    package_logger.propagate = False  # Root logger may be configured for DEBUG by other tools
+    for handler in handlers:
+        package_logger.addHandler(handler)
+
+    logging.getLogger(__name__).info("Logging to %s (level %s)", log_file, logging.getLevelName(get_level()))
+    return log_file
+
+
+def _start_listener(handler: logging.Handler) -> queue.SimpleQueue:
+    """Start background thread writing queued records to handler."""
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Drains queue
+    return log_queue
+
+
+def get_level() -> int:
+    """Get current level of MaxManager loggers."""
+    return logging.getLogger(PACKAGE_LOGGER).level or DEFAULT_LEVEL
+
+
+def set_level(level: Union[int, str]):
+    """Set level of MaxManager loggers (e.g. 'DEBUG' while investigating)."""
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = DEFAULT_LEVEL
+    logging.getLogger(PACKAGE_LOGGER).setLevel(level)
@@ -3,10 +3,15 @@ Database loader for INI parameters.
 
 Loads and provides access to 844 parameters from ini_parameters_database.json
 """
+import logging
 import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from ..core.profiling import timed
+
+logger = logging.getLogger(__name__)
+
 class ParameterDatabase:
     """INI Parameters Database"""
     
@@ -22,6 +27,7 @@ class ParameterDatabase:
         self.section_translations: Dict[str, Dict[str, str]] = {}
         self._loaded = False
     
+    @timed('database.load')
     def load(self) -> bool:
         """Load database from JSON"""
         try:
@@ -38,13 +44,13 @@ class ParameterDatabase:
             # Load section translations if available
             self.section_translations = self.metadata.get('section_translations', {})
             
-            print(f"[DB] Loaded {len(self.parameters)} parameters from database")
+            logger.debug("[DB] Loaded %s parameters from database", len(self.parameters))
             if self.section_translations:
-                print(f"[DB] Loaded {len(self.section_translations)} section translations")
+                logger.debug("[DB] Loaded %s section translations", len(self.section_translations))
             return True
             
         except Exception as e:
-            print(f"[DB] ERROR loading database: {e}")
+            logger.error("[DB] ERROR loading database: %s", e)
             return False
     
     def get_parameter(self, name: str) -> Optional[Dict[str, Any]]:
@@ -3,7 +3,9 @@ Tab mapper - determines which tab a section belongs to.
 
 Maps INI sections to UI tabs based on keywords and patterns.
 """
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import Dict, List
 
 # Tab mapping rules
 TAB_KEYWORDS = {
@@ -17,10 +19,37 @@ TAB_KEYWORDS = {
 # Suffix patterns
 PATH_SUFFIXES = ['dirs', 'path', 'dirsttrs']
 
+# Logical tab order in header
+TAB_ORDER = ['Security', 'Performance', 'Rendering', 'Viewport', 'Paths', 'Plugins', 'Advanced']
 
+
+def _compile_matcher():
+    """
+    Compile all keywords into one regex.
+    
+    Alternatives are listed in priority order (TAB_KEYWORDS order, then
+    PATH_SUFFIXES). Lookahead finds overlapping matches, so the best
+    priority over all matches gives the same result as checking tabs one by one.
+    """
+    priorities = {}  # keyword -> (priority, tab)
+    for priority, (tab_name, keywords) in enumerate(TAB_KEYWORDS.items()):
+        for kw in keywords:
+            priorities.setdefault(kw, (priority, tab_name))
+    for suffix in PATH_SUFFIXES:
+        priorities.setdefault(suffix, (len(TAB_KEYWORDS), 'Paths'))
+    
+    ordered = sorted(priorities, key=lambda kw: priorities[kw][0])
+    pattern = re.compile('(?=(' + '|'.join(re.escape(kw) for kw in ordered) + '))')
+    return pattern, priorities
+
+
+_TAB_MATCHER, _KEYWORD_PRIORITIES = _compile_matcher()
+
+
+@lru_cache(maxsize=4096)
 def get_tab_for_section(section_name: str, ini_file: str = '3dsmax.ini') -> str:
     """
-    Determine which tab a section belongs to.
+    Determine which tab a section belongs to (memoized per section/INI file).
     
     Args:
         section_name: Name of INI section (e.g., 'Performance', 'Security')
@@ -34,22 +63,40 @@ def get_tab_for_section(section_name: str, ini_file: str = '3dsmax.ini') -> str:
     if ini_file != '3dsmax.ini':
         return 'Plugins'
     
-    section_lower = section_name.lower()
-    
-    # Check keyword matches
-    for tab_name, keywords in TAB_KEYWORDS.items():
-        if any(kw in section_lower for kw in keywords):
-            return tab_name
+    # Keyword and path suffix matches in one pass - best priority wins
+    best = None
+    for match in _TAB_MATCHER.finditer(section_name.lower()):
+        candidate = _KEYWORD_PRIORITIES[match.group(1)]
+        if best is None or candidate[0] < best[0]:
+            best = candidate
+            if best[0] == 0:
+                break
     
-    # Check for path-related suffixes
-    if any(suffix in section_lower for suffix in PATH_SUFFIXES):
-        return 'Paths'
+    if best is not None:
+        return best[1]
     
     # Everything else goes to Advanced
     return 'Advanced'
 
 
-def get_dynamic_tabs(sections_by_ini: dict) -> list[str]:
+def build_tab_index(sections_by_ini: dict) -> Dict[str, List[str]]:
+    """
+    Precompute tab -> sections map for loaded INI files.
+    
+    Args:
+        sections_by_ini: {'3dsmax.ini': ['Security', ...], 'corona.ini': [...]}
+    
+    Returns:
+        {tab_name: [section, ...]} with sections in original order
+    """
+    tab_index: Dict[str, List[str]] = {}
+    for ini_file, sections in sections_by_ini.items():
+        for section in sections:
+            tab_index.setdefault(get_tab_for_section(section, ini_file), []).append(section)
+    return tab_index
+
+
+def get_dynamic_tabs(sections_by_ini: dict, tab_index: Dict[str, List[str]] = None) -> list[str]:
     """
     Create dynamic tab list based on actual sections present.
     
@@ -58,22 +105,16 @@ def get_dynamic_tabs(sections_by_ini: dict) -> list[str]:
             '3dsmax.ini': ['Security', 'Performance', ...],
             'corona.ini': ['Corona', ...],
         }
+        tab_index: Precomputed build_tab_index() result (optional)
     
     Returns:
         List of tab names to create (only tabs with content)
     """
-    tabs_needed = set()
-    
-    for ini_file, sections in sections_by_ini.items():
-        for section in sections:
-            tab = get_tab_for_section(section, ini_file)
-            tabs_needed.add(tab)
-    
-    # Order tabs logically
-    tab_order = ['Security', 'Performance', 'Rendering', 'Viewport', 'Paths', 'Plugins', 'Advanced']
+    if tab_index is None:
+        tab_index = build_tab_index(sections_by_ini)
     
     # Return only tabs that are needed, in correct order
-    return [tab for tab in tab_order if tab in tabs_needed]
+    return [tab for tab in TAB_ORDER if tab in tab_index]
 
 
 # Test
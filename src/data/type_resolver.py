@@ -0,0 +1,197 @@
+"""
+Parameter type resolver.
+
+Resolves widget type (boolean/integer/float/path/string) of an INI
+parameter once per (section, key): declared type from the parameter
+database first, then validation/rules.json, then inference from value.
+"""
+import logging
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .database_loader import ParameterDatabase, get_database
+
+logger = logging.getLogger(__name__)
+
+
+# Widget types understood by INIParameterWidget / ParameterListView
+WIDGET_TYPES = ('boolean', 'integer', 'float', 'path', 'string')
+
+# Declared type (database / rules.json, case-insensitive) -> widget type
+TYPE_ALIASES = {
+    'bool': 'boolean',
+    'boolean': 'boolean',
+    'int': 'integer',
+    'integer': 'integer',
+    'float': 'float',
+    'double': 'float',
+    'path': 'path',
+    'string': 'string',
+    'str': 'string',
+    'color': 'string',
+    'array': 'string',
+}
+
+
+def normalize_type(declared: Optional[str]) -> Optional[str]:
+    """Map declared type to widget type (None if unknown)."""
+    if not declared or not isinstance(declared, str):
+        return None
+    return TYPE_ALIASES.get(declared.lower())
+
+
+@lru_cache(maxsize=4096)
+def infer_type(value: str) -> str:
+    """Infer widget type from raw INI value (used when no type is declared)."""
+    if not value:
+        return 'string'
+
+    value_stripped = value.strip()
+
+    # Complex structures (arrays, nested data) - keep as string
+    if value_stripped.startswith('#(') or value_stripped.startswith('[') or ',' in value_stripped:
+        return 'string'
+
+    # Boolean (0/1 or true/false) - ONLY single values
+    value_lower = value_stripped.lower()
+    if value_stripped in ('0', '1') or value_lower in ('true', 'false'):
+        return 'boolean'
+
+    # Path (contains :\ or .\ or starts with C:)
+    if ':\\' in value or '.\\' in value or value.startswith('C:'):
+        return 'path'
+
+    # Float (contains decimal point)
+    if '.' in value:
+        try:
+            float(value)
+            return 'float'
+        except ValueError:
+            return 'string'
+
+    # Integer
+    try:
+        int(value)
+        return 'integer'
+    except ValueError:
+        return 'string'
+
+
+def is_compatible(param_type: str, value: str) -> bool:
+    """Check that widget of param_type can show value (empty value is always fine)."""
+    value = value.strip() if value else ''
+    if not value or param_type in ('path', 'string'):
+        return True
+    if param_type == 'boolean':
+        return value in ('0', '1') or value.lower() in ('true', 'false')
+    try:
+        if param_type == 'integer':
+            int(value)
+        else:
+            float(value)
+        return True
+    except ValueError:
+        return False
+
+
+class TypeResolver:
+    """Resolve and memoize parameter widget types."""
+
+    def __init__(self, database: Optional[ParameterDatabase] = None, rules_path: Optional[Path] = None):
+        """Initialize resolver (schema indexes are built on first use)"""
+        if rules_path is None:
+            rules_path = Path(__file__).parent.parent.parent / 'data' / 'validation' / 'rules.json'
+
+        self.database = database
+        self.rules_path = rules_path
+        self._db_types: Optional[Dict[Tuple[str, str], str]] = None  # (section, key) lowercase -> type
+        self._rule_types: Optional[Dict[str, str]] = None  # key lowercase -> type
+        self._resolved: Dict[Tuple[str, str], Tuple[str, bool]] = {}  # (section, key) -> (type, declared)
+
+    def _build_indexes(self):
+        """Index declared types once (INI sections/keys are case-insensitive)."""
+        database = self.database or get_database()
+        self._db_types = {}
+        for full_name, param_data in database.parameters.items():
+            param_type = normalize_type(param_data.get('type'))
+            if not param_type:
+                continue
+            section = param_data.get('section')
+            if section and full_name.startswith(f"{section}."):
+                self._db_types[(section.lower(), full_name[len(section) + 1:].lower())] = param_type
+                continue
+            if '.' not in full_name:
+                continue
+            # Name prefix (plugin/preset name) differs from INI section - index both
+            prefix, key = full_name.split('.', 1)
+            self._db_types[(prefix.lower(), key.lower())] = param_type
+            if section:
+                self._db_types.setdefault((section.lower(), key.lower()), param_type)
+
+        self._rule_types = {}
+        try:
+            with open(self.rules_path, 'r', encoding='utf-8') as f:
+                rules = json.load(f)
+            for key, rule in rules.items():
+                param_type = normalize_type(rule.get('type')) if isinstance(rule, dict) else None
+                if param_type:
+                    self._rule_types[key.lower()] = param_type
+        except Exception as e:
+            logger.warning("[TypeResolver] Failed to load rules: %s", e)
+
+        logger.debug("[TypeResolver] Indexed %s database types, %s rule types", len(self._db_types), len(self._rule_types))
+
+    def declared_type(self, section: str, key: str) -> Optional[str]:
+        """Get declared type (database first, then rules.json) or None."""
+        if self._db_types is None:
+            self._build_indexes()
+        key_lower = key.lower()
+        declared = self._db_types.get((section.lower(), key_lower))
+        if not declared and '.' in key_lower:
+            # Plugin tabs list parameters by full "Section.Key" name
+            declared = self._db_types.get(tuple(key_lower.split('.', 1)))
+        return declared or self._rule_types.get(key_lower)
+
+    def resolve(self, section: str, key: str, value: str) -> str:
+        """
+        Get widget type for parameter.
+
+        Declared type is memoized and wins regardless of current value;
+        inferred type is memoized too and re-inferred only if a new value
+        does not fit it (e.g. after INI reload).
+        """
+        value = '' if value is None else str(value)
+        cache_key = (section, key)
+        cached = self._resolved.get(cache_key)
+        if cached is not None and is_compatible(cached[0], value):
+            return cached[0]
+
+        declared = cached[0] if cached is not None and cached[1] else self.declared_type(section, key)
+        if declared:
+            if is_compatible(declared, value):
+                self._resolved[cache_key] = (declared, True)
+                return declared
+            # Value doesn't fit declared type - don't break widget, edit as inferred
+            logger.debug("[TypeResolver] %s.%s=%r doesn't fit declared '%s', inferring", section, key, value, declared)
+            return infer_type(value)
+
+        inferred = infer_type(value)
+        self._resolved[cache_key] = (inferred, False)
+        return inferred
+
+    def resolve_section(self, section: str, parameters: Dict[str, str]) -> Dict[str, str]:
+        """Resolve types for {key: value} of one section."""
+        return {key: self.resolve(section, key, value) for key, value in parameters.items()}
+
+
+# Global instance
+_resolver_instance = None
+
+def get_type_resolver() -> TypeResolver:
+    """Get global type resolver instance"""
+    global _resolver_instance
+    if _resolver_instance is None:
+        _resolver_instance = TypeResolver()
+    return _resolver_instance
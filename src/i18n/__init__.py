@@ -7,11 +7,21 @@ from .translations import (
     t,
     TRANSLATIONS
 )
+from .translation_table import (
+    TranslationTable,
+    LabelRegistry,
+    get_translation_table,
+    get_label_registry
+)
 
 __all__ = [
     'Language',
     'TranslationManager',
     'get_translation_manager',
     't',
-    'TRANSLATIONS'
+    'TRANSLATIONS',
+    'TranslationTable',
+    'LabelRegistry',
+    'get_translation_table',
+    'get_label_registry'
 ]
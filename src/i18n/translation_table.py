@@ -0,0 +1,184 @@
+"""
+Translate-in-place engine for MaxManager.
+
+TranslationTable holds display names, help texts and section titles per
+language (built once per language from the parameter info database).
+LabelRegistry keeps bindings of live labels/tooltips/titles to table
+entries, so a language switch is one batched pass over exactly the bound
+setters instead of walking widget trees.
+"""
+
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..modules.parameter_info_loader import ParameterInfoLoader
+from ..utils.name_formatter import format_parameter_name
+
+logger = logging.getLogger(__name__)
+
+
+# Binding kinds resolved through TranslationTable
+KIND_NAME = 'name'  # Parameter display name
+KIND_HELP = 'help'  # Parameter help text
+KIND_SECTION = 'section'  # Canvas (section) title
+
+
+class TranslationTable:
+    """Per-language lookup table of parameter names, help texts and section titles."""
+
+    def __init__(self, info_loader: Optional[ParameterInfoLoader] = None, database=None):
+        """Initialize table (languages are built on first use)"""
+        self._info_loader = info_loader
+        self._database = database
+        self._tables: Dict[str, Dict[str, Dict[str, str]]] = {}  # language -> {kind: {key: text}}
+
+    @property
+    def info_loader(self) -> ParameterInfoLoader:
+        """Shared parameter info loader (loaded on first use)."""
+        if self._info_loader is None:
+            self._info_loader = ParameterInfoLoader()
+        return self._info_loader
+
+    @property
+    def database(self):
+        """Parameter database used for section titles."""
+        if self._database is None:
+            from ..data.database_loader import get_database
+            self._database = get_database()
+        return self._database
+
+    def _table(self, language: str) -> Dict[str, Dict[str, str]]:
+        """Get table of language (built in one pass over parameter info)."""
+        table = self._tables.get(language)
+        if table is None:
+            table = self._build(language)
+            self._tables[language] = table
+        return table
+
+    def _build(self, language: str) -> Dict[str, Dict[str, str]]:
+        """Precompute texts of all known parameters and sections for language."""
+        loader = self.info_loader
+        names = {}
+        help_texts = {}
+        for key, param_info in loader.parameters.items():
+            if not isinstance(param_info, dict):
+                continue
+            localized = param_info.get(language) or {}
+            english = param_info.get('en') or {}
+            names[key] = localized.get('display_name') or english.get('display_name') or key
+            if 'help_text' in localized:
+                help_texts[key] = localized['help_text']
+
+        database = self.database
+        if not database._loaded:
+            database.load()
+        sections = {
+            section_name: translations.get(language, section_name)
+            for section_name, translations in database.section_translations.items()
+        }
+        logger.debug("[TranslationTable] Built '%s': %s names, %s help texts, %s sections", language, len(names), len(help_texts), len(sections))
+        return {KIND_NAME: names, KIND_HELP: help_texts, KIND_SECTION: sections}
+
+    def display_name(self, param_name: str, language: str) -> str:
+        """Localized display name (formatted technical name if unknown)."""
+        key = self.info_loader.find_key(param_name)
+        name = self._table(language)[KIND_NAME].get(key) if key is not None else None
+        return name or format_parameter_name(param_name)
+
+    def help_text(self, param_name: str, language: str) -> str:
+        """Localized help text (exact key first, then short key; generic text if unknown)."""
+        help_texts = self._table(language)[KIND_HELP]
+        for key in self.info_loader.candidate_keys(param_name):
+            if key in help_texts:
+                return help_texts[key] or f"Parameter: {param_name}"
+        return f"Parameter: {param_name}"
+
+    def section_title(self, section_name: str, language: str) -> str:
+        """Localized section title (section name if unknown)."""
+        return self._table(language)[KIND_SECTION].get(section_name, section_name)
+
+    def lookup(self, kind: str, key: str, language: str) -> str:
+        """Resolve text of binding kind."""
+        if kind == KIND_NAME:
+            return self.display_name(key, language)
+        if kind == KIND_HELP:
+            return self.help_text(key, language)
+        return self.section_title(key, language)
+
+
+class LabelRegistry:
+    """
+    Live bindings of widget texts to translation table entries.
+
+    Usage:
+        registry.bind(widget, KIND_NAME, 'ThreadCount', widget.name_label.setText)
+        registry.bind_callback(list_view, list_view.on_language_changed)
+        registry.apply('ru')  # One pass over bound setters
+
+    Bindings are dropped when the owner widget is destroyed.
+    """
+
+    def __init__(self, table: TranslationTable):
+        self.table = table
+        self._bindings: Dict[int, List[Tuple[Optional[str], Optional[str], Callable]]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(bindings) for bindings in self._bindings.values())
+
+    def _owner_bindings(self, owner) -> list:
+        """Get binding list of owner (registers cleanup on destroy)."""
+        owner_id = id(owner)
+        bindings = self._bindings.get(owner_id)
+        if bindings is None:
+            bindings = []
+            self._bindings[owner_id] = bindings
+            owner.destroyed.connect(lambda *args, owner_id=owner_id: self._bindings.pop(owner_id, None))
+        return bindings
+
+    def bind(self, owner, kind: str, key: str, setter: Callable[[str], None]):
+        """Bind setter(text) of owner widget to table entry (kind, key)."""
+        self._owner_bindings(owner).append((kind, key, setter))
+
+    def bind_callback(self, owner, callback: Callable[[], None]):
+        """Bind owner that translates itself lazily (e.g. list model) - called on apply."""
+        self._owner_bindings(owner).append((None, None, callback))
+
+    def unbind(self, owner):
+        """Drop all bindings of owner."""
+        self._bindings.pop(id(owner), None)
+
+    def apply(self, language: str) -> int:
+        """Update all bound texts to language, returns number of updated bindings."""
+        table = self.table
+        updated = 0
+        for owner_id, bindings in list(self._bindings.items()):
+            try:
+                for kind, key, setter in bindings:
+                    if kind is None:
+                        setter()
+                    else:
+                        setter(table.lookup(kind, key, language))
+                    updated += 1
+            except RuntimeError:
+                # C++ object already deleted
+                self._bindings.pop(owner_id, None)
+        return updated
+
+
+# Global instances
+_table_instance = None
+_registry_instance = None
+
+def get_translation_table() -> TranslationTable:
+    """Get global translation table instance"""
+    global _table_instance
+    if _table_instance is None:
+        _table_instance = TranslationTable()
+    return _table_instance
+
+def get_label_registry() -> LabelRegistry:
+    """Get global label registry instance"""
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = LabelRegistry(get_translation_table())
+    return _registry_instance
@@ -47,6 +47,9 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "no_changes": "No changes to save",
         "changes_applied": "Changes applied successfully",
         "changes_reverted": "All changes reverted",
+        "ini_conflict_title": "INI Changed on Disk",
+        "ini_conflict_text": "{file} was changed outside the editor.\nThese unsaved edits differ from the new values on disk:",
+        "ini_conflict_question": "Keep your edits?",
         
         # Common
         "version": "Version",
@@ -83,6 +86,9 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "no_changes": "Нет изменений для сохранения",
         "changes_applied": "Изменения применены успешно",
         "changes_reverted": "Все изменения откачены",
+        "ini_conflict_title": "INI изменён на диске",
+        "ini_conflict_text": "{file} изменён вне редактора.\nЭти несохранённые правки расходятся с новыми значениями на диске:",
+        "ini_conflict_question": "Оставить ваши правки?",
         
         # Common
         "version": "Версия",
@@ -0,0 +1,307 @@
+"""
+Apply planner: live vs restart-required INI changes.
+
+Parameters marked "safe": true in data/validation/rules.json take effect
+in a running 3ds Max when set through the session (setINISetting +
+refresh); everything else is only read by 3ds Max at startup. The planner
+splits a preset or change set into both groups and applies them as one
+transaction:
+
+1. one backup of the INI file
+2. all changes written to the file (INIManager.save_ini)
+3. live-safe changes pushed to the session in one MaxBridge batch
+
+If step 2 or 3 fails, the file is restored from the backup and values
+already pushed to the session are set back. A file changed on disk since
+it was loaded is merged first and the plan is made again; keys changed
+both here and on disk abort the apply (ApplyResult.conflicts).
+
+Usage:
+    planner = ApplyPlanner(ini_manager, bridge=session_bridge_for(ini_manager.ini_path))
+    plan = planner.plan_preset(preset)
+    result = planner.execute(plan, reason=f"preset_applied:{preset.name}")
+    if result.requires_restart: ...
+"""
+
+import json
+import logging
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .ini_manager import INIConflict, INIManager
+from .max_bridge import MaxBridge, get_pymxs_runtime
+from .maxini_backup import MaxINIBackup
+from .maxini_presets import MaxINIPreset
+from ..core.profiling import timed
+
+logger = logging.getLogger(__name__)
+
+RULES_PATH = Path(__file__).parent.parent.parent / 'data' / 'validation' / 'rules.json'
+
+
+def load_live_safe_keys(rules_path: Optional[Path] = None) -> Set[str]:
+    """Get keys marked "safe" in rules.json (lowercase; rules are keyed by key name)."""
+    try:
+        with open(rules_path or RULES_PATH, 'r', encoding='utf-8') as f:
+            rules = json.load(f)
+    except Exception as e:
+        logger.warning("[ApplyPlanner] Failed to load rules: %s", e)
+        return set()
+    return {key.lower() for key, rule in rules.items() if isinstance(rule, dict) and rule.get('safe') is True}
+
+
+def to_ini_value(value: Any) -> str:
+    """Convert preset value to INI string (as INIManager shows it)."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return str(value)
+
+
+def session_bridge_for(ini_path: Path, runtime=None) -> Optional[MaxBridge]:
+    """
+    Get bridge to the running 3ds Max if it uses ini_path as its 3dsMax.ini.
+
+    Args:
+        ini_path: INI file being edited
+        runtime: pymxs runtime or mock (None = pymxs if available)
+
+    Returns:
+        MaxBridge, None outside 3ds Max or when editing another file
+    """
+    runtime = runtime if runtime is not None else get_pymxs_runtime()
+    if runtime is None:
+        return None
+    try:
+        session_ini = Path(str(runtime.getMAXIniFile()))
+        if session_ini.resolve() != Path(ini_path).resolve():
+            return None
+    except Exception as e:
+        logger.warning("[ApplyPlanner] Can't get INI file of session: %s", e)
+        return None
+    return MaxBridge(runtime)
+
+
+@dataclass
+class PlannedChange:
+    """One key to change."""
+    section: str
+    key: str
+    value: str  # New value (INI string)
+    old_value: str  # Value on disk / in session before applying
+
+
+@dataclass
+class ApplyPlan:
+    """Change set split into live-safe and restart-required keys."""
+    live: List[PlannedChange] = field(default_factory=list)  # Pushed to running session
+    restart: List[PlannedChange] = field(default_factory=list)  # Take effect after restart
+    unknown: List[str] = field(default_factory=list)  # Keys not present in the INI file (skipped)
+
+    @property
+    def changes(self) -> List[PlannedChange]:
+        """All changes (live first)."""
+        return self.live + self.restart
+
+    @property
+    def requires_restart(self) -> bool:
+        """True if some changes take effect only after restarting 3ds Max."""
+        return bool(self.restart)
+
+
+@dataclass
+class ApplyResult:
+    """Outcome of executing a plan."""
+    plan: ApplyPlan
+    success: bool = False
+    backup: Optional[MaxINIBackup] = None
+    error: Optional[str] = None
+    conflicts: List[INIConflict] = field(default_factory=list)  # Keys also changed on disk (nothing applied)
+
+    @property
+    def requires_restart(self) -> bool:
+        """True if applied changes need 3ds Max restart."""
+        return self.success and self.plan.requires_restart
+
+
+class ApplyPlanner:
+    """Plans and applies change sets to an INI file and the running session."""
+
+    def __init__(self, manager: INIManager, bridge: Optional[MaxBridge] = None,
+                 live_safe_keys: Optional[Set[str]] = None):
+        """
+        Args:
+            manager: Loaded INI manager of the file to change
+            bridge: Bridge to the session using this file (None = no live apply)
+            live_safe_keys: Lowercase keys applicable live (None = rules.json "safe")
+        """
+        self.manager = manager
+        self.bridge = bridge if bridge is not None and bridge.available else None
+        self.live_safe_keys = live_safe_keys if live_safe_keys is not None else load_live_safe_keys()
+
+    def plan_changes(self, changes: Union[Dict[Tuple[str, str], Any], Iterable[Tuple[str, str, Any]]]) -> ApplyPlan:
+        """
+        Plan (section, key, value) changes.
+
+        Values equal to the file (and not pending as unsaved edits) are
+        dropped; keys missing in the file are listed in plan.unknown.
+        """
+        if isinstance(changes, dict):
+            changes = [(section, key, value) for (section, key), value in changes.items()]
+
+        plan = ApplyPlan()
+        sections = self.manager.current_sections
+        for section_name, key, value in changes:
+            section = sections.get(section_name)
+            key = key.lower()  # Parser stores keys lowercase
+            if section is None or key not in section.parameters:
+                plan.unknown.append(f"{section_name}.{key}")
+                continue
+            value = to_ini_value(value)
+            old_value = self.manager.original_sections[section_name].parameters.get(key, "")
+            if value == old_value and section.parameters[key] == old_value:
+                continue
+            change = PlannedChange(section_name, key, value, old_value)
+            if self.bridge is not None and key in self.live_safe_keys:
+                plan.live.append(change)
+            else:
+                plan.restart.append(change)
+
+        logger.debug("[ApplyPlanner] Planned %s live, %s restart, %s unknown",
+                     len(plan.live), len(plan.restart), len(plan.unknown))
+        return plan
+
+    def plan_values(self, values: Dict[str, Any]) -> ApplyPlan:
+        """
+        Plan {name: value} changes, name is "Section.Key" or "Key".
+
+        A bare key applies to every section of the file having the key.
+        """
+        sections = self.manager.current_sections
+        section_names = {section_name.lower(): section_name for section_name in sections}  # Case-insensitive
+        changes = []
+        unknown = []
+        for name, value in values.items():
+            section_name, _, key = name.rpartition('.')
+            if section_name.lower() in section_names:
+                changes.append((section_names[section_name.lower()], key, value))
+                continue
+            matched = [
+                (section_name, name, value)
+                for section_name, section in sections.items()
+                if name.lower() in section.parameters
+            ]
+            changes += matched
+            if not matched:
+                unknown.append(name)
+        plan = self.plan_changes(changes)
+        plan.unknown += unknown
+        return plan
+
+    def plan_preset(self, preset: MaxINIPreset) -> ApplyPlan:
+        """Plan preset values (keys without section apply to every section having the key)."""
+        return self.plan_values(preset.parameters)
+
+    @timed('apply.execute')
+    def execute(self, plan: ApplyPlan, reason: Optional[str] = None) -> ApplyResult:
+        """
+        Apply plan: one backup, file write, one live batch; rolled back on failure.
+
+        Other unsaved edits of the manager are saved along with the plan.
+        If the file changed on disk, it is merged and the plan is made again
+        (result.plan); conflicting keys abort with result.conflicts set.
+        """
+        result = ApplyResult(plan=plan)
+        if not plan.changes:
+            result.success = True
+            return result
+
+        manager = self.manager
+        if manager.is_changed_on_disk():
+            # Don't overwrite newer values written by 3ds Max
+            if not self._merge_from_disk(result):
+                return result
+            plan = result.plan
+            if not plan.changes:
+                result.success = True
+                return result
+        pending_edits = manager.get_modified_values()
+
+        try:
+            result.backup = manager.backup_manager.create_backup(manager.ini_path, reason=reason or "apply_plan")
+        except Exception as e:
+            result.error = f"Backup failed: {e}"
+            logger.error("[ApplyPlanner] %s", result.error)
+            return result
+
+        for change in plan.changes:
+            manager.update_parameter(change.section, change.key, change.value)
+        success, error = manager.save_ini(create_backup=False)
+        if not success:
+            result.error = error
+            self._rollback(result.backup, pending_edits, pushed=[])
+            return result
+
+        if plan.live:
+            try:
+                written = self.bridge.write([(c.section, c.key, c.value) for c in plan.live], refresh=True)
+            except Exception as e:
+                written = {}
+                logger.error("[ApplyPlanner] Live apply failed: %s", e)
+            pushed = [change for change in plan.live if written.get((change.section, change.key))]
+            if len(pushed) != len(plan.live):
+                result.error = f"Live apply failed for {len(plan.live) - len(pushed)} of {len(plan.live)} keys"
+                self._rollback(result.backup, pending_edits, pushed)
+                return result
+            manager.file_stamp = manager.read_file_stamp()  # Session rewrote the file with same values
+
+        result.success = True
+        logger.info("[ApplyPlanner] Applied %s live, %s after restart (backup %s)",
+                    len(plan.live), len(plan.restart), result.backup.file_path.name)
+        return result
+
+    def _merge_from_disk(self, result: ApplyResult) -> bool:
+        """Merge file changed on disk and plan again; False (result.error set) on failure or conflicts."""
+        plan = result.plan
+        merge = self.manager.merge_from_disk()
+        if merge is None:
+            result.error = f"Failed to reload {self.manager.ini_path.name} changed on disk"
+            logger.error("[ApplyPlanner] %s", result.error)
+            return False
+
+        conflicts = list(merge.conflicts)
+        edited = {(conflict.section, conflict.key) for conflict in conflicts}
+        for change in plan.changes:
+            # Planned key (not an unsaved edit) changed on disk since planning
+            section = self.manager.original_sections.get(change.section)
+            disk_value = section.parameters.get(change.key) if section else None
+            if (change.section, change.key) not in edited and disk_value not in (change.old_value, change.value):
+                conflicts.append(INIConflict(change.section, change.key, change.value, disk_value))
+        if conflicts:
+            result.conflicts = conflicts
+            result.error = f"{self.manager.ini_path.name} changed on disk: {len(conflicts)} conflicting keys"
+            logger.warning("[ApplyPlanner] %s", result.error)
+            return False
+
+        result.plan = self.plan_changes([(change.section, change.key, change.value) for change in plan.changes])
+        result.plan.unknown = plan.unknown + result.plan.unknown
+        return True
+
+    def _rollback(self, backup: MaxINIBackup, pending_edits: Dict[Tuple[str, str], str],
+                  pushed: List[PlannedChange]):
+        """Restore file from backup, undo pushed live values, restore unsaved edits."""
+        logger.warning("[ApplyPlanner] Rolling back to %s", backup.file_path.name)
+        if pushed:
+            try:
+                self.bridge.write([(c.section, c.key, c.old_value) for c in pushed], refresh=True)
+            except Exception as e:
+                logger.error("[ApplyPlanner] Failed to restore live values: %s", e)
+        try:
+            shutil.copy2(backup.file_path, self.manager.ini_path)
+        except OSError as e:
+            logger.error("[ApplyPlanner] Failed to restore %s: %s", self.manager.ini_path, e)
+            return
+        if self.manager.load_ini():
+            for (section_name, key), value in pending_edits.items():
+                self.manager.update_parameter(section_name, key, value)
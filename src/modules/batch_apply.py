@@ -0,0 +1,248 @@
+"""
+Headless batch apply of a preset or change set to many INI files.
+
+Render-farm and workstation profiles (copies of 3dsMax.ini on a share)
+are changed in parallel worker processes. Each file goes through the same
+path as the editor: INIManager load, ApplyPlanner plan (keys missing in
+the file are skipped, unchanged values are not written), one backup by
+MaxINIBackupManager, save, restore from backup on failure. Every file
+gets a JSON report, plus summary.json for the whole run.
+
+Usage (CLI):
+    python -m src.modules.batch_apply //farm/profiles --set Renderer.ThreadCount=32
+    python -m src.modules.batch_apply "//farm/profiles/node*/3dsMax.ini" --preset high_performance --dry-run
+
+Usage (API):
+    summary = apply_to_files(collect_ini_files(['//farm/profiles']), {'Renderer.ThreadCount': 32})
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INI_PATTERN = '3dsMax.ini'  # Directory scan default: plugin INIs may share key names
+MIN_FILES_PER_PROCESS = 4  # Fewer files are applied in this process (pool startup costs more)
+
+# Report statuses
+STATUS_APPLIED = 'applied'
+STATUS_UNCHANGED = 'unchanged'
+STATUS_DRY_RUN = 'dry_run'
+STATUS_FAILED = 'failed'
+
+
+@dataclass
+class FileReport:
+    """Outcome of one INI file."""
+    file: str
+    status: str
+    changes: List[Dict[str, str]] = field(default_factory=list)  # [{section, key, old, new}]
+    unknown: List[str] = field(default_factory=list)  # Change names not present in the file
+    backup: Optional[str] = None
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+
+
+def collect_ini_files(targets: Iterable[str], pattern: str = INI_PATTERN) -> List[Path]:
+    """
+    Expand targets into INI files.
+
+    Args:
+        targets: INI files, directories (searched recursively for pattern)
+            or glob patterns (** supported)
+        pattern: File name pattern for directory targets ('*.ini' = all INIs)
+
+    Returns:
+        Sorted unique paths
+    """
+    files = set()
+    for target in targets:
+        path = Path(target)
+        if path.is_dir():
+            files.update(path.rglob(pattern))
+        elif glob.has_magic(target):
+            files.update(Path(match) for match in glob.glob(target, recursive=True))
+        elif path.is_file():
+            files.add(path)
+        else:
+            logger.warning("[Batch] Target not found: %s", target)
+    return sorted(path for path in files if path.is_file())
+
+
+def apply_to_file(ini_path: str, changes: Dict[str, Any], dry_run: bool = False,
+                  reason: str = "batch_apply") -> FileReport:
+    """
+    Apply changes to one INI file (runs in worker process).
+
+    Args:
+        ini_path: INI file
+        changes: {"Section.Key" or "Key": value}
+        dry_run: Plan only, don't back up or write
+        reason: Backup reason
+    """
+    # Imported here: the pool pickles this function by name, workers import what they use
+    from .apply_planner import ApplyPlanner
+    from .ini_manager import INIManager
+
+    start = time.perf_counter()
+    report = FileReport(file=str(ini_path), status=STATUS_FAILED)
+    try:
+        manager = INIManager(Path(ini_path))
+        if not manager.load_ini():
+            report.error = "Failed to load INI"
+        else:
+            planner = ApplyPlanner(manager, live_safe_keys=set())  # No session: everything goes to the file
+            plan = planner.plan_values(changes)
+            report.unknown = plan.unknown
+            report.changes = [
+                {'section': change.section, 'key': change.key, 'old': change.old_value, 'new': change.value}
+                for change in plan.changes
+            ]
+            if not plan.changes:
+                report.status = STATUS_UNCHANGED
+            elif dry_run:
+                report.status = STATUS_DRY_RUN
+            else:
+                result = planner.execute(plan, reason=reason)
+                report.status = STATUS_APPLIED if result.success else STATUS_FAILED
+                report.backup = str(result.backup.file_path) if result.backup else None
+                report.error = result.error
+    except Exception as e:
+        report.error = str(e)
+    report.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+    return report
+
+
+def report_name(ini_path: Path, root: Path) -> str:
+    """Unique report file name from path relative to common root (node01/3dsMax.ini -> node01__3dsMax.ini.json)."""
+    try:
+        relative = ini_path.relative_to(root)
+    except ValueError:
+        relative = Path(ini_path.name)
+    return '__'.join(relative.parts) + '.json'
+
+
+def apply_to_files(files: List[Path], changes: Dict[str, Any], report_dir: Optional[Path] = None,
+                   dry_run: bool = False, workers: Optional[int] = None,
+                   reason: str = "batch_apply") -> Dict[str, Any]:
+    """
+    Apply changes to INI files in parallel worker processes.
+
+    Args:
+        files: INI files (see collect_ini_files())
+        changes: {"Section.Key" or "Key": value}
+        report_dir: Directory for per-file JSON reports and summary.json (None = no reports)
+        dry_run: Plan only, don't back up or write
+        workers: Worker processes (None = CPU count; 1 = apply in this process)
+        reason: Backup reason
+
+    Returns:
+        Summary: counts per status, reports, total duration
+    """
+    start = time.perf_counter()
+    files = [Path(path) for path in files]
+    workers = min(workers or os.cpu_count() or 1, max(len(files), 1))
+    args = ([str(path) for path in files], [changes] * len(files), [dry_run] * len(files), [reason] * len(files))
+
+    if workers <= 1 or len(files) < MIN_FILES_PER_PROCESS:
+        reports = list(map(apply_to_file, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            reports = list(pool.map(apply_to_file, *args, chunksize=max(1, len(files) // (workers * 4))))
+
+    counts = {status: 0 for status in (STATUS_APPLIED, STATUS_UNCHANGED, STATUS_DRY_RUN, STATUS_FAILED)}
+    for report in reports:
+        counts[report.status] += 1
+    summary = {
+        'changes': {name: str(value) for name, value in changes.items()},
+        'dry_run': dry_run,
+        'files': len(files),
+        'workers': workers,
+        'counts': counts,
+        'duration_ms': round((time.perf_counter() - start) * 1000, 1),
+        'reports': [asdict(report) for report in reports],
+    }
+
+    if report_dir is not None:
+        report_dir = Path(report_dir)
+        report_dir.mkdir(parents=True, exist_ok=True)
+        root = Path(os.path.commonpath([str(path.parent) for path in files])) if files else report_dir
+        for path, report in zip(files, reports):
+            with open(report_dir / report_name(path, root), 'w', encoding='utf-8') as f:
+                json.dump(asdict(report), f, indent=2, ensure_ascii=False)
+        with open(report_dir / 'summary.json', 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+
+    logger.info("[Batch] %s files in %.0f ms: %s", len(files), summary['duration_ms'], counts)
+    return summary
+
+
+def parse_assignments(assignments: Iterable[str]) -> Dict[str, str]:
+    """Parse ["Section.Key=value", "Key=value"] into {name: value}."""
+    changes = {}
+    for assignment in assignments:
+        name, sep, value = assignment.partition('=')
+        if not sep or not name.strip():
+            raise ValueError(f"Expected NAME=VALUE, got: {assignment}")
+        changes[name.strip()] = value.strip()
+    return changes
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Apply a preset or changes to many 3dsMax.ini files")
+    parser.add_argument('targets', nargs='+', help="INI files, directories or glob patterns")
+    parser.add_argument('--pattern', default=INI_PATTERN,
+                        help=f"File name pattern for directory targets (default: {INI_PATTERN})")
+    parser.add_argument('--set', dest='assignments', action='append', default=[], metavar='NAME=VALUE',
+                        help="Change to apply: Section.Key=value or Key=value (repeatable)")
+    parser.add_argument('--preset', help="Built-in or user preset id/name")
+    parser.add_argument('--report-dir', type=Path, default=Path('batch_reports'), help="Per-file JSON reports")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--dry-run', action='store_true', help="Report planned changes without writing")
+    args = parser.parse_args(argv)
+
+    changes = {}
+    reason = "batch_apply"
+    if args.preset:
+        from .maxini_presets import MaxINIPresetManager
+        presets = MaxINIPresetManager()
+        preset = presets.get_all_presets().get(args.preset) or presets.get_preset_by_name(args.preset)
+        if preset is None:
+            parser.error(f"Preset not found: {args.preset}")
+        changes.update(preset.parameters)
+        reason = f"preset_applied:{preset.name}"
+    try:
+        changes.update(parse_assignments(args.assignments))
+    except ValueError as e:
+        parser.error(str(e))
+    if not changes:
+        parser.error("Nothing to apply: use --set and/or --preset")
+
+    files = collect_ini_files(args.targets, pattern=args.pattern)
+    if not files:
+        print("No INI files found")
+        return 1
+
+    summary = apply_to_files(files, changes, report_dir=args.report_dir, dry_run=args.dry_run,
+                             workers=args.workers, reason=reason)
+    counts = summary['counts']
+    print(f"{summary['files']} files in {summary['duration_ms']:.0f} ms ({summary['workers']} workers): "
+          + ", ".join(f"{status} {count}" for status, count in counts.items() if count))
+    for report in summary['reports']:
+        if report['status'] == STATUS_FAILED:
+            print(f"  [FAIL] {report['file']}: {report['error']}")
+    print(f"Reports: {args.report_dir}")
+    return 1 if counts[STATUS_FAILED] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,12 +4,16 @@ INI Manager for MaxManager.
 Manages INI file loading, editing, and saving with UI integration.
 """
 
+import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 
 from .maxini_parser import MaxINIParser, MaxINIParameter
 from .maxini_backup import MaxINIBackupManager
+from ..core.profiling import timed
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -17,6 +21,22 @@ class INISection:
     """Represents a section in INI file."""
     name: str
     parameters: Dict[str, str]  # key: value (as strings for UI)
+
+
+@dataclass
+class INIConflict:
+    """Unsaved edit of a key that was also changed on disk (to another value)."""
+    section: str
+    key: str
+    local_value: str  # Unsaved value in the editor
+    disk_value: Optional[str]  # New value on disk (None = key removed)
+
+
+@dataclass
+class INIMergeResult:
+    """Outcome of merging file on disk into the working copy."""
+    changed_sections: Set[str] = field(default_factory=set)  # Sections whose current values changed
+    conflicts: List[INIConflict] = field(default_factory=list)  # Local edits kept, disk value differs
     
 
 class INIManager:
@@ -34,7 +54,7 @@ class INIManager:
         """Initialize INI manager."""
         self.ini_path = ini_path
         self.parser = MaxINIParser()
-        self.backup_manager = MaxINIBackupManager(ini_path.parent / "backups")
+        self.backup_manager = MaxINIBackupManager()
         
         # Original data from file
         self.original_parameters: List[MaxINIParameter] = []
@@ -46,6 +66,10 @@ class INIManager:
         # Track modifications
         self.modified_params: set[str] = set()  # Set of "section.key" strings
         
+        # (mtime_ns, size) of file at last load/save - detects changes made outside the editor
+        self.file_stamp: Optional[Tuple[int, int]] = None
+        
+    @timed('ini.load')
     def load_ini(self) -> bool:
         """
         Load INI file and parse into sections.
@@ -54,6 +78,9 @@ class INIManager:
             True if successful, False otherwise
         """
         try:
+            # Stamp before parsing: a write during parsing is seen as a change next time
+            file_stamp = self.read_file_stamp()
+            
             # Load with parser
             self.original_parameters = self.parser.load(self.ini_path)
             
@@ -84,13 +111,71 @@ class INIManager:
                 )
                 for section_name, section in self.original_sections.items()
             }
+            self.modified_params.clear()
+            self.file_stamp = file_stamp
             
             return True
             
         except Exception as e:
-            print(f"Error loading INI: {e}")
+            logger.error("Error loading INI: %s", e)
             return False
     
+    def read_file_stamp(self) -> Tuple[int, int]:
+        """Get (mtime_ns, size) of INI file on disk."""
+        stat = self.ini_path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def is_changed_on_disk(self) -> bool:
+        """Check if INI file was modified (or removed) since last load/save."""
+        try:
+            return self.read_file_stamp() != self.file_stamp
+        except OSError:
+            return self.file_stamp is not None
+    
+    @timed('ini.merge')
+    def merge_from_disk(self) -> Optional[INIMergeResult]:
+        """
+        Reload INI file changed on disk, keeping unsaved edits (three-way merge).
+        
+        Keys not edited in the editor take the disk value. Edited keys keep
+        the unsaved value; when the disk value also changed (and differs
+        from the edit) the key is reported as a conflict. Edits of keys
+        removed on disk are dropped (and reported).
+        
+        Returns:
+            Merge result, None if file could not be loaded
+        """
+        base_sections = self.original_sections
+        old_values = {name: dict(section.parameters) for name, section in self.current_sections.items()}
+        edits = self.get_modified_values()
+        
+        if not self.load_ini():
+            return None
+        
+        result = INIMergeResult()
+        for (section_name, key), local_value in edits.items():
+            section = self.current_sections.get(section_name)
+            disk_value = section.parameters.get(key) if section else None
+            if disk_value == local_value:
+                continue  # Same change made outside the editor
+            base_value = base_sections.get(section_name, INISection("", {})).parameters.get(key)
+            if disk_value != base_value:
+                result.conflicts.append(INIConflict(section_name, key, local_value, disk_value))
+            if disk_value is not None:
+                self.update_parameter(section_name, key, local_value)
+        
+        result.changed_sections = {
+            section_name
+            for section_name in old_values.keys() | self.current_sections.keys()
+            if old_values.get(section_name) != (
+                self.current_sections[section_name].parameters if section_name in self.current_sections else None
+            )
+        }
+        if result.conflicts:
+            logger.warning("%s changed on disk, %s conflicting unsaved edits kept",
+                           self.ini_path.name, len(result.conflicts))
+        return result
+    
     def get_sections_for_category(self, category: str) -> List[str]:
         """
         Get section names for a specific category/tab.
@@ -174,6 +259,15 @@ class INIManager:
             else:
                 self.modified_params.discard(param_id)
     
+    def get_modified_values(self) -> Dict[Tuple[str, str], str]:
+        """Get unsaved values as {(section, key): value}."""
+        return {
+            (section_name, key): value
+            for section_name, section in self.current_sections.items()
+            for key, value in section.parameters.items()
+            if f"{section_name}.{key}" in self.modified_params
+        }
+    
     def has_unsaved_changes(self) -> bool:
         """Check if there are unsaved modifications."""
         return len(self.modified_params) > 0
@@ -206,6 +300,7 @@ class INIManager:
             for param_id in to_remove:
                 self.modified_params.discard(param_id)
     
+    @timed('ini.save')
     def save_ini(self, create_backup: bool = True) -> Tuple[bool, Optional[str]]:
         """
         Save current values to INI file.
@@ -220,7 +315,7 @@ class INIManager:
             # Create backup if requested
             if create_backup:
                 backup_path = self.backup_manager.create_backup(self.ini_path)
-                print(f"Backup created: {backup_path}")
+                logger.debug("Backup created: %s", backup_path)
             
             # Convert current sections back to MaxINIParameter objects
             parameters_to_save: List[MaxINIParameter] = []
@@ -247,6 +342,7 @@ class INIManager:
             
             # Save with parser
             self.parser.save(self.ini_path, parameters_to_save, create_backup=False)
+            self.file_stamp = self.read_file_stamp()
             
             # Update original to match current (changes are now saved)
             self.original_sections = {
@@ -264,7 +360,7 @@ class INIManager:
             
         except Exception as e:
             error_msg = f"Failed to save INI: {e}"
-            print(error_msg)
+            logger.error(error_msg)
             return False, error_msg
     
     def get_parameter_help(self, section: str, key: str) -> str:
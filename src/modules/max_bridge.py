@@ -0,0 +1,245 @@
+"""
+Batched bridge between MaxManager and a running 3ds Max (pymxs).
+
+Every pymxs call crosses the Python <-> MAXScript boundary, so reading or
+writing INI settings key by key costs one round-trip per key. MaxBridge
+turns a batch of (section, key, value) operations into a single MAXScript
+expression evaluated with one runtime.execute() call and returns all
+results at once; a failing key yields None/False instead of aborting the
+batch.
+
+MockMaxRuntime executes the same scripts against an in-memory INI, so the
+bridge (and code using it) can be tested outside 3ds Max.
+
+Usage:
+    bridge = MaxBridge()  # pymxs runtime, None outside 3ds Max
+    values = bridge.read([('Renderer', 'ThreadCount'), ('Performance', 'UndoLevels')])
+    bridge.write([('Renderer', 'ThreadCount', '8')], refresh=True)
+"""
+
+import logging
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class IniOp(NamedTuple):
+    """One INI operation: read when value is None, write otherwise."""
+    section: str
+    key: str
+    value: Optional[str] = None
+
+
+def maxscript_string(text: str) -> str:
+    """Quote text as MAXScript string literal."""
+    escaped = str(text).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
+    return f'"{escaped}"'
+
+
+def build_batch_script(ops: Iterable[IniOp], ini_file: Optional[str] = None, refresh: bool = False) -> str:
+    """
+    Build one MAXScript expression executing all operations.
+
+    The expression evaluates to an array with one item per operation:
+    value string (read, "" if key is missing) or true/false (write);
+    undefined/false when the operation raised.
+
+    Args:
+        ops: Operations in execution order
+        ini_file: INI file (None = getMAXIniFile(), the running session's 3dsMax.ini)
+        refresh: Call refreshSystem() after the operations (if defined)
+    """
+    lines = [
+        '(',
+        f'local f = {maxscript_string(ini_file) if ini_file else "getMAXIniFile()"}',
+        'local r = #()',
+    ]
+    for op in ops:
+        section, key = maxscript_string(op.section), maxscript_string(op.key)
+        if op.value is None:
+            lines.append(f'append r (try (getINISetting f {section} {key}) catch undefined)')
+        else:
+            lines.append(f'append r (try (setINISetting f {section} {key} {maxscript_string(op.value)}) catch false)')
+    if refresh:
+        lines.append('if refreshSystem != undefined do try (refreshSystem()) catch ()')
+    lines += ['r', ')']
+    return '\n'.join(lines)
+
+
+def get_pymxs_runtime():
+    """Get pymxs runtime (None outside 3ds Max)."""
+    try:
+        from pymxs import runtime
+        return runtime
+    except ImportError:
+        return None
+
+
+class MaxBridge:
+    """
+    Reads and writes INI settings of a running 3ds Max in one round-trip per batch.
+
+    Attributes:
+        round_trips: Number of runtime.execute() calls made
+    """
+
+    def __init__(self, runtime=None, ini_file: Optional[str] = None):
+        """
+        Args:
+            runtime: pymxs runtime or MockMaxRuntime (None = pymxs if available)
+            ini_file: INI file of operations (None = 3dsMax.ini of the session)
+        """
+        self.runtime = runtime if runtime is not None else get_pymxs_runtime()
+        self.ini_file = ini_file
+        self.round_trips = 0
+
+    @property
+    def available(self) -> bool:
+        """True when connected to a runtime (3ds Max or mock)."""
+        return self.runtime is not None
+
+    def execute(self, ops: Iterable[IniOp], refresh: bool = False) -> List:
+        """
+        Execute operations in one MAXScript evaluation.
+
+        Returns:
+            One result per operation: value string or None (read),
+            True/False (write)
+
+        Raises:
+            RuntimeError: No runtime (outside 3ds Max)
+        """
+        if self.runtime is None:
+            raise RuntimeError("3ds Max runtime not available")
+        ops = [IniOp(*op) for op in ops]
+        if not ops and not refresh:
+            return []
+
+        raw = self.runtime.execute(build_batch_script(ops, self.ini_file, refresh))
+        self.round_trips += 1
+
+        results = []
+        for op, value in zip(ops, list(raw) if raw is not None else []):
+            if op.value is None:
+                results.append(value if isinstance(value, str) else None)
+            else:
+                results.append(value is True)
+        if len(results) != len(ops):
+            logger.warning("[MaxBridge] Batch returned %s results for %s operations", len(results), len(ops))
+            results += [None if op.value is None else False for op in ops[len(results):]]
+
+        failed = [op for op, result in zip(ops, results) if result is None or result is False]
+        if failed:
+            logger.warning("[MaxBridge] %s of %s operations failed: %s", len(failed), len(ops),
+                           [f"{op.section}.{op.key}" for op in failed[:10]])
+        logger.debug("[MaxBridge] Executed %s operations in one round-trip", len(ops))
+        return results
+
+    def read(self, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[str]]:
+        """
+        Read values of (section, key) pairs.
+
+        Returns:
+            {(section, key): value} ("" = key not set, None = read failed)
+        """
+        keys = [tuple(key) for key in keys]
+        return dict(zip(keys, self.execute(IniOp(section, key) for section, key in keys)))
+
+    def write(self, values: Iterable[Tuple[str, str, str]], refresh: bool = False) -> Dict[Tuple[str, str], bool]:
+        """
+        Write (section, key, value) settings.
+
+        Args:
+            values: Settings to write (values converted to strings)
+            refresh: Ask 3ds Max to re-read its settings after writing
+
+        Returns:
+            {(section, key): written}
+        """
+        ops = [IniOp(section, key, str(value)) for section, key, value in values]
+        results = self.execute(ops, refresh=refresh)
+        return {(op.section, op.key): result for op, result in zip(ops, results)}
+
+
+# Statement lines generated by build_batch_script()
+_STRING = r'"((?:[^"\\]|\\.)*)"'
+_INI_FILE_RE = re.compile(rf'^local f = (?:{_STRING}|getMAXIniFile\(\))$')
+_GET_RE = re.compile(rf'^append r \(try \(getINISetting f {_STRING} {_STRING}\) catch undefined\)$')
+_SET_RE = re.compile(rf'^append r \(try \(setINISetting f {_STRING} {_STRING} {_STRING}\) catch false\)$')
+_REFRESH_LINE = 'if refreshSystem != undefined do try (refreshSystem()) catch ()'
+_UNESCAPE = {'\\': '\\', '"': '"', 'n': '\n', 'r': '\r'}
+
+
+def _unescape(text: str) -> str:
+    """Reverse maxscript_string() escaping."""
+    return re.sub(r'\\(.)', lambda match: _UNESCAPE.get(match.group(1), match.group(1)), text)
+
+
+class MockMaxRuntime:
+    """
+    Stand-in for pymxs.runtime executing bridge scripts against in-memory INI.
+
+    Section and key names are case-insensitive, like in 3ds Max.
+
+    Attributes:
+        settings: {ini file: {(section, key): value}} (lowercase names)
+        executed: Scripts passed to execute()
+        refresh_count: refreshSystem() calls
+        fail_keys: (section, key) pairs whose operations raise
+    """
+
+    def __init__(self, settings: Optional[Dict[Tuple[str, str], str]] = None, max_ini_file: str = '3dsMax.ini'):
+        """
+        Args:
+            settings: Initial {(section, key): value} of session INI
+            max_ini_file: Path returned by getMAXIniFile()
+        """
+        self.max_ini_file = max_ini_file
+        self.settings: Dict[str, Dict[Tuple[str, str], str]] = {max_ini_file: {}}
+        self.executed: List[str] = []
+        self.refresh_count = 0
+        self.fail_keys = set()
+        for (section, key), value in (settings or {}).items():
+            self.setINISetting(max_ini_file, section, key, value)
+
+    def getMAXIniFile(self) -> str:
+        return self.max_ini_file
+
+    def getINISetting(self, ini_file: str, section: str, key: str) -> str:
+        if (section, key) in self.fail_keys:
+            raise RuntimeError(f"getINISetting failed: {section}.{key}")
+        return self.settings.get(ini_file, {}).get((section.lower(), key.lower()), '')
+
+    def setINISetting(self, ini_file: str, section: str, key: str, value: str) -> bool:
+        if (section, key) in self.fail_keys:
+            raise RuntimeError(f"setINISetting failed: {section}.{key}")
+        self.settings.setdefault(ini_file, {})[(section.lower(), key.lower())] = value
+        return True
+
+    def refreshSystem(self):
+        self.refresh_count += 1
+
+    def execute(self, script: str):
+        """Evaluate a script generated by build_batch_script()."""
+        self.executed.append(script)
+        ini_file = self.max_ini_file
+        results = []
+        for line in script.splitlines():
+            if match := _INI_FILE_RE.match(line):
+                ini_file = _unescape(match.group(1)) if match.group(1) is not None else self.max_ini_file
+            elif match := _GET_RE.match(line):
+                try:
+                    results.append(self.getINISetting(ini_file, *map(_unescape, match.groups())))
+                except RuntimeError:
+                    results.append(None)
+            elif match := _SET_RE.match(line):
+                try:
+                    results.append(self.setINISetting(ini_file, *map(_unescape, match.groups())))
+                except RuntimeError:
+                    results.append(False)
+            elif line == _REFRESH_LINE:
+                self.refreshSystem()
+            elif line not in ('(', ')', 'local r = #()', 'r'):
+                raise ValueError(f"Unsupported MAXScript line: {line}")
+        return results
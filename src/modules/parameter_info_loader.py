@@ -4,9 +4,12 @@ Parameter information loader for INI parameters.
 Loads parameter metadata (display names, descriptions, help text) from JSON.
 """
 
+import logging
 import json
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
 
 
 class ParameterInfoLoader:
@@ -16,56 +19,62 @@ class ParameterInfoLoader:
         # Use main database from data/ folder - CRITICAL location!
         self.json_path = json_path or Path(__file__).parent.parent.parent / "data" / "ini_parameters_database.json"
         self.parameters: Dict = {}
+        self._exact_keys: Dict[str, str] = {}  # lowercase key -> key
+        self._short_keys: Dict[str, str] = {}  # lowercase name after last dot -> key
         self.load_parameters()
     
     def load_parameters(self) -> bool:
         """Load parameters from JSON file."""
         try:
             if not self.json_path.exists():
-                print(f"WARN Parameter info file not found: {self.json_path}")
+                logger.warning("Parameter info file not found: %s", self.json_path)
                 return False
             
             with open(self.json_path, 'r', encoding='utf-8') as f:
                 self.parameters = json.load(f)
+            self._build_index()
             
-            print(f"OK Loaded {len(self.parameters)} parameter descriptions")
+            logger.debug("Loaded %s parameter descriptions", len(self.parameters))
             return True
             
         except Exception as e:
-            print(f"FAIL Failed to load parameter info: {e}")
+            logger.warning("Failed to load parameter info: %s", e)
             return False
     
+    def _build_index(self):
+        """Index keys case-insensitively by full name and by name after last dot."""
+        self._exact_keys = {}
+        self._short_keys = {}
+        for key in self.parameters:
+            key_lower = key.lower()
+            self._exact_keys.setdefault(key_lower, key)
+            # Section.Parameter format (e.g., Performance.UnitType) - first key wins
+            self._short_keys.setdefault(key_lower.rsplit('.', 1)[-1], key)
+    
+    def find_key(self, param_name: str) -> Optional[str]:
+        """Get database key of parameter (exact case-insensitive match first, then by name after last dot)."""
+        param_lower = param_name.lower()
+        return self._exact_keys.get(param_lower) or self._short_keys.get(param_lower)
+    
+    def candidate_keys(self, param_name: str) -> List[str]:
+        """Get database keys to try for parameter: exact match, then by name after last dot."""
+        param_lower = param_name.lower()
+        return [key for key in (self._exact_keys.get(param_lower), self._short_keys.get(param_lower)) if key]
+    
     def get_display_name(self, param_name: str, language: str = "ru") -> Optional[str]:
         """Get localized display name for a parameter."""
-        # Try exact case-insensitive match first
-        for key in self.parameters:
-            if key.lower() == param_name.lower():
-                param_info = self.parameters[key]
-                # Primary language
-                if language in param_info and "display_name" in param_info[language]:
-                    return param_info[language]["display_name"]
-                # Fallback to English
-                if "en" in param_info and "display_name" in param_info["en"]:
-                    return param_info["en"]["display_name"]
-                # Fallback to raw key
-                return key
-        
-        # Try matching with Section.Parameter format (e.g., Performance.UnitType)
-        for key in self.parameters:
-            # Extract parameter name after last dot
-            param_only = key.split('.')[-1] if '.' in key else key
-            if param_only.lower() == param_name.lower():
-                param_info = self.parameters[key]
-                # Primary language
-                if language in param_info and "display_name" in param_info[language]:
-                    return param_info[language]["display_name"]
-                # Fallback to English
-                if "en" in param_info and "display_name" in param_info["en"]:
-                    return param_info["en"]["display_name"]
-                # Fallback to raw key
-                return key
-        
-        return None
+        key = self.find_key(param_name)
+        if key is None:
+            return None
+        param_info = self.parameters[key]
+        # Primary language
+        if language in param_info and "display_name" in param_info[language]:
+            return param_info[language]["display_name"]
+        # Fallback to English
+        if "en" in param_info and "display_name" in param_info["en"]:
+            return param_info["en"]["display_name"]
+        # Fallback to raw key
+        return key
     
     def get_description(self, param_name: str, language: str = "ru") -> Optional[str]:
         """Get localized description for a parameter."""
@@ -80,21 +89,10 @@ class ParameterInfoLoader:
     
     def get_help_text(self, param_name: str, language: str = "ru") -> Optional[str]:
         """Get localized help text for a parameter."""
-        # Try exact case-insensitive match
-        for key in self.parameters:
-            if key.lower() == param_name.lower():
-                param_info = self.parameters[key]
-                if language in param_info and "help_text" in param_info[language]:
-                    return param_info[language]["help_text"]
-        
-        # Try matching with Section.Parameter format
-        for key in self.parameters:
-            param_only = key.split('.')[-1] if '.' in key else key
-            if param_only.lower() == param_name.lower():
-                param_info = self.parameters[key]
-                if language in param_info and "help_text" in param_info[language]:
-                    return param_info[language]["help_text"]
-        
+        for key in self.candidate_keys(param_name):
+            param_info = self.parameters.get(key)
+            if param_info and language in param_info and "help_text" in param_info[language]:
+                return param_info[language]["help_text"]
         return None
     
     def get_type(self, param_name: str) -> Optional[str]:
@@ -113,12 +111,4 @@ class ParameterInfoLoader:
     
     def has_info(self, param_name: str) -> bool:
         """Check if parameter has information available."""
-        # Try exact case-insensitive match
-        if any(key.lower() == param_name.lower() for key in self.parameters):
-            return True
-        # Try matching with Section.Parameter format
-        for key in self.parameters:
-            param_only = key.split('.')[-1] if '.' in key else key
-            if param_only.lower() == param_name.lower():
-                return True
-        return False
+        return self.find_key(param_name) is not None
@@ -4,10 +4,13 @@ Plugin INI Finder - finds and loads plugin INI files.
 Searches common plugin locations and loads real plugin INI files.
 """
 
+import logging
 from pathlib import Path
 from typing import Dict, List
 import os
 
+logger = logging.getLogger(__name__)
+
 
 class PluginINIFinder:
     """Finds plugin INI files in common locations."""
@@ -24,7 +27,7 @@ class PluginINIFinder:
         """
         search_locations = self._get_search_locations()
         
-        print(f"[Plugin Finder] Searching in {len(search_locations)} locations...")
+        logger.debug("[Plugin Finder] Searching in %s locations...", len(search_locations))
         
         found_inis = {}
         
@@ -83,13 +86,13 @@ class PluginINIFinder:
                             found_inis[file_lower] = ini_file
                         
             except Exception as e:
-                print(f"[Plugin Finder] Error searching {location}: {e}")
+                logger.warning("[Plugin Finder] Error searching %s: %s", location, e)
                 continue
         
         self.plugin_ini_files = found_inis
-        print(f"[Plugin Finder] Found {len(found_inis)} plugin INI files:")
+        logger.debug("[Plugin Finder] Found %s plugin INI files:", len(found_inis))
         for name, path in found_inis.items():
-            print(f"  - {name}: {path}")
+            logger.debug("  - %s: %s", name, path)
         
         return found_inis
     
@@ -0,0 +1,117 @@
+"""
+Time-sliced canvas builder.
+
+Runs widget construction steps (a generator) in small chunks on the GUI
+thread: the first chunk runs immediately so the visible canvases appear in
+the first paint, the rest is continued via a zero-timer queue with a
+per-frame time budget. Building can be cancelled (tab switch) or finished
+synchronously when the caller needs the complete result.
+"""
+
+import time
+from typing import Callable, Iterator, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from ..core.profiling import timed
+
+
+class CanvasBuilder(QObject):
+    """
+    Drive build steps with per-frame time budget.
+
+    Usage:
+        def steps():
+            for section in sections:
+                canvas = create_canvas(section)
+                yield
+                for param in params:
+                    canvas.add_content(create_widget(param))
+                    yield
+
+        builder = CanvasBuilder(steps(), on_slice=relayout)
+        builder.finished.connect(on_done)
+        builder.start()
+    """
+
+    finished = Signal()  # All steps completed (not emitted on cancel)
+
+    FIRST_FRAME_BUDGET_MS = 25  # First chunk runs synchronously before first paint (leaves room for relayout)
+    FRAME_BUDGET_MS = 12  # Following chunks leave time for painting/input
+
+    def __init__(
+        self,
+        steps: Iterator,
+        on_slice: Optional[Callable[[], None]] = None,
+        first_budget_ms: int = FIRST_FRAME_BUDGET_MS,
+        budget_ms: int = FRAME_BUDGET_MS,
+        parent: Optional[QObject] = None,
+    ):
+        """
+        Initialize builder.
+
+        Args:
+            steps: Iterator/generator, each next() performs one unit of work
+            on_slice: Called after each chunk (e.g. relayout)
+            first_budget_ms: Budget of first (synchronous) chunk
+            budget_ms: Budget of each following chunk
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._steps = steps
+        self._on_slice = on_slice
+        self._first_budget = first_budget_ms / 1000.0
+        self._budget = budget_ms / 1000.0
+        self._running = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run_slice)
+
+    @property
+    def is_running(self) -> bool:
+        """True while steps remain."""
+        return self._running
+
+    def start(self):
+        """Run first chunk now, schedule the rest."""
+        self._running = True
+        self._run_chunk(self._first_budget)
+
+    def cancel(self):
+        """Stop building (remaining steps are dropped)."""
+        self._timer.stop()
+        self._running = False
+        self._steps = iter(())
+
+    def finish_now(self):
+        """Run all remaining steps synchronously."""
+        if self._running:
+            self._timer.stop()
+            self._run_chunk(None)
+
+    def _run_slice(self):
+        self._run_chunk(self._budget)
+
+    @timed('canvas.build_chunk')
+    def _run_chunk(self, budget: Optional[float]):
+        """Run steps until budget is spent (None = run to the end)."""
+        deadline = None if budget is None else time.perf_counter() + budget
+        done = False
+        try:
+            while True:
+                next(self._steps)
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+        except StopIteration:
+            done = True
+
+        if self._on_slice:
+            self._on_slice()
+
+        if done:
+            self._running = False
+            self.finished.emit()
+        elif self._running:
+            self._timer.start()
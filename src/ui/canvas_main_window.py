@@ -4,22 +4,19 @@ Test script for CollapsibleCanvas widget.
 Tests the accordion-style collapsible panels with mock INI data.
 """
 
+import logging
+import os
 import sys
+from typing import TYPE_CHECKING
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, 
-    QHBoxLayout, QLabel, QPushButton, QSizeGrip, QLineEdit
+    QHBoxLayout, QLabel, QPushButton, QSizeGrip, QLineEdit, QMessageBox
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QFont, QPainter, QColor, QPen
-
-try:
-    import qtawesome as qta
-    QTA_AVAILABLE = True
-except ImportError:
-    QTA_AVAILABLE = False
+from PySide6.QtCore import Qt, QSize, QTimer
+from collections import OrderedDict
+from PySide6.QtGui import QFont, QPainter, QColor, QPen, QKeySequence, QShortcut
 
 # Add parent directory to path for imports
-import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -28,12 +25,22 @@ from src.ui.collapsible_canvas import CollapsibleCanvas, CanvasContainer
 from src.ui.modern_sidebar import ModernSidebar
 from src.ui.modern_header import ModernHeader
 from src.ui.ini_parameter_widget import INIParameterWidget
+# search_pipeline, parameter_list_view, canvas_builder and timing_overlay are
+# imported where first used - they are not needed for the first frame
+if TYPE_CHECKING:
+    from src.ui.parameter_list_view import ParameterListView
+    from src.ui.search_pipeline import SearchPipeline
+from src.ui.change_dispatcher import ChangeDispatcher
+from src.ui.startup_loader import StartupLoader
+from src.ui.theme_service import get_icon, get_pixmap, icon_fonts_loaded, install_theme, preload_icon_fonts
 
-# Import INI manager
-from src.modules.ini_manager import INIManager
+# Import logging setup and instrumentation
+from src.core.logger import setup_logging
+from src.core.profiling import timed
 
 # Import i18n
-from src.i18n import Language, get_translation_manager, t
+from src.i18n import Language, get_translation_manager, t, get_translation_table, get_label_registry
+from src.i18n.translation_table import KIND_SECTION
 
 # Import parameter filter
 from src.utils.parameter_filter import filter_parameters
@@ -41,29 +48,36 @@ from src.utils.parameter_filter import filter_parameters
 # Import version
 from src.__version__ import __version__
 
-# Import database and tab mapper
-from src.data.database_loader import get_database
-from src.data.tab_mapper import get_tab_for_section, get_dynamic_tabs
+# Import tab mapper
+from src.data.tab_mapper import get_dynamic_tabs, build_tab_index
+from src.data.type_resolver import get_type_resolver
+
+logger = logging.getLogger(__name__)
 
+MAX_LISTED_CONFLICTS = 10  # Conflicting keys listed in the dialog
+
+# Icons of canvas headers, warmed together with icon fonts before the first tab is built
+STARTUP_ICONS = (
+    ('mdi.resize-bottom-right', '#666666'),
+    ('fa5s.grip-vertical', 'white'),
+    ('fa5.save', 'white'),
+    ('fa5s.undo', 'white'),
+    ('fa6s.chevron-up', 'white'),
+    ('fa6s.chevron-down', 'white'),
+)
 
 class CustomSizeGrip(QSizeGrip):
     """Custom QSizeGrip with visible icon."""
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        # Load icon
-        try:
-            self.icon = qta.icon('mdi.resize-bottom-right', color='#666666')
-        except:
-            self.icon = None
-    
     def paintEvent(self, event):
-        """Draw icon on top of grip."""
+        """Draw icon on top of grip (once icon fonts are loaded)."""
         super().paintEvent(event)
         
-        if self.icon:
+        if icon_fonts_loaded():
+            pixmap = get_pixmap('mdi.resize-bottom-right', '#666666', 20)
+            if pixmap.isNull():
+                return
             painter = QPainter(self)
-            pixmap = self.icon.pixmap(QSize(20, 20))
             # Center icon in grip
             x = (self.width() - 20) // 2
             y = (self.height() - 20) // 2
@@ -105,8 +119,17 @@ class DotGridWidget(QWidget):
 class CanvasMainWindow(QMainWindow):
     """Main window for MaxManager canvas-based UI."""
     
-    def __init__(self):
+    # Canvas cache limits (LRU): max cached tabs and max parameter widgets kept alive
+    CANVAS_CACHE_MAX_TABS = 8
+    CANVAS_CACHE_MAX_WIDGETS = 4000
+    
+    # Sections with at least this many parameters use virtualized ParameterListView
+    VIRTUALIZE_THRESHOLD = 100
+    
+    def __init__(self, ini_path: Path = None):
         super().__init__()
+        setup_logging()
+        self._ini_path = ini_path  # None = default 3dsMax.ini location
         self.setWindowTitle("MaxManager")
         
         # Set minimum window size for 2 canvases:
@@ -122,58 +145,59 @@ class CanvasMainWindow(QMainWindow):
         self.translation_manager = get_translation_manager()
         self.translation_manager.register_callback(self.on_language_changed)
         
-        # Canvas cache: {(category, tab): {"canvases": [...], "data": {...}}}
-        self._canvas_cache = {}
+        # Translate-in-place: precomputed texts per language + live label bindings
+        self.translation_table = get_translation_table()
+        self.label_registry = get_label_registry()
+        
+        # One shared stylesheet for canvases/parameter widgets (on window, not app - 3ds Max UI stays untouched)
+        install_theme(self)
+        
+        # Canvas cache (LRU): {(category, tab): {"snapshot": ..., "sections": set, "widgets": int, "advanced": bool}}
+        # Hidden canvases of previously shown tabs, re-attached on tab switch
+        self._canvas_cache = OrderedDict()
         self._current_cache_key = None
+        self._current_cache_meta = None  # Cache metadata of tab currently shown
+        self._canvas_builder = None  # Time-sliced builder of current tab
         
-        # Initialize INI manager - use real 3dsMax.ini
-        real_ini_path = Path(r"C:\Users\acherednikov\AppData\Local\Autodesk\3dsMax\2025 - 64bit\ENU\3dsMax.ini")
-        test_ini_path = Path("test_simple.ini")
+        # Search pipeline (debounced, runs off GUI thread)
+        self._search_pipeline = None
+        self._search_active = False
         
-        # Try real file first, fallback to test file
-        ini_path = real_ini_path if real_ini_path.exists() else test_ini_path
+        # Search pool: {section_name: CollapsibleCanvas} for ALL sections, built once
+        self._search_pool = {}
+        self._search_saved_view = None  # Detached tab canvases while searching
+        self._search_edited_sections = set()  # Sections edited while searching
         
+        # Parameter edits: latest value per (ini_file, section, key), applied once per event-loop tick
+        self._change_dispatcher = ChangeDispatcher(self)
+        self._change_dispatcher.changes_ready.connect(self._apply_parameter_changes)
+        self._plugin_titles = None  # Plugins tab canvas title -> plugin INI name
+        
+        # INI managers and database are loaded after the first frame (StartupLoader)
         self.ini_manager = None
-        if ini_path.exists():
-            self.ini_manager = INIManager(ini_path)
-            if self.ini_manager.load_ini():
-                print(f"OK INI loaded from: {ini_path}")
-                print(f"   Sections: {len(self.ini_manager.original_sections)}")
-                print(f"   Parameters: {len(self.ini_manager.original_parameters)}")
-            else:
-                print(f"FAIL Failed to load INI from {ini_path}, using mock data")
-                self.ini_manager = None
-        else:
-            print("WARN No INI file found, using mock data")
+        self.db = None
+        self.plugin_ini_managers = {}
+        self._startup_pending = True
+        self._pending_category = 'ini'  # Sidebar category to open once startup data is loaded
         
         # Track current state
         self.current_category = None
         self.current_tab = None
         
-        # Load parameter database
-        self.db = get_database()
+        # Tab -> sections map for loaded INI (reused across tab switches)
+        self._tab_index = None
         
-        # Find and load plugin INI files
-        from src.modules.plugin_ini_finder import PluginINIFinder
-        self.plugin_finder = PluginINIFinder()
-        self.plugin_inis = self.plugin_finder.find_plugin_inis()
+        self.timing_overlay = None  # Created on first Ctrl+Shift+P
+        self._ini_watcher = None  # INIFileWatcher, created when INI files are loaded
         
-        # Load plugin INI files into separate managers
-        self.plugin_ini_managers = {}
-        for plugin_name, plugin_path in self.plugin_inis.items():
-            try:
-                manager = INIManager(plugin_path)
-                if manager.load_ini():
-                    self.plugin_ini_managers[plugin_name] = manager
-                    print(f"[Plugin INI] Loaded {plugin_name}: {len(manager.current_sections)} sections")
-            except Exception as e:
-                print(f"[Plugin INI] Failed to load {plugin_name}: {e}")
+        self._startup_loader = StartupLoader(parent=self)
+        self._startup_loader.finished.connect(self._on_startup_data)
         
         self.init_ui()
         
     def init_ui(self):
         """Initialize UI."""
-        print(f"[CanvasMainWindow] init_ui: starting, window size={self.width()}x{self.height()}")
+        logger.debug("[CanvasMainWindow] init_ui: starting, window size=%sx%s", self.width(), self.height())
         
         # Central widget with dot grid background
         central = DotGridWidget()
@@ -230,9 +254,85 @@ class CanvasMainWindow(QMainWindow):
         main_layout.setStretch(0, 0)  # Sidebar fixed
         main_layout.setStretch(1, 1)  # Right side stretches
         
-        # Initialize with INI category
+        # Timing overlay with hot-path stats (Ctrl+Shift+P)
+        QShortcut(QKeySequence("Ctrl+Shift+P"), self, activated=self.toggle_timing_overlay)
+        
+        # Skeleton first frame: INI category selected, placeholder until startup data is loaded
         self.sidebar.set_active_button('ini')
-        self.on_sidebar_clicked('ini')
+        self.loading_label = QLabel("Loading...", self.canvas_container)
+        self.loading_label.setObjectName("loading_placeholder")
+        self.loading_label.setStyleSheet("color: #888888; font-family: 'Segoe UI'; font-size: 14px; background: transparent;")
+        self.loading_label.adjustSize()
+        self.loading_label.move(20, 20)
+    
+    def get_ini_path(self) -> Path:
+        """3dsMax.ini to edit (given path, else current user's newest INI, test file as fallback)."""
+        if self._ini_path is not None:
+            return self._ini_path
+        # %LOCALAPPDATA%\Autodesk\3dsMax\<version> - 64bit\<language>\3dsMax.ini
+        local_app_data = os.environ.get('LOCALAPPDATA')
+        user_inis = list(Path(local_app_data, 'Autodesk', '3dsMax').glob('*/*/3dsMax.ini')) if local_app_data else []
+        if user_inis:
+            return max(user_inis, key=lambda path: path.stat().st_mtime)
+        return Path("test_simple.ini")
+    
+    def start_deferred_init(self):
+        """Load icon fonts and start background loading of INI files and database (after first frame)."""
+        if not self._startup_pending or self._startup_loader.is_running:
+            return
+        self._startup_loader.start(self.get_ini_path())
+        with timed('startup.icon_fonts'):
+            preload_icon_fonts(STARTUP_ICONS)
+            self.sidebar.load_icons()
+            self._set_search_icon()
+            self.size_grip.update()
+    
+    def wait_until_ready(self):
+        """Finish startup synchronously (tests, scripted use)."""
+        self.start_deferred_init()
+        self._startup_loader.wait()
+    
+    @timed('startup.apply')
+    def _on_startup_data(self, data):
+        """Take loaded INI managers and database, open pending category."""
+        self.ini_manager = data.ini_manager
+        self.db = data.database
+        self.plugin_ini_managers = data.plugin_ini_managers
+        self._startup_pending = False
+        self._tab_index = None
+        
+        self.loading_label.hide()
+        self.loading_label.deleteLater()
+        
+        category = self._pending_category
+        self.sidebar.set_active_button(category)
+        self.on_sidebar_clicked(category)
+        self._watch_ini_files()
+    
+    def _watch_ini_files(self):
+        """Watch loaded INI files for changes made outside the editor."""
+        managers = [self.ini_manager] if self.ini_manager else []
+        managers += list(self.plugin_ini_managers.values())
+        if not managers:
+            return
+        if self._ini_watcher is None:
+            from src.ui.ini_file_watcher import INIFileWatcher
+            self._ini_watcher = INIFileWatcher(parent=self)
+            self._ini_watcher.files_changed.connect(self._on_ini_files_changed)
+        self._ini_watcher.set_paths(manager.ini_path for manager in managers)
+    
+    def _on_ini_files_changed(self, paths: list):
+        """Watched INI files were written (debounced): merge them while window is shown."""
+        if not self.isVisible():
+            return  # Resident window checks files when shown again
+        self.reload_changed_inis()
+    
+    def toggle_timing_overlay(self):
+        """Show/hide timing overlay (created on first use)."""
+        if self.timing_overlay is None:
+            from src.ui.timing_overlay import TimingOverlay
+            self.timing_overlay = TimingOverlay(self.centralWidget())
+        self.timing_overlay.toggle()
         
     
     def toggle_floating_search(self):
@@ -282,14 +382,12 @@ class CanvasMainWindow(QMainWindow):
         close_btn = QPushButton()
         close_btn.setFixedSize(40, 40)
         close_btn.setCursor(Qt.PointingHandCursor)
-        if QTA_AVAILABLE:
-            try:
-                close_btn.setIcon(qta.icon('fa5s.times', color='#888888'))
-                close_btn.setIconSize(QSize(16, 16))
-            except:
-                close_btn.setText("✕")
-        else:
+        close_icon = get_icon('fa5s.times', '#888888')
+        if close_icon.isNull():
             close_btn.setText("✕")
+        else:
+            close_btn.setIcon(close_icon)
+            close_btn.setIconSize(QSize(16, 16))
         
         close_btn.clicked.connect(self.hide_floating_search)
         close_btn.setStyleSheet("""
@@ -338,91 +436,183 @@ class CanvasMainWindow(QMainWindow):
         """Hide floating search and restore view."""
         if hasattr(self, 'floating_search'):
             self.floating_search.setVisible(False)
+            # Clearing the field restores original view (via search pipeline)
             self.search_field.clear()
-            # Restore original view
-            if self.current_category and self.current_tab:
-                self.load_canvas_panels(self.current_category, self.current_tab)
+    
+    def get_search_pipeline(self) -> "SearchPipeline":
+        """Get search pipeline (created on first use)."""
+        if self._search_pipeline is None:
+            from src.ui.search_pipeline import SearchPipeline
+            # Create shared loader on GUI thread - worker only reads it
+            INIParameterWidget.get_param_info_loader()
+            self._search_pipeline = SearchPipeline(
+                self._get_search_snapshot,
+                self._get_search_display_name,
+                parent=self
+            )
+            self._search_pipeline.results_ready.connect(self.apply_search_results)
+            self._search_pipeline.cleared.connect(self.on_search_cleared)
+        return self._search_pipeline
+    
+    def _get_search_snapshot(self) -> dict:
+        """Snapshot of section -> parameter names for search index (GUI thread)."""
+        if not self.ini_manager:
+            return {}
+        return {
+            section_name: list(section.parameters.keys())
+            for section_name, section in self.ini_manager.current_sections.items()
+        }
+    
+    def _get_search_display_name(self, param_name: str):
+        """English display name for search index (worker thread, read-only)."""
+        return INIParameterWidget.get_param_info_loader().get_display_name(param_name, 'en')
     
     def on_floating_search_changed(self, text: str):
-        """Handle floating search text change."""
-        search_text = text.lower().strip()
-        
-        if not search_text:
-            # Restore original view
-            if self.current_category and self.current_tab:
-                self.load_canvas_panels(self.current_category, self.current_tab)
-            return
-        
-        # Perform global search and update main canvas
-        self.perform_global_search(search_text)
+        """Handle floating search text change (debounced, searched off GUI thread)."""
+        self.get_search_pipeline().set_query(text)
     
+    def on_search_cleared(self):
+        """Restore original view once search query is empty."""
+        self._exit_search_mode()
+    
+    @timed('search.global')
     def perform_global_search(self, search_text: str):
-        """Search across ALL INI sections and update main canvas."""
+        """Search across ALL INI sections synchronously and update main canvas."""
         if not self.ini_manager:
             return
         
-        # Clear current canvas
-        self.canvas_container.setUpdatesEnabled(False)
-        self.canvas_container.clear_canvases()
-        QApplication.processEvents()
+        from src.ui.search_pipeline import build_search_index, match_index
+        index = build_search_index(self._get_search_snapshot(), self._get_search_display_name)
+        found = match_index(index, search_text.lower().strip())
+        self.apply_search_results(search_text, found)
+    
+    def _build_search_pool(self):
+        """Create canvases for INI sections missing in the pool (reused by every search)."""
+        missing = [
+            (section_name, section)
+            for section_name, section in self.ini_manager.current_sections.items()
+            if section.parameters and section_name not in self._search_pool
+        ]
+        if not missing:
+            return
+        logger.debug("[SEARCH] Building search pool for %s sections", len(missing))
+        for section_name, section in missing:
+            
+            translated_title = self.translation_table.section_title(section_name, self.translation_manager.current_language.value)
+            canvas = CollapsibleCanvas(translated_title, expanded=True)
+            canvas.section_name = section_name
+            self.label_registry.bind(canvas, KIND_SECTION, section_name, canvas.update_language)
+            canvas.reset_requested.connect(lambda c=canvas, title=section_name: self.revert_canvas_section(c, title))
+            canvas.save_requested.connect(lambda c=canvas, title=section_name: self.save_canvas_section(c, title))
+            
+            if len(section.parameters) >= self.VIRTUALIZE_THRESHOLD:
+                canvas.add_content(self.create_parameter_list(canvas, section.parameters, section_name))
+            else:
+                for param_name, param_value in section.parameters.items():
+                    param_widget = self.create_parameter_widget(param_name, param_value, section=section_name)
+                    param_widget.modified_state_changed.connect(lambda modified, c=canvas: self.on_param_modified(c, modified))
+                    canvas.add_content(param_widget)
+            
+            canvas.hide()
+            self._search_pool[section_name] = canvas
+    
+    def _discard_search_pool(self):
+        """Destroy search pool (INI reloaded, mode changed or edited outside search)."""
+        if self._search_active:
+            self._exit_search_mode()
+        for canvas in self._search_pool.values():
+            canvas.setParent(None)
+            canvas.deleteLater()
+        self._search_pool = {}
+    
+    def _discard_search_section(self, section_name: str):
+        """Destroy pooled canvas of section edited outside search (rebuilt by next search)."""
+        canvas = self._search_pool.pop(section_name, None)
+        if canvas is not None:
+            canvas.setParent(None)
+            canvas.deleteLater()
+    
+    @timed('search.apply')
+    def apply_search_results(self, search_text: str, found: dict):
+        """Show search results by toggling visibility in pooled canvases (no widget churn)."""
+        if not self.ini_manager:
+            return
         
-        search_lower = search_text.lower()
-        found_sections = {}
+        # Search results replace current view - complete its build first
+        if self._canvas_builder is not None:
+            self._canvas_builder.finish_now()
         
-        # Search through ALL sections
-        for section_name, section in self.ini_manager.current_sections.items():
-            filtered_params = {}
-            for param_name, param_value in section.parameters.items():
-                # Search in parameter name
-                if search_lower in param_name.lower():
-                    filtered_params[param_name] = param_value
+        self.canvas_container.setUpdatesEnabled(False)
+        try:
+            if not self._search_active:
+                # Keep current tab canvases alive for instant restore
+                self._search_saved_view = self.canvas_container.detach_canvases()
+                self._search_edited_sections = set()
+                self._search_active = True
+            else:
+                self.canvas_container.detach_canvases()
+            
+            self._build_search_pool()
+            
+            logger.debug("[SEARCH] '%s': %s sections with matches", search_text, len(found))
+            for section_name, param_names in found.items():
+                canvas = self._search_pool.get(section_name)
+                if canvas is None:
                     continue
-                
-                # Search in display name
-                from src.modules.parameter_info_loader import ParameterInfoLoader
-                param_info = ParameterInfoLoader()
-                display_name = param_info.get_display_name(param_name, 'en')
-                if display_name and search_lower in display_name.lower():
-                    filtered_params[param_name] = param_value
+                if canvas.apply_visible_set(set(param_names)):
+                    self.canvas_container.add_canvas(canvas)
             
-            if filtered_params:
-                found_sections[section_name] = filtered_params
-        
-        # Display results in main canvas
-        if found_sections:
-            print(f"Found {len(found_sections)} sections with matches")
-            for section_name, parameters in found_sections.items():
-                canvas = CollapsibleCanvas(section_name, expanded=True)
-                canvas.reset_requested.connect(lambda c=canvas, title=section_name: self.revert_canvas_section(c, title))
-                canvas.save_requested.connect(lambda c=canvas, title=section_name: self.save_canvas_section(c, title))
-                
-                # Add parameters
-                for param_name, param_value in parameters.items():
-                    param_widget = self.create_parameter_widget(param_name, param_value)
-                    param_widget.modified_state_changed.connect(lambda modified, c=canvas: self.on_param_modified(c, modified))
-                    canvas.add_content(param_widget)
-                
-                self.canvas_container.add_canvas(canvas)
+            # Single layout pass for all result canvases
+            self.canvas_container._rebuild_skyline_layout()
+        finally:
+            self.canvas_container.setUpdatesEnabled(True)
+    
+    def _exit_search_mode(self):
+        """Detach search pool and re-attach canvases of the view shown before search."""
+        if not self._search_active:
+            return
+        self._search_active = False
+        
+        saved_view = self._search_saved_view
+        self._search_saved_view = None
         
-        self.canvas_container.setUpdatesEnabled(True)
-        self.canvas_container.update()
+        self.canvas_container.setUpdatesEnabled(False)
+        try:
+            self.canvas_container.detach_canvases()
+            if saved_view is not None:
+                self.canvas_container.attach_canvases(saved_view)
+            
+            # Values edited in search are not reflected in tab widgets - rebuild affected tabs
+            edited_sections = self._search_edited_sections
+            self._search_edited_sections = set()
+            if edited_sections and self.invalidate_canvas_cache(edited_sections):
+                self._reload_current_tab()
+        finally:
+            self.canvas_container.setUpdatesEnabled(True)
     
     def showEvent(self, event):
-        """Handle window show - initial positioning."""
+        """Handle window show - initial positioning, deferred startup after first frame."""
         super().showEvent(event)
         # Position size grip in bottom-right corner on first show
         self.position_size_grip()
-    
+        if self._startup_pending:
+            QTimer.singleShot(0, self.start_deferred_init)
+
+    def closeEvent(self, event):
+        """Handle window close - write pending layout changes."""
+        self.canvas_container.layout_storage.flush()
+        super().closeEvent(event)
+
     def resizeEvent(self, event):
         """Handle window resize."""
         super().resizeEvent(event)
         
-        print(f"[ResizeEvent] Window size: {self.width()}x{self.height()}")
+        logger.debug("[ResizeEvent] Window size: %sx%s", self.width(), self.height())
         
         # Debug header size
-        if hasattr(self, 'header'):
-            print(f"[ResizeEvent] Header size: {self.header.width()}x{self.header.height()}")
-            print(f"[ResizeEvent] Header margins: {self.header.contentsMargins()}")
+        if hasattr(self, 'header') and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[ResizeEvent] Header size: %sx%s", self.header.width(), self.header.height())
+            logger.debug("[ResizeEvent] Header margins: %s", self.header.contentsMargins())
         
         # Reposition floating search if visible
         if hasattr(self, 'floating_search') and self.floating_search.isVisible():
@@ -437,6 +627,15 @@ class CanvasMainWindow(QMainWindow):
             self.size_grip.move(self.footer_widget.width() - 24, self.footer_widget.height() - 24)
     
     
+    def _set_search_icon(self):
+        """Set search button icon (text fallback without QtAwesome)."""
+        icon = get_icon('fa5s.search', 'white')
+        if icon.isNull():
+            self.search_btn.setText("🔍")
+        else:
+            self.search_btn.setIcon(icon)
+            self.search_btn.setIconSize(QSize(16, 16))
+    
     def create_top_controls(self) -> QWidget:
         """Create top-right controls (search + version + language switcher)."""
         container = QWidget()
@@ -474,15 +673,10 @@ class CanvasMainWindow(QMainWindow):
         search_btn.setCursor(Qt.PointingHandCursor)
         search_btn.setToolTip("Search parameters")
         
-        # Add search icon (16x16)
-        if QTA_AVAILABLE:
-            try:
-                search_btn.setIcon(qta.icon('fa5s.search', color='white'))
-                search_btn.setIconSize(QSize(16, 16))
-            except:
-                search_btn.setText("🔍")
-        else:
-            search_btn.setText("🔍")
+        # Search icon (16x16) is set with the other icons after first frame
+        self.search_btn = search_btn
+        if icon_fonts_loaded():
+            self._set_search_icon()
         
         # Connect to toggle floating search
         search_btn.clicked.connect(self.toggle_floating_search)
@@ -542,14 +736,14 @@ class CanvasMainWindow(QMainWindow):
         self.mode_toggle_btn.setText("ADVANCED" if self.is_advanced_mode else "FREE")
         
         # Reload current view with new mode (recreates all widgets with correct can_add)
-        print(f"\n[MODE] Toggled to: {'ADVANCED' if self.is_advanced_mode else 'FREE'}")
-        print(f"[MODE] Reloading view to recreate widgets with can_add={self.is_advanced_mode}")
+        logger.debug("[MODE] Toggled to: %s", 'ADVANCED' if self.is_advanced_mode else 'FREE')
+        logger.debug("[MODE] Reloading view to recreate widgets with can_add=%s", self.is_advanced_mode)
         self.reload_current_view()
     
     def toggle_language(self):
         """Toggle between RU and EN."""
         current_lang = self.translation_manager.current_language
-        print(f"\n[LANGUAGE] Current: {current_lang.value}")
+        logger.debug("[LANGUAGE] Current: %s", current_lang.value)
         
         # Toggle language
         if current_lang == Language.ENGLISH:
@@ -557,7 +751,7 @@ class CanvasMainWindow(QMainWindow):
         else:
             new_lang = Language.ENGLISH
         
-        print(f"[LANGUAGE] Switching to: {new_lang.value}")
+        logger.debug("[LANGUAGE] Switching to: %s", new_lang.value)
         
         # CRITICAL: Set language FIRST and verify it changed
         self.translation_manager.set_language(new_lang)
@@ -565,10 +759,10 @@ class CanvasMainWindow(QMainWindow):
         # Verify language actually changed
         actual_lang = self.translation_manager.current_language
         if actual_lang != new_lang:
-            print(f"[LANGUAGE ERROR] Language change failed! Expected {new_lang.value}, got {actual_lang.value}")
+            logger.error("[LANGUAGE ERROR] Language change failed! Expected %s, got %s", new_lang.value, actual_lang.value)
             return  # Abort if language change failed
         
-        print(f"[LANGUAGE] After set_language: {actual_lang.value} ✓")
+        logger.debug("[LANGUAGE] After set_language: %s", actual_lang.value)
         
         # Update button text to show CURRENT active language
         if new_lang == Language.RUSSIAN:
@@ -576,7 +770,7 @@ class CanvasMainWindow(QMainWindow):
         else:
             self.lang_toggle_btn.setText("EN")
         
-        print(f"[LANGUAGE] Button text updated to: {self.lang_toggle_btn.text()}")
+        logger.debug("[LANGUAGE] Button text updated to: %s", self.lang_toggle_btn.text())
         
         # CRITICAL: Process events to ensure language change propagates
         QApplication.processEvents()
@@ -585,19 +779,19 @@ class CanvasMainWindow(QMainWindow):
         try:
             self.reload_current_view()
         except Exception as e:
-            print(f"[LANGUAGE ERROR] Failed to reload view: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[LANGUAGE ERROR] Failed to reload view: %s", e)
             # Try to restore previous state
             self.translation_manager.set_language(current_lang)
     
     def reload_current_view(self):
         """Update UI language WITHOUT recreating canvases (fast, stable)."""
-        print(f"[RELOAD] Translate-in-place mode!")
+        logger.debug("[RELOAD] Translate-in-place mode!")
+        if self._startup_pending:
+            return  # First tab is built in current language once startup data is loaded
         current_category = self.sidebar.active_button if hasattr(self.sidebar, 'active_button') else 'ini'
         current_tab = self.header.active_tab if hasattr(self.header, 'active_tab') else 'Security'
         current_lang = self.translation_manager.current_language
-        print(f"[RELOAD] category={current_category}, tab={current_tab}, lang={current_lang.value}")
+        logger.debug("[RELOAD] category=%s, tab=%s, lang=%s", current_category, current_tab, current_lang.value)
         
         # Disable updates to prevent visual glitches
         self.setUpdatesEnabled(False)
@@ -630,82 +824,52 @@ class CanvasMainWindow(QMainWindow):
                 footer_buttons[1].setText(revert_text)
                 footer_buttons[2].setText(apply_text)
             
-            # 3. Update EXISTING canvas titles WITHOUT recreating!
-            print(f"[RELOAD] Updating {len(self.canvas_container.canvas_items)} existing canvases...")
+            # 3. Update EXISTING canvases (titles + parameter labels) WITHOUT recreating!
+            # One pass over bound labels - visible, cached and search pool canvases alike
+            updated = self.label_registry.apply(current_lang.value)
+            logger.debug("[RELOAD] Updated %s bound labels", updated)
             
-            # Get mock_data to retrieve translated section names
-            mock_data = self.get_mock_data(current_category, current_tab)
-            
-            for canvas_id, canvas in self.canvas_container.canvas_items.items():
-                # Find section in mock_data by matching canvas title with sections
-                # Canvas title might be already translated, need to map back
-                for section_title, parameters in mock_data.items():
-                    translated_title = self.db.get_section_translation(section_title, current_lang.value)
-                    if not translated_title:
-                        translated_title = section_title
-                    
-                    # Check if this canvas matches this section (by comparing original or translated)
-                    if canvas.title == section_title or canvas.title == translated_title or canvas_id == section_title:
-                        # Update canvas title
-                        canvas.update_language(translated_title)
-                        break
-            
-            # 4. Update parameter labels (they have their own on_language_changed callback)
-            # Just trigger it manually for all visible params
-            all_param_widgets = self.findChildren(INIParameterWidget)
-            print(f"[RELOAD] Updating {len(all_param_widgets)} parameter widgets...")
-            for param_widget in all_param_widgets:
-                try:
-                    param_widget.on_language_changed()
-                except Exception as e:
-                    print(f"[RELOAD ERROR] Failed to update param widget: {e}")
-            
-            print(f"[RELOAD] Language update completed!")
+            logger.debug("[RELOAD] Language update completed!")
             
         except Exception as e:
-            print(f"[RELOAD ERROR] Failed to reload view: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[RELOAD ERROR] Failed to reload view: %s", e)
         finally:
             # Re-enable updates and force redraw
             self.setUpdatesEnabled(True)
             self.update()
             QApplication.processEvents()  # Ensure all updates are processed
         
-        print(f"[RELOAD] Done")
+        logger.debug("[RELOAD] Done")
     
     def on_header_tab_changed(self, context: str, tab_name: str):
         """Handle header tab change - NO FLICKERING."""
-        print(f"\n{'='*60}")
-        print(f"[TAB CHANGED] Context: {context}, Tab: {tab_name}")
-        print(f"{'='*60}")
+        logger.debug("[TAB CHANGED] Context: %s, Tab: %s", context, tab_name)
         
         # Log BEFORE state
-        before_count = len(self.canvas_container.canvas_items)
-        before_canvases = list(self.canvas_container.canvas_items.keys())
-        print(f"[BEFORE] {before_count} canvases: {before_canvases[:3]}{'...' if before_count > 3 else ''}")
+        if logger.isEnabledFor(logging.DEBUG):
+            before_canvases = list(self.canvas_container.canvas_items.keys())
+            logger.debug("[BEFORE] %s canvases: %s%s", len(before_canvases), before_canvases[:3], '...' if len(before_canvases) > 3 else '')
         
         # CRITICAL: Disable updates to prevent flickering/jerking during tab switch
         self.canvas_container.setUpdatesEnabled(False)
-        print(f"[TAB CHANGED] Updates DISABLED on canvas_container")
+        logger.debug("[TAB CHANGED] Updates DISABLED on canvas_container")
         
         try:
             # Simple reload - stable and tested
-            print(f"[TAB CHANGED] Calling load_canvas_panels({context}, {tab_name})...")
+            logger.debug("[TAB CHANGED] Calling load_canvas_panels(%s, %s)...", context, tab_name)
             self.load_canvas_panels(context, tab_name)
             
             # Log AFTER state
-            after_count = len(self.canvas_container.canvas_items)
-            after_canvases = list(self.canvas_container.canvas_items.keys())
-            print(f"[AFTER] {after_count} canvases: {after_canvases[:3]}{'...' if after_count > 3 else ''}")
+            if logger.isEnabledFor(logging.DEBUG):
+                after_canvases = list(self.canvas_container.canvas_items.keys())
+                logger.debug("[AFTER] %s canvases: %s%s", len(after_canvases), after_canvases[:3], '...' if len(after_canvases) > 3 else '')
             
         finally:
             # Re-enable updates and force single atomic redraw
-            print(f"[TAB CHANGED] Re-enabling updates and forcing repaint...")
+            logger.debug("[TAB CHANGED] Re-enabling updates and forcing repaint...")
             self.canvas_container.setUpdatesEnabled(True)
             self.canvas_container.update()  # Single repaint - no flickering!
-            print(f"[TAB CHANGED] DONE - atomic update complete")
-            print(f"{'='*60}\n")
+            logger.debug("[TAB CHANGED] DONE - atomic update complete")
     
     def on_language_changed(self):
         """Handle language change callback (not used - reload triggered directly)."""
@@ -787,7 +951,12 @@ class CanvasMainWindow(QMainWindow):
         
     def on_sidebar_clicked(self, button_name: str):
         """Handle sidebar button click."""
-        print(f"Sidebar clicked: {button_name}")
+        logger.debug("Sidebar clicked: %s", button_name)
+        
+        if self._startup_pending:
+            # Opened once startup data is loaded
+            self._pending_category = button_name
+            return
         
         # Dynamic tabs for 'ini' category
         if button_name == 'ini':
@@ -827,7 +996,7 @@ class CanvasMainWindow(QMainWindow):
         # For now, plugins will be detected from database
         
         # Get dynamic tabs
-        tabs = get_dynamic_tabs(sections_by_ini)
+        tabs = get_dynamic_tabs(sections_by_ini, self.get_tab_index())
         
         # Include Plugins tab if database contains non-3dsmax.ini entries
         try:
@@ -836,14 +1005,26 @@ class CanvasMainWindow(QMainWindow):
             if has_plugins and 'Plugins' not in tabs:
                 tabs.insert(tabs.index('Advanced') if 'Advanced' in tabs else len(tabs), 'Plugins')
         except Exception as e:
-            print(f"[Dynamic Tabs] Plugin detection failed: {e}")
+            logger.warning("[Dynamic Tabs] Plugin detection failed: %s", e)
         
-        print(f"[Dynamic Tabs] Generated: {tabs}")
+        logger.debug("[Dynamic Tabs] Generated: %s", tabs)
         return tabs
         
+    def get_tab_index(self) -> dict:
+        """Get tab -> sections map for loaded 3dsmax.ini (computed once per load)."""
+        if self._tab_index is None:
+            sections = list(self.ini_manager.current_sections.keys()) if self.ini_manager else []
+            self._tab_index = build_tab_index({'3dsmax.ini': sections})
+        return self._tab_index
+    
+    @timed('canvas.load_panels')
     def load_canvas_panels(self, category: str, tab_name: str):
         """Load canvas panels with mock INI data."""
-        print(f"[LOAD CANVAS] Loading panels: {category} / {tab_name}")
+        logger.debug("[LOAD CANVAS] Loading panels: %s / %s", category, tab_name)
+        
+        # Leave search mode first - pooled canvases must not be destroyed by clear
+        if self._search_active:
+            self._exit_search_mode()
         
         # Store current state
         self.current_category = category
@@ -851,124 +1032,215 @@ class CanvasMainWindow(QMainWindow):
         
         # CRITICAL: Verify language is set BEFORE loading
         current_lang = self.translation_manager.current_language
-        print(f"[LOAD CANVAS] Current language: {current_lang.value}")
+        logger.debug("[LOAD CANVAS] Current language: %s", current_lang.value)
         
         # Updates managed by caller (on_header_tab_changed) - NO need to disable here
         
-        canvases_created = 0  # Initialize counter
+        cache_key = (category, tab_name)
         
         try:
-            # Clear existing panels
-            num_before = len(self.canvas_container.canvas_items)
-            print(f"[LOAD CANVAS] Clearing {num_before} existing canvases...")
-            self.canvas_container.clear_canvases()
+            # Stop building previous tab, park its canvases in cache (hidden) instead of destroying them
+            self._cancel_canvas_build()
+            self._park_current_canvases()
             
-            # CRITICAL: Single processEvents is enough - Qt handles deleteLater in event loop
-            QApplication.processEvents()  # Process pending delete events
-            
-            # Verify cleared
-            num_after = len(self.canvas_container.canvas_items)
-            print(f"[LOAD CANVAS] After clear: {num_after} canvases (should be 0)")
-            
-            if num_after > 0:
-                print(f"[LOAD CANVAS WARNING] {num_after} canvases still exist after clear!")
+            # Cached tab: re-attach built canvases, no widget construction
+            if self._restore_cached_canvases(cache_key):
+                logger.debug("[LOAD CANVAS] Restored %s canvases from cache", len(self.canvas_container.canvas_items))
+                return
             
             # Create mock canvas panels based on category/tab
             mock_data = self.get_mock_data(category, tab_name)
             
             # CRITICAL: Check if mock_data is empty
             if not mock_data:
-                print(f"[LOAD CANVAS ERROR] No data returned from get_mock_data() for {category}/{tab_name}")
-                print(f"[LOAD CANVAS] This will result in empty canvas!")
+                logger.error("[LOAD CANVAS ERROR] No data returned from get_mock_data() for %s/%s - canvas will be empty", category, tab_name)
                 return
             
-            print(f"[LOAD CANVAS] Got {len(mock_data)} sections from get_mock_data()")
+            logger.debug("[LOAD CANVAS] Got %s sections from get_mock_data()", len(mock_data))
             
-            canvases_created = 0
-            for section_title, parameters in mock_data.items():
-                # Skip empty sections (all parameters filtered out)
-                if not parameters:
-                    print(f"[LOAD CANVAS] Skipping empty section: {section_title}")
-                    continue
-                
-                # Translate section title for display
-                current_lang_value = current_lang.value
-                translated_title = self.db.get_section_translation(section_title, current_lang_value)
-                if not translated_title:
-                    translated_title = section_title  # Fallback to original
-                
-                print(f"[LOAD CANVAS] Creating canvas: '{translated_title}' ({len(parameters)} params)")
-                
-                canvas = CollapsibleCanvas(translated_title, expanded=True)
-                canvas.reset_requested.connect(lambda c=canvas, title=section_title: self.revert_canvas_section(c, title))
-                canvas.save_requested.connect(lambda c=canvas, title=section_title: self.save_canvas_section(c, title))
-                
-                # Add parameters
-                params_added = 0
-                for param_name, param_value in parameters.items():
-                    try:
-                        # Check if this is an available parameter from database
-                        is_available = isinstance(param_value, dict) and param_value.get('available', False)
-                        param_data = param_value.get('data') if is_available else None
-                        actual_value = param_value.get('value', param_value) if is_available else param_value
-                        
-                        param_widget = self.create_parameter_widget(
-                            param_name, 
-                            actual_value,
-                            is_available=is_available,
-                            param_data=param_data,
-                            can_add=self.is_advanced_mode
-                        )
-                        # Track modifications
-                        param_widget.modified_state_changed.connect(lambda modified, c=canvas: self.on_param_modified(c, modified))
-                        canvas.add_content(param_widget)
-                        params_added += 1
-                    except Exception as e:
-                        print(f"[LOAD CANVAS ERROR] Failed to create param widget '{param_name}': {e}")
-                
-                print(f"[LOAD CANVAS] Added {params_added}/{len(parameters)} params to '{translated_title}'")
-                
-                self.canvas_container.add_canvas(canvas)
-                canvases_created += 1
-                print(f"[LOAD CANVAS] Canvas '{translated_title}' added successfully ({canvases_created}/{len(mock_data)})")
-            
-            print(f"[LOAD CANVAS] Created {canvases_created} canvases successfully")
-            
-            if canvases_created == 0:
-                print(f"[LOAD CANVAS WARNING] No canvases were created! All sections were empty.")
+            # Build incrementally: first chunk now (visible canvases), rest in time slices
+            from src.ui.canvas_builder import CanvasBuilder
+            build_state = {'widgets': 0}
+            self._canvas_builder = CanvasBuilder(
+                self._iter_canvas_build(mock_data, current_lang, build_state),
+                on_slice=self._on_canvas_build_slice,
+                parent=self
+            )
+            self._canvas_builder.finished.connect(
+                lambda key=cache_key, data=mock_data, state=build_state: self._on_canvas_build_finished(key, data, state)
+            )
+            self._canvas_builder.start()
                 
         except Exception as e:
-            print(f"[LOAD CANVAS ERROR] Exception during load: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[LOAD CANVAS ERROR] Exception during load: %s", e)
         finally:
             # NO setUpdatesEnabled here - managed by caller (on_header_tab_changed)
             pass
+    
+    def _iter_canvas_build(self, mock_data: dict, current_lang, build_state: dict):
+        """
+        Build steps for CanvasBuilder: one step per canvas and per parameter widget.
+        
+        Canvases are added in section order, so the ones at the top of the
+        viewport are populated first.
+        """
+        for section_title, parameters in mock_data.items():
+            # Skip empty sections (all parameters filtered out)
+            if not parameters:
+                continue
+            
+            # Translate section title for display
+            translated_title = self.translation_table.section_title(section_title, current_lang.value)
+            
+            canvas = CollapsibleCanvas(translated_title, expanded=True)
+            canvas.section_name = section_title
+            self.label_registry.bind(canvas, KIND_SECTION, section_title, canvas.update_language)
+            canvas.reset_requested.connect(lambda c=canvas, title=section_title: self.revert_canvas_section(c, title))
+            canvas.save_requested.connect(lambda c=canvas, title=section_title: self.save_canvas_section(c, title))
+            self.canvas_container.add_canvas(canvas)
+            yield
+            
+            if len(parameters) >= self.VIRTUALIZE_THRESHOLD:
+                # Large section: one virtualized list instead of a widget per parameter
+                canvas.add_content(self.create_parameter_list(canvas, parameters, section_title))
+                build_state['widgets'] += 1
+                logger.debug("[LOAD CANVAS] Virtualized %s params in '%s'", len(parameters), translated_title)
+                yield
+                continue
+            
+            for param_name, param_value in parameters.items():
+                try:
+                    # Check if this is an available parameter from database
+                    is_available = isinstance(param_value, dict) and param_value.get('available', False)
+                    param_data = param_value.get('data') if is_available else None
+                    actual_value = param_value.get('value', param_value) if is_available else param_value
+                    
+                    param_widget = self.create_parameter_widget(
+                        param_name, 
+                        actual_value,
+                        is_available=is_available,
+                        param_data=param_data,
+                        can_add=self.is_advanced_mode,
+                        section=section_title
+                    )
+                    # Track modifications
+                    param_widget.modified_state_changed.connect(lambda modified, c=canvas: self.on_param_modified(c, modified))
+                    canvas.add_content(param_widget)
+                    build_state['widgets'] += 1
+                except Exception as e:
+                    logger.error("[LOAD CANVAS ERROR] Failed to create param widget '%s': %s", param_name, e)
+                yield
+            
+            logger.debug("[LOAD CANVAS] Canvas '%s' built (%s params)", translated_title, len(parameters))
+    
+    def _on_canvas_build_slice(self):
+        """Relayout after each build chunk (canvas heights grow while populating)."""
+        container = self.canvas_container
+        if not container.canvas_items:
+            return
         
-        # DEBUG: Print canvas_widget and scroll area info AFTER layout completes
-        QApplication.processEvents()  # Single process is sufficient
-        
-        # CRITICAL: Force layout recalculation after canvas creation
-        # This ensures proper spacing and responsive grid layout
-        if canvases_created > 0:
-            # Trigger layout update in canvas container
-            viewport_width = self.canvas_container.scroll_area.viewport().width()
+        container.setUpdatesEnabled(False)
+        try:
+            viewport_width = container.scroll_area.viewport().width()
             if viewport_width > 0:
                 # Force column recalculation
-                self.canvas_container.grid_manager.update_columns(viewport_width)
-                self.canvas_container._update_visible_columns()
-                print(f"[LOAD CANVAS] Layout recalculated for {viewport_width}px viewport")
-        
-        print(f"[DEBUG MainWindow] After loading panels:")
-        print(f"  canvas_widget size: {self.canvas_container.canvas_widget.size()}")
-        print(f"  scroll_area viewport size: {self.canvas_container.scroll_area.viewport().size()}")
-        print(f"  scroll_area size: {self.canvas_container.scroll_area.size()}")
-        print(f"  Current columns: {self.canvas_container.grid_manager.current_columns}")
-        
-        # Check actual canvas widths
-        for canvas_id, canvas in self.canvas_container.canvas_items.items():
-            print(f"  Canvas '{canvas_id}' width: {canvas.width()}px")
+                container.grid_manager.update_columns(viewport_width)
+            container.relayout_changed()
+        finally:
+            container.setUpdatesEnabled(True)
+    
+    def _on_canvas_build_finished(self, cache_key: tuple, mock_data: dict, build_state: dict):
+        """Build complete - current view becomes cacheable."""
+        logger.debug("[LOAD CANVAS] Created %s canvases, %s widgets", len(self.canvas_container.canvas_items), build_state['widgets'])
+        
+        # Remember what this view contains (for caching on next tab switch)
+        self._current_cache_key = cache_key
+        self._current_cache_meta = {
+            'sections': set(mock_data.keys()) | set(self.get_tab_index().get(cache_key[1], [])),
+            'widgets': build_state['widgets'],
+            'advanced': self.is_advanced_mode,
+        }
+    
+    def _cancel_canvas_build(self):
+        """Cancel unfinished build - partially built canvases are not cached."""
+        if self._canvas_builder is not None and self._canvas_builder.is_running:
+            logger.debug("[LOAD CANVAS] Cancelling unfinished build")
+            self._canvas_builder.cancel()
+        self._canvas_builder = None
+    
+    def _park_current_canvases(self):
+        """Move canvases of current tab into LRU cache (hidden, not destroyed)."""
+        key = self._current_cache_key
+        meta = self._current_cache_meta
+        self._current_cache_key = None
+        self._current_cache_meta = None
+        
+        if key is None or not self.canvas_container.canvas_items:
+            self.canvas_container.clear_canvases()
+            return
+        
+        meta['snapshot'] = self.canvas_container.detach_canvases()
+        self._canvas_cache[key] = meta
+        self._canvas_cache.move_to_end(key)
+        self._evict_canvas_cache()
+    
+    def _restore_cached_canvases(self, key: tuple) -> bool:
+        """Re-attach cached canvases for key. Returns False if not cached."""
+        meta = self._canvas_cache.pop(key, None)
+        if meta is None:
+            return False
+        
+        # Widgets were built for other FREE/ADVANCED mode - rebuild
+        if meta['advanced'] != self.is_advanced_mode:
+            self._destroy_canvas_snapshot(meta.pop('snapshot'))
+            return False
+        
+        snapshot = meta.pop('snapshot')
+        self.canvas_container.attach_canvases(snapshot)
+        
+        self._current_cache_key = key
+        self._current_cache_meta = meta
+        return True
+    
+    def _evict_canvas_cache(self):
+        """Drop least recently used tabs over tab/widget limits."""
+        total_widgets = sum(meta['widgets'] for meta in self._canvas_cache.values())
+        while self._canvas_cache and (
+            len(self._canvas_cache) > self.CANVAS_CACHE_MAX_TABS
+            or total_widgets > self.CANVAS_CACHE_MAX_WIDGETS
+        ):
+            key, meta = self._canvas_cache.popitem(last=False)
+            total_widgets -= meta['widgets']
+            self._destroy_canvas_snapshot(meta['snapshot'])
+            logger.debug("[CANVAS CACHE] Evicted %s", key)
+    
+    def _destroy_canvas_snapshot(self, snapshot: dict):
+        """Destroy detached canvases."""
+        for canvas in snapshot['canvas_items'].values():
+            canvas.setParent(None)
+            canvas.deleteLater()
+    
+    def invalidate_canvas_cache(self, sections: set = None) -> bool:
+        """
+        Drop cached tabs containing given sections (INI or database changed).
+        
+        Args:
+            sections: Changed section names, None = drop everything
             
+        Returns:
+            True if currently shown tab contains changed sections (needs reload)
+        """
+        for key in list(self._canvas_cache.keys()):
+            meta = self._canvas_cache[key]
+            if sections is None or meta['sections'] & sections:
+                del self._canvas_cache[key]
+                self._destroy_canvas_snapshot(meta['snapshot'])
+        
+        if self._current_cache_meta is None:
+            # Tab still being built - rebuild to be safe
+            return self._canvas_builder is not None and self._canvas_builder.is_running
+        return sections is None or bool(self._current_cache_meta['sections'] & sections)
+    
     def get_mock_data(self, category: str, tab_name: str) -> dict:
         """Get INI data - from file + database if available, otherwise mock data."""
         if category != 'ini':
@@ -1014,16 +1286,16 @@ class CanvasMainWindow(QMainWindow):
                         real_data[plugin_name.replace('.ini', '').title()] = plugin_params
                 
                 if real_data:
-                    print(f"[Dynamic] Loaded Plugins: {list(real_data.keys())}")
+                    logger.debug("[Dynamic] Loaded Plugins: %s", list(real_data.keys()))
                     return real_data
             
             # Special handling for Paths tab - merge all *Dirs sections into one
             if tab_name == 'Paths':
                 merged_dirs = {}
                 
-                for section_name, section in self.ini_manager.current_sections.items():
-                    tab = get_tab_for_section(section_name, '3dsmax.ini')
-                    if tab == 'Paths':
+                for section_name in self.get_tab_index().get('Paths', []):
+                    section = self.ini_manager.current_sections.get(section_name)
+                    if section is not None:
                         # Add all parameters from this section with section prefix
                         for param_name, param_value in section.parameters.items():
                             # Create unique key: Section.Param
@@ -1032,14 +1304,14 @@ class CanvasMainWindow(QMainWindow):
                 
                 if merged_dirs:
                     real_data['Directories'] = merged_dirs
-                    print(f"[Dynamic] Merged {len(merged_dirs)} directory parameters into single 'Directories' section")
+                    logger.debug("[Dynamic] Merged %s directory parameters into single 'Directories' section", len(merged_dirs))
                     return real_data
             
             # Normal handling for other tabs
-            for section_name, section in self.ini_manager.current_sections.items():
-                # Check if section belongs to this tab
-                tab = get_tab_for_section(section_name, '3dsmax.ini')
-                if tab == tab_name:
+            for section_name in self.get_tab_index().get(tab_name, []):
+                # Sections of this tab (precomputed)
+                section = self.ini_manager.current_sections.get(section_name)
+                if section is not None:
                     # Get real parameters from INI
                     section_params = {}
                     for param_name, param_value in section.parameters.items():
@@ -1066,13 +1338,13 @@ class CanvasMainWindow(QMainWindow):
                                 'data': param_data
                             }
                         else:
-                            print(f"[DUPLICATE SKIP] {section_name}.{param_name_only} already exists in INI")
+                            logger.debug("[DUPLICATE SKIP] %s.%s already exists in INI", section_name, param_name_only)
                     
                     if section_params:
                         real_data[section_name] = section_params
             
             if real_data:
-                print(f"[Dynamic] Loaded {len(real_data)} sections for {tab_name}: {list(real_data.keys())}")
+                logger.debug("[Dynamic] Loaded %s sections for %s: %s", len(real_data), tab_name, list(real_data.keys()))
                 return real_data
         
         # Fallback to mock data
@@ -1125,7 +1397,7 @@ class CanvasMainWindow(QMainWindow):
                 }
             }
             
-    def create_parameter_widget(self, name: str, value: str, is_available: bool = False, param_data: dict = None, can_add: bool = False) -> QWidget:
+    def create_parameter_widget(self, name: str, value: str, is_available: bool = False, param_data: dict = None, can_add: bool = False, section: str = None) -> QWidget:
         """Create parameter widget - supports available (dimmed) parameters."""
         # Get help text for this parameter
         help_text = self.get_help_text(name)
@@ -1143,35 +1415,61 @@ class CanvasMainWindow(QMainWindow):
             if 'en' in param_data and 'description' in param_data['en']:
                 help_text = param_data['en']['description']
             
-            print(f">>> Available param {name}: default='{default_value}'")
+            logger.debug(">>> Available param %s: default='%s'", name, default_value)
         else:
             default_value = value
         
-        param_widget = INIParameterWidget(name, default_value, param_type='auto', help_text=help_text)
+        # Type declared in database/rules wins; resolved once per (section, key)
+        identity = self._param_identity(section, name) if section else None
+        param_type = get_type_resolver().resolve(identity[1], identity[2], default_value) if identity else 'auto'
+        param_widget = INIParameterWidget(name, default_value, param_type=param_type, help_text=help_text)
+        param_widget.identity = identity
         
         # Set available state if needed
         if is_available:
-            print(f"\n>>> Creating AVAILABLE widget: {name}")
-            print(f">>> is_advanced_mode={self.is_advanced_mode}, can_add={can_add}")
+            logger.debug(">>> Creating AVAILABLE widget: %s", name)
+            logger.debug(">>> is_advanced_mode=%s, can_add=%s", self.is_advanced_mode, can_add)
             param_widget.set_available_state(True, can_add=can_add)
             if param_data and 'en' in param_data and 'description' in param_data['en']:
                 param_widget.set_tooltip(param_data['en']['description'])
             # Connect add button
             if can_add:
                 param_widget.parameter_added.connect(lambda pname=name: self.on_parameter_added(pname, param_data))
-                print(f">>> Signal connected for {name}")
+                logger.debug(">>> Signal connected for %s", name)
         
-        param_widget.value_changed.connect(self.on_parameter_changed)
+        param_widget.value_changed.connect(
+            lambda pname, value, ident=identity: self.on_parameter_changed(pname, value, ident)
+        )
         return param_widget
     
+    def create_parameter_list(self, canvas, parameters: dict, section: str = None) -> "ParameterListView":
+        """Create virtualized parameter list for large section."""
+        from src.ui.parameter_list_view import ParameterListView
+        param_types = None
+        if section:
+            resolver = get_type_resolver()
+            param_types = {}
+            for name, value in parameters.items():
+                _, param_section, key = self._param_identity(section, name)
+                value = value.get('value', '') if isinstance(value, dict) else value
+                param_types[name] = resolver.resolve(param_section, key, value)
+        param_list = ParameterListView(parameters, param_types)
+        param_list.value_changed.connect(
+            lambda pname, value, s=section: self.on_parameter_changed(
+                pname, value, self._param_identity(s, pname) if s else None
+            )
+        )
+        param_list.modified_state_changed.connect(lambda modified, c=canvas: self.on_param_modified(c, modified))
+        return param_list
+    
     def on_parameter_added(self, param_name: str, param_data: dict):
         """Handle parameter addition from database to INI."""
-        print(f">>> on_parameter_added HANDLER called for {param_name}")
-        print(f">>> param_data: {param_data is not None}")
+        logger.debug(">>> on_parameter_added HANDLER called for %s", param_name)
+        logger.debug(">>> param_data: %s", param_data is not None)
         # TODO: Add to INI with backup
         # DON'T reload view - widget already activated itself!
         # Just mark canvas as modified
-        print(f">>> Parameter added successfully, widget self-activated")
+        logger.debug(">>> Parameter added successfully, widget self-activated")
         
     def get_help_text(self, param_name: str) -> str:
         """Get help text for parameter."""
@@ -1242,33 +1540,92 @@ class CanvasMainWindow(QMainWindow):
         
         return help_texts.get(param_name, f'{param_name}\n\nNo help available for this parameter.')
         
-    def on_parameter_changed(self, param_name: str, new_value: str):
-        """Handle parameter value change."""
-        print(f"Parameter changed: {param_name} = {new_value}")
+    def _param_identity(self, section_title: str, param_name: str) -> tuple:
+        """
+        Get (ini_file, section, key) of parameter shown in canvas section_title.
+        
+        Plugins tab canvases are titled by plugin and Paths tab merges
+        sections, both list parameters by full "Section.Key" name.
+        """
+        main_ini = self.ini_manager.ini_path.name if self.ini_manager else None
+        
+        if self._plugin_titles is None:
+            self._plugin_titles = {
+                plugin_name.replace('.ini', '').title(): plugin_name
+                for plugin_name in self.plugin_ini_managers
+            }
+        plugin_name = self._plugin_titles.get(section_title)
+        if plugin_name and '.' in param_name:
+            section, key = param_name.split('.', 1)
+            return (plugin_name, section, key)
+        
+        if self.ini_manager and '.' in param_name:
+            sections = self.ini_manager.current_sections
+            section = sections.get(section_title)
+            if section is None or param_name not in section.parameters:
+                section_name, key = param_name.split('.', 1)
+                if section_name in sections:
+                    return (main_ini, section_name, key)
+        
+        return (main_ini, section_title, param_name)
+    
+    def _get_ini_manager(self, ini_file: str):
+        """Get INI manager owning ini_file (main INI or plugin INI)."""
+        if self.ini_manager and ini_file == self.ini_manager.ini_path.name:
+            return self.ini_manager
+        return self.plugin_ini_managers.get(ini_file)
+    
+    def on_parameter_changed(self, param_name: str, new_value: str, identity: tuple = None):
+        """Handle parameter value change (applied to INI manager on next event-loop tick)."""
+        if identity is None:
+            self._apply_unrouted_change(param_name, new_value)
+            return
         
-        # Update in INI manager if available
+        if self._search_active:
+            self._search_edited_sections.add(identity[1])
+        else:
+            # Keep search pool consistent with edits made in tab view
+            self._discard_search_section(identity[1])
+        self._change_dispatcher.submit(identity, new_value)
+    
+    def _apply_unrouted_change(self, param_name: str, new_value: str):
+        """Apply change of widget without identity (section found by scan)."""
+        logger.debug("Parameter changed: %s = %s", param_name, new_value)
         if self.ini_manager:
-            # Find which section this parameter belongs to
             for section_name, section in self.ini_manager.current_sections.items():
                 if param_name in section.parameters:
                     self.ini_manager.update_parameter(section_name, param_name, new_value)
-                    print(f"Updated in INI manager: [{section_name}] {param_name} = {new_value}")
+                    if self._search_active:
+                        self._search_edited_sections.add(section_name)
+                    else:
+                        self._discard_search_section(section_name)
                     break
+    
+    def _apply_parameter_changes(self, changes: list):
+        """Apply coalesced batch of [((ini_file, section, key), value)] to INI managers."""
+        for (ini_file, section_name, key), new_value in changes:
+            manager = self._get_ini_manager(ini_file)
+            if manager is None or section_name not in manager.current_sections:
+                logger.debug("[PARAM] No INI section for %s.%s, change not tracked", section_name, key)
+                continue
+            manager.update_parameter(section_name, key, new_value)
+            logger.debug("Updated in INI manager: %s [%s] %s = %s", ini_file, section_name, key, new_value)
         
     def on_param_modified(self, canvas, modified: bool):
         """Handle parameter modification state change."""
         if modified:
             canvas.mark_as_modified()
-            print(f"Canvas '{canvas.title}' has unsaved changes")
+            logger.debug("Canvas '%s' has unsaved changes", canvas.title)
         else:
             # Check if any other params in canvas are still modified
             # For now, just mark as saved
             canvas.mark_as_saved()
-            print(f"Canvas '{canvas.title}' all changes saved")
+            logger.debug("Canvas '%s' all changes saved", canvas.title)
         
     def save_canvas_section(self, canvas, section_title: str):
         """Save all parameters in a canvas section."""
-        print(f"Save requested for section: {section_title}")
+        logger.debug("Save requested for section: %s", section_title)
+        self._change_dispatcher.flush()
         
         # Call mark_as_saved on all parameter widgets
         for i in range(canvas.content_layout.count()):
@@ -1282,56 +1639,234 @@ class CanvasMainWindow(QMainWindow):
         
     def revert_canvas_section(self, canvas, section_title: str):
         """Reset all parameters in a canvas section to default values."""
-        print(f"Reset to default requested for section: {section_title}")
+        logger.debug("Reset to default requested for section: %s", section_title)
+        self._change_dispatcher.flush()
         canvas.reset_all_parameters()
         
         # Revert in INI manager if available
         if self.ini_manager:
             self.ini_manager.revert_section(section_title)
-            print(f"Reverted section in INI manager: {section_title}")
+            logger.debug("Reverted section in INI manager: %s", section_title)
+        
+        # Other views of the section still show reverted edits
+        if self._search_pool.get(section_title) is canvas:
+            self._search_edited_sections.add(section_title)
+        else:
+            self._discard_search_section(section_title)
         
         canvas.mark_as_saved()
         
     def on_refresh_clicked(self):
         """Reload INI file from disk."""
-        print("Refresh clicked - reloading INI...")
+        logger.debug("Refresh clicked - reloading INI...")
+        self._change_dispatcher.flush()
+        old_sections = self._snapshot_ini_sections()
         if self.ini_manager and self.ini_manager.load_ini():
             # Reload current view
-            print("✅ INI reloaded successfully")
-            # TODO: Refresh canvas panels
+            logger.info("INI reloaded successfully")
+            self._tab_index = None
+            
+            # Rebuild only tabs whose sections changed on disk
+            changed_sections = self._get_changed_sections(old_sections, self._snapshot_ini_sections())
+            self._apply_reloaded_sections(changed_sections)
         else:
-            print("❌ Failed to reload INI")
+            logger.error("Failed to reload INI")
+    
+    @timed('session.reload_changed')
+    def reload_changed_inis(self) -> list:
+        """
+        Reload INI files changed on disk since they were loaded.
+        
+        Called by the file watcher, on re-show of resident window and
+        before saving. Only files whose mtime/size changed are parsed
+        again, only tabs with changed sections are rebuilt. Unsaved edits
+        are merged over the new file contents; edits of keys also changed
+        on disk are reported to the user (keep edit or take disk value).
+        
+        Returns:
+            Names of reloaded INI files
+        """
+        if self._startup_pending:
+            return []
+        self._change_dispatcher.flush()
+        
+        managers = [(self.ini_manager, None)] if self.ini_manager else []
+        managers += [
+            (manager, plugin_name.replace('.ini', '').title())
+            for plugin_name, manager in self.plugin_ini_managers.items()
+        ]
+        
+        reloaded = []
+        changed_sections = set()
+        for manager, plugin_title in managers:
+            if not manager.is_changed_on_disk():
+                continue
+            result = manager.merge_from_disk()
+            if result is None:
+                logger.error("[RELOAD] Failed to reload %s", manager.ini_path)
+                continue
+            reloaded.append(manager.ini_path.name)
+            
+            if result.conflicts:
+                self._resolve_conflicts(manager, result.conflicts)
+            
+            if plugin_title is None:
+                self._tab_index = None
+                changed_sections |= result.changed_sections
+                changed_sections |= {conflict.section for conflict in result.conflicts}
+            elif result.changed_sections or result.conflicts:
+                # Plugins tab shows each plugin INI as one canvas titled by plugin
+                changed_sections.add(plugin_title)
+        
+        if reloaded:
+            logger.info("[RELOAD] Reloaded changed INI files: %s", reloaded)
+            self._apply_reloaded_sections(changed_sections)
+        return reloaded
+    
+    def _resolve_conflicts(self, manager, conflicts: list):
+        """Ask user and take disk values of conflicting keys unless local edits are kept."""
+        if self.ask_keep_local_edits(manager, conflicts):
+            return
+        for conflict in conflicts:
+            if conflict.disk_value is not None:
+                manager.update_parameter(conflict.section, conflict.key, conflict.disk_value)
+    
+    def ask_keep_local_edits(self, manager, conflicts: list) -> bool:
+        """
+        Ask which values win for keys edited here and changed on disk.
+        
+        Returns:
+            True to keep unsaved edits, False to take values from disk
+        """
+        lines = [
+            f"[{conflict.section}] {conflict.key}: {conflict.local_value} \u2192 "
+            f"{conflict.disk_value if conflict.disk_value is not None else '(removed)'}"
+            for conflict in conflicts[:MAX_LISTED_CONFLICTS]
+        ]
+        if len(conflicts) > MAX_LISTED_CONFLICTS:
+            lines.append(f"... +{len(conflicts) - MAX_LISTED_CONFLICTS}")
+        text = "\n\n".join([
+            self.translation_manager.get("ini_conflict_text").format(file=manager.ini_path.name),
+            "\n".join(lines),
+            self.translation_manager.get("ini_conflict_question"),
+        ])
+        reply = QMessageBox.question(
+            self,
+            self.translation_manager.get("ini_conflict_title"),
+            text,
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes
+        )
+        return reply == QMessageBox.Yes
+    
+    def _apply_reloaded_sections(self, changed_sections: set):
+        """Drop search state and rebuild tabs showing sections changed by a reload."""
+        if self._search_pipeline is not None:
+            self._search_pipeline.invalidate()
+        self._discard_search_pool()
+        logger.debug("[REFRESH] Changed sections: %s", sorted(changed_sections))
+        if changed_sections and self.invalidate_canvas_cache(changed_sections):
+            self._reload_current_tab()
+    
+    def _snapshot_ini_sections(self, manager=None) -> dict:
+        """Copy of current INI values per section (for change detection)."""
+        manager = manager or self.ini_manager
+        if not manager:
+            return {}
+        return {
+            section_name: dict(section.parameters)
+            for section_name, section in manager.current_sections.items()
+        }
+    
+    @staticmethod
+    def _get_changed_sections(old_sections: dict, new_sections: dict) -> set:
+        """Sections added, removed or with different values."""
+        return {
+            section_name
+            for section_name in old_sections.keys() | new_sections.keys()
+            if old_sections.get(section_name) != new_sections.get(section_name)
+        }
+    
+    def _reload_current_tab(self):
+        """Rebuild canvases of current tab (current canvases are discarded, not cached)."""
+        if not (self.current_category and self.current_tab):
+            return
+        self._current_cache_key = None
+        self.canvas_container.setUpdatesEnabled(False)
+        try:
+            self.load_canvas_panels(self.current_category, self.current_tab)
+        finally:
+            self.canvas_container.setUpdatesEnabled(True)
     
     def on_revert_clicked(self):
         """Revert all changes."""
-        print("Revert clicked - reverting all changes...")
+        logger.debug("Revert clicked - reverting all changes...")
+        self._change_dispatcher.flush()
         if self.ini_manager:
+            reverted_sections = {key.split('.', 1)[0] for key in self.ini_manager.modified_params}
             self.ini_manager.revert_all()
-            print(f"✅ Reverted all changes")
-            # TODO: Refresh canvas panels to show original values
+            logger.info("Reverted all changes")
+            
+            # Pooled search canvases were built from the edited values
+            if self._search_active:
+                self._discard_search_pool()
+            else:
+                for section_name in reverted_sections:
+                    self._discard_search_section(section_name)
+            
+            # Rebuild tabs showing reverted values
+            if reverted_sections and self.invalidate_canvas_cache(reverted_sections):
+                self._reload_current_tab()
         else:
-            print("No INI manager available")
+            logger.debug("No INI manager available")
     
     def on_apply_clicked(self):
-        """Apply all changes and save to file."""
-        print("Apply clicked - saving changes...")
-        if self.ini_manager:
-            if self.ini_manager.has_unsaved_changes():
-                success, error = self.ini_manager.save_ini(create_backup=True)
-                if success:
-                    print(f"✅ Changes saved to {self.ini_manager.ini_path}")
-                    print(f"Saved {self.ini_manager.get_modified_count()} parameters")
-                    
-                    # Mark all canvases as saved
-                    for canvas in self.ini_manager.canvas_items if hasattr(self.ini_manager, 'canvas_items') else []:
-                        canvas.mark_as_saved()
-                else:
-                    print(f"❌ Failed to save: {error}")
-            else:
-                print("No changes to save")
-        else:
-            print("No INI manager available")
-
+        """Apply all changes and save to file (main INI and plugin INIs)."""
+        logger.debug("Apply clicked - saving changes...")
+        self._change_dispatcher.flush()
+        # Merge newer values written outside the editor instead of overwriting them
+        self.reload_changed_inis()
+        managers = [self.ini_manager] if self.ini_manager else []
+        managers += list(self.plugin_ini_managers.values())
+        if not managers:
+            logger.debug("No INI manager available")
+            return
+        
+        modified = [manager for manager in managers if manager.has_unsaved_changes()]
+        if not modified:
+            logger.debug("No changes to save")
+            return
+        
+        saved = [manager for manager in modified if self._apply_ini_changes(manager)]
+        if len(saved) == len(modified):
+            # Mark all canvases as saved (shown, cached tabs and search pool)
+            canvases = list(self.canvas_container.canvas_items.values())
+            for meta in self._canvas_cache.values():
+                canvases += meta['snapshot']['canvas_items'].values()
+            canvases += self._search_pool.values()
+            for canvas in canvases:
+                canvas.mark_as_saved()
+    
+    def _apply_ini_changes(self, manager) -> bool:
+        """Save unsaved edits of one INI manager through the apply planner."""
+        # Live-safe keys also go to the running session, one backup for both
+        from src.modules.apply_planner import ApplyPlanner, session_bridge_for
+        planner = ApplyPlanner(manager, bridge=session_bridge_for(manager.ini_path))
+        result = planner.execute(planner.plan_changes(manager.get_modified_values()), reason="editor_apply")
+        if result.conflicts:
+            # File changed again after the reload: resolve with user, then apply merged values
+            self._resolve_conflicts(manager, result.conflicts)
+            result = planner.execute(planner.plan_changes(manager.get_modified_values()), reason="editor_apply")
+        plan = result.plan
+        if not result.success:
+            logger.error("Failed to save %s: %s", manager.ini_path, result.error)
+            return False
+        logger.info("Changes saved to %s: %s applied live, %s after restart",
+                    manager.ini_path, len(plan.live), len(plan.restart))
+        if result.requires_restart:
+            logger.info("Restart 3ds Max to apply: %s",
+                        [f"{change.section}.{change.key}" for change in plan.restart])
+        return True
 
 def main():
     """Run the application standalone."""
@@ -1341,6 +1876,9 @@ def main():
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
     
+    # Standalone debug runs (run_ui_debug.bat) show log in console too
+    setup_logging(console_level=logging.DEBUG)
+    
     app = QApplication(sys.argv)
     
     # Set UTF-8 for Qt text rendering
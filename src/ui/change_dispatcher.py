@@ -0,0 +1,57 @@
+"""
+Coalescing parameter change dispatcher.
+
+Parameter editors (scrubby spin boxes in particular) report a value on
+every mouse move. The dispatcher keeps only the latest value per
+parameter identity and hands the batch over once per event-loop tick.
+"""
+
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class ChangeDispatcher(QObject):
+    """
+    Collect (identity, value) changes, emit one batch per event-loop tick.
+
+    Usage:
+        dispatcher = ChangeDispatcher()
+        dispatcher.changes_ready.connect(apply_changes)
+        widget.value_changed.connect(lambda name, value: dispatcher.submit(identity, value))
+
+    Call flush() before reading the target state synchronously (save,
+    revert, reload), so no change is left pending.
+    """
+
+    changes_ready = Signal(list)  # [(identity, value), ...] in order of first change
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._pending: "OrderedDict[Hashable, str]" = OrderedDict()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of parameters with undelivered changes."""
+        return len(self._pending)
+
+    def submit(self, identity: Hashable, value: str):
+        """Record latest value for identity (delivered on next tick)."""
+        self._pending[identity] = value
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """Deliver pending changes now."""
+        self._timer.stop()
+        if not self._pending:
+            return
+        batch: List[Tuple[Hashable, str]] = list(self._pending.items())
+        self._pending.clear()
+        self.changes_ready.emit(batch)
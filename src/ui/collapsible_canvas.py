@@ -5,6 +5,7 @@ Provides accordion-style panels with expand/collapse functionality.
 Each panel has a header with title and arrow, and collapsible content area.
 """
 
+import logging
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, 
     QPushButton, QScrollArea, QFrame, QMenu, QSizePolicy, QApplication, QSpacerItem
@@ -13,14 +14,17 @@ from PySide6.QtCore import Qt, Signal, QMimeData, QPoint, QTimer, QRect, QProper
 from PySide6.QtGui import QFont, QPainter, QColor, QPen, QDrag, QPixmap, QBrush
 
 from .grid_layout_manager import GridLayoutManager, GridItem
-from .layout_storage import LayoutStorage
+from .layout_storage import get_layout_storage
 from .skyline_layout import SkylineLayout
+from .packing_engine import PackingEngine, PackItem, next_slot
+from .theme_service import QTA_AVAILABLE, get_icon, get_pixmap, repolish
+from ..core.profiling import timed
 
-try:
-    import qtawesome as qta
-    QTA_AVAILABLE = True
-except ImportError:
-    QTA_AVAILABLE = False
+logger = logging.getLogger(__name__)
+
+
+# Assert after every layout pass that no canvases overlap (O(n²), for debugging layout code)
+LAYOUT_DEBUG = False
 
 
 class CollapsibleCanvas(QWidget):
@@ -42,6 +46,7 @@ class CollapsibleCanvas(QWidget):
     def __init__(self, title: str, expanded: bool = True, parent=None):
         super().__init__(parent)
         self.title = title
+        self.section_name = title  # Untranslated section name (title may be translated)
         self.is_expanded = expanded
         self.header = None  # Initialize before init_ui
         self.has_unsaved_changes = False  # Track unsaved changes
@@ -54,7 +59,6 @@ class CollapsibleCanvas(QWidget):
         self._target_height = 0  # Cache content height for animation
         
         self.init_ui()
-        self.apply_styles()
         
         # Enable context menu on header
         self.header.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -74,7 +78,7 @@ class CollapsibleCanvas(QWidget):
         
         # Create content area - gray opaque background, with bottom rounding
         self.content_widget = QWidget()
-        self.content_widget.setStyleSheet("background-color: #3A3A3A; border-bottom-left-radius: 7.5px; border-bottom-right-radius: 7.5px;")
+        self.content_widget.setObjectName("canvas_content")
         self.content_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)  # Expand to fill parent
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(10, 10, 10, 10)
@@ -125,10 +129,8 @@ class CollapsibleCanvas(QWidget):
             grip_label = QLabel(grip)
             grip_label.setFixedSize(20, 20)
             grip_label.setAlignment(Qt.AlignCenter)
-            grip_pixmap = qta.icon('mdi.resize-bottom-right', color='#666666').pixmap(16, 16)
-            grip_label.setPixmap(grip_pixmap)
+            grip_label.setPixmap(get_pixmap('mdi.resize-bottom-right', '#666666', 16))
         else:
-            grip.setStyleSheet("color: #666666; font-size: 16px;")
             grip_text = QLabel("⋰", grip)  # Diagonal resize symbol
             grip_text.setAlignment(Qt.AlignCenter)
         
@@ -183,11 +185,9 @@ class CollapsibleCanvas(QWidget):
         
         if QTA_AVAILABLE:
             # FontAwesome grip-vertical icon - white color
-            drag_pixmap = qta.icon('fa5s.grip-vertical', color='white').pixmap(16, 16)
-            self.drag_icon.setPixmap(drag_pixmap)
+            self.drag_icon.setPixmap(get_pixmap('fa5s.grip-vertical', 'white', 16))
         else:
             self.drag_icon.setText("⋮⋮")
-            self.drag_icon.setStyleSheet("color: white; font-size: 14px;")
         
         layout.addWidget(self.drag_icon)
         
@@ -208,8 +208,7 @@ class CollapsibleCanvas(QWidget):
         self.save_button.setVisible(False)  # Hidden by default
         
         if QTA_AVAILABLE:
-            save_icon = qta.icon('fa5.save', color='white')
-            self.save_button.setIcon(save_icon)
+            self.save_button.setIcon(get_icon('fa5.save', 'white'))
             self.save_button.setIconSize(self.save_button.size() * 0.8)  # 16x16 icon
         else:
             self.save_button.setText("💾")
@@ -226,8 +225,7 @@ class CollapsibleCanvas(QWidget):
         self.reset_button.setVisible(False)  # Hidden by default
         
         if QTA_AVAILABLE:
-            reset_icon = qta.icon('fa5s.undo', color='white')
-            self.reset_button.setIcon(reset_icon)
+            self.reset_button.setIcon(get_icon('fa5s.undo', 'white'))
             self.reset_button.setIconSize(self.reset_button.size() * 0.6)  # 12x12 icon
         else:
             self.reset_button.setText("⟲")
@@ -256,104 +254,9 @@ class CollapsibleCanvas(QWidget):
         super().paintEvent(event)
     
     def update_header_style(self):
-        """Update header style based on expand/collapse state."""
-        if self.is_expanded:
-            # Expanded - only top rounded
-            self.header.setStyleSheet("""
-                QWidget#canvas_header {
-                    background-color: #9C823A;
-                    border: none;
-                    border-top-left-radius: 7.5px;
-                    border-top-right-radius: 7.5px;
-                    border-bottom-left-radius: 0px;
-                    border-bottom-right-radius: 0px;
-                }
-                QWidget#canvas_header:hover {
-                    background-color: #9C823A;
-                }
-                QLabel#canvas_title {
-                    color: white;
-                    font-size: 10px;
-                    font-weight: bold;
-                    background-color: transparent;
-                }
-                QPushButton#canvas_arrow {
-                    background-color: transparent;
-                    color: white;
-                    border: none;
-                    font-size: 12px;
-                    font-weight: bold;
-                    padding: 0px;
-                }
-                QPushButton#canvas_arrow:hover {
-                    color: white;
-                }
-                QPushButton#canvas_reset {
-                    background-color: transparent;
-                    color: white;
-                    border: none;
-                    padding: 0px;
-                }
-                QPushButton#canvas_reset:hover {
-                    background-color: transparent;
-                }
-                QPushButton#canvas_save {
-                    background-color: transparent;
-                    color: white;
-                    border: none;
-                    padding: 0px;
-                }
-                QPushButton#canvas_save:hover {
-                    background-color: transparent;
-                }
-            """)
-        else:
-            # Collapsed - all corners rounded
-            self.header.setStyleSheet("""
-                QWidget#canvas_header {
-                    background-color: #9C823A;
-                    border: none;
-                    border-radius: 7.5px;
-                }
-                QWidget#canvas_header:hover {
-                    background-color: #9C823A;
-                }
-                QLabel#canvas_title {
-                    color: white;
-                    font-size: 10px;
-                    font-weight: bold;
-                    background-color: transparent;
-                }
-                QPushButton#canvas_arrow {
-                    background-color: transparent;
-                    color: white;
-                    border: none;
-                    font-size: 12px;
-                    font-weight: bold;
-                    padding: 0px;
-                }
-                QPushButton#canvas_arrow:hover {
-                    color: white;
-                }
-                QPushButton#canvas_reset {
-                    background-color: transparent;
-                    color: white;
-                    border: none;
-                    padding: 0px;
-                }
-                QPushButton#canvas_reset:hover {
-                    background-color: transparent;
-                }
-                QPushButton#canvas_save {
-                    background-color: transparent;
-                    color: white;
-                    border: none;
-                    padding: 0px;
-                }
-                QPushButton#canvas_save:hover {
-                    background-color: transparent;
-                }
-            """)
+        """Update header style based on expand/collapse state (expanded - only top rounded)."""
+        self.header.setProperty("expanded", self.is_expanded)
+        repolish(self.header, recursive=False)
     
     def update_arrow(self):
         """Update arrow direction based on expanded state."""
@@ -371,17 +274,17 @@ class CollapsibleCanvas(QWidget):
         try:
             if self.is_expanded:
                 # Expanded - chevron up
-                icon = qta.icon('fa6s.chevron-up', color='white')
+                icon = get_icon('fa6s.chevron-up', 'white')
             else:
                 # Collapsed - chevron down
-                icon = qta.icon('fa6s.chevron-down', color='white')
+                icon = get_icon('fa6s.chevron-down', 'white')
                 
             self.arrow_button.setIcon(icon)
             self.arrow_button.setIconSize(self.arrow_button.size() * 0.8)  # 16x16 icon in 20x20 button
             self.arrow_button.setText("")  # Clear text when using icon
         except Exception as e:
             # Fallback to unicode if icon fails
-            print(f"Failed to load chevron icon: {e}")
+            logger.warning("Failed to load chevron icon: %s", e)
             if self.is_expanded:
                 self.arrow_button.setText("▲")
             else:
@@ -389,7 +292,7 @@ class CollapsibleCanvas(QWidget):
             
     def toggle(self):
         """Toggle expand/collapse state - NO ANIMATION."""
-        print(f"[CollapsibleCanvas.toggle] ========== START toggle for '{self.title}' ==========")
+        logger.debug("[CollapsibleCanvas.toggle] START toggle for '%s'", self.title)
         
         # Find CanvasContainer parent
         container = self.parent()
@@ -403,7 +306,7 @@ class CollapsibleCanvas(QWidget):
         self.update_arrow()
         self.update_header_style()
         
-        print(f"[CollapsibleCanvas.toggle] State changed to: expanded={self.is_expanded}")
+        logger.debug("[CollapsibleCanvas.toggle] State changed to: expanded=%s", self.is_expanded)
         
         # Force layout update
         self.updateGeometry()
@@ -411,9 +314,8 @@ class CollapsibleCanvas(QWidget):
             self.parent().updateGeometry()
         
         # CRITICAL: Rebuild masonry layout when height changes!
-        if container and hasattr(container, '_rebuild_skyline_layout'):
-            print(f"[CollapsibleCanvas.toggle] Triggering masonry rebuild")
-            container._rebuild_skyline_layout()
+        if container and hasattr(container, 'relayout_canvas'):
+            container.relayout_canvas(self)
         
         self.toggled.emit(self.is_expanded)
         
@@ -439,8 +341,8 @@ class CollapsibleCanvas(QWidget):
                     else:
                         self._base_col_width = 460  # Fallback
                     
-                    print(f"[ResizeGrip] Start resize: {self.title}")
-                    print(f"  Current width={self._resize_start_width}px, base_col_width={self._base_col_width}px")
+                    logger.debug("[ResizeGrip] Start resize: %s", self.title)
+                    logger.debug("  Current width=%spx, base_col_width=%spx", self._resize_start_width, self._base_col_width)
                     return True
             
             elif event.type() == event.Type.MouseMove:
@@ -490,12 +392,10 @@ class CollapsibleCanvas(QWidget):
                                     geom = canvas.geometry()
                                     self._original_positions[cid] = (geom.x(), geom.y(), geom.width(), geom.height())
                             
-                            print(f"\n{'='*60}")
-                            print(f"[DRAG START] Canvas '{canvas_id}': my_x={my_x}, my_y={my_y}, width={int(new_width)}")
-                            print(f"[DRAG START] Saved original positions:")
+                            logger.debug("[DRAG START] Canvas '%s': my_x=%s, my_y=%s, width=%s", canvas_id, my_x, my_y, int(new_width))
+                            logger.debug("[DRAG START] Saved original positions:")
                             for cid, (ox, oy, w, h) in self._original_positions.items():
-                                print(f"  '{cid}': x={ox}, y={oy}, w={w}, h={h}")
-                            print(f"{'='*60}\n")
+                                logger.debug("  '%s': x=%s, y=%s, w=%s, h=%s", cid, ox, oy, w, h)
                         
                         # Find neighbors in SAME ROW (same Y) - these need to move
                         neighbors_in_row = []
@@ -508,7 +408,7 @@ class CollapsibleCanvas(QWidget):
                         
                         neighbors_in_row.sort(key=lambda x: x[0])  # Sort by X
                         
-                        print(f"[DRAG] Neighbors in same row (y≈{my_y}): {len(neighbors_in_row)}")
+                        logger.debug("[DRAG] Neighbors in same row (y≈%s): %s", my_y, len(neighbors_in_row))
                         
                         # Position neighbors to the right, keeping same Y
                         current_x = my_right + spacing
@@ -523,13 +423,13 @@ class CollapsibleCanvas(QWidget):
                             # Check if fits
                             if current_x + canvas_width <= viewport_width - right_margin:
                                 canvas.setGeometry(current_x, new_y, canvas_width, canvas_height)
-                                print(f"[DRAG] '{cid}': x={orig_x}→{current_x}, y={new_y} (SAME ROW)")
+                                logger.debug("[DRAG] '%s': x=%s→%s, y=%s (SAME ROW)", cid, orig_x, current_x, new_y)
                                 current_x += canvas_width + spacing
                             else:
                                 # Wrap down
                                 wrap_y = my_y + current_geom.height() + spacing
                                 canvas.setGeometry(left_margin, wrap_y, canvas_width, canvas_height)
-                                print(f"[DRAG] '{cid}': WRAPPED to x={left_margin}, y={wrap_y}")
+                                logger.debug("[DRAG] '%s': WRAPPED to x=%s, y=%s", cid, left_margin, wrap_y)
                                 current_x = left_margin + canvas_width + spacing
                     return True
             
@@ -581,9 +481,9 @@ class CollapsibleCanvas(QWidget):
                     if is_expanding and final_span < 2:
                         final_span = 2
                     
-                    print(f"[ResizeGrip] End resize: {self.title}")
-                    print(f"  current_width={current_width}px, calculated_span={calculated_span:.2f}x")
-                    print(f"  Final span (after rounding)={final_span}x")
+                    logger.debug("[ResizeGrip] End resize: %s", self.title)
+                    logger.debug("  current_width=%spx, calculated_span=%.2fx", current_width, calculated_span)
+                    logger.debug("  Final span (after rounding)=%sx", final_span)
                     
                     # Calculate target width for animation
                     if final_span == 1:
@@ -603,7 +503,7 @@ class CollapsibleCanvas(QWidget):
                             # Update span in grid
                             container.grid_manager.items[canvas_id].span = final_span
                             # Rebuild masonry to position neighbors correctly
-                            container._rebuild_skyline_layout()
+                            container.relayout_canvas(self)
                     
                     # Now animate only the dragged canvas width
                     self._animation = QPropertyAnimation(self, b"geometry")
@@ -618,10 +518,10 @@ class CollapsibleCanvas(QWidget):
                     
                     # After animation - final cleanup (neighbors already positioned)
                     def on_snap_finished():
-                        print(f"[ResizeGrip] Snap animation finished")
+                        logger.debug("[ResizeGrip] Snap animation finished")
                         # Final rebuild to ensure everything is aligned
-                        if container and hasattr(container, '_rebuild_skyline_layout'):
-                            container._rebuild_skyline_layout()
+                        if container and hasattr(container, 'relayout_canvas'):
+                            container.relayout_canvas(self)
                     
                     self._animation.finished.connect(on_snap_finished)
                     self._animation.start()
@@ -665,7 +565,7 @@ class CollapsibleCanvas(QWidget):
     
     def start_drag(self):
         """Start Qt drag-and-drop operation."""
-        print(f"[CollapsibleCanvas] Starting drag: {self.title}")
+        logger.debug("[CollapsibleCanvas] Starting drag: %s", self.title)
         
         # Create drag object
         drag = QDrag(self)
@@ -686,11 +586,14 @@ class CollapsibleCanvas(QWidget):
         
         # Execute drag
         result = drag.exec_(Qt.MoveAction)
-        print(f"[CollapsibleCanvas] Drag finished: {result}")
+        logger.debug("[CollapsibleCanvas] Drag finished: %s", result)
         
     def add_content(self, widget: QWidget):
         """Add widget to content area."""
         self.content_layout.addWidget(widget)
+        if self.isVisible() and not widget.testAttribute(Qt.WA_WState_ExplicitShowHide):
+            # Show now, not via queued call - sizeHint() must include widget for relayout in same chunk
+            widget.show()
         
     def clear_content(self):
         """Clear all content widgets."""
@@ -738,6 +641,33 @@ class CollapsibleCanvas(QWidget):
                     widget.setVisible(False)
         
         return has_matches
+    
+    def apply_visible_set(self, param_names=None) -> int:
+        """
+        Show only parameters from precomputed match set (no text matching).
+        
+        Args:
+            param_names: Set of parameter names to show, None = show all
+            
+        Returns:
+            Number of visible parameter widgets
+        """
+        visible_count = 0
+        for i in range(self.content_layout.count()):
+            widget = self.content_layout.itemAt(i).widget()
+            if widget and hasattr(widget, 'apply_visible_set'):
+                # Virtualized parameter list filters its own rows
+                visible_count += widget.apply_visible_set(param_names)
+            elif widget and hasattr(widget, 'param_name'):
+                visible = param_names is None or widget.param_name in param_names
+                if widget.isHidden() == visible:
+                    widget.setVisible(visible)
+                visible_count += visible
+        
+        # Hidden canvases don't get LayoutRequest processed - recompute size hint now
+        self.content_layout.invalidate()
+        self.layout().invalidate()
+        return visible_count
                     
     def show_context_menu(self, pos):
         """Show context menu on header right-click."""
@@ -820,34 +750,34 @@ class CollapsibleCanvas(QWidget):
         """Update canvas title for language change (without recreating)."""
         self.title = new_title
         self.title_label.setText(new_title)
-        print(f"[Canvas] Updated title to: {new_title}")
+        logger.debug("[Canvas] Updated title to: %s", new_title)
     
     def request_resize(self, new_span: int):
         """Request resize from CanvasContainer."""
-        print(f"[Canvas.request_resize] START for '{self.title}' → {new_span}x")
+        logger.debug("[Canvas.request_resize] START for '%s' → %sx", self.title, new_span)
         
         # Find CanvasContainer parent
         container = self.parent()
-        print(f"[Canvas.request_resize] Direct parent: {type(container).__name__}")
+        logger.debug("[Canvas.request_resize] Direct parent: %s", type(container).__name__)
         
         search_depth = 0
         while container and not isinstance(container, CanvasContainer):
             container = container.parent()
             search_depth += 1
             if search_depth > 10:
-                print(f"[Canvas.request_resize] ERROR: Search depth exceeded (10 levels)")
+                logger.error("[Canvas.request_resize] ERROR: Search depth exceeded (10 levels)")
                 break
             if container:
-                print(f"[Canvas.request_resize] Level {search_depth}: {type(container).__name__}")
+                logger.debug("[Canvas.request_resize] Level %s: %s", search_depth, type(container).__name__)
         
-        print(f"[Canvas.request_resize] Found container: {type(container).__name__ if container else 'None'}")
-        print(f"[Canvas.request_resize] Has resize_canvas: {hasattr(container, 'resize_canvas') if container else False}")
+        logger.debug("[Canvas.request_resize] Found container: %s", type(container).__name__ if container else 'None')
+        logger.debug("[Canvas.request_resize] Has resize_canvas: %s", hasattr(container, 'resize_canvas') if container else False)
         
         if container and hasattr(container, 'resize_canvas'):
-            print(f"[Canvas.request_resize] CALLING container.resize_canvas('{self.title}', {new_span})")
+            logger.debug("[Canvas.request_resize] CALLING container.resize_canvas('%s', %s)", self.title, new_span)
             container.resize_canvas(self.title, new_span)
         else:
-            print(f"[Canvas.request_resize] ERROR: CanvasContainer not found or no resize_canvas method")
+            logger.error("[Canvas.request_resize] ERROR: CanvasContainer not found or no resize_canvas method")
             
     def mark_as_modified(self):
         """Show save and reset buttons when there are unsaved changes."""
@@ -860,73 +790,6 @@ class CollapsibleCanvas(QWidget):
         self.has_unsaved_changes = False
         self.save_button.setVisible(False)
         self.reset_button.setVisible(False)
-            
-    def apply_styles(self):
-        """Apply visual styles."""
-        # Set border-radius on the entire widget to clip children
-        self.setStyleSheet("""
-            CollapsibleCanvas {
-                background-color: transparent;
-                border: none;
-                border-radius: 7.5px;
-            }
-        """)
-        
-        # Apply header styles separately to ensure proper rendering
-        self.header.setStyleSheet("""
-            QWidget#canvas_header {
-                background-color: #9C823A;
-                border: none;
-                border-top-left-radius: 7.5px;
-                border-top-right-radius: 7.5px;
-                border-bottom-left-radius: 0px;
-                border-bottom-right-radius: 0px;
-            }
-            QWidget#canvas_header:hover {
-                background-color: #9C823A;
-            }
-            QLabel#canvas_title {
-                color: white;
-                font-size: 10px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-            QPushButton#canvas_arrow {
-                background-color: transparent;
-                color: white;
-                border: none;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 0px;
-            }
-            QPushButton#canvas_arrow:hover {
-                color: white;
-            }
-            QPushButton#canvas_reset {
-                background-color: transparent;
-                color: white;
-                border: none;
-                padding: 0px;
-            }
-            QPushButton#canvas_reset:hover {
-                background-color: transparent;
-            }
-            QPushButton#canvas_save {
-                background-color: transparent;
-                color: white;
-                border: none;
-                padding: 0px;
-            }
-            QPushButton#canvas_save:hover {
-                background-color: transparent;
-            }
-            QPushButton#canvas_revert {
-                background-color: transparent;
-                color: white;
-                border: none;
-                padding: 0px;
-            }
-        """)
 
 
 class CanvasContainer(QWidget):
@@ -935,16 +798,22 @@ class CanvasContainer(QWidget):
     
     Features:
     - Adaptive 1-4 column grid layout
-    - Automatic positioning with collision detection
+    - Placement by PackingEngine (grid_manager only keeps pinned positions)
     - Save/load layout configurations
     - Scroll support with always-visible scrollbar
     """
     
+    LAYOUT_MARGIN = 10  # Left/top margin of canvas area
+    LAYOUT_SPACING = 10  # Gap between canvases
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.canvas_items = {}  # canvas_id -> CollapsibleCanvas
+        self.packer = PackingEngine(spacing=self.LAYOUT_SPACING, margin=self.LAYOUT_MARGIN)
+        self._layout = None  # Viewport width + canvas -> id of last full pass (for incremental relayout)
+        self._heights = {}  # canvas_id -> cached sizeHint height
         self.grid_manager = GridLayoutManager(max_columns=4)
-        self.layout_storage = LayoutStorage()
+        self.layout_storage = get_layout_storage()  # Shared cache of layout file
         self.current_tab = None  # Track current tab for per-tab layouts
         self.init_ui()
         
@@ -980,9 +849,6 @@ class CanvasContainer(QWidget):
         self.scroll_area.setWidget(self.canvas_widget)
         main_layout.addWidget(self.scroll_area)
         
-        # Apply styles
-        self.apply_styles()
-        
         # Install resize event
         self.scroll_area.viewport().installEventFilter(self)
         
@@ -994,7 +860,6 @@ class CanvasContainer(QWidget):
         if not self._initial_layout_done:
             self._initial_layout_done = True
             # Use QTimer to defer until after show is complete
-            from PySide6.QtCore import QTimer
             QTimer.singleShot(0, lambda: self._rebuild_skyline_layout() if hasattr(self, '_rebuild_skyline_layout') else None)
     
     def eventFilter(self, obj, event):
@@ -1006,13 +871,14 @@ class CanvasContainer(QWidget):
             self.canvas_widget.setMaximumWidth(viewport_width)
             
             # Update columns (may or may not change count)
-            column_count_changed = self.grid_manager.update_columns(viewport_width)
+            self.grid_manager.update_columns(viewport_width)
             
-            # ALWAYS rebuild skyline on resize
-            self._rebuild_skyline_layout()
+            # ALWAYS rebuild skyline on resize (heights don't depend on width)
+            self._rebuild_skyline_layout(use_cached_heights=True)
         return super().eventFilter(obj, event)
     
-    def _rebuild_skyline_layout(self):
+    @timed('layout.rebuild')
+    def _rebuild_skyline_layout(self, use_cached_heights: bool = False):
         """
         HYBRID approach: Manual positioning + absolute layout (NO height stretch!)
         
@@ -1021,102 +887,110 @@ class CanvasContainer(QWidget):
         - Using ABSOLUTE setGeometry() like Masonry.js
         - NO QLayout auto-positioning (full manual control)
         - Each widget = natural height (NO stretching!)
+        
+        Full pass: re-reads heights (unless use_cached_heights - window
+        resize doesn't change canvas heights) and packs all canvases with
+        PackingEngine; relayout_canvas() re-places incrementally afterwards.
         """
         cols = self.grid_manager.current_columns
-        print(f"[ManualMasonry] Rebuilding for {cols} columns")
         
         # CRITICAL: Disable updates
         self.setUpdatesEnabled(False)
         
-        # Calculate column width
-        viewport_width = self.scroll_area.viewport().width()
-        left_margin = 10
-        right_margin = 10
-        spacing = 10
-        available_for_cols = viewport_width - left_margin - right_margin - (cols - 1) * spacing
-        col_width = available_for_cols // cols
-        
-        print(f"[ManualMasonry] Viewport: {viewport_width}px, col_width: {col_width}px")
-        
-        # Track column heights for EACH column (Skyline style)
-        column_heights = [0] * cols
-        
-        # Sort canvases by (col, row) for column-by-column placement
-        # Then by canvas_id for stable sort (prevent randomness)
-        sorted_canvases = sorted(
-            [(cid, canvas, self.grid_manager.items[cid]) 
-             for cid, canvas in self.canvas_items.items() 
-             if cid in self.grid_manager.items],
-            key=lambda x: (x[2].col, x[2].row, x[0])  # col, row, canvas_id for stability
-        )
-        
-        # Position each canvas using ABSOLUTE coordinates
-        for canvas_id, canvas, grid_item in sorted_canvases:
-            col = grid_item.col
-            span = grid_item.span
-            
-            # CRITICAL: Clamp col to available columns!
-            if col >= cols:
-                col = col % cols  # Wrap around
-                print(f"[ManualMasonry] WARNING: '{canvas_id}' col={grid_item.col} >= {cols}, wrapping to col={col}")
-            
+        items = []
+        for canvas_id, canvas in self.canvas_items.items():
+            grid_item = self.grid_manager.items.get(canvas_id)
+            if grid_item is None:
+                continue
             # CRITICAL: Set parent for absolute positioning!
-            canvas.setParent(self.canvas_widget)
-            canvas.show()
-            
-            # CRITICAL: Always RECALCULATE Y from column heights!
-            # (Saved Y causes issues, better to always use Skyline)
-            y_base = max(column_heights[c] for c in range(col, min(col + span, cols)))
-            y = left_margin + y_base
-            
-            # Calculate X
-            x = left_margin + col * (col_width + spacing)
-            
-            # Calculate width
-            width = span * col_width + (span - 1) * spacing
-            height = canvas.sizeHint().height()
-            
-            # Set ABSOLUTE geometry (NO layout manager!)
-            canvas.setGeometry(x, y, width, height)
-            
-            # Update column heights for ALL spanned columns
-            new_height = y_base + height + spacing
-            for i in range(col, min(col + span, cols)):
-                column_heights[i] = new_height
-            
-            print(f"[ManualMasonry] Placed '{canvas_id}': x={x}, y={y}, w={width}, h={height}, span={span}, y_base={y_base}")
-        
-        # Calculate total height for scroll area
-        max_height = max(column_heights) if column_heights else 0
-        self.canvas_widget.setMinimumHeight(max_height + left_margin)
-        
-        # DEBUG: Check for overlaps!
-        print(f"[ManualMasonry] Checking for overlaps...")
-        canvas_rects = {}
-        for canvas_id, canvas, grid_item in sorted_canvases:
-            rect = canvas.geometry()
-            canvas_rects[canvas_id] = rect
-        
-        # Check all pairs
-        overlap_found = False
-        for id1, rect1 in canvas_rects.items():
-            for id2, rect2 in canvas_rects.items():
-                if id1 >= id2:  # Skip duplicates and self
-                    continue
-                if rect1.intersects(rect2):
-                    overlap_found = True
-                    print(f"[OVERLAP!] '{id1}' overlaps '{id2}'!")
-                    print(f"  {id1}: x={rect1.x()}, y={rect1.y()}, w={rect1.width()}, h={rect1.height()}")
-                    print(f"  {id2}: x={rect2.x()}, y={rect2.y()}, w={rect2.width()}, h={rect2.height()}")
-        
-        if not overlap_found:
-            print(f"[ManualMasonry] ✓ No overlaps detected")
+            if canvas.parent() is not self.canvas_widget:
+                canvas.setParent(self.canvas_widget)
+            if canvas.isHidden():
+                canvas.show()
+            if not use_cached_heights or canvas_id not in self._heights:
+                self._heights[canvas_id] = canvas.sizeHint().height()
+            # Every canvas is pinned to its grid column, ordered by grid row
+            items.append(PackItem(canvas_id, self._heights[canvas_id], grid_item.span, grid_item.col, grid_item.row))
+        
+        self.packer.set_columns(cols)
+        viewport_width = self.scroll_area.viewport().width()
+        self.packer.pack(items, viewport_width)
+        self._layout = {
+            'viewport_width': viewport_width,
+            'ids': {id(self.canvas_items[item.item_id]): item.item_id for item in items},
+        }
+        moved = self._apply_placements(self.packer.placements)
         
         # Re-enable updates
         self.setUpdatesEnabled(True)
         self.update()
         
-        print(f"[ManualMasonry] Complete! Max height: {max_height}px")
+        logger.debug("[ManualMasonry] %s columns, col_width=%spx: placed %s canvases (%s moved)", cols, self.packer.col_width, len(items), moved)
+    
+    @timed('layout.relayout')
+    def relayout_canvas(self, canvas: CollapsibleCanvas):
+        """
+        Re-place after one canvas changed height or span (collapse, resize grip).
+        
+        Canvases before it in placement order keep their positions; only it
+        and the ones after it (below it and in columns to the right) are
+        re-placed from the cached skyline.
+        """
+        canvas_id = self._layout['ids'].get(id(canvas)) if self._layout else None
+        if canvas_id is None or not self._layout_valid():
+            self._rebuild_skyline_layout()
+            return
+        
+        height = canvas.sizeHint().height()
+        self._heights[canvas_id] = height
+        self.setUpdatesEnabled(False)
+        try:
+            placed = self.packer.repack_from(canvas_id, height, self.grid_manager.items[canvas_id].span)
+            moved = self._apply_placements({cid: self.packer.placements[cid] for cid in placed})
+        finally:
+            self.setUpdatesEnabled(True)
+        logger.debug("[ManualMasonry] Relayout of %s canvases: %s moved", len(placed), moved)
+    
+    def relayout_changed(self):
+        """Re-place from the first canvas whose height changed (e.g. while being populated)."""
+        if not self._layout_valid():
+            self._rebuild_skyline_layout()
+            return
+        
+        heights = self._heights
+        for item in self.packer.items:
+            canvas = self.canvas_items.get(item.item_id)
+            if canvas is None:
+                self._rebuild_skyline_layout()
+                return
+            if canvas.sizeHint().height() != heights.get(item.item_id):
+                self.relayout_canvas(canvas)
+                return
+    
+    def _layout_valid(self) -> bool:
+        """Packed placement still matches canvas set, column count and viewport width."""
+        return (self._layout is not None
+                and len(self.packer.items) == len(self.canvas_items)
+                and self.packer.columns == self.grid_manager.current_columns
+                and self._layout['viewport_width'] == self.scroll_area.viewport().width())
+    
+    def _apply_placements(self, placements: dict) -> int:
+        """Set ABSOLUTE geometry (NO layout manager!) of placed canvases, returns number moved."""
+        moved = 0
+        for canvas_id, placement in placements.items():
+            rect = QRect(placement.x, placement.y, placement.width, placement.height)
+            canvas = self.canvas_items[canvas_id]
+            if canvas.geometry() != rect:
+                canvas.setGeometry(rect)
+                moved += 1
+        
+        # Calculate total height for scroll area
+        self.canvas_widget.setMinimumHeight(self.packer.total_height + self.LAYOUT_MARGIN)
+        
+        if LAYOUT_DEBUG:
+            overlaps = self.packer.find_overlaps()
+            assert not overlaps, f"Overlapping canvases: {overlaps}"
+        return moved
     
     def _update_visible_columns(self):
         """Alias for backwards compatibility - calls _rebuild_skyline_layout."""
@@ -1134,27 +1008,32 @@ class CanvasContainer(QWidget):
         canvas_id = canvas.title
         
         # Use Skyline algorithm to find optimal position
-        row, col = self.grid_manager.find_optimal_position(span)
+        row, col = next_slot(self.grid_manager.items.values(), self.grid_manager.current_columns, span)
         
-        print(f"[CanvasContainer] Skyline placement '{canvas_id}' at row={row}, col={col}, span={span}")
+        logger.debug("[CanvasContainer] Skyline placement '%s' at row=%s, col=%s, span=%s", canvas_id, row, col, span)
         
         # Add to grid_manager
         grid_item = self.grid_manager.add_item(canvas_id, row=row, col=col, span=span)
         
         # Store reference
         self.canvas_items[canvas_id] = canvas
+        self._heights.pop(canvas_id, None)
+        self._layout = None
         
-        print(f"[CanvasContainer] Added '{canvas_id}' at ({grid_item.row}, {grid_item.col})")
+        logger.debug("[CanvasContainer] Added '%s' at (%s, %s)", canvas_id, grid_item.row, grid_item.col)
     
     def resize_canvas(self, canvas_id: str, new_span: int):
         """
         Resize canvas to new span and redistribute layout.
         
+        Span is stored in grid_manager; relayout_canvas() re-places the
+        canvas and the ones after it with the new span.
+        
         Args:
             canvas_id: Canvas title/ID
             new_span: New span (1-4 columns)
         """
-        print(f"[CanvasContainer] Resize request: '{canvas_id}' to {new_span}x")
+        logger.debug("[CanvasContainer] Resize request: '%s' to %sx", canvas_id, new_span)
         
         # Update grid manager
         if self.grid_manager.resize_item(canvas_id, new_span):
@@ -1163,7 +1042,11 @@ class CanvasContainer(QWidget):
             
             try:
                 # Redistribute layout with new spans
-                self._update_visible_columns()
+                canvas = self.canvas_items.get(canvas_id)
+                if canvas is not None:
+                    self.relayout_canvas(canvas)
+                else:
+                    self._update_visible_columns()
                 
                 # Save layout
                 if hasattr(self, 'layout_storage'):
@@ -1173,9 +1056,9 @@ class CanvasContainer(QWidget):
                 self.setUpdatesEnabled(True)
                 self.update()
                 
-            print(f"[CanvasContainer] Resize complete: '{canvas_id}' is now {new_span}x")
+            logger.debug("[CanvasContainer] Resize complete: '%s' is now %sx", canvas_id, new_span)
         else:
-            print(f"[CanvasContainer] Resize failed for '{canvas_id}'")
+            logger.warning("[CanvasContainer] Resize failed for '%s'", canvas_id)
     
     def clear_canvases(self):
         """Remove all canvas panels."""
@@ -1187,8 +1070,43 @@ class CanvasContainer(QWidget):
         # Clear tracking
         self.canvas_items.clear()
         self.grid_manager.clear()
-        print("[CanvasContainer] Cleared all canvases")
+        self._layout = None
+        self._heights.clear()
+        logger.debug("[CanvasContainer] Cleared all canvases")
                 
+    def detach_canvases(self) -> dict:
+        """
+        Detach current canvases WITHOUT destroying them.
+        
+        Canvases are hidden and grid positions kept in returned snapshot,
+        so the same set can be re-attached instantly with attach_canvases().
+        """
+        snapshot = {
+            'canvas_items': dict(self.canvas_items),
+            'grid_items': dict(self.grid_manager.items),
+        }
+        for canvas in self.canvas_items.values():
+            canvas.hide()
+        
+        self.canvas_items.clear()
+        self.grid_manager.items.clear()
+        self._layout = None
+        return snapshot
+    
+    def attach_canvases(self, snapshot: dict, rebuild: bool = True):
+        """
+        Re-attach canvases detached with detach_canvases().
+        
+        Args:
+            snapshot: Snapshot returned by detach_canvases()
+            rebuild: Rebuild layout immediately
+        """
+        self.canvas_items.update(snapshot['canvas_items'])
+        self.grid_manager.items.update(snapshot['grid_items'])
+        self._layout = None
+        if rebuild:
+            self._rebuild_skyline_layout()
+    
     def expand_all(self):
         """Expand all canvas panels."""
         for canvas in self.canvas_items.values():
@@ -1217,10 +1135,10 @@ class CanvasContainer(QWidget):
     
     def dropEvent(self, event):
         """
-        Smart drop with SWAP and auto-positioning:
-        - Drop on canvas → SWAP positions
-        - Drop on empty space → find nearest position
-        - Auto-shift neighbors
+        Smart drop with INSERT and auto-positioning:
+        - Drop on canvas → insert before/after it in its column
+        - Drop on empty space → top of column under cursor
+        - Target slot and pushing neighbors down done by PackingEngine
         """
         if not event.mimeData().hasText():
             return
@@ -1232,97 +1150,23 @@ class CanvasContainer(QWidget):
         scroll_pos = self.scroll_area.mapFrom(self, drop_pos)
         canvas_pos = self.canvas_widget.mapFrom(self.scroll_area.viewport(), scroll_pos)
         
-        print(f"\n[DROP] Canvas '{canvas_id}' at ({canvas_pos.x()}, {canvas_pos.y()})")
-        
-        # Find canvas under cursor and determine INSERT position (before/after)
-        canvas_under = None
-        insert_before = False  # True = insert before, False = insert after
-        drop_y = canvas_pos.y()
-        
-        for cid, canvas in self.canvas_items.items():
-            if cid == canvas_id:
-                continue
-            rect = canvas.geometry()
-            # Check if drop Y is within this canvas Y range
-            if rect.top() <= drop_y <= rect.bottom():
-                canvas_under = cid
-                # Determine before/after by drop position relative to canvas center
-                canvas_center_y = (rect.top() + rect.bottom()) / 2
-                insert_before = (drop_y < canvas_center_y)
-                print(f"[DROP] Found canvas under: '{cid}' (y={rect.top()}-{rect.bottom()}), insert_{'BEFORE' if insert_before else 'AFTER'}")
-                break
+        logger.debug("[DROP] Canvas '%s' at (%s, %s)", canvas_id, canvas_pos.x(), canvas_pos.y())
         
-        if canvas_id in self.grid_manager.items:
-            dragged = self.grid_manager.items[canvas_id]
+        if canvas_id in self.grid_manager.items and canvas_id in self.canvas_items:
+            if not self._layout_valid():
+                self._rebuild_skyline_layout()
             
-            # Calculate target position - ALWAYS use canvas_under if found!
-            if canvas_under and canvas_under in self.grid_manager.items:
-                target_item = self.grid_manager.items[canvas_under]
-                target_col = target_item.col
-                target_row = target_item.row
-                
-                # ALWAYS INSERT BEFORE/AFTER (works for any direction!)
-                if insert_before:
-                    # Insert BEFORE target (take its row, target moves down)
-                    print(f"[DROP] INSERT BEFORE '{canvas_under}' at ({target_row},{target_col})")
-                    dragged.row = target_row
-                    dragged.col = target_col
-                    
-                    # Push target and all canvas BELOW it down by 1 row
-                    for cid, item in self.grid_manager.items.items():
-                        if cid != canvas_id and item.col == target_col and item.row >= target_row:
-                            item.row += 1
-                            print(f"  Pushed '{cid}' down: row {item.row - 1} -> {item.row}")
-                else:
-                    # Insert AFTER target
-                    print(f"[DROP] INSERT AFTER '{canvas_under}' at ({target_row},{target_col})")
-                    dragged.row = target_row + 1
-                    dragged.col = target_col
-                    
-                    # Push all canvas BELOW target position down by 1 row
-                    for cid, item in self.grid_manager.items.items():
-                        if cid != canvas_id and item.col == target_col and item.row > target_row:
-                            item.row += 1
-                            print(f"  Pushed '{cid}' down: row {item.row - 1} -> {item.row}")
-            else:
-                # Drop on empty space - calculate column from X
-                viewport_width = self.scroll_area.viewport().width()
-                cols = self.grid_manager.current_columns
-                spacing = 10
-                left_margin = 10
-                col_width = (viewport_width - 20 - (cols - 1) * spacing) // cols
-                
-                drop_x = canvas_pos.x()
-                
-                # Calculate which column this X falls into
-                target_col = 0
-                for try_col in range(cols):
-                    col_start = left_margin + try_col * (col_width + spacing)
-                    col_end = col_start + col_width
-                    
-                    if col_start <= drop_x <= col_end:
-                        target_col = try_col
-                        break
-                else:
-                    # Fallback
-                    target_col = max(0, min((drop_x - left_margin) // (col_width + spacing), cols - 1))
-                
-                # CRITICAL: Place at TOP of column (row=0), push others down!
-                old_col = dragged.col
-                old_row = dragged.row
-                dragged.col = target_col
-                dragged.row = 0  # ALWAYS TOP!
-                
-                # Push ALL canvas in target column down
-                for cid, item in self.grid_manager.items.items():
-                    if cid != canvas_id and item.col == target_col:
-                        item.row += 1
-                        print(f"  Pushed '{cid}' down to row {item.row}")
-                
-                print(f"[DROP] Moved '{canvas_id}' to TOP of col {target_col}: ({old_row},{old_col}) -> (0,{target_col})")
+            col, row = self.packer.drop_slot(canvas_pos.x(), canvas_pos.y(), canvas_id)
+            logger.debug("[DROP] Pin '%s' at (%s,%s)", canvas_id, row, col)
             
-            # Rebuild layout
-            self._rebuild_skyline_layout()
+            self.setUpdatesEnabled(False)
+            try:
+                moved = self._apply_placements(self.packer.pin(canvas_id, col, row))
+            finally:
+                self.setUpdatesEnabled(True)
+                self.update()
+            self.grid_manager.update_positions(self.packer.items)
+            logger.debug("[DROP] %s canvases moved", moved)
             
             # Save layout
             layout_data = self.grid_manager.to_dict()
@@ -1338,7 +1182,7 @@ class CanvasContainer(QWidget):
         
         layout_data = self.grid_manager.to_dict()
         result = self.layout_storage.save_layout(layout_data, layout_name)
-        print(f"[CanvasContainer] Saved layout '{layout_name}'")
+        logger.debug("[CanvasContainer] Saved layout '%s'", layout_name)
         return result
     
     def load_layout(self, layout_name: str = "default") -> bool:
@@ -1348,7 +1192,7 @@ class CanvasContainer(QWidget):
             layout_name = f"{self.current_tab}_layout"
         
         layout_data = self.layout_storage.load_layout(layout_name)
-        print(f"[CanvasContainer] Loading layout '{layout_name}'")
+        logger.debug("[CanvasContainer] Loading layout '%s'", layout_name)
         if layout_data is None:
             return False
         
@@ -1358,7 +1202,7 @@ class CanvasContainer(QWidget):
         # Load layout into grid manager
         self.grid_manager.from_dict(layout_data)
         
-        print(f"[CanvasContainer] Loaded layout '{layout_name}'")
+        logger.debug("[CanvasContainer] Loaded layout '%s'", layout_name)
         return True
                     
     def show_context_menu(self, pos):
@@ -1398,42 +1242,4 @@ class CanvasContainer(QWidget):
             self.expand_all()
         elif action == collapse_all:
             self.collapse_all()
-                
-    def apply_styles(self):
-        """Apply visual styles."""
-        self.setStyleSheet("""
-            CanvasContainer {
-                background-color: transparent;
-                border: none;
-            }
-            QWidget {
-                background-color: transparent;
-                border: none;
-            }
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background-color: rgba(51, 51, 51, 100);
-                width: 5px;
-                border: none;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #353535;
-                border-radius: 2.5px;
-                min-height: 30px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #404040;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
 
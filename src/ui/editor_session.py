@@ -0,0 +1,107 @@
+"""
+Resident editor session inside 3ds Max.
+
+The first show_editor() call creates the editor window (parented to the
+3ds Max main window) and keeps it for the lifetime of Max's Python
+interpreter; closing the window only hides it. Later calls re-show the
+same window with warm caches (parameter database, parsed INI files, built
+canvases) after a cheap mtime check that reloads only INI files changed
+on disk.
+
+Usage (maxmanager.mcr, MaxManager root on sys.path):
+    from src.ui.editor_session import show_editor
+    show_editor()
+"""
+
+import logging
+import sys
+from pathlib import Path
+from typing import Optional
+
+import shiboken6
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget
+
+from ..core.profiling import timed
+
+logger = logging.getLogger(__name__)
+
+_window = None  # Resident CanvasMainWindow
+
+
+def get_max_main_window() -> Optional[QWidget]:
+    """Get 3ds Max main window (None outside 3ds Max)."""
+    try:
+        import qtmax
+        return qtmax.GetQMaxMainWindow()
+    except Exception:
+        return None
+
+
+def get_editor():
+    """Get resident editor window (None if not created or already destroyed)."""
+    global _window
+    if _window is not None and not shiboken6.isValid(_window):
+        _window = None
+    return _window
+
+
+@timed('session.show')
+def show_editor(ini_path: Optional[Path] = None, parent: Optional[QWidget] = None):
+    """
+    Show editor window: create it on first call, re-show it afterwards.
+
+    Args:
+        ini_path: 3dsMax.ini to edit (first call only, None = default location)
+        parent: Parent window (first call only, None = 3ds Max main window)
+
+    Returns:
+        Resident CanvasMainWindow
+    """
+    global _window
+    window = get_editor()
+
+    if window is None:
+        from .canvas_main_window import CanvasMainWindow
+        window = CanvasMainWindow(ini_path)
+        parent = parent or get_max_main_window()
+        if parent is not None:
+            window.setParent(parent, window.windowFlags())
+        _window = window
+        logger.debug("[Session] Editor window created")
+    else:
+        reloaded = window.reload_changed_inis()
+        logger.debug("[Session] Editor window re-shown, reloaded: %s", reloaded)
+
+    if window.windowState() & Qt.WindowMinimized:
+        window.setWindowState(window.windowState() & ~Qt.WindowMinimized)
+    window.show()
+    window.raise_()
+    window.activateWindow()
+    return window
+
+
+def close_session():
+    """
+    Destroy resident window (next show_editor() builds a fresh one).
+
+    Used before reloading MaxManager modules during development.
+    """
+    global _window
+    window = get_editor()
+    _window = None
+    if window is not None:
+        window.close()  # Flushes pending layout writes
+        window.deleteLater()
+        logger.debug("[Session] Editor window destroyed")
+
+
+def unload_session():
+    """
+    Destroy resident window and drop MaxManager modules from sys.modules.
+
+    Next show_editor() imports fresh code (reinstall, development reload).
+    """
+    close_session()
+    for name in [name for name in sys.modules if name == 'src' or name.startswith('src.')]:
+        del sys.modules[name]
@@ -1,13 +1,18 @@
 """
 Grid Layout Manager for MaxManager Canvas.
 
-Manages flexible grid layout (1-4 columns) with automatic collision detection,
-auto-shift, and responsive column adjustment.
+Bookkeeping of canvas grid positions (column, row, span) and responsive
+column count. Placement itself is done by PackingEngine.
 """
 
-from typing import Dict, List, Tuple, Optional
+import logging
+from typing import Dict, Iterable, List, Optional
 from dataclasses import dataclass
 
+from .packing_engine import PackItem
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class GridItem:
@@ -24,13 +29,12 @@ class GridItem:
 
 class GridLayoutManager:
     """
-    Manages grid-based layout with automatic positioning and collision resolution.
+    Grid positions of canvases, saved with to_dict()/from_dict().
     
     Features:
     - Adaptive 1-4 columns based on viewport width
-    - Automatic collision detection
-    - Auto-shift items on conflict
     - Span support (items can occupy multiple columns)
+    - Column/row of each item is a pinned position for PackingEngine
     """
     
     def __init__(self, max_columns: int = 4, cell_width: int = 460, spacing: int = 10):
@@ -94,7 +98,7 @@ class GridLayoutManager:
         if new_columns != self.current_columns:
             old_columns = self.current_columns
             self.current_columns = new_columns
-            print(f"[GridLayout] Columns changed: {old_columns} -> {new_columns}")
+            logger.debug("[GridLayout] Columns changed: %s -> %s", old_columns, new_columns)
             # Reflow items to fit new column count
             self._reflow_items()
             return True
@@ -108,7 +112,7 @@ class GridLayoutManager:
         Only clamp span if needed - KEEP col positions even if overflow!
         Masonry layout will handle rendering correctly.
         """
-        print(f"[GridLayout] Preserving ALL positions for {self.current_columns} columns")
+        logger.debug("[GridLayout] Preserving ALL positions for %s columns", self.current_columns)
         
         for canvas_id, item in self.items.items():
             # Only clamp span if absolutely necessary
@@ -116,129 +120,42 @@ class GridLayoutManager:
             item.span = min(item.span, self.current_columns)
             
             if old_span != item.span:
-                print(f"[GridLayout]   Clamped '{canvas_id}' span: {old_span} -> {item.span}")
+                logger.debug("[GridLayout]   Clamped '%s' span: %s -> %s", canvas_id, old_span, item.span)
             
             # CRITICAL: KEEP col position even if it overflows!
             # Masonry layout will handle it (wrap to available space)
-            print(f"[GridLayout]   Preserved '{canvas_id}' at ({item.row}, {item.col}), span={item.span}")
+            logger.debug("[GridLayout]   Preserved '%s' at (%s, %s), span=%s", canvas_id, item.row, item.col, item.span)
     
     def add_item(self, canvas_id: str, row: int, col: int, span: int = 1) -> GridItem:
         """
-        Add item to grid with automatic collision resolution.
+        Add item to grid at given position.
+        
+        No collision search - panels pinned to the same column are stacked
+        by row, and overlaps are resolved by PackingEngine.
         
         Args:
             canvas_id: Unique identifier for canvas
-            row: Target row
-            col: Target column (0-based)
+            row: Order inside column
+            col: Column (0-based)
             span: Number of columns to span
         
         Returns:
-            GridItem with final position (may differ from target if collision occurred)
+            GridItem with span clamped to current columns
         """
-        # Clamp span to current columns
-        span = min(span, self.current_columns)
-        
-        # Clamp column to valid range
+        span = max(1, min(span, self.current_columns))
         col = max(0, min(col, self.current_columns - span))
         
-        # Check for collision and auto-shift if needed
-        final_row, final_col = self._find_free_position(row, col, span)
-        
-        item = GridItem(canvas_id, final_row, final_col, span)
+        item = GridItem(canvas_id, row, col, span)
         self.items[canvas_id] = item
         
-        print(f"[GridLayout] Added {item}")
-        return item
-    
-    def move_item(self, canvas_id: str, target_row: int, target_col: int, force: bool = False) -> Optional[GridItem]:
-        """
-        Move item to new position.
-        
-        Args:
-            force: If True, skip collision check (for drag-and-drop SWAP)
-        
-        Args:
-            canvas_id: ID of item to move
-            target_row: Target row
-            target_col: Target column
-        
-        Returns:
-            Updated GridItem or None if item not found
-        """
-        if canvas_id not in self.items:
-            return None
-        
-        item = self.items[canvas_id]
-        old_pos = (item.row, item.col)
-        
-        # Temporarily remove item from grid
-        del self.items[canvas_id]
-        
-        span = item.span
-        target_col = max(0, min(target_col, self.current_columns - span))
-        
-        if force:
-            # FORCE mode - move directly without collision check
-            final_row = target_row
-            final_col = target_col
-            print(f"[GridLayout] FORCE move {canvas_id}: {old_pos} -> ({final_row}, {final_col})")
-        else:
-            # Normal mode - find free position
-            final_row, final_col = self._find_free_position(target_row, target_col, span)
-            print(f"[GridLayout] Moved {canvas_id}: {old_pos} -> ({final_row}, {final_col})")
-        
-        # Update item
-        item.row = final_row
-        item.col = final_col
-        self.items[canvas_id] = item
-        
-        return item
-    
-    def resize_item(self, canvas_id: str, new_span: int) -> Optional[GridItem]:
-        """
-        Change item span with collision resolution.
-        
-        Args:
-            canvas_id: ID of item to resize
-            new_span: New span (1-4)
-        
-        Returns:
-            Updated GridItem or None if item not found
-        """
-        if canvas_id not in self.items:
-            return None
-        
-        item = self.items[canvas_id]
-        old_span = item.span
-        
-        # Clamp to valid range
-        new_span = max(1, min(new_span, self.current_columns))
-        
-        if new_span == old_span:
-            return item
-        
-        # Temporarily remove
-        del self.items[canvas_id]
-        
-        # Check if new span fits at current position
-        if self._can_place(item.row, item.col, new_span):
-            item.span = new_span
-        else:
-            # Find new position
-            row, col = self._find_free_position(item.row, item.col, new_span)
-            item.row = row
-            item.col = col
-            item.span = new_span
-        
-        self.items[canvas_id] = item
-        print(f"[GridLayout] Resized {canvas_id}: span {old_span} -> {new_span}")
+        logger.debug("[GridLayout] Added %s", item)
         return item
     
     def remove_item(self, canvas_id: str) -> bool:
         """Remove item from grid."""
         if canvas_id in self.items:
             del self.items[canvas_id]
-            print(f"[GridLayout] Removed {canvas_id}")
+            logger.debug("[GridLayout] Removed %s", canvas_id)
             return True
         return False
     
@@ -250,218 +167,38 @@ class GridLayoutManager:
         """Get all items sorted by position (row, then col)."""
         return sorted(self.items.values(), key=lambda x: (x.row, x.col))
     
-    def _find_free_position(self, start_row: int, start_col: int, span: int) -> Tuple[int, int]:
-        """
-        Find first free position starting from (start_row, start_col).
-        
-        Returns:
-            (row, col) tuple of free position
-        """
-        # Ensure start_col is valid for span
-        start_col = max(0, min(start_col, self.current_columns - span))
-        
-        # Try starting position first
-        if self._can_place(start_row, start_col, span):
-            return (start_row, start_col)
-        
-        # Scan row-by-row, column-by-column
-        for row in range(start_row, start_row + 100):  # Limit search depth
-            for col in range(self.current_columns - span + 1):
-                if self._can_place(row, col, span):
-                    return (row, col)
-        
-        # Fallback: place at end
-        max_row = max((item.row for item in self.items.values()), default=-1)
-        return (max_row + 1, 0)
-    
-    def _can_place(self, row: int, col: int, span: int) -> bool:
-        """
-        Check if item can be placed at position without collision.
-        
-        Args:
-            row: Row position
-            col: Column position
-            span: Number of columns to span
-        
-        Returns:
-            True if position is free, False if collision
-        """
-        # Check bounds
-        if col < 0 or col + span > self.current_columns:
-            return False
-        
-        # Check collision with existing items
-        for item in self.items.values():
-            if item.row == row:
-                # Check horizontal overlap
-                item_end = item.col + item.span
-                new_end = col + span
-                
-                # Overlap if: item starts before new ends AND new starts before item ends
-                if item.col < new_end and col < item_end:
-                    return False
-        
-        return True
-    
-    def get_occupied_cells(self, row: int) -> List[Tuple[int, int]]:
-        """
-        Get list of occupied column ranges for a given row.
-        
-        Returns:
-            List of (start_col, end_col) tuples
-        """
-        occupied = []
-        for item in self.items.values():
-            if item.row == row:
-                occupied.append((item.col, item.col + item.span))
-        return sorted(occupied)
-    
     def resize_item(self, canvas_id: str, new_span: int) -> bool:
         """
-        Resize item to new span and auto-shift neighbors.
-        
-        Args:
-            canvas_id: ID of canvas to resize
-            new_span: New span (1-4)
+        Set item span (neighbors are re-placed by PackingEngine).
         
         Returns:
-            True if resize successful, False otherwise
+            True if span changed, False otherwise
         """
         if canvas_id not in self.items:
-            print(f"[GridLayout] Resize failed: {canvas_id} not found")
+            logger.warning("[GridLayout] Resize failed: %s not found", canvas_id)
             return False
         
         item = self.items[canvas_id]
-        old_span = item.span
-        
-        if old_span == new_span:
-            print(f"[GridLayout] No resize needed: {canvas_id} already {new_span}x")
+        if item.span == new_span:
+            logger.debug("[GridLayout] No resize needed: %s already %sx", canvas_id, new_span)
             return False
         
-        print(f"[GridLayout] Resizing '{canvas_id}': {old_span}x → {new_span}x at ({item.row}, {item.col})")
-        
-        # Update span
+        logger.debug("[GridLayout] Resized '%s': %sx -> %sx", canvas_id, item.span, new_span)
         item.span = new_span
-        
-        # Auto-shift neighbors if needed
-        self._auto_shift_after_resize(canvas_id, old_span, new_span)
-        
-        print(f"[GridLayout] Resize complete: {canvas_id} now {new_span}x")
         return True
     
-    def _auto_shift_after_resize(self, resized_id: str, old_span: int, new_span: int):
-        """
-        Auto-shift neighbors horizontally with wrap to next row.
-        
-        JUSTIFIED LOGIC (1234, 5678):
-        - Growing: push neighbors RIGHT, wrap to next row if overflow
-        - Shrinking: pull neighbors LEFT, pull UP from row below if space
-        """
-        resized_item = self.items[resized_id]
-        
-        if new_span > old_span:
-            print(f"[GridLayout] GROW {resized_id}: {old_span}x -> {new_span}x, pushing right")
-            
-            # Get ALL items on same row, sorted by column
-            same_row = sorted(
-                [(id, item) for id, item in self.items.items()
-                 if item.row == resized_item.row and id != resized_id],
-                key=lambda x: x[1].col
-            )
-            
-            # Calculate new positions - SHIFT RIGHT
-            delta = new_span - old_span
-            new_end_col = resized_item.col + new_span
-            
-            for neighbor_id, neighbor in same_row:
-                if neighbor.col >= resized_item.col:
-                    # This neighbor is to the right - SHIFT it
-                    neighbor.col += delta
-                    
-                    # If overflow - WRAP to next row
-                    if neighbor.col + neighbor.span > self.current_columns:
-                        neighbor.row += 1
-                        neighbor.col = 0
-                        print(f"[GridLayout]   '{neighbor_id}' wrapped to row {neighbor.row}")
-                    else:
-                        print(f"[GridLayout]   '{neighbor_id}' shifted to col {neighbor.col}")
-        
-        elif new_span < old_span:
-            print(f"[GridLayout] SHRINK {resized_id}: {old_span}x -> {new_span}x, pulling left/up")
-            
-            # Get ALL items, sorted by (row, col)
-            all_items = sorted(
-                [(id, item) for id, item in self.items.items() if id != resized_id],
-                key=lambda x: (x[1].row, x[1].col)
-            )
-            
-            # Try to compact: move items left and up if space available
-            for neighbor_id, neighbor in all_items:
-                if neighbor.row == resized_item.row and neighbor.col > resized_item.col:
-                    # Same row, to the right - try to pull LEFT
-                    delta = old_span - new_span
-                    new_col = neighbor.col - delta
-                    if new_col >= resized_item.col + new_span:
-                        neighbor.col = new_col
-                        print(f"[GridLayout]   Pulled '{neighbor_id}' LEFT to col {new_col}")
-                
-                elif neighbor.row > resized_item.row:
-                    # Lower row - try to pull UP to current row
-                    for try_col in range(self.current_columns - neighbor.span + 1):
-                        if self._can_place(resized_item.row, try_col, neighbor.span):
-                            old_row = neighbor.row
-                            neighbor.row = resized_item.row
-                            neighbor.col = try_col
-                            print(f"[GridLayout]   Pulled '{neighbor_id}' UP: ({old_row},{neighbor.col}) -> ({neighbor.row},{try_col})")
-                            break
-    
-    def find_optimal_position(self, span: int) -> Tuple[int, int]:
-        """
-        JUSTIFIED layout: Fill HORIZONTALLY first! (1234, 5678, 9...)
-        
-        Uses Skyline to find shortest column, places there.
-        Each canvas gets UNIQUE row for masonry (no height stretch).
-        
-        Args:
-            span: Widget span (1-4)
-            
-        Returns:
-            (row, col) tuple with optimal position
-        """
-        # Track column heights (count of items in each column)
-        column_heights = [0] * self.current_columns
-        
-        for item in self.items.values():
-            for col in range(item.col, min(item.col + item.span, self.current_columns)):
-                column_heights[col] += 1
-        
-        # Find SHORTEST column (Skyline algorithm)
-        min_height = min(column_heights) if column_heights else 0
-        
-        # Find first column with min height that fits span
-        best_col = 0
-        for col in range(self.current_columns - span + 1):
-            if column_heights[col] == min_height:
-                # Check if all spanned columns are at same height (for multi-span)
-                if all(column_heights[c] == min_height for c in range(col, col + span)):
-                    best_col = col
-                    break
-        
-        # CRITICAL: Row = height of the column we're placing in!
-        # This creates JUSTIFIED horizontal filling:
-        # Row 0: Canvas 1,2,3,4 (all column_heights[col] = 0 initially)
-        # Row 1: Canvas 5,6,7,8 (all column_heights[col] = 1)
-        best_row = min_height
-        
-        print(f"[Skyline] JUSTIFIED: row={best_row}, col={best_col}, span={span}")
-        print(f"  Column heights: {column_heights}")
-        
-        return (best_row, best_col)
+    def update_positions(self, items: Iterable[PackItem]):
+        """Store pinned columns/rows of packed items (after PackingEngine.pin())."""
+        for pack_item in items:
+            item = self.items.get(pack_item.item_id)
+            if item is not None and pack_item.col is not None:
+                item.col = pack_item.col
+                item.row = pack_item.row
     
     def clear(self):
         """Remove all items from grid."""
         self.items.clear()
-        print("[GridLayout] Cleared all items")
+        logger.debug("[GridLayout] Cleared all items")
     
     def to_dict(self) -> Dict[str, Dict]:
         """
@@ -0,0 +1,153 @@
+"""
+Watcher of INI files edited by the editor (3dsMax.ini, plugin INIs).
+
+Local files are watched with QFileSystemWatcher; files on network
+profiles (UNC paths, mapped network drives) - where change notifications
+are unreliable - and files that can't be watched are polled by
+(mtime, size). Bursts of writes (3ds Max rewrites its INI key by key on
+exit, editors save via temp file + rename) are debounced into a single
+files_changed signal.
+
+Usage:
+    watcher = INIFileWatcher(parent=window)
+    watcher.files_changed.connect(window.on_ini_files_changed)
+    watcher.set_paths([ini_path, *plugin_paths])
+"""
+
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+logger = logging.getLogger(__name__)
+
+DEBOUNCE_MS = 300  # Quiet period after last write before files_changed
+POLL_INTERVAL_MS = 2000  # Stat interval of polled files
+FORCE_POLLING_ENV = 'MAXMANAGER_WATCH_POLL'  # =1: poll all files (notifications don't arrive)
+
+DRIVE_REMOTE = 4  # GetDriveTypeW result of mapped network drive
+
+
+def is_network_path(path: Path) -> bool:
+    """Check if path is on a network share (UNC path or mapped network drive)."""
+    text = str(path)
+    if text.startswith(('\\\\', '//')):
+        return True
+    if sys.platform == 'win32' and len(text) > 1 and text[1] == ':':
+        import ctypes
+        return ctypes.windll.kernel32.GetDriveTypeW(text[:2] + '\\') == DRIVE_REMOTE
+    return False
+
+
+def read_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """Get (mtime_ns, size) of file (None if missing)."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class INIFileWatcher(QObject):
+    """
+    Debounced change notifications of INI files.
+
+    Changes made by the editor itself are reported too; receivers compare
+    with INIManager.is_changed_on_disk() to skip own saves.
+    """
+
+    files_changed = Signal(list)  # [Path] changed since last emit
+
+    def __init__(self, parent: Optional[QObject] = None, force_polling: Optional[bool] = None,
+                 poll_interval_ms: int = POLL_INTERVAL_MS):
+        """
+        Args:
+            parent: Owner QObject
+            force_polling: Poll all files (None = MAXMANAGER_WATCH_POLL env)
+            poll_interval_ms: Stat interval of polled files
+        """
+        super().__init__(parent)
+        if force_polling is None:
+            force_polling = os.environ.get(FORCE_POLLING_ENV) == '1'
+        self.force_polling = force_polling
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._polled: Dict[str, Optional[Tuple[int, int]]] = {}  # {path: last stamp}
+        self._pending: Dict[str, None] = {}  # Changed paths in order (dict as ordered set)
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(DEBOUNCE_MS)
+        self._debounce.timeout.connect(self.flush)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_interval_ms)
+        self._poll_timer.timeout.connect(self._poll)
+
+    def set_paths(self, paths: Iterable[Path]):
+        """Watch exactly these files (replaces previous set)."""
+        self.clear()
+        for path in paths:
+            path = str(path)
+            if self.force_polling or is_network_path(Path(path)) or not self._watcher.addPath(path):
+                self._start_polling(path)
+        logger.debug("[Watcher] Watching %s files, polling %s",
+                     len(self._watcher.files()), len(self._polled))
+
+    def clear(self):
+        """Stop watching all files, drop pending changes."""
+        if self._watcher.files():
+            self._watcher.removePaths(self._watcher.files())
+        self._polled.clear()
+        self._pending.clear()
+        self._poll_timer.stop()
+        self._debounce.stop()
+
+    def watched_paths(self) -> List[Path]:
+        """All watched files (notified and polled)."""
+        return [Path(path) for path in [*self._watcher.files(), *self._polled]]
+
+    def is_polled(self, path: Path) -> bool:
+        """Check if file is polled instead of watched by notifications."""
+        return str(path) in self._polled
+
+    def flush(self):
+        """Emit pending changes now (end of debounce)."""
+        self._debounce.stop()
+        if not self._pending:
+            return
+        changed = [Path(path) for path in self._pending]
+        self._pending.clear()
+        logger.debug("[Watcher] Changed: %s", [path.name for path in changed])
+        self.files_changed.emit(changed)
+
+    def _start_polling(self, path: str):
+        """Poll file by stamp (network share, not watchable, removed)."""
+        self._polled[path] = read_stamp(path)
+        if not self._poll_timer.isActive():
+            self._poll_timer.start()
+
+    def _on_file_changed(self, path: str):
+        """Notification from QFileSystemWatcher (one per write of a burst)."""
+        if path not in self._watcher.files():
+            # Saved via temp file + rename, or removed: the watch was dropped
+            if not (os.path.exists(path) and self._watcher.addPath(path)):
+                self._start_polling(path)  # Picked up again when file reappears
+        self._mark_changed(path)
+
+    def _poll(self):
+        """Stat polled files, mark those with new stamp."""
+        for path, stamp in list(self._polled.items()):
+            new_stamp = read_stamp(path)
+            if new_stamp != stamp:
+                self._polled[path] = new_stamp
+                self._mark_changed(path)
+
+    def _mark_changed(self, path: str):
+        """Add to pending and restart quiet period."""
+        self._pending[path] = None
+        self._debounce.start()
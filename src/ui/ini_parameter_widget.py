@@ -4,24 +4,25 @@ INI Parameter Widget for MaxManager.
 Provides smart UI controls for different INI parameter types.
 """
 
+import logging
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QLabel, QLineEdit, 
     QSpinBox, QDoubleSpinBox, QSlider, QPushButton, QCheckBox, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal, QPoint
+from PySide6.QtCore import Qt, Signal, QPoint, QTimer
 from PySide6.QtGui import QFont, QPainter, QFontMetrics, QCursor
 
-# Import name formatter and parameter info loader
-from ..utils.name_formatter import format_parameter_name
+# Import parameter info loader
 from ..modules.parameter_info_loader import ParameterInfoLoader
+from ..data.type_resolver import infer_type
+from ..i18n.translation_table import KIND_NAME, KIND_HELP, get_translation_table, get_label_registry
+from .theme_service import QTA_AVAILABLE, get_icon, repolish
+
+logger = logging.getLogger(__name__)
 # DON'T import get_translation_manager here - will import inside functions to avoid caching
 
-try:
-    import qtawesome as qta
-    QTA_AVAILABLE = True
-except ImportError:
-    QTA_AVAILABLE = False
-    print("QtAwesome not available, using simple checkbox for toggles")
+# Drag/wheel on scrubby boxes: text follows the mouse, valueChanged at most once per frame (~60 fps)
+FRAME_INTERVAL_MS = 16
 
 
 class ElidedLabel(QLabel):
@@ -53,6 +54,12 @@ class ScrubbyIntSpinBox(QLineEdit):
         self.setMinimumWidth(80)  # Minimum but can stretch
         self.setMaximumWidth(150)  # Max to prevent too wide
         
+        # Throttled valueChanged while dragging/scrolling (committed on release)
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(FRAME_INTERVAL_MS)
+        self._emit_timer.timeout.connect(self._emit_value)
+        
         # Connect text editing
         self.editingFinished.connect(self._on_text_changed)
         
@@ -64,13 +71,28 @@ class ScrubbyIntSpinBox(QLineEdit):
         except ValueError:
             self.setText(str(self._value))
     
-    def setValue(self, value):
-        """Set value programmatically."""
+    def setValue(self, value, throttled=False):
+        """Set value (throttled=True: text now, valueChanged on next frame)."""
         value = max(self._min, min(self._max, value))
         if value != self._value:
             self._value = value
             self.setText(str(value))
-            self.valueChanged.emit(value)
+            if throttled:
+                if not self._emit_timer.isActive():
+                    self._emit_timer.start()
+            else:
+                self._emit_timer.stop()
+                self.valueChanged.emit(value)
+    
+    def commit(self):
+        """Emit throttled value now (end of drag, focus out)."""
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            self.valueChanged.emit(self._value)
+    
+    def _emit_value(self):
+        """Frame timer: deliver latest value."""
+        self.valueChanged.emit(self._value)
     
     def value(self):
         """Get current value."""
@@ -102,7 +124,7 @@ class ScrubbyIntSpinBox(QLineEdit):
                 sensitivity = 1.0  # Normal
             
             new_value = int(self._drag_start_value + delta_x * sensitivity)
-            self.setValue(new_value)
+            self.setValue(new_value, throttled=True)
             event.accept()
         else:
             super().mouseMoveEvent(event)
@@ -112,6 +134,7 @@ class ScrubbyIntSpinBox(QLineEdit):
         if event.button() == Qt.LeftButton and self._dragging:
             self._dragging = False
             self.setCursor(QCursor(Qt.IBeamCursor))  # Back to text cursor
+            self.commit()
             event.accept()
         else:
             super().mouseReleaseEvent(event)
@@ -130,9 +153,14 @@ class ScrubbyIntSpinBox(QLineEdit):
             step = 1
         
         new_value = int(self._value + delta * step)
-        self.setValue(new_value)
+        self.setValue(new_value, throttled=True)
         event.accept()
     
+    def focusOutEvent(self, event):
+        """Commit pending wheel change before focus moves (e.g. to Save)."""
+        self.commit()
+        super().focusOutEvent(event)
+    
     def enterEvent(self, event):
         """Change cursor on hover."""
         if not self._dragging:
@@ -164,6 +192,12 @@ class ScrubbyFloatSpinBox(QLineEdit):
         self.setMinimumWidth(80)  # Minimum but can stretch
         self.setMaximumWidth(150)  # Max to prevent too wide
         
+        # Throttled valueChanged while dragging/scrolling (committed on release)
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(FRAME_INTERVAL_MS)
+        self._emit_timer.timeout.connect(self._emit_value)
+        
         # Connect text editing
         self.editingFinished.connect(self._on_text_changed)
     
@@ -175,13 +209,28 @@ class ScrubbyFloatSpinBox(QLineEdit):
         except ValueError:
             self.setText(f"{self._value:.{self._decimals}f}")
     
-    def setValue(self, value):
-        """Set value programmatically."""
+    def setValue(self, value, throttled=False):
+        """Set value (throttled=True: text now, valueChanged on next frame)."""
         value = max(self._min, min(self._max, value))
         if abs(value - self._value) > 1e-10:
             self._value = value
             self.setText(f"{value:.{self._decimals}f}")
-            self.valueChanged.emit(value)
+            if throttled:
+                if not self._emit_timer.isActive():
+                    self._emit_timer.start()
+            else:
+                self._emit_timer.stop()
+                self.valueChanged.emit(value)
+    
+    def commit(self):
+        """Emit throttled value now (end of drag, focus out)."""
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            self.valueChanged.emit(self._value)
+    
+    def _emit_value(self):
+        """Frame timer: deliver latest value."""
+        self.valueChanged.emit(self._value)
     
     def value(self):
         """Get current value."""
@@ -213,7 +262,7 @@ class ScrubbyFloatSpinBox(QLineEdit):
                 sensitivity = 0.01  # Normal
             
             new_value = self._drag_start_value + delta_x * sensitivity
-            self.setValue(new_value)
+            self.setValue(new_value, throttled=True)
             event.accept()
         else:
             super().mouseMoveEvent(event)
@@ -223,6 +272,7 @@ class ScrubbyFloatSpinBox(QLineEdit):
         if event.button() == Qt.LeftButton and self._dragging:
             self._dragging = False
             self.setCursor(QCursor(Qt.IBeamCursor))  # Back to text cursor
+            self.commit()
             event.accept()
         else:
             super().mouseReleaseEvent(event)
@@ -241,9 +291,14 @@ class ScrubbyFloatSpinBox(QLineEdit):
             step = 0.01
         
         new_value = self._value + delta * step
-        self.setValue(new_value)
+        self.setValue(new_value, throttled=True)
         event.accept()
     
+    def focusOutEvent(self, event):
+        """Commit pending wheel change before focus moves (e.g. to Save)."""
+        self.commit()
+        super().focusOutEvent(event)
+    
     def enterEvent(self, event):
         """Change cursor on hover."""
         if not self._dragging:
@@ -291,6 +346,7 @@ class INIParameterWidget(QWidget):
     def __init__(self, param_name: str, param_value: str, param_type: str = 'auto', help_text: str = None, parent=None):
         super().__init__(parent)
         self.param_name = param_name
+        self.identity = None  # (ini_file, section, key) - set by owner, routes value changes
         self.param_value = param_value
         self.original_value = param_value
         self.is_modified = False
@@ -300,8 +356,7 @@ class INIParameterWidget(QWidget):
         self.marked_for_deletion = False  # Track if marked for deletion
         
         # Initialize parameter info loader (once)
-        if INIParameterWidget._param_info_loader is None:
-            INIParameterWidget._param_info_loader = ParameterInfoLoader()
+        INIParameterWidget.get_param_info_loader()
         
         # DON'T cache language in __init__ - will be read fresh in init_ui
         self.help_text_key = param_name  # Store key for later
@@ -313,10 +368,16 @@ class INIParameterWidget(QWidget):
             self.param_type = param_type
             
         self.init_ui()
-        self.apply_styles()
         
         # Don't register callback on each widget - too many callbacks!
         # Language change will be triggered manually from parent window
+    
+    @classmethod
+    def get_param_info_loader(cls) -> ParameterInfoLoader:
+        """Get shared parameter info loader (created on first use)."""
+        if cls._param_info_loader is None:
+            cls._param_info_loader = get_translation_table().info_loader
+        return cls._param_info_loader
         
     def eventFilter(self, obj, event):
         """Handle hover events for help button."""
@@ -331,40 +392,10 @@ class INIParameterWidget(QWidget):
                 return False
         return super().eventFilter(obj, event)
     
-    def detect_type(self, value: str) -> str:
-        """Auto-detect parameter type from value."""
-        if not value:
-            return 'string'
-        
-        value_stripped = value.strip()
-        
-        # Complex structures (arrays, nested data) - keep as string
-        if value_stripped.startswith('#(') or value_stripped.startswith('[') or ',' in value_stripped:
-            return 'string'
-        
-        # Boolean (0/1 or true/false) - ONLY single values
-        value_lower = value_stripped.lower()
-        if value_stripped in ('0', '1') or value_lower in ('true', 'false'):
-            return 'boolean'
-            
-        # Path (contains :\ or .\ or starts with C:)
-        if ':\\' in value or '.\\' in value or value.startswith('C:'):
-            return 'path'
-            
-        # Float (contains decimal point)
-        if '.' in value:
-            try:
-                float(value)
-                return 'float'
-            except ValueError:
-                return 'string'
-                
-        # Integer
-        try:
-            int(value)
-            return 'integer'
-        except ValueError:
-            return 'string'
+    @staticmethod
+    def detect_type(value: str) -> str:
+        """Auto-detect parameter type from value (prefer TypeResolver when section is known)."""
+        return infer_type(value)
             
     def init_ui(self):
         """Initialize UI based on parameter type."""
@@ -376,10 +407,8 @@ class INIParameterWidget(QWidget):
         current_lang = tm.current_language.value
         
         # Get localized help text with FRESH language
-        if INIParameterWidget._param_info_loader.has_info(self.param_name):
-            help_text = INIParameterWidget._param_info_loader.get_help_text(self.param_name, current_lang) or f"Parameter: {self.param_name}"
-        else:
-            help_text = f"Parameter: {self.param_name}"
+        translation_table = get_translation_table()
+        help_text = translation_table.help_text(self.param_name, current_lang)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
@@ -400,8 +429,8 @@ class INIParameterWidget(QWidget):
         
         if QTA_AVAILABLE:
             # Start with gray icon
-            self.help_button_gray_icon = qta.icon('fa5.question-circle', color='#666666')
-            self.help_button_white_icon = qta.icon('fa5s.question-circle', color='white')
+            self.help_button_gray_icon = get_icon('fa5.question-circle', '#666666')
+            self.help_button_white_icon = get_icon('fa5s.question-circle', 'white')
             self.help_button.setIcon(self.help_button_gray_icon)
             self.help_button.setIconSize(self.help_button.size() * 0.8)  # 16x16 in 20x20 button
             
@@ -413,11 +442,9 @@ class INIParameterWidget(QWidget):
         layout.addWidget(self.help_button)
         
         # Parameter name label (40% width) - use localized name with FRESH language
-        display_name = INIParameterWidget._param_info_loader.get_display_name(self.param_name, current_lang)
-        if not display_name:  # Fallback if no info found
-            display_name = format_parameter_name(self.param_name)
+        display_name = translation_table.display_name(self.param_name, current_lang)
         
-        print(f"[PARAM WIDGET] {self.param_name}: lang={current_lang}, display_name={display_name}")
+        logger.debug("[PARAM WIDGET] %s: lang=%s, display_name=%s", self.param_name, current_lang, display_name)
         
         self.name_label = ElidedLabel(display_name)  # Custom label with eliding
         name_label = self.name_label
@@ -433,6 +460,11 @@ class INIParameterWidget(QWidget):
         name_label.setToolTip(f"{display_name}\n\nTechnical: {self.param_name}")
         layout.addWidget(name_label, 1)  # Stretch factor 1 - allow expansion
         
+        # Language switch updates exactly these texts (no widget tree walk)
+        label_registry = get_label_registry()
+        label_registry.bind(self, KIND_NAME, self.param_name, self.set_display_name)
+        label_registry.bind(self, KIND_HELP, self.param_name, self.help_button.setToolTip)
+        
         # Value widget - depends on type
         if self.param_type == 'boolean':
             self.value_widget = self.create_boolean_widget()
@@ -464,16 +496,13 @@ class INIParameterWidget(QWidget):
         self.action_button.setCursor(Qt.PointingHandCursor)
         self.action_button.setEnabled(False)
         self.action_button.setFocusPolicy(Qt.NoFocus)
-        self.action_button.setStyleSheet("""
-            QPushButton { background: transparent; border: none; padding: 0px; }
-        """)
         
         if QTA_AVAILABLE:
             # Store all possible icons
-            self.icon_white_undo = qta.icon('fa5s.undo', color='#FFFFFF')
-            self.icon_red_undo = qta.icon('fa5s.undo', color='#990000')
-            self.icon_red_x = qta.icon('fa5s.times', color='#cc0000')
-            self.icon_white_plus = qta.icon('fa5s.plus', color='#FFFFFF')
+            self.icon_white_undo = get_icon('fa5s.undo', '#FFFFFF')
+            self.icon_red_undo = get_icon('fa5s.undo', '#990000')
+            self.icon_red_x = get_icon('fa5s.times', '#cc0000')
+            self.icon_white_plus = get_icon('fa5s.plus', '#FFFFFF')
             from PySide6.QtGui import QIcon
             self.action_button.setIcon(QIcon())  # Start empty
             self.action_button.setIconSize(self.action_button.size() * 0.7)
@@ -529,13 +558,14 @@ class INIParameterWidget(QWidget):
             self.action_button.setIcon(QIcon())
             self.action_button.setEnabled(False)
         
-        print(f"[ACTION_BTN] {self.param_name}: {icon_name} (available={self.is_available}, just_added={self.just_added}, is_modified={self.is_modified}, was_added={self.was_added})")
+        logger.debug("[ACTION_BTN] %s: %s (available=%s, just_added=%s, is_modified=%s, was_added=%s)", self.param_name, icon_name, self.is_available, self.just_added, self.is_modified, self.was_added)
         
     def create_boolean_widget(self) -> QWidget:
         """Create toggle switch for boolean values using FontAwesome icons."""
         if QTA_AVAILABLE:
             # Use QPushButton with FontAwesome toggle icons
             toggle = QPushButton()
+            toggle.setObjectName("param_toggle")
             toggle.setCheckable(True)
             toggle.setChecked(self.param_value == '1')
             toggle.setFixedSize(30, 20)
@@ -545,9 +575,9 @@ class INIParameterWidget(QWidget):
             # Update icon based on state
             def update_icon():
                 if toggle.isChecked():
-                    icon = qta.icon('fa5s.toggle-on', color='#E0E0E0')
+                    icon = get_icon('fa5s.toggle-on', '#E0E0E0')
                 else:
-                    icon = qta.icon('fa5s.toggle-off', color='#666666')
+                    icon = get_icon('fa5s.toggle-off', '#666666')
                 toggle.setIcon(icon)
                 toggle.setIconSize(toggle.size())  # Full 30x20 icon size
                 
@@ -557,14 +587,6 @@ class INIParameterWidget(QWidget):
                 self.on_value_changed('1' if checked else '0')
             ))
             
-            toggle.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: none;
-                    padding: 0px;
-                }
-            """)
-            
             return toggle
         else:
             # Fallback to simple checkbox
@@ -621,8 +643,8 @@ class INIParameterWidget(QWidget):
         
         # Separator line - no spacing, lineedit padding handles it
         separator = QWidget()
+        separator.setObjectName("path_separator")
         separator.setFixedWidth(1)
-        separator.setStyleSheet("background-color: #555555;")
         layout.addWidget(separator)
         
         # Browse button with folder icon
@@ -634,41 +656,13 @@ class INIParameterWidget(QWidget):
         browse_btn.clicked.connect(lambda: self.browse_path(lineedit))
         
         if QTA_AVAILABLE:
-            icon = qta.icon('fa6.folder', color='white')
-            browse_btn.setIcon(icon)
+            browse_btn.setIcon(get_icon('fa6.folder', 'white'))
             browse_btn.setIconSize(browse_btn.size() * 0.6)  # 16x16 icon in 28x26 button
         else:
             browse_btn.setText("📁")
             
         layout.addWidget(browse_btn)
         
-        # Container styling - unified border
-        container.setStyleSheet("""
-            QWidget#path_widget_container {
-                background-color: #2A2A2A;
-                border: 1px solid #555555;
-                border-radius: 3px;
-            }
-            QLineEdit#path_input {
-                background-color: transparent;
-                color: white;
-                border: none;
-                padding: 0px;  /* No padding - using textMargins instead */
-            }
-            QPushButton#path_browse_button {
-                background-color: transparent;
-                border: none;
-                outline: none;
-            }
-            QPushButton#path_browse_button:hover {
-                background-color: rgba(255, 255, 255, 20);
-            }
-            QPushButton#path_browse_button:focus {
-                outline: none;
-                border: none;
-            }
-        """)
-        
         return container
         
     def create_string_widget(self) -> QWidget:
@@ -702,7 +696,7 @@ class INIParameterWidget(QWidget):
         
         # If just_added and user modifies → switch to RED undo (revert mode)
         if self.just_added:
-            print(f">>> First edit after adding - switching to RED undo")
+            logger.debug(">>> First edit after adding - switching to RED undo")
             self.just_added = False
             self.was_added = True  # Remember param was added by user
             # DON'T change original_value! It should remain the default value
@@ -738,14 +732,12 @@ class INIParameterWidget(QWidget):
     def highlight_modified(self):
         """Highlight widget as modified (yellow background)."""
         self.setProperty("modified", True)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        repolish(self, recursive=False)
         
     def remove_highlight(self):
         """Remove modified highlight."""
         self.setProperty("modified", False)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        repolish(self, recursive=False)
         
     def get_value(self) -> str:
         """Get current value as string."""
@@ -764,12 +756,12 @@ class INIParameterWidget(QWidget):
                 
     def reset_to_original(self):
         """Reset value to original OR delete if just added."""
-        print(f"\n[UNDO] reset_to_original called for {self.param_name}")
-        print(f"[UNDO] just_added={self.just_added}, is_modified={self.is_modified}")
+        logger.debug("[UNDO] reset_to_original called for %s", self.param_name)
+        logger.debug("[UNDO] just_added=%s, is_modified=%s", self.just_added, self.is_modified)
         
         if self.just_added:
             # DELETE parameter - make available again
-            print(f"[UNDO] DELETING just-added parameter {self.param_name}")
+            logger.debug("[UNDO] DELETING just-added parameter %s", self.param_name)
             self.is_available = True
             self.just_added = False
             self.setProperty("available", True)
@@ -781,14 +773,12 @@ class INIParameterWidget(QWidget):
             # Update action button to + icon
             self.update_action_button()
             
-            # Refresh
-            self.style().unpolish(self)
-            self.style().polish(self)
-            self.update()
-            print(f">>> Parameter deleted, + restored")
+            # Refresh (children too - label color depends on "available")
+            repolish(self)
+            logger.debug(">>> Parameter deleted, + restored")
         else:
             # REVERT to original value
-            print(f">>> REVERT {self.param_name} to original")
+            logger.debug(">>> REVERT %s to original", self.param_name)
             
             # Block signals to prevent triggering on_value_changed during programmatic change
             self.value_widget.blockSignals(True)
@@ -833,23 +823,17 @@ class INIParameterWidget(QWidget):
             self.is_available = True
             self.marked_for_deletion = True
             self.setProperty("available", True)
+            self.setProperty("deleted", True)
             
             # Hide value widget
             if hasattr(self, 'value_widget'):
                 self.value_widget.setVisible(False)
             
-            # Clear inline style for gray text
-            if hasattr(self, 'name_label'):
-                self.name_label.setStyleSheet("")
-                self.name_label.style().unpolish(self.name_label)
-                self.name_label.style().polish(self.name_label)
-            
             # Update action button to + icon
             self.update_action_button()
             
-            self.style().unpolish(self)
-            self.style().polish(self)
-            self.update()
+            # Refresh (children too - name label turns gray)
+            repolish(self)
             
             self.modified_state_changed.emit(True)
     
@@ -858,8 +842,7 @@ class INIParameterWidget(QWidget):
         self.is_modified = False
         self.just_added = False
         self.setProperty("modified", False)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        repolish(self, recursive=False)
         
         # Update action button (RED X for added params)
         self.update_action_button()
@@ -880,7 +863,7 @@ class INIParameterWidget(QWidget):
                 self.value_widget.setEnabled(False)
             
             # + button will be shown in showEvent when widget becomes visible
-            print(f"[AVAIL] {self.param_name}: available=True, can_add={can_add} (button will show in showEvent)")
+            logger.debug("[AVAIL] %s: available=True, can_add=%s (button will show in showEvent)", self.param_name, can_add)
         else:
             self.setProperty("available", False)
             # SHOW value widget
@@ -891,19 +874,17 @@ class INIParameterWidget(QWidget):
         # Update action button
         self.update_action_button()
         
-        self.style().unpolish(self)
-        self.style().polish(self)
+        repolish(self)
     
     def on_add_clicked(self):
         """Handle add button click - signal to add parameter to INI."""
         from PySide6.QtWidgets import QMessageBox
         
-        print(f"\n{'='*60}")
-        print(f"[ADD] on_add_clicked CALLED")
-        print(f"[ADD] Parameter: {self.param_name}")
-        print(f"[ADD] Current state: is_available={self.is_available}, is_modified={self.is_modified}")
-        print(f"[ADD] Value widget visible: {self.value_widget.isVisible() if hasattr(self, 'value_widget') else 'N/A'}")
-        print(f"[ADD] Add button visible: {self.add_button.isVisible() if hasattr(self, 'add_button') else 'N/A'}")
+        logger.debug("[ADD] on_add_clicked CALLED")
+        logger.debug("[ADD] Parameter: %s", self.param_name)
+        logger.debug("[ADD] Current state: is_available=%s, is_modified=%s", self.is_available, self.is_modified)
+        logger.debug("[ADD] Value widget visible: %s", self.value_widget.isVisible() if hasattr(self, 'value_widget') else 'N/A')
+        logger.debug("[ADD] Add button visible: %s", self.add_button.isVisible() if hasattr(self, 'add_button') else 'N/A')
         
         # TEST: Show immediate dialog to confirm click works
         reply = QMessageBox.question(
@@ -915,34 +896,30 @@ class INIParameterWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            print(f"[ADD] User clicked YES - starting activation...")
+            logger.debug("[ADD] User clicked YES - starting activation...")
             
             # Emit signal to parent to handle actual INI modification
             self.parameter_added.emit()
-            print(f"[ADD] Signal emitted to parent")
+            logger.debug("[ADD] Signal emitted to parent")
             
             # STEP 1: Remove "available" property and make text WHITE
-            print(f"[ADD] STEP 1: Removing 'available' property...")
+            logger.debug("[ADD] STEP 1: Removing 'available' property...")
             self.is_available = False
             self.setProperty("available", None)  # None to remove property completely
+            self.setProperty("deleted", None)
             
-            # Force name_label to WHITE
-            if hasattr(self, 'name_label'):
-                self.name_label.setStyleSheet("color: white;")
-                print(f"[ADD]   name_label forced to white")
-            
-            print(f"[ADD]   is_available = {self.is_available}")
+            logger.debug("[ADD]   is_available = %s", self.is_available)
             
             # STEP 2: Show value widget
-            print(f"[ADD] STEP 2: Showing value widget...")
+            logger.debug("[ADD] STEP 2: Showing value widget...")
             if hasattr(self, 'value_widget'):
                 self.value_widget.setVisible(True)
                 self.value_widget.setEnabled(True)
-                print(f"[ADD]   value_widget.visible = {self.value_widget.isVisible()}")
-                print(f"[ADD]   value_widget.enabled = {self.value_widget.isEnabled()}")
+                logger.debug("[ADD]   value_widget.visible = %s", self.value_widget.isVisible())
+                logger.debug("[ADD]   value_widget.enabled = %s", self.value_widget.isEnabled())
             
             # STEP 3: Show WHITE undo
-            print(f"[ADD] STEP 3: Setting state and showing WHITE undo...")
+            logger.debug("[ADD] STEP 3: Setting state and showing WHITE undo...")
             self.is_modified = False
             self.just_added = True
             self.was_added = True  # Remember this param was added
@@ -952,16 +929,12 @@ class INIParameterWidget(QWidget):
             
             # Emit modified signal so canvas header shows Save/Revert buttons
             self.modified_state_changed.emit(True)
-            print(f"[ADD]   Emitted modified_state_changed(True) for canvas header")
+            logger.debug("[ADD]   Emitted modified_state_changed(True) for canvas header")
             
             # STEP 5: Force style refresh
-            print(f"[ADD] STEP 5: Refreshing styles...")
-            self.style().unpolish(self)
-            self.style().polish(self)
-            self.update()
-            self.repaint()
-            print(f"[ADD] COMPLETE - Widget should be BRIGHT now")
-            print(f"{'='*60}\n")
+            logger.debug("[ADD] STEP 5: Refreshing styles...")
+            repolish(self)  # Children too - name label turns WHITE
+            logger.debug("[ADD] COMPLETE - Widget should be BRIGHT now")
     
     def set_tooltip(self, text: str):
         """Set tooltip text for parameter."""
@@ -970,132 +943,17 @@ class INIParameterWidget(QWidget):
         self.setToolTip(text)
     
     def on_language_changed(self):
-        """Handle language change."""
-        # CRITICAL: Check if widget is still valid (not deleted)
-        try:
-            if not self.isVisible() and self.parent() is None:
-                # Widget is being deleted or already deleted
-                return
-        except RuntimeError:
-            # C++ object already deleted
-            return
-        
-        # Import FRESH to avoid caching
+        """Handle language change (normally done in batch by LabelRegistry)."""
         from ..i18n import get_translation_manager
-        
-        # Get FRESH language
-        tm = get_translation_manager()
-        current_lang = tm.current_language.value
-        
-        # Update display name
-        if INIParameterWidget._param_info_loader.has_info(self.param_name):
-            display_name = INIParameterWidget._param_info_loader.get_display_name(self.param_name, current_lang) or format_parameter_name(self.param_name)
-        else:
-            display_name = format_parameter_name(self.param_name)
-        
-        # Find and update name label - search all QLabel children
-        labels = self.findChildren(QLabel)
-        if labels:
-            # First QLabel is the name label
-            labels[0].setText(display_name)
-            labels[0].update()  # Force repaint
-        
-        # Update help text
-        if INIParameterWidget._param_info_loader.has_info(self.param_name):
-            help_text = INIParameterWidget._param_info_loader.get_help_text(self.param_name, current_lang) or f"Parameter: {self.param_name}"
-        else:
-            help_text = f"Parameter: {self.param_name}"
-        
-        # Update tooltip on help button
-        if hasattr(self, 'help_button'):
-            self.help_button.setToolTip(help_text)
-        
-        # Force repaint of entire widget
-        self.update()
-        
-    def apply_styles(self):
-        """Apply visual styles."""
-        self.setStyleSheet("""
-            QToolTip {
-                background-color: #2A2A2A;
-                color: white;
-                border: 1px solid #444444;
-                padding: 10px;
-                font-family: 'Segoe UI';
-                font-size: 10px;
-                border-radius: 0px;
-            }
-            INIParameterWidget {
-                background-color: transparent;
-                border: none;
-                padding: 2px;
-            }
-            INIParameterWidget[modified="true"] {
-                background-color: transparent;
-                border-left: none;
-            }
-            INIParameterWidget[available="true"] QLabel {
-                color: #888888 !important;  /* Dimmed text for available params */
-            }
-            INIParameterWidget > QLabel {
-                color: white;
-                background-color: transparent;
-            }
-            INIParameterWidget QLineEdit {
-                background-color: #2A2A2A;
-                color: white;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                padding: 3px;
-            }
-            INIParameterWidget QLineEdit:focus {
-                border: 1px solid #555555;
-                outline: none;
-            }
-            INIParameterWidget QSpinBox, INIParameterWidget QDoubleSpinBox {
-                background-color: #2A2A2A;
-                color: white;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                padding: 3px;
-            }
-            INIParameterWidget QPushButton {
-                background-color: #404040;
-                color: white;
-                border: none;
-                border-radius: 3px;
-            }
-            INIParameterWidget QPushButton:hover {
-                background-color: #555555;
-            }
-            QPushButton#help_button {
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                outline: none;
-            }
-            QPushButton#help_button:hover {
-                background-color: transparent;
-            }
-            QPushButton#help_button:focus {
-                outline: none;
-                border: none;
-            }
-            QPushButton#undo_button {
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                outline: none;
-            }
-            QPushButton#undo_button:hover {
-                background-color: transparent;
-            }
-            QPushButton#undo_button:focus {
-                outline: none;
-                border: none;
-            }
-            QPushButton#undo_button:disabled {
-                background-color: transparent;
-            }
-        """)
-
+        current_lang = get_translation_manager().current_language.value
+        
+        translation_table = get_translation_table()
+        self.set_display_name(translation_table.display_name(self.param_name, current_lang))
+        self.help_button.setToolTip(translation_table.help_text(self.param_name, current_lang))
+    
+    def set_display_name(self, display_name: str):
+        """Set localized name label text and tooltip."""
+        self.name_label.setText(display_name)
+        if self.name_label.toolTip().endswith(f"Technical: {self.param_name}"):
+            # Keep description tooltip of available params
+            self.name_label.setToolTip(f"{display_name}\n\nTechnical: {self.param_name}")
@@ -2,29 +2,52 @@
 Layout Storage for MaxManager Canvas.
 
 Handles saving and loading canvas layout configurations to/from JSON files.
+
+All layouts are kept in memory after the first read. Saves only update
+the cache and schedule a write; writes are batched by a background timer
+(WRITE_DELAY_S) and are atomic (temp file + rename), so a drag-and-drop
+never waits for disk and a crash mid-write never truncates the file.
+Pending writes are flushed on flush(), on window close and at exit.
 """
 
+import atexit
 import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
 from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+
+WRITE_DELAY_S = 0.5  # Batch window of layout writes
+
+_instances = weakref.WeakSet()  # Storages flushed at exit
+
 
 class LayoutStorage:
     """
     Manages persistent storage of canvas layout configurations.
-    
+
     Stores canvas positions, spans, and other layout metadata in JSON format.
     Default storage location: ~/.maxmanager/canvas_layout.json
+
+    Use get_layout_storage() for the default file - storages with their own
+    cache of one file would overwrite each other's layouts.
     """
-    
-    def __init__(self, storage_path: Optional[Path] = None):
+
+    def __init__(self, storage_path: Optional[Path] = None, write_delay: float = WRITE_DELAY_S):
         """
         Initialize layout storage.
-        
+
         Args:
             storage_path: Optional custom path for storage file.
                          Defaults to ~/.maxmanager/canvas_layout.json
+            write_delay: Seconds to batch saves before writing file
         """
         if storage_path is None:
             # Default to user home directory
@@ -35,108 +58,116 @@ class LayoutStorage:
         else:
             self.storage_path = Path(storage_path)
             self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        print(f"[LayoutStorage] Using storage: {self.storage_path}")
-    
+
+        self.write_delay = write_delay
+        self._layouts: Optional[Dict] = None  # In-memory copy of file (read on first use)
+        self._dirty = False
+        self._writing = False
+        self._lock = threading.Lock()  # Guards cache, dirty flag and timer
+        self._write_lock = threading.Lock()  # Serializes file writes
+        self._timer: Optional[threading.Timer] = None
+        _instances.add(self)
+
+        logger.debug("[LayoutStorage] Using storage: %s", self.storage_path)
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """True if cache has changes not yet written to file."""
+        return self._dirty or self._writing
+
     def save_layout(self, layout_data: Dict[str, Dict], layout_name: str = "default") -> bool:
         """
-        Save layout configuration to file.
-        
+        Save layout configuration (written to file in background).
+
         Args:
             layout_data: Dictionary with canvas positions (from GridLayoutManager.to_dict())
             layout_name: Name of the layout (for multiple layout support)
-        
+
         Returns:
             True if saved successfully, False otherwise
         """
         try:
-            # Load existing layouts
-            all_layouts = self._load_all_layouts()
-            
-            # Update with new layout
-            all_layouts[layout_name] = {
-                "data": layout_data,
-                "updated_at": datetime.now().isoformat(),
-                "version": "1.0"
-            }
-            
-            # Save to file
-            with open(self.storage_path, 'w', encoding='utf-8') as f:
-                json.dump(all_layouts, f, indent=2, ensure_ascii=False)
-            
-            print(f"[LayoutStorage] Saved layout '{layout_name}' with {len(layout_data)} items")
+            with self._lock:
+                # Entries are replaced, never mutated - writer can snapshot without deep copy
+                self._load_all_layouts()[layout_name] = {
+                    "data": layout_data,
+                    "updated_at": datetime.now().isoformat(),
+                    "version": "1.0"
+                }
+                self._schedule_write()
+
+            logger.debug("[LayoutStorage] Saved layout '%s' with %s items", layout_name, len(layout_data))
             return True
-            
+
         except Exception as e:
-            print(f"[LayoutStorage] ERROR saving layout: {e}")
+            logger.error("[LayoutStorage] ERROR saving layout: %s", e)
             return False
-    
+
     def load_layout(self, layout_name: str = "default") -> Optional[Dict[str, Dict]]:
         """
-        Load layout configuration from file.
-        
+        Load layout configuration (file is read only on first use).
+
         Args:
             layout_name: Name of the layout to load
-        
+
         Returns:
             Dictionary with canvas positions or None if not found
         """
         try:
-            all_layouts = self._load_all_layouts()
-            
-            if layout_name not in all_layouts:
-                print(f"[LayoutStorage] Layout '{layout_name}' not found")
+            with self._lock:
+                layout_info = self._load_all_layouts().get(layout_name)
+
+            if layout_info is None:
+                logger.debug("[LayoutStorage] Layout '%s' not found", layout_name)
                 return None
-            
-            layout_info = all_layouts[layout_name]
+
             data = layout_info.get("data", {})
-            
-            print(f"[LayoutStorage] Loaded layout '{layout_name}' with {len(data)} items")
+
+            logger.debug("[LayoutStorage] Loaded layout '%s' with %s items", layout_name, len(data))
             return data
-            
+
         except Exception as e:
-            print(f"[LayoutStorage] ERROR loading layout: {e}")
+            logger.error("[LayoutStorage] ERROR loading layout: %s", e)
             return None
-    
+
     def delete_layout(self, layout_name: str) -> bool:
         """
         Delete a saved layout.
-        
+
         Args:
             layout_name: Name of layout to delete
-        
+
         Returns:
             True if deleted, False if not found or error
         """
         try:
-            all_layouts = self._load_all_layouts()
-            
-            if layout_name not in all_layouts:
-                print(f"[LayoutStorage] Layout '{layout_name}' not found")
-                return False
-            
-            del all_layouts[layout_name]
-            
-            # Save updated layouts
-            with open(self.storage_path, 'w', encoding='utf-8') as f:
-                json.dump(all_layouts, f, indent=2, ensure_ascii=False)
-            
-            print(f"[LayoutStorage] Deleted layout '{layout_name}'")
+            with self._lock:
+                all_layouts = self._load_all_layouts()
+
+                if layout_name not in all_layouts:
+                    logger.debug("[LayoutStorage] Layout '%s' not found", layout_name)
+                    return False
+
+                del all_layouts[layout_name]
+                self._schedule_write()
+
+            logger.debug("[LayoutStorage] Deleted layout '%s'", layout_name)
             return True
-            
+
         except Exception as e:
-            print(f"[LayoutStorage] ERROR deleting layout: {e}")
+            logger.error("[LayoutStorage] ERROR deleting layout: %s", e)
             return False
-    
+
     def list_layouts(self) -> Dict[str, Dict]:
         """
         Get list of all saved layouts with metadata.
-        
+
         Returns:
             Dictionary mapping layout names to their metadata
         """
-        all_layouts = self._load_all_layouts()
-        
+        with self._lock:
+            all_layouts = dict(self._load_all_layouts())
+
         # Return only metadata (without full data)
         result = {}
         for name, info in all_layouts.items():
@@ -145,62 +176,143 @@ class LayoutStorage:
                 "version": info.get("version", "unknown"),
                 "item_count": len(info.get("data", {}))
             }
-        
+
         return result
-    
+
     def has_saved_layout(self, layout_name: str = "default") -> bool:
         """
         Check if a layout exists in storage.
-        
+
         Args:
             layout_name: Name of layout to check
-        
+
         Returns:
             True if layout exists, False otherwise
         """
-        all_layouts = self._load_all_layouts()
-        return layout_name in all_layouts
-    
+        with self._lock:
+            return layout_name in self._load_all_layouts()
+
+    def flush(self) -> bool:
+        """
+        Write pending changes to file now (blocks until written).
+
+        Returns:
+            True if file is up to date, False if write failed
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        return self._write_pending()
+
+    def _schedule_write(self):
+        """Mark cache dirty and start batch timer (caller holds _lock)."""
+        self._dirty = True
+        if self._timer is None:
+            self._timer = threading.Timer(self.write_delay, self._on_write_timer)
+            self._timer.daemon = True  # Exit is handled by atexit flush
+            self._timer.start()
+
+    def _on_write_timer(self):
+        """Background timer: write batch of saves."""
+        with self._lock:
+            self._timer = None
+        self._write_pending()
+
+    def _write_pending(self) -> bool:
+        """Write snapshot of cache if dirty."""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                snapshot = dict(self._layouts)
+                self._dirty = False
+                self._writing = True
+
+            try:
+                self._write_atomic(snapshot)
+                return True
+            except Exception as e:
+                logger.error("[LayoutStorage] ERROR writing layouts: %s", e)
+                with self._lock:
+                    self._dirty = True  # Retry on next save/flush
+                return False
+            finally:
+                self._writing = False
+
+    def _write_atomic(self, all_layouts: Dict):
+        """Write all layouts to temp file next to storage file, then rename over it."""
+        fd, temp_path = tempfile.mkstemp(
+            dir=str(self.storage_path.parent),
+            prefix=f".{self.storage_path.name}.",
+            suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(all_layouts, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.storage_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+        logger.debug("[LayoutStorage] Wrote %s layouts to %s", len(all_layouts), self.storage_path.name)
+
     def _load_all_layouts(self) -> Dict:
+        """
+        Get all layouts (cached, read from storage file on first call).
+
+        Returns:
+            Dictionary of all layouts or empty dict if file doesn't exist
+        """
+        if self._layouts is None:
+            self._layouts = self._read_file()
+        return self._layouts
+
+    def _read_file(self) -> Dict:
         """
         Load all layouts from storage file.
-        
+
         Returns:
             Dictionary of all layouts or empty dict if file doesn't exist
         """
         if not self.storage_path.exists():
             return {}
-        
+
         try:
             with open(self.storage_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except json.JSONDecodeError as e:
-            print(f"[LayoutStorage] ERROR: Corrupt JSON file: {e}")
+            logger.error("[LayoutStorage] ERROR: Corrupt JSON file: %s", e)
             # Backup corrupt file
             backup_path = self.storage_path.with_suffix('.json.backup')
             if self.storage_path.exists():
-                self.storage_path.rename(backup_path)
-                print(f"[LayoutStorage] Backed up corrupt file to {backup_path}")
+                os.replace(self.storage_path, backup_path)
+                logger.warning("[LayoutStorage] Backed up corrupt file to %s", backup_path)
             return {}
         except Exception as e:
-            print(f"[LayoutStorage] ERROR reading file: {e}")
+            logger.error("[LayoutStorage] ERROR reading file: %s", e)
             return {}
-    
+
     def export_layout(self, layout_name: str, export_path: Path) -> bool:
         """
         Export layout to external file (for sharing/backup).
-        
+
         Args:
             layout_name: Name of layout to export
             export_path: Path where to export
-        
+
         Returns:
             True if exported successfully
         """
         layout_data = self.load_layout(layout_name)
         if layout_data is None:
             return False
-        
+
         try:
             export_path.parent.mkdir(parents=True, exist_ok=True)
             with open(export_path, 'w', encoding='utf-8') as f:
@@ -209,36 +321,55 @@ class LayoutStorage:
                     "exported_at": datetime.now().isoformat(),
                     "data": layout_data
                 }, f, indent=2, ensure_ascii=False)
-            
-            print(f"[LayoutStorage] Exported layout '{layout_name}' to {export_path}")
+
+            logger.debug("[LayoutStorage] Exported layout '%s' to %s", layout_name, export_path)
             return True
-            
+
         except Exception as e:
-            print(f"[LayoutStorage] ERROR exporting layout: {e}")
+            logger.error("[LayoutStorage] ERROR exporting layout: %s", e)
             return False
-    
+
     def import_layout(self, import_path: Path, layout_name: Optional[str] = None) -> bool:
         """
         Import layout from external file.
-        
+
         Args:
             import_path: Path to import from
             layout_name: Optional new name for imported layout
-        
+
         Returns:
             True if imported successfully
         """
         try:
             with open(import_path, 'r', encoding='utf-8') as f:
                 imported = json.load(f)
-            
+
             # Use provided name or original name
             name = layout_name or imported.get("layout_name", "imported")
             data = imported.get("data", {})
-            
+
             return self.save_layout(data, name)
-            
+
         except Exception as e:
-            print(f"[LayoutStorage] ERROR importing layout: {e}")
+            logger.error("[LayoutStorage] ERROR importing layout: %s", e)
             return False
 
+
+def flush_all_layout_storages():
+    """Write pending changes of all storages (called at exit)."""
+    for storage in list(_instances):
+        storage.flush()
+
+
+atexit.register(flush_all_layout_storages)
+
+
+# Global instance
+_storage_instance = None
+
+def get_layout_storage() -> LayoutStorage:
+    """Get global layout storage instance (default file)"""
+    global _storage_instance
+    if _storage_instance is None:
+        _storage_instance = LayoutStorage()
+    return _storage_instance
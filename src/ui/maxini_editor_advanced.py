@@ -17,6 +17,7 @@ from PySide6.QtGui import QFont, QIcon, QPixmap
 
 # Import modern sidebar
 from .modern_sidebar import ModernSidebar
+from ..modules.max_bridge import MaxBridge
 
 # Use standard Qt widgets with modern CSS styling
 FLUENT_AVAILABLE = False
@@ -28,8 +29,11 @@ from PySide6.QtWidgets import (
 import sys
 import os
 import importlib
+import logging
 from typing import Dict, Any, Optional, List
 
+logger = logging.getLogger(__name__)
+
 # Hot reload system for development
 def hot_reload_modules():
     """Hot reload all MaxManager modules for development."""
@@ -56,15 +60,36 @@ def hot_reload_modules():
     except Exception as e:
         print(f"⚠️ Hot reload failed: {e}")
 
-# Try to import MaxScript API with fallback
-try:
-    import maxscript
-    from pymxs import runtime as rt
-    MAXSCRIPT_AVAILABLE = True
-    print("MaxScript API available")
-except ImportError:
-    MAXSCRIPT_AVAILABLE = False
-    print("MaxScript API not available - using fallback mode")
+# MaxScript API is imported on first use, not at module import (editor startup)
+_max_runtime = None
+
+def get_max_runtime():
+    """Get pymxs runtime, imported on first call (None outside 3ds Max - fallback mode)."""
+    global _max_runtime
+    if _max_runtime is None:
+        try:
+            import maxscript
+            from pymxs import runtime
+            _max_runtime = runtime
+            logger.debug("MaxScript API available")
+        except ImportError:
+            _max_runtime = False
+            logger.warning("MaxScript API not available - using fallback mode")
+    return _max_runtime or None
+
+# Settings shown by the editor tabs, read from the running session in one batch
+LIVE_SETTING_KEYS = (
+    ("Security", "SafeSceneScriptExecutionEnabled"),
+    ("Security", "EmbeddedPythonExecutionBlocked"),
+    ("Security", "EmbeddedMAXScriptSystemCommandsExecutionBlocked"),
+    ("Security", "EmbeddedDotNetExecutionBlocked"),
+    ("Renderer", "ThreadCount"),
+    ("Performance", "MemoryPool"),
+    ("Performance", "DynamicHeapSize"),
+    ("Performance", "UndoLevels"),
+    ("Autobackup", "AutoBackupEnabled"),
+    ("Autobackup", "AutoBackupInterval"),
+)
 
 class AdvancedMaxINIEditor(QMainWindow):
     """Advanced MaxManager with Fluent Design UI."""
@@ -458,7 +483,7 @@ class AdvancedMaxINIEditor(QMainWindow):
         layout.addLayout(header_layout)
         
         # API Status
-        if MAXSCRIPT_AVAILABLE:
+        if get_max_runtime() is not None:
             status_label = QLabel("MaxScript API Connected")
             status_label.setStyleSheet("color: #00ff00; font-weight: bold;")
         else:
@@ -975,9 +1000,9 @@ class AdvancedMaxINIEditor(QMainWindow):
         
         # API Status
         api_card = InfoCard(
-            FIcon.INFO if MAXSCRIPT_AVAILABLE else FIcon.WARNING,
+            FIcon.INFO if get_max_runtime() is not None else FIcon.WARNING,
             "API Status",
-            "MaxScript API Available" if MAXSCRIPT_AVAILABLE else "MaxScript API Not Available",
+            "MaxScript API Available" if get_max_runtime() is not None else "MaxScript API Not Available",
             page
         )
         advanced_layout.addWidget(api_card)
@@ -1006,7 +1031,7 @@ class AdvancedMaxINIEditor(QMainWindow):
         api_label = QLabel("API Status:")
         advanced_layout.addWidget(api_label)
         
-        if MAXSCRIPT_AVAILABLE:
+        if get_max_runtime() is not None:
             api_status = QLabel("MaxScript API Available")
             api_status.setStyleSheet("color: #00ff00; font-weight: bold;")
         else:
@@ -1026,79 +1051,41 @@ class AdvancedMaxINIEditor(QMainWindow):
         self.tab_widget.addTab(tab, "Advanced")
     
     def load_current_settings(self):
-        """Load current settings from 3ds Max."""
+        """Load current settings from 3ds Max (one bridge round-trip)."""
         try:
-            if not MAXSCRIPT_AVAILABLE:
+            rt = get_max_runtime()
+            if rt is None:
                 print("MaxScript API not available - using default values")
                 return
-                
+            
+            values = MaxBridge(rt).read(LIVE_SETTING_KEYS)
+            
+            def flag(section, key):
+                return values.get((section, key)) == "1"
+            
+            def number(section, key, spin):
+                try:
+                    value = values.get((section, key))
+                    if value:
+                        spin.setValue(int(value))
+                except ValueError:
+                    pass
+            
             # Load Security settings
-            try:
-                safe_scene = rt.getIniSetting("Security", "SafeSceneScriptExecutionEnabled")
-                self.safe_scene_cb.setChecked(safe_scene == "1")
-            except:
-                pass
-                
-            try:
-                python_blocked = rt.getIniSetting("Security", "EmbeddedPythonExecutionBlocked")
-                self.python_cb.setChecked(python_blocked != "1")
-            except:
-                pass
-                
-            try:
-                maxscript_blocked = rt.getIniSetting("Security", "EmbeddedMAXScriptSystemCommandsExecutionBlocked")
-                self.maxscript_cb.setChecked(maxscript_blocked != "1")
-            except:
-                pass
-                
-            try:
-                dotnet_blocked = rt.getIniSetting("Security", "EmbeddedDotNetExecutionBlocked")
-                self.dotnet_cb.setChecked(dotnet_blocked != "1")
-            except:
-                pass
+            self.safe_scene_cb.setChecked(flag("Security", "SafeSceneScriptExecutionEnabled"))
+            self.python_cb.setChecked(not flag("Security", "EmbeddedPythonExecutionBlocked"))
+            self.maxscript_cb.setChecked(not flag("Security", "EmbeddedMAXScriptSystemCommandsExecutionBlocked"))
+            self.dotnet_cb.setChecked(not flag("Security", "EmbeddedDotNetExecutionBlocked"))
             
             # Load Performance settings
-            try:
-                threads = rt.getIniSetting("Renderer", "ThreadCount")
-                if threads:
-                    self.render_threads_spin.setValue(int(threads))
-            except:
-                pass
-                
-            try:
-                memory = rt.getIniSetting("Performance", "MemoryPool")
-                if memory:
-                    self.memory_pool_spin.setValue(int(memory))
-            except:
-                pass
-                
-            try:
-                heap = rt.getIniSetting("Performance", "DynamicHeapSize")
-                if heap:
-                    self.heap_size_spin.setValue(int(heap))
-            except:
-                pass
+            number("Renderer", "ThreadCount", self.render_threads_spin)
+            number("Performance", "MemoryPool", self.memory_pool_spin)
+            number("Performance", "DynamicHeapSize", self.heap_size_spin)
             
             # Load System settings
-            try:
-                undo = rt.getIniSetting("Performance", "UndoLevels")
-                if undo:
-                    self.undo_levels_spin.setValue(int(undo))
-            except:
-                pass
-                
-            try:
-                autobackup = rt.getIniSetting("Autobackup", "AutoBackupEnabled")
-                self.auto_backup_cb.setChecked(autobackup == "1")
-            except:
-                pass
-                
-            try:
-                interval = rt.getIniSetting("Autobackup", "AutoBackupInterval")
-                if interval:
-                    self.backup_interval_spin.setValue(int(interval))
-            except:
-                pass
+            number("Performance", "UndoLevels", self.undo_levels_spin)
+            self.auto_backup_cb.setChecked(flag("Autobackup", "AutoBackupEnabled"))
+            number("Autobackup", "AutoBackupInterval", self.backup_interval_spin)
             
             # Status message for FluentWindow (no statusBar method)
             print("Settings loaded successfully")
@@ -1107,30 +1094,34 @@ class AdvancedMaxINIEditor(QMainWindow):
             print(f"Error loading settings: {e}")
     
     def apply_all_settings(self):
-        """Apply all settings to 3ds Max."""
+        """Apply all settings to 3ds Max (one bridge round-trip)."""
         try:
-            if not MAXSCRIPT_AVAILABLE:
+            rt = get_max_runtime()
+            if rt is None:
                 QMessageBox.warning(self, "API Error", "MaxScript API not available!\nCannot apply changes to 3ds Max.")
                 return
-                
-            # Apply Security settings
-            rt.setIniSetting("Security", "SafeSceneScriptExecutionEnabled", str(int(self.safe_scene_cb.isChecked())))
-            rt.setIniSetting("Security", "EmbeddedPythonExecutionBlocked", str(int(not self.python_cb.isChecked())))
-            rt.setIniSetting("Security", "EmbeddedMAXScriptSystemCommandsExecutionBlocked", str(int(not self.maxscript_cb.isChecked())))
-            rt.setIniSetting("Security", "EmbeddedDotNetExecutionBlocked", str(int(not self.dotnet_cb.isChecked())))
-            
-            # Apply Performance settings
-            rt.setIniSetting("Renderer", "ThreadCount", str(self.render_threads_spin.value()))
-            rt.setIniSetting("Performance", "MemoryPool", str(self.memory_pool_spin.value()))
-            rt.setIniSetting("Performance", "DynamicHeapSize", str(self.heap_size_spin.value()))
             
-            # Apply System settings
-            rt.setIniSetting("Performance", "UndoLevels", str(self.undo_levels_spin.value()))
-            rt.setIniSetting("Autobackup", "AutoBackupEnabled", str(int(self.auto_backup_cb.isChecked())))
-            rt.setIniSetting("Autobackup", "AutoBackupInterval", str(self.backup_interval_spin.value()))
+            settings = [
+                # Security settings
+                ("Security", "SafeSceneScriptExecutionEnabled", int(self.safe_scene_cb.isChecked())),
+                ("Security", "EmbeddedPythonExecutionBlocked", int(not self.python_cb.isChecked())),
+                ("Security", "EmbeddedMAXScriptSystemCommandsExecutionBlocked", int(not self.maxscript_cb.isChecked())),
+                ("Security", "EmbeddedDotNetExecutionBlocked", int(not self.dotnet_cb.isChecked())),
+                # Performance settings
+                ("Renderer", "ThreadCount", self.render_threads_spin.value()),
+                ("Performance", "MemoryPool", self.memory_pool_spin.value()),
+                ("Performance", "DynamicHeapSize", self.heap_size_spin.value()),
+                # System settings
+                ("Performance", "UndoLevels", self.undo_levels_spin.value()),
+                ("Autobackup", "AutoBackupEnabled", int(self.auto_backup_cb.isChecked())),
+                ("Autobackup", "AutoBackupInterval", self.backup_interval_spin.value()),
+            ]
             
-            # Force 3ds Max to reload settings
-            rt.refreshSystem()
+            # Write all and force 3ds Max to reload settings
+            written = MaxBridge(rt).write(settings, refresh=True)
+            failed = [f"{section}.{key}" for (section, key), ok in written.items() if not ok]
+            if failed:
+                raise RuntimeError(f"Not written: {', '.join(failed)}")
             
             QMessageBox.information(self, "Success", "Settings applied successfully to 3ds Max!")
             print("All settings applied successfully!")
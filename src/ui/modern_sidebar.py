@@ -3,6 +3,7 @@ Modern Sidebar for MaxManager
 Based on SVG design with 5 buttons and expandable width
 """
 
+import logging
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QSpacerItem, QSizePolicy
@@ -11,14 +12,9 @@ from PySide6.QtCore import Qt, QPropertyAnimation, QRect, QEasingCurve, Signal,
 from PySide6.QtGui import QFont, QPainter, QColor, QIcon
 import os
 
-# Import QtAwesome for beautiful icons
-try:
-    import qtawesome as qta
-    QTAWESOME_AVAILABLE = True
-    print("QtAwesome available - using professional icons")
-except ImportError:
-    QTAWESOME_AVAILABLE = False
-    print("QtAwesome not available - using fallback emojis")
+from .theme_service import get_pixmap, icon_fonts_loaded
+
+logger = logging.getLogger(__name__)
 
 
 class ModernSidebar(QWidget):
@@ -38,6 +34,7 @@ class ModernSidebar(QWidget):
         self.button_width = 80      # Button width
         self.indicator_width = 10   # Indicator width
         self.is_animating = False
+        self.icon_labels = {}  # key -> QLabel, filled by load_icons()
         
         # Timer for preventing rapid clicks
         self.click_timer = QTimer()
@@ -148,25 +145,16 @@ class ModernSidebar(QWidget):
         icon_layout.setContentsMargins(0, 0, 0, 0)
         icon_layout.setAlignment(Qt.AlignCenter)
         
-        # Icon label (always visible) - use QtAwesome
-        try:
-            # Create QtAwesome icon
-            icon = qta.icon(data['icon'], color='white')
-            icon_label = QLabel()
-            icon_label.setPixmap(icon.pixmap(24, 24))
-            icon_label.setObjectName(f"button_icon_{key}")
-            icon_label.setAlignment(Qt.AlignCenter)
-            icon_label.setFixedSize(24, 24)  # Icon always same size
-            icon_layout.addWidget(icon_label)
-        except Exception as e:
-            # Fallback to text if icon fails
-            print(f"Failed to load icon {data['icon']}: {e}")
-            icon_label = QLabel(data['icon'])
-            icon_label.setObjectName(f"button_icon_{key}")
-            icon_label.setAlignment(Qt.AlignCenter)
-            icon_label.setFixedSize(24, 24)
-            icon_label.setStyleSheet(f"color: {data['color']}; font-size: 20px;")
-            icon_layout.addWidget(icon_label)
+        # Icon label (always visible) - QtAwesome icon is set by load_icons()
+        # once icon fonts are loaded, so the first frame doesn't wait for them
+        icon_label = QLabel()
+        icon_label.setObjectName(f"button_icon_{key}")
+        icon_label.setAlignment(Qt.AlignCenter)
+        icon_label.setFixedSize(24, 24)  # Icon always same size
+        icon_layout.addWidget(icon_label)
+        self.icon_labels[key] = icon_label
+        if icon_fonts_loaded():
+            self._set_button_icon(key, data)
         
         layout.addWidget(icon_container)
         
@@ -190,6 +178,23 @@ class ModernSidebar(QWidget):
         
         return button
         
+    def load_icons(self):
+        """Set QtAwesome icons of all buttons (loads icon fonts if needed)."""
+        for key, data in self.buttons_data.items():
+            if key in self.icon_labels:
+                self._set_button_icon(key, data)
+    
+    def _set_button_icon(self, key, data):
+        """Set icon of one button, text fallback if QtAwesome is not available."""
+        icon_label = self.icon_labels[key]
+        pixmap = get_pixmap(data['icon'], 'white', 24)
+        if not pixmap.isNull():
+            icon_label.setPixmap(pixmap)
+            return
+        logger.warning("Failed to load icon %s", data['icon'])
+        icon_label.setText(data['icon'])
+        icon_label.setStyleSheet(f"color: {data['color']}; font-size: 20px;")
+        
     def create_logo_button(self):
         """Create adaptive logo button - 80x80 collapsed, 160x80 expanded."""
         logo_button = QPushButton()
@@ -220,9 +225,6 @@ class ModernSidebar(QWidget):
         
         try:
             # Try multiple paths for SVG
-            import sys
-            import os
-            
             # Get the directory where the script is running from
             script_dir = os.path.dirname(os.path.abspath(__file__))
             project_root = os.path.dirname(os.path.dirname(script_dir))  # Go up from src/ui to project root
@@ -238,23 +240,23 @@ class ModernSidebar(QWidget):
             icon_loaded = False
             for svg_path in svg_paths:
                 try:
-                    print(f"Trying to load logo from: {svg_path}")
+                    logger.debug("Trying to load logo from: %s", svg_path)
                     if os.path.exists(svg_path):
-                        print(f"OK File exists: {svg_path}")
+                        logger.debug("File exists: %s", svg_path)
                         icon = QIcon(svg_path)
-                        print(f"Icon is null: {icon.isNull()}")
+                        logger.debug("Icon is null: %s", icon.isNull())
                         if not icon.isNull():
                             pixmap = icon.pixmap(40, 40)
-                            print(f"Pixmap is null: {pixmap.isNull()}")
+                            logger.debug("Pixmap is null: %s", pixmap.isNull())
                             if not pixmap.isNull():
                                 icon_label.setPixmap(pixmap)
                                 icon_loaded = True
-                                print(f"SUCCESS Logo loaded from: {svg_path}")
+                                logger.debug("Logo loaded from: %s", svg_path)
                                 break
                     else:
-                        print(f"FAIL File not found: {svg_path}")
+                        logger.debug("File not found: %s", svg_path)
                 except Exception as e:
-                    print(f"ERROR loading {svg_path}: {e}")
+                    logger.error("ERROR loading %s: %s", svg_path, e)
                     continue
             
             if not icon_loaded:
@@ -262,7 +264,7 @@ class ModernSidebar(QWidget):
                 
         except Exception as e:
             # Fallback to text
-            print(f"WARNING SVG logo failed to load: {e}")
+            logger.warning("SVG logo failed to load: %s", e)
             icon_label.setText("MM")
             icon_label.setStyleSheet("color: lime; font-size: 16px; font-weight: bold;")
         
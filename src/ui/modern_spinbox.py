@@ -5,11 +5,7 @@ Modern SpinBox widgets with QtAwesome icons for MaxManager.
 from PySide6.QtWidgets import QSpinBox, QDoubleSpinBox, QPushButton, QHBoxLayout, QWidget
 from PySide6.QtCore import Qt
 
-try:
-    import qtawesome as qta
-    QTA_AVAILABLE = True
-except ImportError:
-    QTA_AVAILABLE = False
+from .theme_service import QTA_AVAILABLE
 
 
 class ModernSpinBox(QSpinBox):
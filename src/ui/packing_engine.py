@@ -0,0 +1,240 @@
+"""
+Packing engine for MaxManager canvas layouts.
+
+Pure-Python skyline (heightmap) packing of panels into 1-4 columns, shared
+by CanvasContainer and SkylineLayout (which only translate placements to
+Qt geometry). No Qt dependency, so it can be tested and benchmarked alone.
+
+Placement order:
+- Pinned panels (col set) first, sorted by (col, row, id) - each goes to
+  its column at the height of the skyline under its span
+- Auto panels (col=None) after them in given order - each goes to the
+  column window with the lowest skyline (first one on ties)
+
+Packing is O(n log n) for the sort plus O(n * columns) for placement; the
+skyline before each panel is kept, so repack_from() re-places only the
+changed panel and the ones after it. Span changes (repack_from()) and
+drops (drop_slot() + pin()) are updates of the packed items.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class PackItem:
+    """Panel to pack."""
+    item_id: str
+    height: int
+    span: int = 1  # Number of columns (clamped to column count)
+    col: Optional[int] = None  # Pinned column (None = auto)
+    row: int = 0  # Order inside pinned column
+
+
+@dataclass
+class Placement:
+    """Packed panel position (absolute pixels)."""
+    x: int
+    y: int
+    width: int
+    height: int
+    col: int
+    span: int
+
+
+def best_column(heights: Sequence[int], span: int) -> Tuple[int, int]:
+    """
+    Get (col, y) of column window with lowest skyline for span.
+
+    Window height is max(heights[col:col + span]); first window wins on ties.
+    """
+    span = max(1, min(span, len(heights)))
+    best_col = 0
+    best_y = max(heights[0:span])
+    for col in range(1, len(heights) - span + 1):
+        window_y = max(heights[col:col + span])
+        if window_y < best_y:
+            best_col = col
+            best_y = window_y
+    return best_col, best_y
+
+
+def next_slot(items: Iterable, columns: int, span: int) -> Tuple[int, int]:
+    """
+    Get (row, col) to pin a new panel: column window with fewest panels.
+
+    Items need col and span (PackItem, GridItem); each panel counts once in
+    every column it spans, so new panels fill rows left to right.
+    """
+    counts = [0] * columns
+    for item in items:
+        if item.col is None:
+            continue
+        for col in range(item.col, min(item.col + item.span, columns)):
+            counts[col] += 1
+    col, row = best_column(counts, span)
+    return row, col
+
+
+class PackingEngine:
+    """
+    Skyline packing with spans, pinned columns and column changes.
+
+    Usage:
+        engine = PackingEngine(columns=3)
+        placements = engine.pack([PackItem('Security', 200, col=0), ...], viewport_width)
+        changed = engine.repack_from('Security', height=40)  # Collapsed
+        col, row = engine.drop_slot(x, y)
+        placements = engine.pin('Performance', col, row)  # Dropped
+    """
+
+    def __init__(self, columns: int = 4, spacing: int = 10, margin: int = 10):
+        """
+        Initialize engine.
+
+        Args:
+            columns: Column count
+            spacing: Gap between panels (horizontal and vertical)
+            margin: Left/right/top margin of packing area
+        """
+        self.columns = columns
+        self.spacing = spacing
+        self.margin = margin
+        self.width = 0
+        self.col_width = 0
+        self.items: List[PackItem] = []  # Placement order of last pack()
+        self.placements: Dict[str, Placement] = {}
+        self.skyline: List[int] = [0] * columns  # Column heights after last panel
+        self._index: Dict[str, int] = {}
+        self._skyline_before: List[Tuple[int, ...]] = []  # Skyline before each panel
+
+    @property
+    def total_height(self) -> int:
+        """Height of highest column (including trailing spacing)."""
+        return max(self.skyline) if self.skyline else 0
+
+    def column_width(self, width: int, columns: Optional[int] = None) -> int:
+        """Width of one column for packing area width."""
+        columns = columns or self.columns
+        return (width - 2 * self.margin - (columns - 1) * self.spacing) // columns
+
+    def set_columns(self, columns: int) -> bool:
+        """Change column count (takes effect on next pack()), True if changed."""
+        if columns == self.columns:
+            return False
+        self.columns = columns
+        return True
+
+    def pack(self, items: Sequence[PackItem], width: int) -> Dict[str, Placement]:
+        """Pack all items into packing area of width, returns {item_id: Placement}."""
+        pinned = sorted((item for item in items if item.col is not None),
+                        key=lambda item: (item.col, item.row, item.item_id))
+        self.items = pinned + [item for item in items if item.col is None]
+        self._index = {item.item_id: i for i, item in enumerate(self.items)}
+        self._skyline_before = [()] * len(self.items)
+        self.placements = {}
+        self.width = width
+        self.col_width = self.column_width(width)
+        self._place_from(0)
+        return self.placements
+
+    def repack_from(self, item_id: str, height: Optional[int] = None, span: Optional[int] = None) -> List[str]:
+        """
+        Update one item and re-place it and everything after it.
+
+        Returns:
+            Ids of re-placed items (in placement order)
+        """
+        index = self._index[item_id]
+        item = self.items[index]
+        if height is not None:
+            item.height = height
+        if span is not None:
+            item.span = span
+        return self._place_from(index)
+
+    def _place_from(self, start: int) -> List[str]:
+        """Place items from start (placement order) on."""
+        columns = self.columns
+        col_width = self.col_width
+        spacing = self.spacing
+        margin = self.margin
+        heights = list(self._skyline_before[start]) if start > 0 else [0] * columns
+
+        placed = []
+        for i in range(start, len(self.items)):
+            item = self.items[i]
+            self._skyline_before[i] = tuple(heights)
+            span = max(1, min(item.span, columns))
+
+            if item.col is None:
+                col, y_base = best_column(heights, span)
+            else:
+                # Column may be gone after column count change - wrap, keep span inside grid
+                col = min(item.col % columns, columns - span)
+                y_base = max(heights[col:col + span])
+
+            self.placements[item.item_id] = Placement(
+                x=margin + col * (col_width + spacing),
+                y=margin + y_base,
+                width=span * col_width + (span - 1) * spacing,
+                height=item.height,
+                col=col,
+                span=span,
+            )
+            new_height = y_base + item.height + spacing
+            for c in range(col, col + span):
+                heights[c] = new_height
+            placed.append(item.item_id)
+
+        self.skyline = heights
+        return placed
+
+    def column_at(self, x: int) -> int:
+        """Column under x of last pack (nearest one for margins and gaps)."""
+        col = (x - self.margin) // (self.col_width + self.spacing) if self.col_width > 0 else 0
+        return max(0, min(col, self.columns - 1))
+
+    def drop_slot(self, x: int, y: int, item_id: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Get pinned (col, row) for a panel dropped at (x, y) of last pack.
+
+        On a pinned panel: before it (upper half) or after it (lower half) in
+        its column; elsewhere: top of column under x. item_id (the dragged
+        panel) is ignored as a target.
+        """
+        for item in self.items:
+            placement = self.placements[item.item_id]
+            if (item.item_id != item_id and item.col is not None
+                    and placement.x <= x < placement.x + placement.width
+                    and placement.y <= y < placement.y + placement.height):
+                after = y >= placement.y + placement.height / 2
+                return item.col, item.row + 1 if after else item.row
+        return self.column_at(x), 0
+
+    def pin(self, item_id: str, col: int, row: int) -> Dict[str, Placement]:
+        """
+        Pin item to (col, row) and repack.
+
+        Panels pinned in col at row or below are pushed down one row.
+
+        Returns:
+            {item_id: Placement} of all items
+        """
+        item = self.items[self._index[item_id]]
+        for other in self.items:
+            if other is not item and other.col == col and other.row >= row:
+                other.row += 1
+        item.col = col
+        item.row = row
+        return self.pack(self.items, self.width)
+
+    def find_overlaps(self) -> List[Tuple[str, str]]:
+        """Pairs of overlapping placements (O(n²), for debugging/tests)."""
+        rects = [(item_id, p) for item_id, p in self.placements.items()]
+        overlaps = []
+        for i, (id1, a) in enumerate(rects):
+            for id2, b in rects[i + 1:]:
+                if a.x < b.x + b.width and b.x < a.x + a.width and a.y < b.y + b.height and b.y < a.y + a.height:
+                    overlaps.append((id1, id2))
+        return overlaps
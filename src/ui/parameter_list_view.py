@@ -0,0 +1,491 @@
+"""
+Virtualized parameter list for large INI sections.
+
+Model/view alternative to one INIParameterWidget per parameter: rows are
+painted by a delegate and only hovered/focused rows get real editors
+(persistent editors), so widget count depends on the viewport, not on the
+section size.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from PySide6.QtWidgets import (
+    QListView, QStyledItemDelegate, QStyle, QLineEdit, QPushButton, QCheckBox,
+    QAbstractItemView, QFrame
+)
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractListModel, QModelIndex, QRect, QSize, QEvent, QPersistentModelIndex, QTimer
+)
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPen
+
+from .ini_parameter_widget import INIParameterWidget, ScrubbyIntSpinBox, ScrubbyFloatSpinBox
+from .theme_service import QTA_AVAILABLE, get_icon
+from ..i18n.translation_table import get_translation_table, get_label_registry
+
+
+class ParameterListModel(QAbstractListModel):
+    """
+    List model of INI parameters of one section.
+
+    Rows: {'name', 'value', 'original', 'type', 'available', 'data'}.
+    Available parameters (from database, not in INI) are read-only here.
+    """
+
+    NameRole = Qt.UserRole + 1
+    ValueRole = Qt.UserRole + 2
+    TypeRole = Qt.UserRole + 3
+    ModifiedRole = Qt.UserRole + 4
+    AvailableRole = Qt.UserRole + 5
+
+    value_changed = Signal(str, str)  # (param_name, new_value)
+    modified_state_changed = Signal(bool)  # Any row modified/unmodified
+
+    def __init__(self, parameters: dict, param_types: Optional[Dict[str, str]] = None, parent=None):
+        """
+        Initialize model.
+
+        Args:
+            parameters: {param_name: value} or {param_name: {'value', 'available', 'data'}}
+            param_types: Optional {param_name: widget type} (inferred from value if missing)
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._rows: List[Dict] = []
+        self._row_by_name: Dict[str, int] = {}
+        self._display_names: Dict[str, str] = {}
+        self._modified_count = 0
+
+        for param_name, param_value in parameters.items():
+            is_available = isinstance(param_value, dict) and param_value.get('available', False)
+            value = param_value.get('value', '') if is_available else param_value
+            value = '' if value is None else str(value)
+            self._row_by_name[param_name] = len(self._rows)
+            self._rows.append({
+                'name': param_name,
+                'value': value,
+                'original': value,
+                'type': param_types.get(param_name) if param_types and param_name in param_types else INIParameterWidget.detect_type(value),
+                'available': is_available,
+                'data': param_value.get('data') if is_available else None,
+            })
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+
+        if role == Qt.DisplayRole:
+            return self._display_name(row['name'])
+        if role == self.ValueRole or role == Qt.EditRole:
+            return row['value']
+        if role == self.NameRole:
+            return row['name']
+        if role == self.TypeRole:
+            return row['type']
+        if role == self.ModifiedRole:
+            return row['value'] != row['original']
+        if role == self.AvailableRole:
+            return row['available']
+        if role == Qt.ToolTipRole:
+            # Looked up lazily - only for hovered rows
+            return get_translation_table().help_text(row['name'], self._language())
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if not self._rows[index.row()]['available']:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role not in (Qt.EditRole, self.ValueRole):
+            return False
+        row = self._rows[index.row()]
+        value = str(value)
+        if value == row['value']:
+            return False
+
+        was_modified = row['value'] != row['original']
+        row['value'] = value
+        is_modified = value != row['original']
+
+        self.dataChanged.emit(index, index, [self.ValueRole, self.ModifiedRole])
+        if was_modified != is_modified:
+            self._modified_count += 1 if is_modified else -1
+            self.modified_state_changed.emit(self._modified_count > 0)
+        self.value_changed.emit(row['name'], value)
+        return True
+
+    def index_of(self, param_name: str) -> QModelIndex:
+        """Get model index of parameter (O(1))."""
+        row = self._row_by_name.get(param_name)
+        return self.index(row) if row is not None else QModelIndex()
+
+    def param_names(self) -> List[str]:
+        """All parameter names in row order."""
+        return [row['name'] for row in self._rows]
+
+    def reset_row(self, row_index: int):
+        """Revert one row to original value."""
+        row = self._rows[row_index]
+        self.setData(self.index(row_index), row['original'], self.ValueRole)
+
+    def reset_to_original(self):
+        """Revert all rows to original values (no value_changed emitted)."""
+        if not self._modified_count:
+            return
+        self.beginResetModel()
+        for row in self._rows:
+            row['value'] = row['original']
+        self._modified_count = 0
+        self.endResetModel()
+        self.modified_state_changed.emit(False)
+
+    def mark_as_saved(self):
+        """Current values become original values."""
+        for row in self._rows:
+            row['original'] = row['value']
+        if self._modified_count:
+            self._modified_count = 0
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1), [self.ModifiedRole])
+
+    def refresh_display_names(self):
+        """Drop cached display names after language change."""
+        self._display_names.clear()
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1),
+                                  [Qt.DisplayRole, Qt.ToolTipRole])
+
+    def _display_name(self, param_name: str) -> str:
+        """Localized display name (cached per language change)."""
+        display_name = self._display_names.get(param_name)
+        if display_name is None:
+            display_name = get_translation_table().display_name(param_name, self._language())
+            self._display_names[param_name] = display_name
+        return display_name
+
+    @staticmethod
+    def _language() -> str:
+        from ..i18n import get_translation_manager
+        return get_translation_manager().current_language.value
+
+
+class ParameterItemDelegate(QStyledItemDelegate):
+    """
+    Paints parameter rows and creates type-specific editors.
+
+    Editors reuse INIParameterWidget controls: scrubby int/float spinboxes,
+    toggle button for booleans, line edit for strings/paths.
+    """
+
+    ROW_HEIGHT = 40  # Same as INIParameterWidget
+    ACTION_SIZE = 20
+    VALUE_WIDTH = INIParameterWidget.NUMERIC_FIELD_WIDTH
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont("Segoe UI", 9)
+        self._metrics = QFontMetrics(self._font)
+
+    def _label_rect(self, rect: QRect) -> QRect:
+        label_width = min(INIParameterWidget.LABEL_FIXED_WIDTH, rect.width() // 2)
+        return QRect(rect.left() + 10, rect.top(), label_width - 10, rect.height())
+
+    def _action_rect(self, rect: QRect) -> QRect:
+        return QRect(rect.right() - self.ACTION_SIZE - 5, rect.center().y() - self.ACTION_SIZE // 2,
+                     self.ACTION_SIZE, self.ACTION_SIZE)
+
+    def _value_rect(self, rect: QRect) -> QRect:
+        label = self._label_rect(rect)
+        left = label.right() + 10
+        right = self._action_rect(rect).left() - 10
+        return QRect(left, rect.top() + 5, max(0, right - left), rect.height() - 10)
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        rect = option.rect
+        available = index.data(ParameterListModel.AvailableRole)
+        modified = index.data(ParameterListModel.ModifiedRole)
+        text_color = QColor('#888888') if available else QColor('white')
+
+        if option.state & QStyle.State_MouseOver:
+            painter.fillRect(rect, QColor(255, 255, 255, 12))
+
+        # Name
+        painter.setFont(self._font)
+        metrics = self._metrics
+        painter.setPen(text_color)
+        label_rect = self._label_rect(rect)
+        name = metrics.elidedText(index.data(Qt.DisplayRole), Qt.ElideRight, label_rect.width())
+        painter.drawText(label_rect, Qt.AlignVCenter | Qt.AlignLeft, name)
+
+        # Value (real editor is shown on hover/focus)
+        value_rect = self._value_rect(rect)
+        value = index.data(ParameterListModel.ValueRole)
+        param_type = index.data(ParameterListModel.TypeRole)
+        if param_type == 'boolean':
+            toggle_rect = QRect(value_rect.left(), value_rect.center().y() - 10, 30, 20)
+            if QTA_AVAILABLE:
+                checked = value == '1'
+                icon = get_icon('fa5s.toggle-on', '#E0E0E0') if checked else get_icon('fa5s.toggle-off', '#666666')
+                icon.paint(painter, toggle_rect)
+            else:
+                painter.drawText(toggle_rect, Qt.AlignVCenter | Qt.AlignLeft, value)
+        else:
+            box = QRect(value_rect)
+            if param_type in ('integer', 'float'):
+                box.setWidth(min(box.width(), self.VALUE_WIDTH))
+            painter.setPen(QPen(QColor('#555555')))
+            painter.setBrush(QColor('#2A2A2A'))
+            painter.drawRoundedRect(box.adjusted(0, 0, -1, -1), 3, 3)
+            painter.setPen(text_color)
+            align = Qt.AlignVCenter | (Qt.AlignRight if param_type in ('integer', 'float') else Qt.AlignLeft)
+            text = metrics.elidedText(value, Qt.ElideMiddle, box.width() - 8)
+            painter.drawText(box.adjusted(4, 0, -4, 0), align, text)
+
+        # Revert action for modified rows
+        if modified and QTA_AVAILABLE:
+            get_icon('fa5s.undo', '#990000').paint(painter, self._action_rect(rect))
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        """Click on revert icon reverts row."""
+        if (event.type() == QEvent.MouseButtonRelease
+                and index.data(ParameterListModel.ModifiedRole)
+                and self._action_rect(option.rect).contains(event.position().toPoint())):
+            model.reset_row(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+    def createEditor(self, parent, option, index):
+        param_type = index.data(ParameterListModel.TypeRole)
+        value = index.data(ParameterListModel.ValueRole)
+
+        if param_type == 'boolean':
+            if QTA_AVAILABLE:
+                editor = QPushButton(parent)
+                editor.setCheckable(True)
+                editor.setFixedSize(30, 20)
+                editor.setObjectName("param_toggle")
+                editor.setCursor(Qt.PointingHandCursor)
+                editor.setFocusPolicy(Qt.NoFocus)
+                editor.toggled.connect(lambda checked, e=editor: self._update_toggle_icon(e))
+            else:
+                editor = QCheckBox(parent)
+            editor.toggled.connect(lambda checked, e=editor: self.commitData.emit(e))
+        elif param_type == 'integer' and self._to_number(param_type, value) is not None:
+            editor = ScrubbyIntSpinBox(value=self._to_number(param_type, value), parent=parent)
+            editor.valueChanged.connect(lambda val, e=editor: self.commitData.emit(e))
+        elif param_type == 'float' and self._to_number(param_type, value) is not None:
+            editor = ScrubbyFloatSpinBox(value=self._to_number(param_type, value), decimals=6, parent=parent)
+            editor.valueChanged.connect(lambda val, e=editor: self.commitData.emit(e))
+        else:
+            # Also numeric keys with non-numeric value (hand-edited INI): edit as text
+            param_type = 'string' if param_type in ('integer', 'float') else param_type
+            editor = QLineEdit(parent)
+            editor.editingFinished.connect(lambda e=editor: self.commitData.emit(e))
+
+        editor.setProperty("param_type", param_type)
+        return editor
+
+    @staticmethod
+    def _to_number(param_type: str, value: str):
+        """Parse value for numeric editor, None if it is not a number of param_type."""
+        try:
+            if param_type == 'integer':
+                return int(value) if value else 0
+            return float(value) if value else 0.0
+        except ValueError:
+            return None
+
+    def _update_toggle_icon(self, editor):
+        if editor.isChecked():
+            editor.setIcon(get_icon('fa5s.toggle-on', '#E0E0E0'))
+        else:
+            editor.setIcon(get_icon('fa5s.toggle-off', '#666666'))
+        editor.setIconSize(editor.size())
+
+    def setEditorData(self, editor, index):
+        value = index.data(ParameterListModel.ValueRole)
+        param_type = editor.property("param_type")
+
+        editor.blockSignals(True)
+        if param_type == 'boolean':
+            editor.setChecked(value == '1')
+            if isinstance(editor, QPushButton):
+                self._update_toggle_icon(editor)
+        elif param_type in ('integer', 'float'):
+            number = self._to_number(param_type, value)
+            if number is not None:  # Non-numeric value keeps last valid number
+                editor.setValue(number)
+        elif editor.text() != value:
+            editor.setText(value)
+        editor.blockSignals(False)
+
+    def setModelData(self, editor, model, index):
+        param_type = editor.property("param_type")
+        if param_type == 'boolean':
+            value = '1' if editor.isChecked() else '0'
+        elif param_type == 'integer':
+            value = str(editor.value())
+        elif param_type == 'float':
+            value = f"{editor.value():.6f}"
+        else:
+            value = editor.text()
+        model.setData(index, value, ParameterListModel.ValueRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        value_rect = self._value_rect(option.rect)
+        param_type = editor.property("param_type")
+        if param_type == 'boolean':
+            editor.setGeometry(value_rect.left(), value_rect.center().y() - 10, 30, 20)
+        elif param_type in ('integer', 'float'):
+            value_rect.setWidth(min(value_rect.width(), self.VALUE_WIDTH))
+            editor.setGeometry(value_rect)
+        else:
+            editor.setGeometry(value_rect)
+
+
+class ParameterListView(QListView):
+    """
+    Virtualized list of parameters for one canvas section.
+
+    Drop-in for a stack of INIParameterWidget in CollapsibleCanvas:
+    same value_changed/modified_state_changed signals and
+    reset_to_original/mark_as_saved/on_language_changed methods.
+    """
+
+    value_changed = Signal(str, str)  # (param_name, new_value)
+    modified_state_changed = Signal(bool)
+
+    MAX_VISIBLE_ROWS = 15  # Taller sections scroll inside the canvas
+
+    def __init__(self, parameters: dict, param_types: Optional[Dict[str, str]] = None, parent=None):
+        super().__init__(parent)
+        self.list_model = ParameterListModel(parameters, param_types, self)
+        self.setModel(self.list_model)
+        get_label_registry().bind_callback(self, self.on_language_changed)
+        self.setItemDelegate(ParameterItemDelegate(self))
+
+        self.list_model.value_changed.connect(self.value_changed)
+        self.list_model.modified_state_changed.connect(self.modified_state_changed)
+
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)  # Editors are persistent
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFrameShape(QFrame.NoFrame)
+
+        # Rows with open persistent editors: hovered row + row whose editor has focus
+        self._hover_index: Optional[QPersistentModelIndex] = None
+        self._focus_index: Optional[QPersistentModelIndex] = None  # Kept open for typing, closed on focus-out
+        self.entered.connect(self._on_row_entered)
+
+        self._update_height()
+
+    def _on_row_entered(self, index: QModelIndex):
+        """Open editor for hovered row, close editor of previous one (unless focused)."""
+        if self._hover_index is not None and self._hover_index.isValid():
+            if QModelIndex(self._hover_index) == index:
+                return
+            self._close_editor(QModelIndex(self._hover_index))
+        self._hover_index = None
+        self._close_focus_editor()
+
+        if index.isValid() and index.flags() & Qt.ItemIsEditable:
+            if self._focus_index is not None and QModelIndex(self._focus_index) == index:
+                self._focus_index = None  # Focused row is hovered again
+            self.openPersistentEditor(index)
+            self._hover_index = QPersistentModelIndex(index)
+
+    def _close_editor(self, index: QModelIndex):
+        editor = self.indexWidget(index)
+        if editor is not None and editor.hasFocus():
+            # Keep editor the user is typing into until it loses focus
+            self._close_focus_editor()
+            self._focus_index = QPersistentModelIndex(index)
+            editor.installEventFilter(self)
+            return
+        if isinstance(editor, (ScrubbyIntSpinBox, ScrubbyFloatSpinBox)):
+            editor.commit()  # Deliver throttled wheel change before editor goes away
+        if self.isPersistentEditorOpen(index):
+            self.closePersistentEditor(index)
+
+    def _close_focus_editor(self):
+        """Close editor kept open for typing once it lost focus (hovered row keeps its editor)."""
+        if self._focus_index is None:
+            return
+        index = QModelIndex(self._focus_index)
+        if self._focus_index.isValid():
+            editor = self.indexWidget(index)
+            if editor is not None and editor.hasFocus():
+                return
+            if self._hover_index is not None and QModelIndex(self._hover_index) == index:
+                self._focus_index = None
+                return
+        self._focus_index = None
+        if index.isValid():
+            self._close_editor(index)
+
+    def eventFilter(self, obj, event):
+        """Close focused editor after focus-out (deferred: editor is inside its own event)."""
+        if (event.type() == QEvent.FocusOut and self._focus_index is not None
+                and obj is self.indexWidget(QModelIndex(self._focus_index))):
+            QTimer.singleShot(0, self, self._close_focus_editor)
+        return super().eventFilter(obj, event)
+
+    def leaveEvent(self, event):
+        if self._hover_index is not None and self._hover_index.isValid():
+            self._close_editor(QModelIndex(self._hover_index))
+        self._hover_index = None
+        super().leaveEvent(event)
+
+    def _update_height(self):
+        """Fixed height for up to MAX_VISIBLE_ROWS visible rows."""
+        visible_rows = sum(1 for row in range(self.list_model.rowCount()) if not self.isRowHidden(row))
+        rows = min(visible_rows, self.MAX_VISIBLE_ROWS)
+        self.setFixedHeight(rows * ParameterItemDelegate.ROW_HEIGHT + 2 * self.frameWidth())
+
+    def apply_visible_set(self, param_names: Optional[Iterable[str]] = None) -> int:
+        """
+        Show only rows from precomputed match set.
+
+        Args:
+            param_names: Set of parameter names to show, None = show all
+
+        Returns:
+            Number of visible rows
+        """
+        visible_count = 0
+        for row, name in enumerate(self.list_model.param_names()):
+            visible = param_names is None or name in param_names
+            if self.isRowHidden(row) == visible:
+                self.setRowHidden(row, not visible)
+            visible_count += visible
+
+        self.setVisible(visible_count > 0)
+        self._update_height()
+        return visible_count
+
+    def reset_to_original(self):
+        """Revert all parameters to original values."""
+        self.list_model.reset_to_original()
+
+    def mark_as_saved(self):
+        """Current values become saved values."""
+        self.list_model.mark_as_saved()
+
+    def on_language_changed(self):
+        """Refresh display names and help texts."""
+        self.list_model.refresh_display_names()
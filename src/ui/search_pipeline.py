@@ -0,0 +1,209 @@
+"""
+Search pipeline for CanvasMainWindow.
+
+Debounces search input, matches parameters on a worker thread and hands the
+result back to the GUI thread as one batch. Stale queries are cancelled via a
+generation counter, so typing a word produces a single rebuild.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+
+# (section, param_name, param_name_lower, display_name_lower)
+SearchEntry = Tuple[str, str, str, str]
+
+# How many entries a worker scans between cancellation checks
+CANCEL_CHECK_INTERVAL = 256
+
+
+def build_search_index(
+    sections: Dict[str, List[str]],
+    display_name_lookup: Optional[Callable[[str], Optional[str]]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> Optional[List[SearchEntry]]:
+    """
+    Build flat search index from section -> parameter names snapshot.
+
+    Args:
+        sections: {section_name: [param_name, ...]}
+        display_name_lookup: Optional callable returning English display name
+        is_cancelled: Optional callable, checked periodically
+
+    Returns:
+        List of search entries or None if cancelled
+    """
+    index: List[SearchEntry] = []
+    for section_name, param_names in sections.items():
+        for param_name in param_names:
+            display_name = display_name_lookup(param_name) if display_name_lookup else None
+            index.append((
+                section_name,
+                param_name,
+                param_name.lower(),
+                display_name.lower() if display_name else "",
+            ))
+            if is_cancelled and len(index) % CANCEL_CHECK_INTERVAL == 0 and is_cancelled():
+                return None
+    return index
+
+
+def match_index(
+    index: List[SearchEntry],
+    query: str,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> Optional[Dict[str, List[str]]]:
+    """
+    Match query against search index (parameter name or display name).
+
+    Args:
+        index: Index from build_search_index()
+        query: Lowercase search text
+        is_cancelled: Optional callable, checked periodically
+
+    Returns:
+        {section_name: [matching param names]} in index order, or None if cancelled
+    """
+    found: Dict[str, List[str]] = {}
+    for i, (section_name, param_name, name_lower, display_lower) in enumerate(index):
+        if is_cancelled and i % CANCEL_CHECK_INTERVAL == 0 and is_cancelled():
+            return None
+        if query in name_lower or (display_lower and query in display_lower):
+            found.setdefault(section_name, []).append(param_name)
+    return found
+
+
+class _SearchSignals(QObject):
+    """Signals emitted from worker thread (delivered queued to GUI thread)."""
+
+    finished = Signal(int, int, str, object, object)  # (generation, index_epoch, query, index, found)
+
+
+class _SearchTask(QRunnable):
+    """Worker: builds index if needed and matches query."""
+
+    def __init__(self, pipeline: "SearchPipeline", generation: int, query: str,
+                 index: Optional[List[SearchEntry]], sections: Optional[Dict[str, List[str]]]):
+        super().__init__()
+        self.pipeline = pipeline
+        self.generation = generation
+        self.index_epoch = pipeline._index_epoch
+        self.query = query
+        self.index = index
+        self.sections = sections
+        self.signals = pipeline._signals
+
+    def is_cancelled(self) -> bool:
+        """Task is stale once a newer query was dispatched."""
+        return self.generation != self.pipeline._generation
+
+    def run(self):
+        """Run matching off the GUI thread."""
+        index = self.index
+        if index is None:
+            index = build_search_index(self.sections or {}, self.pipeline.display_name_lookup, self.is_cancelled)
+            if index is None:
+                return
+
+        found = match_index(index, self.query, self.is_cancelled)
+        if found is None:
+            return
+
+        self.signals.finished.emit(self.generation, self.index_epoch, self.query, index, found)
+
+
+class SearchPipeline(QObject):
+    """
+    Debounced, cancellable search over INI parameters.
+
+    Usage:
+        pipeline = SearchPipeline(snapshot_provider, display_name_lookup)
+        pipeline.results_ready.connect(apply_results)
+        line_edit.textChanged.connect(pipeline.set_query)
+    """
+
+    results_ready = Signal(str, dict)  # (query, {section_name: [param names]})
+    cleared = Signal()  # Query became empty
+
+    DEFAULT_DEBOUNCE_MS = 250
+
+    def __init__(
+        self,
+        snapshot_provider: Callable[[], Dict[str, List[str]]],
+        display_name_lookup: Optional[Callable[[str], Optional[str]]] = None,
+        debounce_ms: int = DEFAULT_DEBOUNCE_MS,
+        parent: Optional[QObject] = None,
+    ):
+        """
+        Initialize search pipeline.
+
+        Args:
+            snapshot_provider: Returns {section: [param names]} (called on GUI thread)
+            display_name_lookup: Returns display name for a param (called on worker thread)
+            debounce_ms: Delay after last keystroke before search starts
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.snapshot_provider = snapshot_provider
+        self.display_name_lookup = display_name_lookup
+
+        self._generation = 0
+        self._pending_query = ""
+        self._index: Optional[List[SearchEntry]] = None
+        self._index_epoch = 0  # Bumped on invalidate() so in-flight indexes are not cached
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self._dispatch)
+
+        # Single worker: stale tasks exit early, newest one runs next
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._signals = _SearchSignals()
+        self._signals.finished.connect(self._on_task_finished)
+
+    def set_query(self, text: str):
+        """Schedule search for text (restarts debounce timer)."""
+        query = text.lower().strip()
+        self._pending_query = query
+
+        if not query:
+            # Clearing is instant - cancel whatever is in flight
+            self.cancel()
+            self.cleared.emit()
+            return
+
+        self._debounce.start()
+
+    def cancel(self):
+        """Cancel pending and running searches."""
+        self._debounce.stop()
+        self._generation += 1
+        self._pool.clear()
+
+    def invalidate(self):
+        """Drop cached index (call after INI reload)."""
+        self._index = None
+        self._index_epoch += 1
+
+    def _dispatch(self):
+        """Start worker for pending query."""
+        self._generation += 1
+        self._pool.clear()  # Drop queued (not started) stale tasks
+
+        sections = self.snapshot_provider() if self._index is None else None
+        task = _SearchTask(self, self._generation, self._pending_query, self._index, sections)
+        self._pool.start(task)
+
+    def _on_task_finished(self, generation: int, index_epoch: int, query: str, index, found):
+        """Receive worker result on GUI thread, drop stale ones."""
+        if self._index is None and index_epoch == self._index_epoch:
+            self._index = index
+
+        if generation != self._generation:
+            return
+
+        self.results_ready.emit(query, found)
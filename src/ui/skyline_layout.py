@@ -8,9 +8,14 @@ Uses Skyline algorithm to pack widgets efficiently:
 - Fixed 10px spacing (horizontal + vertical)
 """
 
+import logging
 from PySide6.QtCore import QRect, QSize, Qt
 from PySide6.QtWidgets import QLayout, QLayoutItem, QWidget
 
+from .packing_engine import PackingEngine, PackItem, best_column
+
+logger = logging.getLogger(__name__)
+
 
 class SkylineLayout(QLayout):
     """Masonry layout using Skyline packing algorithm."""
@@ -21,6 +26,7 @@ class SkylineLayout(QLayout):
         self._columns = columns
         self._spacing = spacing
         self._column_heights = [0] * columns  # Track height of each column
+        self._engine = PackingEngine(columns, spacing=spacing, margin=0)
         
     def addItem(self, item: QLayoutItem):
         """Add item to layout."""
@@ -75,50 +81,30 @@ class SkylineLayout(QLayout):
         4. Update column heights for spanned columns
         
         CRITICAL: Each widget uses natural height (NO stretching!)
+        Packing itself is done by PackingEngine (auto columns, in item order).
         """
         left, top, right, bottom = self.getContentsMargins()
         effective_rect = rect.adjusted(left, top, -right, -bottom)
         
-        # Reset column heights
-        self._column_heights = [0] * self._columns
-        
-        # Calculate column width
-        available_width = effective_rect.width() - (self._columns - 1) * self._spacing
-        col_width = available_width // self._columns
-        
-        print(f"[SkylineLayout] Layout {len(self._items)} items, {self._columns} cols, col_width={col_width}px")
-        
-        for idx, item in enumerate(self._items):
-            widget = item.widget()
-            if not widget:
-                continue
-            
+        widgets = [item.widget() for item in self._items]
+        pack_items = [
             # Get span from widget property (default=1)
-            span = getattr(widget, '_layout_span', 1)
-            span = min(span, self._columns)  # Clamp to available columns
-            
-            # Find best position using Skyline algorithm
-            best_col = self._find_best_column(span)
-            
-            # Calculate ABSOLUTE position (like Masonry.js)
-            x = effective_rect.x() + best_col * (col_width + self._spacing)
-            y = effective_rect.y() + self._column_heights[best_col]
-            
-            # Calculate size
-            width = span * col_width + (span - 1) * self._spacing
-            height = widget.sizeHint().height()
-            
+            PackItem(str(idx), widget.sizeHint().height(), getattr(widget, '_layout_span', 1))
+            for idx, widget in enumerate(widgets) if widget
+        ]
+        
+        self._engine.set_columns(self._columns)
+        placements = self._engine.pack(pack_items, effective_rect.width())
+        for pack_item in pack_items:
+            placement = placements[pack_item.item_id]
             # Set geometry - ABSOLUTE positioning!
-            item.setGeometry(QRect(x, y, width, height))
-            
-            # Update column heights for ALL spanned columns
-            new_height = self._column_heights[best_col] + height + self._spacing
-            for i in range(best_col, best_col + span):
-                if i < self._columns:
-                    self._column_heights[i] = new_height
-            
-            widget_name = getattr(widget, 'title', f'Widget{idx}')
-            print(f"  [{widget_name}] span={span}, col={best_col}, y={y}px, height={height}px")
+            self._items[int(pack_item.item_id)].setGeometry(QRect(
+                effective_rect.x() + placement.x, effective_rect.y() + placement.y,
+                placement.width, placement.height
+            ))
+        self._column_heights = list(self._engine.skyline)
+        
+        logger.debug("[SkylineLayout] Layout %s items, %s cols, col_width=%spx", len(pack_items), self._columns, self._engine.col_width)
     
     def _find_best_column(self, span: int) -> int:
         """
@@ -127,20 +113,7 @@ class SkylineLayout(QLayout):
         Skyline algorithm: for each possible position, find max height across span,
         then choose position with minimal max height.
         """
-        best_col = 0
-        min_max_height = float('inf')
-        
-        # Try each possible starting column
-        for col in range(self._columns - span + 1):
-            # Find max height across span
-            max_height = max(self._column_heights[col:col + span])
-            
-            # If this is better (lower), use it
-            if max_height < min_max_height:
-                min_max_height = max_height
-                best_col = col
-        
-        return best_col
+        return best_column(self._column_heights, span)[0]
     
     def set_columns(self, columns: int):
         """Update column count and trigger relayout."""
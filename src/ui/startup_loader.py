@@ -0,0 +1,140 @@
+"""
+Deferred startup of the MaxManager editor window.
+
+The window is constructed and shown with its chrome only (sidebar, header,
+footer, loading placeholder); everything the first tab needs but the first
+frame does not is loaded afterwards:
+
+- 3dsMax.ini, parameter database and plugin INI files - on a worker thread
+  (plain Python, no Qt objects), delivered back to the GUI thread as one
+  StartupData
+- icon fonts (QtAwesome) - on the GUI thread, on the first idle tick after
+  the window is shown (fonts must be registered on the GUI thread)
+"""
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+from PySide6.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, Signal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StartupData:
+    """Everything loaded off the GUI thread at startup."""
+    ini_manager: Optional[object] = None  # INIManager of 3dsMax.ini (None = mock data)
+    database: Optional[object] = None  # ParameterDatabase
+    plugin_ini_managers: Dict[str, object] = field(default_factory=dict)  # {plugin ini name: INIManager}
+
+
+def load_startup_data(ini_path: Optional[Path], find_plugins: bool = True) -> StartupData:
+    """
+    Load INI, parameter database and plugin INIs (runs on worker thread).
+
+    Args:
+        ini_path: 3dsMax.ini to load (None or missing file = mock data)
+        find_plugins: Scan plugin locations for plugin INI files
+    """
+    # Imported here, not at module level: the window imports this module
+    # before its first frame, these are only needed by the worker
+    from ..data.database_loader import get_database
+    from ..modules.ini_manager import INIManager
+
+    data = StartupData()
+
+    if ini_path is not None and ini_path.exists():
+        manager = INIManager(ini_path)
+        if manager.load_ini():
+            logger.info("INI loaded from %s: %s sections, %s parameters", ini_path,
+                        len(manager.original_sections), len(manager.original_parameters))
+            data.ini_manager = manager
+        else:
+            logger.warning("Failed to load INI from %s, using mock data", ini_path)
+    else:
+        logger.warning("No INI file found, using mock data")
+
+    data.database = get_database()
+
+    if find_plugins:
+        from ..modules.plugin_ini_finder import PluginINIFinder
+        for plugin_name, plugin_path in PluginINIFinder().find_plugin_inis().items():
+            try:
+                manager = INIManager(plugin_path)
+                if manager.load_ini():
+                    data.plugin_ini_managers[plugin_name] = manager
+                    logger.debug("[Plugin INI] Loaded %s: %s sections", plugin_name, len(manager.current_sections))
+            except Exception as e:
+                logger.warning("[Plugin INI] Failed to load %s: %s", plugin_name, e)
+
+    return data
+
+
+class _StartupSignals(QObject):
+    """Signals emitted from worker thread (delivered queued to GUI thread)."""
+
+    finished = Signal(object)  # StartupData
+
+
+class _StartupTask(QRunnable):
+    """Worker: runs load_startup_data()."""
+
+    def __init__(self, signals: _StartupSignals, ini_path: Optional[Path], find_plugins: bool):
+        super().__init__()
+        self.signals = signals
+        self.ini_path = ini_path
+        self.find_plugins = find_plugins
+
+    def run(self):
+        """Load off the GUI thread; failures still finish (with mock data)."""
+        try:
+            data = load_startup_data(self.ini_path, self.find_plugins)
+        except Exception as e:
+            logger.exception("[Startup] Loading failed: %s", e)
+            data = StartupData()
+        self.signals.finished.emit(data)
+
+
+class StartupLoader(QObject):
+    """
+    Loads StartupData on a worker thread.
+
+    Usage:
+        loader = StartupLoader(parent=window)
+        loader.finished.connect(window.on_startup_data)
+        loader.start(ini_path)
+    """
+
+    finished = Signal(object)  # StartupData (on GUI thread)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._signals = _StartupSignals()
+        self._signals.finished.connect(self._on_task_finished)
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        """True while worker is loading."""
+        return self._running
+
+    def start(self, ini_path: Optional[Path], find_plugins: bool = True):
+        """Start loading (no-op while already running)."""
+        if self._running:
+            return
+        self._running = True
+        self._pool.start(_StartupTask(self._signals, ini_path, find_plugins))
+
+    def wait(self):
+        """Block until loaded and deliver finished now (tests, synchronous callers)."""
+        self._pool.waitForDone()
+        QCoreApplication.sendPostedEvents()
+
+    def _on_task_finished(self, data: StartupData):
+        """Receive worker result on GUI thread."""
+        self._running = False
+        self.finished.emit(data)
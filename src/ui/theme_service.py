@@ -0,0 +1,341 @@
+"""
+Theme service for MaxManager.
+
+One compiled stylesheet for canvases and parameter widgets (states are
+dynamic properties: modified, available, deleted, expanded) plus a
+process-wide cache of QtAwesome icons and pixmaps. Widgets only set object
+names/properties and take icons from here, so creating a widget does not
+parse a stylesheet or rasterize glyphs, and a theme switch is one re-polish.
+
+QtAwesome (and the qtpy modules and fonts it loads) is imported on first
+icon request, not at import time, so the editor window can show its first
+frame before icon fonts are ready.
+"""
+
+import importlib.util
+import logging
+from functools import lru_cache
+from string import Template
+from typing import Dict, Optional
+
+from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtWidgets import QWidget
+
+logger = logging.getLogger(__name__)
+
+QTA_AVAILABLE = importlib.util.find_spec('qtawesome') is not None
+if not QTA_AVAILABLE:
+    logger.debug("QtAwesome not available, using text fallbacks for icons")
+
+_qta = None  # qtawesome module, imported by get_qta()
+
+
+# Palette names used in STYLESHEET_TEMPLATE
+DARK_THEME = {
+    'accent': '#9C823A',
+    'canvas_bg': '#3A3A3A',
+    'field_bg': '#2A2A2A',
+    'field_border': '#555555',
+    'button_bg': '#404040',
+    'button_hover': '#555555',
+    'text': 'white',
+    'text_dimmed': '#888888',
+    'tooltip_border': '#444444',
+    'grip': '#666666',
+    'scroll_handle': '#353535',
+}
+
+STYLESHEET_TEMPLATE = Template("""
+QToolTip {
+    background-color: $field_bg;
+    color: $text;
+    border: 1px solid $tooltip_border;
+    padding: 10px;
+    font-family: 'Segoe UI';
+    font-size: 10px;
+    border-radius: 0px;
+}
+
+/* ---------- CanvasContainer (first: scoped defaults, overridden below) ---------- */
+CanvasContainer, CanvasContainer QWidget, CanvasContainer QScrollArea {
+    background-color: transparent;
+    border: none;
+}
+CanvasContainer QScrollBar:vertical {
+    background-color: rgba(51, 51, 51, 100);
+    width: 5px;
+    border: none;
+    margin: 0px;
+}
+CanvasContainer QScrollBar::handle:vertical {
+    background-color: $scroll_handle;
+    border-radius: 2.5px;
+    min-height: 30px;
+    margin: 0px;
+}
+CanvasContainer QScrollBar::handle:vertical:hover {
+    background-color: $button_bg;
+}
+CanvasContainer QScrollBar::add-line:vertical, CanvasContainer QScrollBar::sub-line:vertical {
+    height: 0px;
+}
+CanvasContainer QScrollBar::add-page:vertical, CanvasContainer QScrollBar::sub-page:vertical {
+    background: none;
+}
+
+/* ---------- CollapsibleCanvas ---------- */
+CollapsibleCanvas {
+    background-color: transparent;
+    border: none;
+    border-radius: 7.5px;
+}
+QWidget#canvas_header {
+    background-color: $accent;
+    border: none;
+    border-radius: 7.5px;
+}
+QWidget#canvas_header[expanded="true"] {
+    border-top-left-radius: 7.5px;
+    border-top-right-radius: 7.5px;
+    border-bottom-left-radius: 0px;
+    border-bottom-right-radius: 0px;
+}
+QLabel#canvas_title {
+    color: $text;
+    font-size: 10px;
+    font-weight: bold;
+    background-color: transparent;
+}
+QLabel#drag_handle {
+    color: $text;
+    font-size: 14px;
+}
+QPushButton#canvas_arrow {
+    background-color: transparent;
+    color: $text;
+    border: none;
+    font-size: 12px;
+    font-weight: bold;
+    padding: 0px;
+}
+QPushButton#canvas_save, QPushButton#canvas_reset, QPushButton#canvas_revert {
+    background-color: transparent;
+    color: $text;
+    border: none;
+    padding: 0px;
+}
+QWidget#canvas_content {
+    background-color: $canvas_bg;
+    border-bottom-left-radius: 7.5px;
+    border-bottom-right-radius: 7.5px;
+}
+CollapsibleCanvas QScrollBar:vertical {
+    background-color: transparent;  /* Lists inside canvas: groove blends into content */
+}
+QWidget#resize_grip QLabel {
+    color: $grip;
+    font-size: 16px;
+}
+
+/* ---------- INIParameterWidget ---------- */
+INIParameterWidget {
+    background-color: transparent;
+    border: none;
+    padding: 2px;
+}
+INIParameterWidget[modified="true"] {
+    background-color: transparent;
+    border-left: none;
+}
+INIParameterWidget > QLabel {
+    color: $text;
+    background-color: transparent;
+}
+INIParameterWidget[available="true"] QLabel, INIParameterWidget[deleted="true"] QLabel {
+    color: $text_dimmed;
+}
+INIParameterWidget QLineEdit {
+    background-color: $field_bg;
+    color: $text;
+    border: 1px solid $field_border;
+    border-radius: 3px;
+    padding: 3px;
+}
+INIParameterWidget QLineEdit:focus {
+    border: 1px solid $field_border;
+    outline: none;
+}
+INIParameterWidget QSpinBox, INIParameterWidget QDoubleSpinBox {
+    background-color: $field_bg;
+    color: $text;
+    border: 1px solid $field_border;
+    border-radius: 3px;
+    padding: 3px;
+}
+INIParameterWidget QPushButton {
+    background-color: $button_bg;
+    color: $text;
+    border: none;
+    border-radius: 3px;
+}
+INIParameterWidget QPushButton:hover {
+    background-color: $button_hover;
+}
+QPushButton#help_button, QPushButton#action_button, QPushButton#param_toggle {
+    background-color: transparent;
+    border: none;
+    padding: 0px;
+    outline: none;
+}
+QPushButton#help_button:hover, QPushButton#action_button:hover, QPushButton#param_toggle:hover {
+    background-color: transparent;
+}
+QWidget#path_widget_container {
+    background-color: $field_bg;
+    border: 1px solid $field_border;
+    border-radius: 3px;
+}
+QWidget#path_separator {
+    background-color: $field_border;
+}
+QLineEdit#path_input {
+    background-color: transparent;
+    color: $text;
+    border: none;
+    padding: 0px;  /* No padding - using textMargins instead */
+}
+QPushButton#path_browse_button {
+    background-color: transparent;
+    border: none;
+    outline: none;
+}
+QPushButton#path_browse_button:hover {
+    background-color: rgba(255, 255, 255, 20);
+}
+
+/* ---------- ParameterListView ---------- */
+ParameterListView {
+    background-color: transparent;
+    border: none;
+}
+ParameterListView QLineEdit {
+    background-color: $field_bg;
+    color: $text;
+    border: 1px solid $field_border;
+    border-radius: 3px;
+    padding: 3px;
+}
+""")
+
+
+_palette: Dict[str, str] = dict(DARK_THEME)
+_stylesheet: Optional[str] = None
+_targets: Dict[int, object] = {}  # id -> widget/application the stylesheet is installed on (dropped on destroy)
+
+
+def get_color(name: str) -> str:
+    """Get color of current palette by name."""
+    return _palette[name]
+
+
+def get_stylesheet() -> str:
+    """Get stylesheet compiled from current palette (compiled once per theme)."""
+    global _stylesheet
+    if _stylesheet is None:
+        _stylesheet = STYLESHEET_TEMPLATE.substitute(_palette)
+    return _stylesheet
+
+
+def install_theme(target) -> None:
+    """
+    Install compiled stylesheet on target.
+
+    Target is the top-level window (or QApplication when running
+    standalone); all canvases and parameter widgets below it are styled by
+    this one sheet. Inside 3ds Max install on the window, not on the app,
+    so Max's own UI is not restyled.
+    """
+    target.setStyleSheet(get_stylesheet())
+    target_id = id(target)
+    if target_id not in _targets:
+        _targets[target_id] = target
+        # Closed windows must not be kept alive by the service
+        target.destroyed.connect(lambda *args, target_id=target_id: _targets.pop(target_id, None))
+
+
+def set_theme(palette: Dict[str, str]) -> None:
+    """Switch palette and re-polish every installed target once."""
+    global _stylesheet
+    _palette.update(palette)
+    _stylesheet = None
+    sheet = get_stylesheet()
+    for target_id, target in list(_targets.items()):
+        try:
+            target.setStyleSheet(sheet)
+        except RuntimeError:
+            # C++ object already deleted
+            _targets.pop(target_id, None)
+
+
+def get_qta():
+    """Get qtawesome module, importing it on first call (None if not available)."""
+    global _qta, QTA_AVAILABLE
+    if _qta is None and QTA_AVAILABLE:
+        try:
+            import qtawesome
+            _qta = qtawesome
+        except ImportError as e:
+            QTA_AVAILABLE = False
+            logger.debug("QtAwesome failed to import, using text fallbacks for icons: %s", e)
+    return _qta
+
+
+def icon_fonts_loaded() -> bool:
+    """True once QtAwesome is imported (icons are cheap from now on)."""
+    return _qta is not None
+
+
+def preload_icon_fonts(glyphs=()) -> None:
+    """
+    Import QtAwesome and load its fonts (call after first frame is shown).
+
+    Args:
+        glyphs: (glyph, color) pairs to render into the icon cache up front
+    """
+    if get_qta() is None:
+        return
+    for glyph, color in glyphs:
+        get_icon(glyph, color)
+
+
+@lru_cache(maxsize=None)
+def get_icon(glyph: str, color: str) -> QIcon:
+    """Get shared QtAwesome icon (empty icon if QtAwesome is not available)."""
+    qta = get_qta()
+    if qta is None:
+        return QIcon()
+    return qta.icon(glyph, color=color)
+
+
+@lru_cache(maxsize=None)
+def get_pixmap(glyph: str, color: str, size: int) -> QPixmap:
+    """Get shared pixmap of QtAwesome icon rendered at size x size."""
+    return get_icon(glyph, color).pixmap(size, size)
+
+
+def repolish(widget: QWidget, recursive: bool = True) -> None:
+    """
+    Re-apply stylesheet after dynamic property change.
+
+    Descendant rules (e.g. dimmed labels of available params) need children
+    re-polished too, so recursive is the default.
+    """
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    if recursive:
+        for child in widget.findChildren(QWidget):
+            child_style = child.style()
+            child_style.unpolish(child)
+            child_style.polish(child)
+    widget.update()
@@ -0,0 +1,130 @@
+"""
+Timing overlay for MaxManager.
+
+Floating panel over the main window with rolling timer stats of the
+global profiler (count, last, p50, p95, max per hot path), refreshed while
+visible. Toggled with Ctrl+Shift+P; can reset stats and export a Chrome
+trace for regression reports.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QFileDialog, QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
+
+from ..core.profiling import Profiler, get_profiler
+
+
+REFRESH_INTERVAL_MS = 500
+
+
+def format_stats_table(profiler: Profiler) -> str:
+    """Stats of all timers as fixed-width text table."""
+    stats = profiler.stats()
+    if not stats:
+        return "No timings recorded yet"
+    name_width = max(len(name) for name in stats)
+    lines = [f"{'timer':<{name_width}}  {'n':>5}  {'last':>8}  {'p50':>8}  {'p95':>8}  {'max':>8}"]
+    for s in stats.values():
+        lines.append(
+            f"{s.name:<{name_width}}  {s.count:>5}  {s.last_ms:>8.2f}  {s.p50_ms:>8.2f}  {s.p95_ms:>8.2f}  {s.max_ms:>8.2f}"
+        )
+    return "\n".join(lines)
+
+
+class TimingOverlay(QFrame):
+    """Floating stats panel (child of main window central widget)."""
+
+    def __init__(self, parent: QWidget, profiler: Optional[Profiler] = None):
+        super().__init__(parent)
+        self.profiler = profiler or get_profiler()
+        self.setObjectName("timing_overlay")
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 8, 10, 8)
+        layout.setSpacing(6)
+
+        self.table_label = QLabel()
+        self.table_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        layout.addWidget(self.table_label)
+
+        buttons = QHBoxLayout()
+        buttons.setSpacing(6)
+        buttons.addStretch()
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self.reset)
+        buttons.addWidget(reset_btn)
+        export_btn = QPushButton("Export trace...")
+        export_btn.clicked.connect(self.export_trace)
+        buttons.addWidget(export_btn)
+        layout.addLayout(buttons)
+
+        self.setStyleSheet("""
+            QFrame#timing_overlay {
+                background-color: rgba(42, 42, 42, 230);
+                border: 1px solid #555555;
+                border-radius: 7.5px;
+            }
+            QLabel {
+                color: white;
+                font-family: 'Consolas', 'Courier New', monospace;
+                font-size: 12px;
+                background: transparent;
+            }
+            QPushButton {
+                background-color: #404040;
+                color: white;
+                border: none;
+                border-radius: 3px;
+                padding: 3px 10px;
+                font-family: 'Segoe UI';
+                font-size: 12px;
+            }
+            QPushButton:hover {
+                background-color: #555555;
+            }
+        """)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+
+        self.setVisible(False)
+
+    def toggle(self):
+        """Show/hide overlay."""
+        self.setVisible(not self.isVisible())
+        if self.isVisible():
+            self.raise_()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._timer.stop()
+
+    def refresh(self):
+        """Redraw stats table and keep panel in top-right corner."""
+        self.table_label.setText(format_stats_table(self.profiler))
+        self.adjustSize()
+        parent = self.parentWidget()
+        if parent is not None:
+            self.move(parent.width() - self.width() - 20, 90)
+
+    def reset(self):
+        """Drop collected stats."""
+        self.profiler.reset()
+        self.refresh()
+
+    def export_trace(self):
+        """Save Chrome trace JSON (open in chrome://tracing or ui.perfetto.dev)."""
+        default_path = Path.home() / '.maxmanager' / f"trace_{datetime.now():%Y%m%d_%H%M%S}.json"
+        path, _ = QFileDialog.getSaveFileName(self, "Export trace", str(default_path), "Chrome trace (*.json)")
+        if path:
+            count = self.profiler.export_chrome_trace(Path(path))
+            self.table_label.setToolTip(f"Exported {count} events to {path}")
@@ -5,6 +5,21 @@ Converts technical parameter names to human-readable format.
 """
 
 import re
+from functools import lru_cache
+from typing import Dict, Iterable
+
+# Acronyms kept uppercase in display names
+ACRONYMS = frozenset({
+    'GPU', 'UI', 'CPU', 'RAM', 'API', 'URL', 'HTTP', 'FTP',
+    'MAX', 'INI', 'EXE', 'DLL', 'XML', 'JSON', 'HDAO',
+})
+
+# Precompiled split patterns
+_ACRONYM_BOUNDARY_RE = re.compile(r'([A-Z]+)([A-Z][a-z])')
+_CAMEL_BOUNDARY_RE = re.compile(r'([a-z])([A-Z])')
+
+# Bounded cache size for formatted names
+FORMAT_CACHE_SIZE = 8192
 
 
 def camel_case_split(text: str) -> str:
@@ -23,29 +38,22 @@ def camel_case_split(text: str) -> str:
         Space-separated capitalized words
     """
     # First, handle acronyms (GPU, UI, etc.)
-    text = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1 \2', text)
+    text = _ACRONYM_BOUNDARY_RE.sub(r'\1 \2', text)
     
     # Insert space before uppercase letters
-    text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
-    
-    # Split on spaces and capitalize each word
-    words = text.split()
+    text = _CAMEL_BOUNDARY_RE.sub(r'\1 \2', text)
     
     # Capitalize first letter of each word
-    formatted_words = []
-    for word in words:
-        if word.upper() in ['GPU', 'UI', 'CPU', 'RAM', 'API', 'URL', 'HTTP', 'FTP', 
-                            'MAX', 'INI', 'EXE', 'DLL', 'XML', 'JSON', 'HDAO']:
-            formatted_words.append(word.upper())
-        else:
-            formatted_words.append(word.capitalize())
-    
-    return ' '.join(formatted_words)
+    return ' '.join(
+        word.upper() if word.upper() in ACRONYMS else word.capitalize()
+        for word in text.split()
+    )
 
 
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
 def format_parameter_name(param_name: str, use_title_case: bool = True) -> str:
     """
-    Format parameter name for display.
+    Format parameter name for display (cached per raw name).
     
     Args:
         param_name: Raw parameter name from INI
@@ -70,6 +78,20 @@ def format_parameter_name(param_name: str, use_title_case: bool = True) -> str:
     return readable if readable else param_name
 
 
+def format_many(param_names: Iterable[str]) -> Dict[str, str]:
+    """
+    Format all parameter names of a section in one call.
+    
+    Args:
+        param_names: Raw parameter names
+        
+    Returns:
+        {raw_name: formatted_name}
+    """
+    return {name: format_parameter_name(name) for name in param_names}
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
 def get_short_name(param_name: str, max_length: int = 40) -> str:
     """
     Get shortened version of parameter name.
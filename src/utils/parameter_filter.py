@@ -6,6 +6,7 @@ Goal: Give access to ALL useful settings!
 """
 
 import re
+from functools import lru_cache
 
 
 # Patterns for TRULY useless parameters (only window positions)
@@ -30,23 +31,41 @@ HIDDEN_PATTERNS = [
 ]
 
 
+# All patterns as one precompiled alternation (single regex pass per name)
+_HIDDEN_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in HIDDEN_PATTERNS))
+
+
+@lru_cache(maxsize=16384)
 def is_technical_parameter(param_name: str) -> bool:
     """
     Check if parameter is truly useless (window coords only).
     
+    Verdicts are memoized per parameter name.
+    
     Args:
         param_name: Parameter name (case-insensitive)
         
     Returns:
         True if parameter should be hidden, False otherwise
     """
-    param_lower = param_name.lower()
-    
-    for pattern in HIDDEN_PATTERNS:
-        if re.match(pattern, param_lower):
-            return True
+    return _HIDDEN_RE.match(param_name.lower()) is not None
+
+
+def hidden_mask(param_names) -> int:
+    """
+    Get hidden/visible bitmask for a whole section in one call.
     
-    return False
+    Args:
+        param_names: Iterable of parameter names (e.g. section dict keys)
+        
+    Returns:
+        Bitmask where bit i is set if i-th name should be hidden
+    """
+    mask = 0
+    for i, name in enumerate(param_names):
+        if is_technical_parameter(name):
+            mask |= 1 << i
+    return mask
 
 
 def filter_parameters(parameters: dict) -> dict:
@@ -58,9 +77,14 @@ def filter_parameters(parameters: dict) -> dict:
         
     Returns:
         Filtered dictionary with useful parameters
+        (the input dictionary itself if nothing is hidden)
     """
+    mask = hidden_mask(parameters)
+    if not mask:
+        return parameters
+    
     return {
         name: value
-        for name, value in parameters.items()
-        if not is_technical_parameter(name)
+        for i, (name, value) in enumerate(parameters.items())
+        if not (mask >> i) & 1
     }